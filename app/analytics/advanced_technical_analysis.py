@@ -10,6 +10,9 @@ import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import warnings
+
+from app.analytics.indicators import IndicatorSet, indicator_set
+
 warnings.filterwarnings('ignore')
 
 
@@ -26,6 +29,7 @@ class AdvancedTechnicalAnalyzer:
         self.period = period
         self.stock = yf.Ticker(self.symbol)
         self.data = self._fetch_data()
+        self.kernels = self._indicator_set()
 
     def _fetch_data(self) -> pd.DataFrame:
         """Fiyat verilerini çek"""
@@ -37,6 +41,10 @@ class AdvancedTechnicalAnalyzer:
         except Exception as e:
             raise ValueError(f"Failed to fetch data: {str(e)}")
 
+    def _indicator_set(self) -> IndicatorSet:
+        """Sembolün gösterge kolonları; aynı bar için tüm hesaplamalarda paylaşılır"""
+        return indicator_set(self.data['Close'], self.data['High'], self.data['Low'], cache_key=self.symbol)
+
     def get_complete_technical_analysis(self) -> Dict[str, Any]:
         """Tüm teknik analiz göstergelerini hesapla"""
         if self.data.empty:
@@ -58,18 +66,16 @@ class AdvancedTechnicalAnalyzer:
         df = self.data.copy()
 
         # Moving Averages
-        df['SMA_20'] = df['Close'].rolling(window=20).mean()
-        df['SMA_50'] = df['Close'].rolling(window=50).mean()
-        df['SMA_200'] = df['Close'].rolling(window=200).mean()
+        df['SMA_20'] = self.kernels.sma(20)
+        df['SMA_50'] = self.kernels.sma(50)
+        df['SMA_200'] = self.kernels.sma(200)
 
         # Exponential Moving Averages
-        df['EMA_12'] = df['Close'].ewm(span=12, adjust=False).mean()
-        df['EMA_26'] = df['Close'].ewm(span=26, adjust=False).mean()
+        df['EMA_12'] = self.kernels.ema(12)
+        df['EMA_26'] = self.kernels.ema(26)
 
         # MACD
-        df['MACD'] = df['EMA_12'] - df['EMA_26']
-        df['MACD_Signal'] = df['MACD'].ewm(span=9, adjust=False).mean()
-        df['MACD_Histogram'] = df['MACD'] - df['MACD_Signal']
+        df['MACD'], df['MACD_Signal'], df['MACD_Histogram'] = self.kernels.macd(12, 26, 9)
 
         current = df.iloc[-1]
 
@@ -104,12 +110,8 @@ class AdvancedTechnicalAnalyzer:
         """Momentum göstergeleri: RSI, Stochastic, ROC"""
         df = self.data.copy()
 
-        # RSI (Relative Strength Index)
-        delta = df['Close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        df['RSI'] = 100 - (100 / (1 + rs))
+        # RSI (Relative Strength Index, Wilder)
+        df['RSI'] = self.kernels.rsi(14)
 
         # Stochastic Oscillator
         low_14 = df['Low'].rolling(window=14).min()
@@ -178,19 +180,12 @@ class AdvancedTechnicalAnalyzer:
         df = self.data.copy()
 
         # Bollinger Bands
-        df['BB_Middle'] = df['Close'].rolling(window=20).mean()
-        bb_std = df['Close'].rolling(window=20).std()
-        df['BB_Upper'] = df['BB_Middle'] + (bb_std * 2)
-        df['BB_Lower'] = df['BB_Middle'] - (bb_std * 2)
+        df['BB_Upper'], df['BB_Middle'], df['BB_Lower'] = self.kernels.bollinger(20, 2)
         df['BB_Width'] = ((df['BB_Upper'] - df['BB_Lower']) / df['BB_Middle']) * 100
 
         # Average True Range (ATR)
-        df['TR'] = pd.concat([
-            df['High'] - df['Low'],
-            abs(df['High'] - df['Close'].shift()),
-            abs(df['Low'] - df['Close'].shift())
-        ], axis=1).max(axis=1)
-        df['ATR'] = df['TR'].rolling(window=14).mean()
+        df['TR'] = self.kernels.true_range()
+        df['ATR'] = self.kernels.atr(14)
 
         # Historical Volatility
         df['Returns'] = df['Close'].pct_change()
@@ -378,8 +373,8 @@ class AdvancedTechnicalAnalyzer:
         if len(df) < 200:
             return False
 
-        ma50 = df['Close'].rolling(window=50).mean()
-        ma200 = df['Close'].rolling(window=200).mean()
+        ma50 = self.kernels.sma(50)
+        ma200 = self.kernels.sma(200)
 
         if ma50.iloc[-2] <= ma200.iloc[-2] and ma50.iloc[-1] > ma200.iloc[-1]:
             return True
@@ -390,8 +385,8 @@ class AdvancedTechnicalAnalyzer:
         if len(df) < 200:
             return False
 
-        ma50 = df['Close'].rolling(window=50).mean()
-        ma200 = df['Close'].rolling(window=200).mean()
+        ma50 = self.kernels.sma(50)
+        ma200 = self.kernels.sma(200)
 
         if ma50.iloc[-2] >= ma200.iloc[-2] and ma50.iloc[-1] < ma200.iloc[-1]:
             return True
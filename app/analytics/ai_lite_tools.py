@@ -16,6 +16,7 @@ from scipy import stats
 from sklearn.preprocessing import StandardScaler
 import re
 from utils.news_utils import normalize_yfinance_news
+from app.analytics.path_simulation import simulate_price_paths
 
 
 class AILiteTools:
@@ -57,13 +58,11 @@ class AILiteTools:
 
             # Run Monte Carlo simulation
             with st.spinner(f"Running {num_simulations:,} simulations..."):
-                simulation_results = np.zeros((time_horizon, num_simulations))
+                simulation_results = np.empty((time_horizon, num_simulations))
                 simulation_results[0] = initial_investment
-
-                for t in range(1, time_horizon):
-                    # Generate random returns from normal distribution
-                    random_returns = np.random.normal(mean_return, std_return, num_simulations)
-                    simulation_results[t] = simulation_results[t-1] * (1 + random_returns)
+                simulation_results[1:] = simulate_price_paths(
+                    initial_investment, mean_return, std_return, time_horizon - 1, num_simulations
+                ).T
 
             # Calculate statistics
             final_values = simulation_results[-1]
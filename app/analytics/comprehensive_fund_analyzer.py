@@ -4,6 +4,9 @@ import numpy as np
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import warnings
+
+from app.utils.fetch_context import shared_fetch
+
 warnings.filterwarnings('ignore')
 
 class ComprehensiveFundAnalyzer:
@@ -284,8 +287,10 @@ class ComprehensiveFundAnalyzer:
 
     def compare_with_benchmark(self, benchmark_symbol: str = 'SPY') -> Dict[str, Any]:
         try:
-            benchmark_analyzer = ComprehensiveFundAnalyzer(benchmark_symbol)
-            benchmark_analysis = benchmark_analyzer.get_comprehensive_analysis()
+            benchmark_analysis = shared_fetch(
+                ('fund-analysis', benchmark_symbol),
+                lambda: ComprehensiveFundAnalyzer(benchmark_symbol).get_comprehensive_analysis(),
+            )
 
             fund_performance = self.calculate_performance_metrics()
             benchmark_performance = benchmark_analysis.get('performance_metrics', {})
@@ -13,6 +13,9 @@ import requests
 from sklearn.linear_model import LinearRegression
 from sklearn.preprocessing import StandardScaler
 import warnings
+
+from app.analytics import indicators
+
 warnings.filterwarnings('ignore')
 
 class ComprehensiveStockAnalyzer:
@@ -240,17 +243,18 @@ class ComprehensiveStockAnalyzer:
             high_prices = hist['High']
             low_prices = hist['Low']
 
+            kernels = indicators.indicator_set(close_prices, high_prices, low_prices, cache_key=self.symbol)
+
             # Moving averages
-            sma_20 = close_prices.rolling(window=20).mean()
-            sma_50 = close_prices.rolling(window=50).mean()
-            sma_200 = close_prices.rolling(window=200).mean()
-            ema_12 = close_prices.ewm(span=12).mean()
-            ema_26 = close_prices.ewm(span=26).mean()
+            sma_20 = kernels.sma(20)
+            sma_50 = kernels.sma(50)
+            sma_200 = kernels.sma(200)
 
             # Technical indicators
-            rsi = self._calculate_rsi(close_prices, 14)
-            macd, macd_signal = self._calculate_macd(close_prices)
-            bollinger_bands = self._calculate_bollinger_bands(close_prices, 20, 2)
+            rsi = kernels.rsi(14)
+            macd, macd_signal, _ = kernels.macd()
+            upper, middle, lower = kernels.bollinger(20, 2)
+            bollinger_bands = {'upper': upper, 'middle': middle, 'lower': lower}
             stochastic = self._calculate_stochastic(high_prices, low_prices, close_prices, 14)
 
             # Support and resistance
@@ -291,7 +295,7 @@ class ComprehensiveStockAnalyzer:
                     "bollinger_middle": bollinger_bands['middle'].iloc[-1],
                     "bollinger_lower": bollinger_bands['lower'].iloc[-1],
                     "bollinger_position": self._calculate_bollinger_position(current_price, bollinger_bands),
-                    "atr": self._calculate_atr(high_prices, low_prices, close_prices, 14).iloc[-1],
+                    "atr": kernels.atr(14).iloc[-1],
                     "volatility_percentile": self._calculate_volatility_percentile(close_prices)
                 },
                 "support_resistance": support_resistance,
@@ -359,27 +363,16 @@ class ComprehensiveStockAnalyzer:
 
     def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
         """Calculate RSI"""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        return indicators.rsi(prices, period)
 
     def _calculate_macd(self, prices: pd.Series) -> Tuple[pd.Series, pd.Series]:
         """Calculate MACD and signal line"""
-        ema_12 = prices.ewm(span=12).mean()
-        ema_26 = prices.ewm(span=26).mean()
-        macd = ema_12 - ema_26
-        signal = macd.ewm(span=9).mean()
+        macd, signal, _ = indicators.macd(prices)
         return macd, signal
 
     def _calculate_bollinger_bands(self, prices: pd.Series, period: int = 20, std_dev: int = 2) -> Dict[str, pd.Series]:
         """Calculate Bollinger Bands"""
-        middle = prices.rolling(window=period).mean()
-        std = prices.rolling(window=period).std()
-        upper = middle + (std * std_dev)
-        lower = middle - (std * std_dev)
+        upper, middle, lower = indicators.bollinger(prices, period, std_dev)
         return {'upper': upper, 'middle': middle, 'lower': lower}
 
     def _calculate_stochastic(self, high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> Dict[str, pd.Series]:
@@ -392,12 +385,7 @@ class ComprehensiveStockAnalyzer:
 
     def _calculate_atr(self, high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
         """Calculate Average True Range"""
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = true_range.rolling(window=period).mean()
-        return atr
+        return indicators.atr(high, low, close, period)
 
     def _calculate_piotroski_score(self, income: pd.Series, balance: pd.Series, cashflow: pd.Series) -> int:
         """Calculate Piotroski F-Score"""
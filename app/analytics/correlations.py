@@ -8,6 +8,165 @@ warnings.filterwarnings('ignore')
 
 from app.utils.logger import get_logger
 
+# Upper bound on floats held per product block by the rolling engine (~32 MB of float64).
+DEFAULT_MAX_CELLS = 4_000_000
+
+REGIME_LABELS = {1: "high_correlation", 0: "normal_correlation", -1: "low_correlation"}
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing ``window`` sums along axis 0; rows before the first full window are NaN."""
+    sums = np.cumsum(values, axis=0)
+    sums[window:] -= sums[:-window].copy()
+    sums[:window - 1] = np.nan
+    return sums
+
+
+def _rolling_mean_std(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Trailing mean and sample std per column; NaN unless the whole window is present."""
+    periods = len(values)
+    if periods < window or window < 2:
+        empty = np.full(values.shape, np.nan)
+        return empty, empty.copy()
+    valid = np.isfinite(values)
+    centers = np.zeros(values.shape[1])
+    present = valid.any(axis=0)
+    centers[present] = np.nanmean(values[:, present], axis=0)
+    x = np.where(valid, values - centers, 0.0)
+
+    count = _rolling_sum(valid.astype(float), window)
+    sum_x = _rolling_sum(x, window)
+    sum_xx = _rolling_sum(x * x, window)
+    with np.errstate(invalid="ignore"):
+        variance = (sum_xx - sum_x * sum_x / window) / (window - 1)
+        # Flat windows leave only rounding noise
+        variance[~(variance > 1e-12 * sum_xx / window)] = 0.0
+    complete = count == window
+    mean = np.where(complete, sum_x / window + centers, np.nan)
+    std = np.where(complete, np.sqrt(variance), np.nan)
+    return mean, std
+
+
+def rolling_correlation_matrix(
+    values: np.ndarray,
+    window: int,
+    left: Optional[np.ndarray] = None,
+    min_periods: Optional[int] = None,
+    max_cells: int = DEFAULT_MAX_CELLS
+) -> np.ndarray:
+    """
+    Rolling Pearson correlations of every column against every column in O(T·N²).
+
+    Windowed sums of x, x² and the cross products x_i·x_j come from cumulative
+    sums, so every window of every pair is produced without revisiting data.
+    Missing values drop out pairwise: a window of a pair needs ``min_periods``
+    rows where both columns are present.
+
+    Args:
+        values: (T, N) aligned matrix, NaN for missing observations
+        window: Rolling window length in rows
+        left: Column positions for the first axis of the result (default: all)
+        min_periods: Joint observations required per window (default: window)
+        max_cells: Cap on cross-product cells materialized per block of left columns
+
+    Returns:
+        (T, len(left), N) array of correlations, NaN where undefined
+    """
+    x = np.asarray(values, dtype=float)
+    if x.ndim == 1:
+        x = x[:, None]
+    periods, assets = x.shape
+    left = np.arange(assets) if left is None else np.asarray(left, dtype=int)
+    min_periods = window if min_periods is None else max(2, min(min_periods, window))
+    output = np.full((periods, len(left), assets), np.nan)
+    if periods < window or assets == 0 or len(left) == 0 or window < 2:
+        return output
+
+    valid = np.isfinite(x)
+    # Correlation is shift-invariant; centering keeps the running sums small.
+    centers = np.zeros(assets)
+    present = valid.any(axis=0)
+    centers[present] = np.nanmean(x[:, present], axis=0)
+    x = np.where(valid, x - centers, 0.0)
+    has_gaps = not valid.all()
+    mask = valid.astype(float)
+
+    if not has_gaps:
+        count = float(window)
+        sum_x = _rolling_sum(x, window)
+        sum_xx = _rolling_sum(x * x, window)
+
+    block = max(1, min(len(left), max_cells // max(1, periods * assets)))
+    for start in range(0, len(left), block):
+        cols = left[start:start + block]
+        xl = x[:, cols]
+        sum_xy = _rolling_sum(xl[:, :, None] * x[:, None, :], window)
+        if has_gaps:
+            ml = mask[:, cols]
+            count = _rolling_sum(ml[:, :, None] * mask[:, None, :], window)
+            sx = _rolling_sum(xl[:, :, None] * mask[:, None, :], window)
+            sy = _rolling_sum(ml[:, :, None] * x[:, None, :], window)
+            sxx = _rolling_sum((xl * xl)[:, :, None] * mask[:, None, :], window)
+            syy = _rolling_sum(ml[:, :, None] * (x * x)[:, None, :], window)
+        else:
+            sx = sum_x[:, cols][:, :, None]
+            sy = sum_x[:, None, :]
+            sxx = sum_xx[:, cols][:, :, None]
+            syy = sum_xx[:, None, :]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            var_x = sxx - sx * sx / count
+            var_y = syy - sy * sy / count
+            corr = (sum_xy - sx * sy / count) / np.sqrt(var_x * var_y)
+        # Flat windows leave only rounding noise in the variance
+        flat = ~(var_x > 1e-12 * sxx) | ~(var_y > 1e-12 * syy)
+        if has_gaps:
+            flat |= ~(count >= min_periods)
+        corr[flat] = np.nan
+        output[:, start:start + len(cols)] = np.clip(corr, -1.0, 1.0)
+
+    return output
+
+
+def regime_history(correlations: np.ndarray, regime_window: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Correlation regime labels and run lengths for every column at once.
+
+    A row is classified when its trailing ``regime_window`` mean and std exist:
+    z > 1 is high (1), z < -1 low (-1), otherwise normal (0); a zero std counts
+    as z = 0. Run length is the number of consecutive classified rows, ending
+    at that row, that share its label.
+
+    Args:
+        correlations: (T, K) correlation series, one column per series
+        regime_window: Window for the rolling mean and std
+
+    Returns:
+        Tuple of (z_scores, labels, run_lengths); unclassified rows have
+        NaN z-score, label 0 and run length 0
+    """
+    values = np.asarray(correlations, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    mean, std = _rolling_mean_std(values, regime_window)
+
+    classified = ~(np.isnan(mean) | np.isnan(std))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z_scores = np.where(std > 0, (values - mean) / std, 0.0)
+    z_scores[~classified] = np.nan
+    labels = np.select([z_scores > 1, z_scores < -1], [1, -1], default=0)
+
+    # A run restarts where the label changes or after an unclassified row
+    periods = len(values)
+    starts = ~classified.copy()
+    starts[1:] |= (labels[1:] != labels[:-1]) | ~classified[:-1]
+    starts[0] = True
+    rows = np.broadcast_to(np.arange(periods)[:, None], labels.shape)
+    run_start = np.maximum.accumulate(np.where(starts, rows, 0), axis=0)
+    run_lengths = np.where(classified, rows - run_start + 1, 0)
+
+    return z_scores, labels, run_lengths
+
 
 class CorrelationAnalyzer:
     """Advanced correlation analysis for financial assets."""
@@ -34,11 +193,8 @@ class CorrelationAnalyzer:
         """
         try:
             if window:
-                # Rolling correlation
-                correlations = price_data.rolling(window=window).corr(method=method)
-                # Take the latest window
-                latest_date = correlations.index.get_level_values(0)[-1]
-                corr_matrix = correlations.loc[latest_date]
+                # Latest rolling window only; pairs need a full window of joint observations
+                corr_matrix = price_data.tail(window).corr(method=method, min_periods=window)
             else:
                 # Full period correlation
                 corr_matrix = price_data.corr(method=method)
@@ -77,6 +233,51 @@ class CorrelationAnalyzer:
             self.logger.error("Failed to calculate rolling correlation", error=str(e))
             return pd.Series(dtype=float)
 
+    def rolling_correlation_matrix(
+        self,
+        data: pd.DataFrame,
+        window: int = 30,
+        min_periods: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Rolling correlations of every asset pair in one vectorized pass.
+
+        Args:
+            data: Aligned DataFrame (usually returns) with assets as columns
+            window: Rolling window size
+            min_periods: Joint observations required per window (default: window)
+
+        Returns:
+            DataFrame indexed by (date, asset) with assets as columns, the
+            layout of ``data.rolling(window).corr()``
+        """
+        try:
+            matrix = rolling_correlation_matrix(data.to_numpy(dtype=float), window, min_periods=min_periods)
+            periods, assets = matrix.shape[0], matrix.shape[2]
+            index = pd.MultiIndex.from_product([data.index, data.columns])
+            result = pd.DataFrame(matrix.reshape(periods * assets, assets), index=index, columns=data.columns)
+
+            self.logger.info(f"Calculated rolling correlations for {assets} assets over {periods} periods")
+            return result
+
+        except Exception as e:
+            self.logger.error("Failed to calculate rolling correlation matrix", error=str(e))
+            return pd.DataFrame()
+
+    def pairwise_rolling_correlations(
+        self,
+        data: pd.DataFrame,
+        window: int = 30,
+        min_periods: Optional[int] = None
+    ) -> pd.DataFrame:
+        """Rolling correlation series for each unique pair, one column per (asset_1, asset_2)."""
+        matrix = rolling_correlation_matrix(data.to_numpy(dtype=float), window, min_periods=min_periods)
+        first, second = np.triu_indices(data.shape[1], k=1)
+        columns = pd.MultiIndex.from_arrays(
+            [data.columns[first], data.columns[second]], names=["asset_1", "asset_2"]
+        )
+        return pd.DataFrame(matrix[:, first, second], index=data.index, columns=columns)
+
     def correlation_breakdown_detection(
         self,
         correlations: pd.Series,
@@ -159,45 +360,17 @@ class CorrelationAnalyzer:
             if pd.isna(current_mean) or pd.isna(current_std):
                 return {"error": "Cannot calculate regime - insufficient historical data"}
 
-            # Classify current regime
-            z_score = (current_corr - current_mean) / current_std if current_std > 0 else 0
-
-            if z_score > 1:
-                regime = "high_correlation"
-            elif z_score < -1:
-                regime = "low_correlation"
-            else:
-                regime = "normal_correlation"
-
-            # Calculate regime persistence
-            regime_changes = 0
-            regime_duration = 1
-
-            for i in range(2, min(30, len(correlations))):  # Look back up to 30 periods
-                past_corr = correlations.iloc[-i]
-                past_mean = rolling_mean.iloc[-i]
-                past_std = rolling_std.iloc[-i]
-
-                if pd.isna(past_mean) or pd.isna(past_std):
-                    break
-
-                past_z_score = (past_corr - past_mean) / past_std if past_std > 0 else 0
-
-                if past_z_score > 1:
-                    past_regime = "high_correlation"
-                elif past_z_score < -1:
-                    past_regime = "low_correlation"
-                else:
-                    past_regime = "normal_correlation"
-
-                if past_regime == regime:
-                    regime_duration += 1
-                else:
-                    break
+            # Classify the full history and measure regime persistence
+            z_scores, labels, run_lengths = regime_history(correlations.to_numpy()[:, None], regime_window)
+            z_score = float(z_scores[-1, 0])
+            regime = REGIME_LABELS[int(labels[-1, 0])]
+            classified = run_lengths[:, 0] > 0
+            regime_changes = int(((labels[1:, 0] != labels[:-1, 0]) & classified[1:] & classified[:-1]).sum())
 
             result = {
                 "current_regime": regime,
-                "regime_duration": regime_duration,
+                "regime_duration": int(run_lengths[-1, 0]),
+                "regime_changes": regime_changes,
                 "z_score": z_score,
                 "current_correlation": current_corr,
                 "regime_mean": current_mean,
@@ -211,6 +384,65 @@ class CorrelationAnalyzer:
             self.logger.error("Failed to analyze correlation regimes", error=str(e))
             return {"error": str(e)}
 
+    def pairwise_regime_summary(
+        self,
+        data: pd.DataFrame,
+        window: int = 30,
+        regime_window: int = 60,
+        breakdown_threshold: float = 0.2,
+        lookback_periods: int = 7
+    ) -> pd.DataFrame:
+        """
+        Current regime, regime duration and breakdown flag for every asset pair.
+
+        Uses the same rules as ``correlation_regime_analysis`` and
+        ``correlation_breakdown_detection``, applied to all pairs at once.
+
+        Args:
+            data: Aligned DataFrame with assets as columns
+            window: Rolling correlation window
+            regime_window: Window for regime classification
+            breakdown_threshold: Minimum change versus the lookback average
+            lookback_periods: Periods averaged for the breakdown comparison
+
+        Returns:
+            DataFrame with one row per pair (pairs without a classified regime are dropped)
+        """
+        try:
+            pair_corrs = self.pairwise_rolling_correlations(data, window=window)
+            if pair_corrs.shape[1] == 0 or len(pair_corrs) < regime_window:
+                return pd.DataFrame()
+
+            values = pair_corrs.to_numpy()
+            z_scores, labels, run_lengths = regime_history(values, regime_window)
+            classified = run_lengths > 0
+            changes = ((labels[1:] != labels[:-1]) & classified[1:] & classified[:-1]).sum(axis=0)
+
+            current = values[-1]
+            historical = np.full_like(current, np.nan)
+            if lookback_periods and len(values) >= lookback_periods + 1:
+                historical = np.nanmean(values[-(lookback_periods + 1):-1], axis=0)
+            change = np.abs(current - historical)
+
+            summary = pd.DataFrame({
+                "asset_1": pair_corrs.columns.get_level_values(0),
+                "asset_2": pair_corrs.columns.get_level_values(1),
+                "current_correlation": current,
+                "z_score": z_scores[-1],
+                "regime": [REGIME_LABELS[label] for label in labels[-1]],
+                "regime_duration": run_lengths[-1],
+                "regime_changes": changes,
+                "historical_average": historical,
+                "breakdown_detected": change >= breakdown_threshold
+            })
+
+            self.logger.info(f"Classified correlation regimes for {len(summary)} pairs")
+            return summary[classified[-1]].reset_index(drop=True)
+
+        except Exception as e:
+            self.logger.error("Failed to summarize pairwise correlation regimes", error=str(e))
+            return pd.DataFrame()
+
     def correlation_significance_test(
         self,
         asset1_prices: pd.Series,
@@ -295,21 +527,26 @@ class CorrelationAnalyzer:
             top_positive = correlations.nlargest(top_n)
             top_negative = correlations.nsmallest(top_n)
 
-            # Calculate correlation stability (using rolling windows)
-            rolling_corrs = {}
-            for asset in correlations.index[:5]:  # Top 5 to avoid too much computation
-                rolling_corr = self.rolling_correlation(
-                    price_data[target_asset],
-                    price_data[asset],
-                    window=30
-                )
-                if not rolling_corr.empty:
-                    rolling_corrs[asset] = {
-                        "current": rolling_corr.iloc[-1],
-                        "mean": rolling_corr.mean(),
-                        "std": rolling_corr.std(),
-                        "stability": 1 - (rolling_corr.std() / abs(rolling_corr.mean())) if rolling_corr.mean() != 0 else 0
-                    }
+            # Calculate correlation stability for every asset (rolling windows against the target)
+            assets = price_data[correlations.index]
+            target_rolling = rolling_correlation_matrix(
+                np.column_stack([price_data[target_asset].to_numpy(dtype=float), assets.to_numpy(dtype=float)]),
+                window=30,
+                left=np.array([0])
+            )[:, 0, 1:]
+            rolling_frame = pd.DataFrame(target_rolling, index=price_data.index, columns=correlations.index)
+            valid = rolling_frame.notna()
+            stats_frame = pd.DataFrame({
+                "current": rolling_frame.ffill().iloc[-1],
+                "mean": rolling_frame.mean(),
+                "std": rolling_frame.std()
+            })
+            stats_frame["stability"] = np.where(
+                stats_frame["mean"] != 0,
+                1 - stats_frame["std"] / stats_frame["mean"].abs(),
+                0
+            )
+            rolling_corrs = stats_frame[valid.any()].to_dict("index")
 
             result = {
                 "target_asset": target_asset,
@@ -426,6 +663,17 @@ class CorrelationAnalyzer:
                     "negative_correlation_pairs": int(np.sum(upper_triangle < -0.3))
                 }
 
+            # Regimes and breakdowns for every pair from one rolling pass
+            pair_regimes = self.pairwise_regime_summary(price_data, window=window)
+            if not pair_regimes.empty:
+                report["regime_analysis"] = {
+                    "pairs_by_regime": pair_regimes["regime"].value_counts().to_dict(),
+                    "non_normal_pairs": pair_regimes[
+                        pair_regimes["regime"] != "normal_correlation"
+                    ].to_dict("records")
+                }
+                report["breakdown_alerts"] = pair_regimes[pair_regimes["breakdown_detected"]].to_dict("records")
+
             self.logger.info("Generated comprehensive correlation report")
             return report
 
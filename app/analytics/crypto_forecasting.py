@@ -260,16 +260,14 @@ class CryptoForecaster:
             # Simple exponential smoothing
             alpha = 0.3  # Smoothing parameter
 
-            # Calculate smoothed values
-            smoothed = [data.iloc[0]]
-            for i in range(1, len(data)):
-                smoothed.append(alpha * data.iloc[i] + (1 - alpha) * smoothed[-1])
+            # Calculate smoothed values (recursive form of s_t = a*x_t + (1-a)*s_{t-1})
+            smoothed = data.ewm(alpha=alpha, adjust=False).mean().values
 
             # Forecast (constant level)
             forecast = smoothed[-1]
 
             # Estimate uncertainty
-            residuals = data.values - np.array(smoothed)
+            residuals = data.values - smoothed
             std_error = np.std(residuals)
 
             # Confidence interval widens with horizon
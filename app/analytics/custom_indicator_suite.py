@@ -3,11 +3,16 @@
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Hashable, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from app.analytics import indicators
 
 
 @dataclass
@@ -166,10 +171,6 @@ PROFILES: Dict[str, ProfileConfig] = {
 }
 
 
-def _ema(series: pd.Series, span: int) -> pd.Series:
-    return series.ewm(span=span, adjust=False).mean()
-
-
 def _calc_adx_safe(df: pd.DataFrame, length: int) -> pd.Series:
     high = df['High']
     low = df['Low']
@@ -181,11 +182,7 @@ def _calc_adx_safe(df: pd.DataFrame, length: int) -> pd.Series:
     plus_dm = np.where((up > down) & (up > 0), up, 0.0)
     minus_dm = np.where((down > up) & (down > 0), down, 0.0)
 
-    tr = pd.concat([
-        high - low,
-        (high - close.shift()).abs(),
-        (low - close.shift()).abs(),
-    ], axis=1).max(axis=1)
+    tr = indicators.true_range(high, low, close)
 
     atr = tr.ewm(alpha=1 / length, adjust=False).mean()
     atr_safe = atr.replace(0, 1e-9)
@@ -200,60 +197,138 @@ def _calc_adx_safe(df: pd.DataFrame, length: int) -> pd.Series:
     return adx
 
 
-def _calc_atr(df: pd.DataFrame, length: int) -> pd.Series:
-    high = df['High']
-    low = df['Low']
-    close = df['Close']
+def _kernels(df: pd.DataFrame, cache_key: Optional[Hashable]) -> indicators.IndicatorSet:
+    return indicators.indicator_set(df['Close'].astype(float), df['High'], df['Low'], cache_key=cache_key)
 
-    tr = pd.concat([
-        high - low,
-        (high - close.shift()).abs(),
-        (low - close.shift()).abs(),
-    ], axis=1).max(axis=1)
 
-    return tr.ewm(alpha=1 / length, adjust=False).mean()
+IMSE_HORIZONS = ("s", "m", "l")
 
 
-def _calc_rsi(series: pd.Series, length: int) -> pd.Series:
-    delta = series.diff()
-    gain = delta.where(delta > 0, 0).rolling(length).mean()
-    loss = -delta.where(delta < 0, 0).rolling(length).mean()
-    rs = gain / loss.replace(0, np.nan)
-    rsi = 100 - (100 / (1 + rs))
-    return rsi.fillna(50.0)
+@dataclass
+class ImseState:
+    """Features, bar changes and k-NN scores of the bars already scored for one symbol."""
 
+    last_bar: Hashable
+    features: np.ndarray
+    chg: np.ndarray
+    scores: np.ndarray
 
-def _knn_score(features: np.ndarray, chg: np.ndarray, k_in: int, win_in: int, sens: float) -> np.ndarray:
+
+_IMSE_STATE_LIMIT = 512
+_imse_states: "OrderedDict[Tuple[Hashable, Tuple], ImseState]" = OrderedDict()
+_imse_states_lock = threading.Lock()
+
+
+def clear_imse_state() -> None:
+    with _imse_states_lock:
+        _imse_states.clear()
+
+
+def _knn_horizons(params: Dict[str, Any]) -> List[Tuple[int, int, float]]:
+    return [(params[f"k_{h}"], params[f"w_{h}"], params[f"s_{h}"]) for h in IMSE_HORIZONS]
+
+
+def _knn_scores(
+    features: np.ndarray,
+    chg: np.ndarray,
+    horizons: Sequence[Tuple[int, int, float]],
+    first_row: int = 0,
+) -> np.ndarray:
+    """k-NN direction scores for every horizon, shape ``(n, len(horizons))``.
+
+    Bar ``t`` is compared with its previous ``k`` bars: the distance is the
+    summed ``log1p`` absolute feature difference, each neighbour votes its
+    next-bar direction with weight ``1 / (1 + d * sens)``. Lagged differences
+    for all horizons come from one strided view; rows before ``first_row`` or a
+    horizon's warm-up are left at 0.
+    """
     n = len(chg)
-    scores = np.zeros(n)
-    k_eff = max(1, min(k_in, win_in))
-    start = min(n, max(win_in + 50, k_eff + 2))
-
-    for t in range(start, n):
-        score = 0.0
-        wsum = 0.0
-        for i in range(1, k_eff + 1):
-            if t - i < 0:
-                break
-            d = np.log1p(np.abs(features[t] - features[t - i])).sum()
-            y = 1.0 if chg[t - i] > 0 else -1.0
-            w = 1.0 / (1.0 + d * sens)
-            score += y * w
-            wsum += w
-        scores[t] = score / wsum if wsum > 0 else 0.0
+    scores = np.zeros((n, len(horizons)))
+    k_eff = np.array([max(1, min(k, win)) for k, win, _ in horizons])
+    starts = np.array([min(n, max(win + 50, k + 2)) for k, (_, win, _) in zip(k_eff, horizons)])
+    first = max(first_row, int(starts.min()) if len(starts) else n)
+    if first >= n:
+        return scores
+
+    max_lag = int(k_eff.max())
+    padded = np.vstack([np.full((max_lag, features.shape[1]), np.nan), features])
+    # windows[r, :, j] is features[first + r + j - max_lag]; reverse so column i-1 is lag i
+    windows = sliding_window_view(padded, max_lag + 1, axis=0)[first:n, :, max_lag - 1::-1]
+    distance = np.log1p(np.abs(features[first:, :, None] - windows)).sum(axis=1)
+
+    direction = np.concatenate([np.zeros(max_lag), np.where(chg > 0, 1.0, -1.0)])
+    votes = sliding_window_view(direction, max_lag + 1)[first:n, max_lag - 1::-1]
+
+    sens = np.array([sens for _, _, sens in horizons], dtype=float)
+    in_horizon = np.arange(1, max_lag + 1)[None, :] <= k_eff[:, None]
+    with np.errstate(invalid="ignore"):
+        weights = np.where(in_horizon, 1.0 / (1.0 + distance[:, None, :] * sens[None, :, None]), 0.0)
+        horizon_scores = (weights * votes[:, None, :]).sum(axis=2) / weights.sum(axis=2)
+
+    rows = np.arange(first, n)[:, None]
+    scores[first:] = np.where(rows >= starts[None, :], horizon_scores, 0.0)
+    return scores
+
 
+def _knn_score(features: np.ndarray, chg: np.ndarray, k_in: int, win_in: int, sens: float) -> np.ndarray:
+    return _knn_scores(features, chg, [(k_in, win_in, sens)])[:, 0]
+
+
+def _cached_knn_scores(
+    features: np.ndarray,
+    chg: np.ndarray,
+    index: pd.Index,
+    params: Dict[str, Any],
+    cache_key: Optional[Hashable],
+) -> np.ndarray:
+    """k-NN scores that only score bars appended since the cached state for ``cache_key``."""
+    horizons = _knn_horizons(params)
+    if cache_key is None or not len(index):
+        return _knn_scores(features, chg, horizons)
+
+    state_key = (cache_key, tuple(horizons))
+    with _imse_states_lock:
+        state = _imse_states.get(state_key)
+
+    scored = 0
+    if state is not None:
+        cached = len(state.chg)
+        # Scores are causal: rows before the first changed bar keep their cached values
+        if cached <= len(chg) and index[cached - 1] == state.last_bar:
+            same = (features[:cached] == state.features).all(axis=1) & (chg[:cached] == state.chg)
+            scored = cached if same.all() else int(np.argmin(same))
+
+    if state is not None and scored == len(chg):
+        scores = state.scores
+    else:
+        scores = _knn_scores(features, chg, horizons, first_row=scored)
+        if scored:
+            scores[:scored] = state.scores[:scored]
+
+    with _imse_states_lock:
+        _imse_states[state_key] = ImseState(index[-1], features, chg, scores)
+        _imse_states.move_to_end(state_key)
+        while len(_imse_states) > _IMSE_STATE_LIMIT:
+            _imse_states.popitem(last=False)
     return scores
 
 
-def compute_imse(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
+def compute_imse(df: pd.DataFrame, params: Dict[str, Any], cache_key: Optional[Hashable] = None) -> pd.DataFrame:
+    """IMSE score, regime and signals per bar.
+
+    With ``cache_key`` (usually the symbol) the k-NN scores of bars seen on the
+    previous call are reused and only new bars are scored.
+    """
     src = df['Close'].astype(float)
     chg = src.diff().fillna(0.0).to_numpy()
+    kernels = _kernels(df, cache_key)
 
-    rsi = _calc_rsi(src, 14) / 100.0
-    atr = _calc_atr(df, 14)
+    rsi = kernels.rsi(14).fillna(50.0) / 100.0
+    atr = kernels.atr(14)
     atrp = (atr / src.replace(0, np.nan)).fillna(0.0) * 100.0
-    adx = _calc_adx_safe(df, 14) / 100.0
-    trend = (src - _ema(src, 50)) / src.replace(0, np.nan)
+    adx_14 = _calc_adx_safe(df, 14)
+    adx = adx_14 / 100.0
+    trend = (src - kernels.ema(50)) / src.replace(0, np.nan)
     trend = trend.replace([np.inf, -np.inf], 0.0).fillna(0.0)
 
     features = np.vstack([
@@ -263,17 +338,16 @@ def compute_imse(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
         trend.to_numpy(),
     ]).T
 
-    s_sco = _knn_score(features, chg, params["k_s"], params["w_s"], params["s_s"])
-    m_sco = _knn_score(features, chg, params["k_m"], params["w_m"], params["s_m"])
-    l_sco = _knn_score(features, chg, params["k_l"], params["w_l"], params["s_l"])
+    knn = _cached_knn_scores(features, chg, df.index, params, cache_key)
+    s_sco, m_sco, l_sco = knn[:, 0], knn[:, 1], knn[:, 2]
 
     w_sum = max(1e-9, params["wgt_s"] + params["wgt_m"] + params["wgt_l"])
     final_score = (params["wgt_s"] * s_sco + params["wgt_m"] * m_sco + params["wgt_l"] * l_sco) / w_sum
     confidence = np.abs(final_score)
 
     adx_len = params.get("adx_len", 14)
-    adx_raw = _calc_adx_safe(df, adx_len).fillna(0.0)
-    atrp_raw = (atr / src.replace(0, np.nan)).fillna(0.0) * 100.0
+    adx_raw = (adx_14 if adx_len == 14 else _calc_adx_safe(df, adx_len)).fillna(0.0)
+    atrp_raw = atrp
 
     regime = np.where(atrp_raw > params["atrp_high"], "HIGH_VOL", np.where(adx_raw > 20, "TREND", "RANGE"))
     th_eff = np.where(regime == "RANGE", params["base_th"] * 1.5, np.where(regime == "HIGH_VOL", params["base_th"] * 1.2, params["base_th"]))
@@ -281,7 +355,7 @@ def compute_imse(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
     bull = (final_score > th_eff) & (confidence >= params["min_conf"])
     bear = (final_score < -th_eff) & (confidence >= params["min_conf"])
 
-    trend_base = _ema(src, params["trend_len"]) + final_score * _calc_atr(df, 14) * params["trend_scale"]
+    trend_base = kernels.ema(params["trend_len"]) + final_score * atr * params["trend_scale"]
     trend_slope_raw = trend_base - trend_base.shift(params["slope_len"])
     trend_slope = trend_slope_raw.fillna(0.0)
 
@@ -298,7 +372,32 @@ def compute_imse(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
     }, index=df.index)
 
 
-def compute_indicator_bundle(df: pd.DataFrame, profile: ProfileConfig) -> Dict[str, Any]:
+def compute_imse_universe(
+    histories: Dict[str, pd.DataFrame],
+    params: Dict[str, Any],
+    cache_tag: Optional[Hashable] = None,
+) -> pd.DataFrame:
+    """Latest IMSE row per symbol; each symbol keeps incremental k-NN state between calls.
+
+    ``cache_tag`` (e.g. the data source) is paired with the symbol as the cache key.
+    """
+    rows = {}
+    for symbol, df in histories.items():
+        if df is None or df.empty:
+            continue
+        data = df.dropna(subset=["Open", "High", "Low", "Close"])
+        if data.empty:
+            continue
+        cache_key = symbol if cache_tag is None else (symbol, cache_tag)
+        rows[symbol] = compute_imse(data, params, cache_key=cache_key).iloc[-1]
+    return pd.DataFrame.from_dict(rows, orient="index")
+
+
+def compute_indicator_bundle(
+    df: pd.DataFrame,
+    profile: ProfileConfig,
+    cache_key: Optional[Hashable] = None,
+) -> Dict[str, Any]:
     if df.empty:
         return {"error": "No data"}
 
@@ -308,28 +407,22 @@ def compute_indicator_bundle(df: pd.DataFrame, profile: ProfileConfig) -> Dict[s
 
     close = data['Close']
 
-    ema_fast = _ema(close, profile.ema_fast)
-    ema_slow = _ema(close, profile.ema_slow)
-    sma_long = close.rolling(profile.sma_long).mean()
+    kernels = _kernels(data, cache_key)
+    ema_fast = kernels.ema(profile.ema_fast)
+    ema_slow = kernels.ema(profile.ema_slow)
+    sma_long = kernels.sma(profile.sma_long)
 
-    rsi = _calc_rsi(close, profile.rsi_len)
-    atr = _calc_atr(data, profile.atr_len)
+    rsi = kernels.rsi(profile.rsi_len).fillna(50.0)
+    atr = kernels.atr(profile.atr_len)
 
     # MACD
-    ema12 = _ema(close, 12)
-    ema26 = _ema(close, 26)
-    macd = ema12 - ema26
-    macd_signal = _ema(macd, 9)
-    macd_hist = macd - macd_signal
+    macd, macd_signal, macd_hist = kernels.macd(12, 26, 9)
 
     # Bollinger
-    bb_mid = close.rolling(profile.bb_len).mean()
-    bb_std = close.rolling(profile.bb_len).std()
-    bb_upper = bb_mid + bb_std * profile.bb_std
-    bb_lower = bb_mid - bb_std * profile.bb_std
+    bb_upper, bb_mid, bb_lower = kernels.bollinger(profile.bb_len, profile.bb_std)
 
     # IMSE core
-    imse = compute_imse(data, profile.imse)
+    imse = compute_imse(data, profile.imse, cache_key=cache_key)
 
     latest = data.iloc[-1]
     imse_latest = imse.iloc[-1]
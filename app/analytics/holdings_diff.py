@@ -0,0 +1,159 @@
+"""
+Holdings Diff
+=============
+Columnar quarter-over-quarter comparison of two holdings books.
+
+``diff_holdings`` outer-joins the books on a position key. Every numeric
+column comes back as ``<name>_curr`` / ``<name>_prev`` with zeros for
+missing sides, plus a change column. Each label column comes back with its
+two sides and a coalesced value that prefers the current quarter. Actions are
+classified in one ``np.select`` pass over the basis column:
+
+* NEW: held now, not held before
+* SOLD: held before, not held now
+* INCREASED / DECREASED: the basis column moved up or down
+* UNCHANGED: everything else
+
+``issuer_keys`` normalizes issuer names through a process-wide intern table,
+so each distinct issuer is normalized once no matter how many filings name it.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from typing import Dict, Iterable, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+ISSUER_SUFFIXES = frozenset(
+    {
+        "INC",
+        "INCORPORATED",
+        "CORP",
+        "CORPORATION",
+        "CO",
+        "COMPANY",
+        "PLC",
+        "LTD",
+        "LIMITED",
+        "HOLDINGS",
+        "HLDGS",
+        "GROUP",
+        "NV",
+        "SA",
+    }
+)
+SHARE_CLASS_PREFIXES = frozenset({"CLASS", "CL"})
+SHARE_CLASSES = frozenset({"A", "B", "C"})
+ISSUER_KEY_LIMIT = 200_000
+
+ACTIONS = ("NEW", "SOLD", "INCREASED", "DECREASED")
+CHANGE_COLUMNS = {"value_usd": "value_change", "shares": "shares_change", "portfolio_weight": "weight_change"}
+
+_NON_ALNUM = re.compile(r"[^A-Z0-9]+")
+_issuer_keys: Dict[str, str] = {}
+_issuer_keys_lock = threading.Lock()
+
+
+def _normalize(issuer: str) -> str:
+    parts = _NON_ALNUM.sub(" ", issuer.upper()).split()
+    while parts and parts[-1] in ISSUER_SUFFIXES:
+        parts.pop()
+    while len(parts) >= 2 and parts[-2] in SHARE_CLASS_PREFIXES and parts[-1] in SHARE_CLASSES:
+        parts = parts[:-2]
+    return " ".join(parts)
+
+
+def normalize_issuer_key(issuer: object) -> str:
+    """Issuer name without punctuation, corporate suffixes or share-class tails ("Apple Inc." -> "APPLE")."""
+    name = str(issuer or "")
+    key = _issuer_keys.get(name)
+    if key is None:
+        key = _normalize(name)
+        with _issuer_keys_lock:
+            if len(_issuer_keys) >= ISSUER_KEY_LIMIT:
+                _issuer_keys.clear()
+            _issuer_keys[name] = key
+    return key
+
+
+def issuer_keys(issuers: Iterable[object]) -> pd.Series:
+    """Vectorized ``normalize_issuer_key``: each distinct name is looked up once."""
+    values = issuers if isinstance(issuers, pd.Series) else pd.Series(list(issuers), dtype=object)
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    keys = pd.Series(uniques, dtype=object).map(_issuer_keys).to_numpy(dtype=object)
+    missing = pd.isna(keys)
+    if missing.any():
+        keys[missing] = [normalize_issuer_key(name) for name in uniques[missing]]
+    return pd.Series(keys[codes] if len(codes) else keys[:0], index=values.index, dtype=object)
+
+
+def clear_issuer_keys() -> None:
+    with _issuer_keys_lock:
+        _issuer_keys.clear()
+
+
+def classify_changes(current: np.ndarray, previous: np.ndarray) -> np.ndarray:
+    """NEW / SOLD / INCREASED / DECREASED / UNCHANGED for each pair of basis values."""
+    current = np.asarray(current, dtype=float)
+    previous = np.asarray(previous, dtype=float)
+    return np.select(
+        [
+            (previous == 0) & (current > 0),
+            (current == 0) & (previous > 0),
+            current > previous,
+            current < previous,
+        ],
+        ACTIONS,
+        default="UNCHANGED",
+    ).astype(object)
+
+
+def diff_holdings(
+    current: pd.DataFrame | None,
+    previous: pd.DataFrame | None,
+    key: str,
+    numeric: Sequence[str] = ("value_usd", "shares", "portfolio_weight"),
+    labels: Sequence[str] = (),
+    basis: str = "value_usd",
+    change_columns: Mapping[str, str] | None = None,
+) -> pd.DataFrame:
+    """
+    Outer diff of two holdings books keyed by ``key``.
+
+    Args:
+        current: Current quarter holdings (None or empty for no positions)
+        previous: Previous quarter holdings
+        key: Position key column shared by both books
+        numeric: Columns diffed as floats; a missing side counts as 0
+        labels: Text columns; a missing side is "" and the coalesced column prefers current
+        basis: Numeric column that drives the action
+        change_columns: Change column name per numeric column (defaults to ``CHANGE_COLUMNS``)
+
+    Returns:
+        DataFrame with one row per position and an ``action`` column
+    """
+    names = {**CHANGE_COLUMNS, **(change_columns or {})}
+    columns = [key, *numeric, *labels]
+    sides = [
+        frame.reindex(columns=columns) if frame is not None and not frame.empty else pd.DataFrame(columns=columns)
+        for frame in (current, previous)
+    ]
+    merged = sides[0].merge(sides[1], on=key, how="outer", suffixes=("_curr", "_prev"))
+
+    for column in numeric:
+        for suffix in ("_curr", "_prev"):
+            merged[column + suffix] = pd.to_numeric(merged[column + suffix], errors="coerce").fillna(0.0).astype(float)
+        merged[names.get(column, f"{column}_change")] = merged[column + "_curr"] - merged[column + "_prev"]
+
+    for column in labels:
+        current_label = merged[column + "_curr"].fillna("").astype(object)
+        previous_label = merged[column + "_prev"].fillna("").astype(object)
+        merged[column + "_curr"] = current_label
+        merged[column + "_prev"] = previous_label
+        merged[column] = current_label.where(current_label != "", previous_label)
+
+    merged["action"] = classify_changes(merged[basis + "_curr"].to_numpy(), merged[basis + "_prev"].to_numpy())
+    return merged.reset_index(drop=True)
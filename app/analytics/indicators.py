@@ -0,0 +1,287 @@
+"""
+Technical Indicator Kernels
+===========================
+Shared NumPy implementations of the moving averages and oscillators used
+across the analytics modules.
+
+Every kernel accepts a Series (one symbol) or a wide DataFrame (one column per
+symbol) and returns the same shape, so a whole universe is computed in one
+call. Recursive averages run through ``scipy.signal.lfilter`` along the time
+axis; each column starts at its own first valid value, so listings with
+different histories can share a frame.
+
+RSI and ATR follow Wilder: the first average is the simple mean of the first
+``length`` values and later ones use ``avg = avg_prev + (x - avg_prev) / length``.
+
+``indicator_set`` memoizes indicator columns per price-history version, so a
+symbol's indicators are computed once per new bar no matter how many modules
+ask for them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+
+Frame = Union[pd.Series, pd.DataFrame]
+
+INDICATOR_SET_LIMIT = 256
+
+
+def _as_matrix(values: Frame) -> np.ndarray:
+    matrix = np.asarray(values, dtype=float)
+    return matrix[:, None] if matrix.ndim == 1 else matrix
+
+
+def _wrap(matrix: np.ndarray, like: Frame) -> Frame:
+    if isinstance(like, pd.Series):
+        return pd.Series(matrix[:, 0], index=like.index, name=like.name)
+    return pd.DataFrame(matrix, index=like.index, columns=like.columns)
+
+
+def _first_valid(matrix: np.ndarray) -> np.ndarray:
+    """Row of the first finite value per column (``len(matrix)`` when there is none)."""
+    valid = np.isfinite(matrix)
+    return np.where(valid.any(axis=0), valid.argmax(axis=0), len(matrix))
+
+
+def _fill_forward(matrix: np.ndarray) -> np.ndarray:
+    """Carry the last finite value over interior gaps; leading NaNs stay NaN."""
+    valid = np.isfinite(matrix)
+    if valid.all():
+        return matrix
+    rows = np.where(valid, np.arange(len(matrix))[:, None], 0)
+    np.maximum.accumulate(rows, axis=0, out=rows)
+    filled = np.take_along_axis(matrix, rows, axis=0)
+    filled[~valid & (np.cumsum(valid, axis=0) == 0)] = np.nan
+    return filled
+
+
+def _recursive_average(matrix: np.ndarray, alpha: float, seed_row: np.ndarray, seed: np.ndarray) -> np.ndarray:
+    """``y[t] = y[t-1] + alpha * (x[t] - y[t-1])`` from ``seed`` at ``seed_row`` per column; NaN before."""
+    periods, columns = matrix.shape
+    output = np.full((periods, columns), np.nan)
+    if periods == 0:
+        return output
+    rows = np.arange(periods)[:, None]
+    before = rows < seed_row[None, :]
+    held = rows <= seed_row[None, :]
+    # Holding the input at the seed keeps y at the seed through seed_row, so one filter pass serves every column.
+    seeded = np.where(held | ~np.isfinite(matrix), np.nan, matrix)
+    seeded[held] = np.broadcast_to(seed, (periods, columns))[held]
+    seeded = _fill_forward(seeded)
+    live = np.isfinite(seed)
+    if not live.any():
+        return output
+    start = np.nan_to_num(seeded[0, live])
+    filtered, _ = lfilter([alpha], [1.0, alpha - 1.0], np.nan_to_num(seeded[:, live]), axis=0, zi=((1 - alpha) * start)[None, :])
+    output[:, live] = filtered
+    output[before] = np.nan
+    return output
+
+
+def _ema_matrix(matrix: np.ndarray, span: int) -> np.ndarray:
+    first = _first_valid(matrix)
+    seed = np.full(matrix.shape[1], np.nan)
+    has_data = first < len(matrix)
+    seed[has_data] = matrix[first[has_data], np.flatnonzero(has_data)]
+    return _recursive_average(matrix, 2.0 / (span + 1.0), first, seed)
+
+
+def _wilder_matrix(matrix: np.ndarray, length: int) -> np.ndarray:
+    periods = len(matrix)
+    first = _first_valid(matrix)
+    seed_row = first + length - 1
+    seed = np.full(matrix.shape[1], np.nan)
+    ready = seed_row < periods
+    if ready.any():
+        filled = np.nan_to_num(_fill_forward(matrix))
+        totals = np.vstack([np.zeros((1, matrix.shape[1])), np.cumsum(filled, axis=0)])
+        cols = np.flatnonzero(ready)
+        seed[cols] = (totals[seed_row[cols] + 1, cols] - totals[first[cols], cols]) / length
+    return _recursive_average(matrix, 1.0 / length, seed_row, seed)
+
+
+def _rolling_mean_matrix(matrix: np.ndarray, length: int) -> np.ndarray:
+    """Trailing mean, NaN unless all ``length`` values are present (pandas ``rolling(length).mean()``)."""
+    periods = len(matrix)
+    output = np.full(matrix.shape, np.nan)
+    if periods < length or length < 1:
+        return output
+    valid = np.isfinite(matrix)
+    center = np.nanmean(np.where(valid, matrix, np.nan), axis=0) if valid.any() else np.zeros(matrix.shape[1])
+    center = np.nan_to_num(center)
+    centered = np.where(valid, matrix - center, 0.0)
+    totals = np.cumsum(np.vstack([np.zeros((1, matrix.shape[1])), centered]), axis=0)
+    counts = np.cumsum(np.vstack([np.zeros((1, matrix.shape[1])), valid]), axis=0)
+    window_sum = totals[length:] - totals[:-length]
+    window_count = counts[length:] - counts[:-length]
+    output[length - 1:] = np.where(window_count == length, window_sum / length + center, np.nan)
+    return output
+
+
+def ema(values: Frame, span: int) -> Frame:
+    """Exponential moving average, ``alpha = 2 / (span + 1)``, seeded with the first value.
+
+    Matches ``ewm(span=span, adjust=False).mean()`` on gap-free series.
+    """
+    return _wrap(_ema_matrix(_as_matrix(values), span), values)
+
+
+def wilder_average(values: Frame, length: int) -> Frame:
+    """Wilder's smoothed average (RMA), seeded with the simple mean of the first ``length`` values."""
+    return _wrap(_wilder_matrix(_as_matrix(values), length), values)
+
+
+def sma(values: Frame, length: int) -> Frame:
+    """Simple moving average over complete windows."""
+    return _wrap(_rolling_mean_matrix(_as_matrix(values), length), values)
+
+
+def rsi(close: Frame, length: int = 14) -> Frame:
+    """Wilder RSI. NaN during warm-up; 100 when there are no losses, 50 for a flat window."""
+    prices = _as_matrix(close)
+    deltas = np.full(prices.shape, np.nan)
+    deltas[1:] = np.diff(prices, axis=0)
+    gains = np.where(deltas > 0, deltas, np.where(np.isnan(deltas), np.nan, 0.0))
+    losses = np.where(deltas < 0, -deltas, np.where(np.isnan(deltas), np.nan, 0.0))
+    avg_gain = _wilder_matrix(gains, length)
+    avg_loss = _wilder_matrix(losses, length)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    values = np.where(avg_loss == 0, np.where(avg_gain > 0, 100.0, 50.0), values)
+    values[np.isnan(avg_gain) | np.isnan(avg_loss)] = np.nan
+    return _wrap(values, close)
+
+
+def macd(close: Frame, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[Frame, Frame, Frame]:
+    """MACD line, signal line and histogram from EMAs of ``fast``/``slow`` spans."""
+    prices = _as_matrix(close)
+    line = _ema_matrix(prices, fast) - _ema_matrix(prices, slow)
+    signal_line = _ema_matrix(line, signal)
+    return _wrap(line, close), _wrap(signal_line, close), _wrap(line - signal_line, close)
+
+
+def true_range(high: Frame, low: Frame, close: Frame) -> Frame:
+    """Greatest of high-low and the gaps from the previous close; the first bar is high-low."""
+    highs, lows, closes = _as_matrix(high), _as_matrix(low), _as_matrix(close)
+    previous = np.vstack([np.full((1, closes.shape[1]), np.nan), closes[:-1]])
+    spread = highs - lows
+    # fmax skips the missing previous close on the first bar
+    ranges = np.fmax(spread, np.fmax(np.abs(highs - previous), np.abs(lows - previous)))
+    ranges[np.isnan(spread)] = np.nan
+    return _wrap(ranges, close)
+
+
+def atr(high: Frame, low: Frame, close: Frame, length: int = 14) -> Frame:
+    """Wilder average true range."""
+    return _wrap(_wilder_matrix(_as_matrix(true_range(high, low, close)), length), close)
+
+
+def bollinger(close: Frame, length: int = 20, num_std: float = 2.0) -> Tuple[Frame, Frame, Frame]:
+    """Upper, middle and lower bands from the rolling mean and sample std."""
+    prices = _as_matrix(close)
+    middle = _rolling_mean_matrix(prices, length)
+    # Center before squaring so the windowed variance does not cancel catastrophically
+    center = np.nan_to_num(np.nanmean(prices, axis=0)) if np.isfinite(prices).any() else 0.0
+    mean_square = _rolling_mean_matrix((prices - center) ** 2, length)
+    variance = np.maximum(mean_square - (middle - center) ** 2, 0.0) * length / max(length - 1, 1)
+    width = np.sqrt(variance) * num_std
+    return _wrap(middle + width, close), _wrap(middle, close), _wrap(middle - width, close)
+
+
+def history_version(close: Frame) -> Tuple:
+    """Identity of a price history: length, first and last bar, and a digest of every price.
+
+    Hashing the whole array keeps adjusted and unadjusted histories of the same
+    dates apart, since a split or dividend adjustment rewrites the earlier bars only.
+    """
+    if len(close) == 0:
+        return (0,)
+    prices = np.ascontiguousarray(close.to_numpy(dtype=float))
+    digest = hashlib.blake2b(prices.tobytes(), digest_size=16).hexdigest()
+    return (len(close), close.index[0], close.index[-1], digest)
+
+
+class IndicatorSet:
+    """Indicator columns of one price history, each computed on first use."""
+
+    def __init__(self, close: Frame, high: Optional[Frame] = None, low: Optional[Frame] = None) -> None:
+        self.close = close
+        self.high = high
+        self.low = low
+        self._columns: Dict[Tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key: Tuple, build):
+        with self._lock:
+            if key in self._columns:
+                return self._columns[key]
+        value = build()
+        with self._lock:
+            return self._columns.setdefault(key, value)
+
+    def ema(self, span: int) -> Frame:
+        return self._get(("ema", span), lambda: ema(self.close, span))
+
+    def sma(self, length: int) -> Frame:
+        return self._get(("sma", length), lambda: sma(self.close, length))
+
+    def rsi(self, length: int = 14) -> Frame:
+        return self._get(("rsi", length), lambda: rsi(self.close, length))
+
+    def macd(self, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[Frame, Frame, Frame]:
+        def build():
+            line = self.ema(fast) - self.ema(slow)
+            signal_line = ema(line, signal)
+            return line, signal_line, line - signal_line
+
+        return self._get(("macd", fast, slow, signal), build)
+
+    def true_range(self) -> Frame:
+        return self._get(("true_range",), lambda: true_range(self.high, self.low, self.close))
+
+    def atr(self, length: int = 14) -> Frame:
+        return self._get(("atr", length), lambda: wilder_average(self.true_range(), length))
+
+    def bollinger(self, length: int = 20, num_std: float = 2.0) -> Tuple[Frame, Frame, Frame]:
+        return self._get(("bollinger", length, num_std), lambda: bollinger(self.close, length, num_std))
+
+
+_indicator_sets: "OrderedDict[Tuple, IndicatorSet]" = OrderedDict()
+_indicator_sets_lock = threading.Lock()
+
+
+def indicator_set(
+    close: Frame,
+    high: Optional[Frame] = None,
+    low: Optional[Frame] = None,
+    cache_key: Optional[Hashable] = None,
+) -> IndicatorSet:
+    """Indicator set for a price history; with ``cache_key`` it is shared until a new bar arrives."""
+    if cache_key is None:
+        return IndicatorSet(close, high, low)
+    key = (cache_key, history_version(close))
+    with _indicator_sets_lock:
+        cached = _indicator_sets.get(key)
+        if cached is not None:
+            _indicator_sets.move_to_end(key)
+            if cached.high is None and high is not None:
+                # A close-only caller got there first; later range indicators still need the bars.
+                cached.high, cached.low = high, low
+            return cached
+        created = _indicator_sets[key] = IndicatorSet(close, high, low)
+        while len(_indicator_sets) > INDICATOR_SET_LIMIT:
+            _indicator_sets.popitem(last=False)
+        return created
+
+
+def clear_indicator_cache() -> None:
+    with _indicator_sets_lock:
+        _indicator_sets.clear()
@@ -7,6 +7,9 @@ import pandas as pd
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
 import warnings
+
+from app.analytics import indicators
+
 warnings.filterwarnings('ignore')
 
 # Try to import TensorFlow, provide fallback for demo
@@ -40,17 +43,18 @@ class NeuralNetworkAnalyzer:
         self.tensorflow_available = TENSORFLOW_AVAILABLE
         self.sklearn_available = SKLEARN_AVAILABLE
 
-    def prepare_data(self, data: pd.DataFrame, target_column: str = 'Close') -> tuple:
-        """Prepare data for neural network training"""
+    def prepare_data(self, data: pd.DataFrame, target_column: str = 'Close', symbol: Optional[str] = None) -> tuple:
+        """Prepare data for neural network training; ``symbol`` shares its indicators with other modules"""
 
         # Feature engineering
         df = data.copy()
 
         # Technical indicators as features
-        df['SMA_20'] = df['Close'].rolling(window=20).mean()
-        df['SMA_50'] = df['Close'].rolling(window=50).mean()
-        df['RSI'] = self._calculate_rsi(df['Close'])
-        df['MACD'] = self._calculate_macd(df['Close'])
+        kernels = indicators.indicator_set(df['Close'], cache_key=symbol)
+        df['SMA_20'] = kernels.sma(20)
+        df['SMA_50'] = kernels.sma(50)
+        df['RSI'] = kernels.rsi(14)
+        df['MACD'] = kernels.macd()[0]
         df['Volatility'] = df['Close'].rolling(window=20).std()
         df['Price_Change'] = df['Close'].pct_change()
         df['Volume_MA'] = df['Volume'].rolling(window=20).mean()
@@ -352,17 +356,11 @@ class NeuralNetworkAnalyzer:
 
     def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
         """Calculate RSI indicator"""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        return 100 - (100 / (1 + rs))
+        return indicators.rsi(prices, period)
 
     def _calculate_macd(self, prices: pd.Series, fast: int = 12, slow: int = 26) -> pd.Series:
         """Calculate MACD indicator"""
-        ema_fast = prices.ewm(span=fast).mean()
-        ema_slow = prices.ewm(span=slow).mean()
-        return ema_fast - ema_slow
+        return indicators.ema(prices, fast) - indicators.ema(prices, slow)
 
     def backtest_models(self, data: pd.DataFrame, test_size: int = 60) -> Dict:
         """Backtest neural network models"""
@@ -577,7 +575,7 @@ def run_comprehensive_analysis(symbol: str, data: pd.DataFrame) -> Dict:
 
     try:
         # Train models
-        X, y = nn_analyzer.prepare_data(data)
+        X, y = nn_analyzer.prepare_data(data, symbol=symbol)
         if len(X) == 0:
             return {'error': 'Insufficient data for analysis'}
 
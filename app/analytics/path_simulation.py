@@ -0,0 +1,110 @@
+"""
+Monte Carlo Price Path Simulation
+=================================
+Vectorized random-walk price paths shared by the forecasting tools.
+
+Each step compounds a normal daily return, ``price_t = price_{t-1} * (1 + r_t)``
+with ``r_t ~ N(mean_return, std_return)``. All shocks for a block of days are
+drawn in one call and compounded with a cumulative product.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+# Upper bound on floats held at once by the quantile-only mode (~16 MB of float64).
+DEFAULT_MAX_CELLS = 2_000_000
+
+
+def _rng(seed: Optional[int | np.random.Generator]) -> np.random.Generator:
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed)
+
+
+def _draw_returns(
+    rng: np.random.Generator,
+    mean_return: float,
+    std_return: float,
+    shape: Tuple[int, int],
+    antithetic: bool,
+) -> np.ndarray:
+    simulations, days = shape
+    if not antithetic:
+        return rng.normal(mean_return, std_return, size=shape)
+    half = (simulations + 1) // 2
+    shocks = rng.standard_normal(size=(half, days))
+    shocks = np.concatenate([shocks, -shocks])[:simulations]
+    return mean_return + std_return * shocks
+
+
+def simulate_price_paths(
+    start_price: float,
+    mean_return: float,
+    std_return: float,
+    days: int,
+    simulations: int = 1000,
+    seed: Optional[int | np.random.Generator] = None,
+    antithetic: bool = False,
+) -> np.ndarray:
+    """Return a ``(simulations, days)`` matrix of simulated prices after ``start_price``.
+
+    Args:
+        start_price: Price the paths start from (not included in the output)
+        mean_return: Mean simple daily return
+        std_return: Standard deviation of daily returns
+        days: Number of future steps
+        simulations: Number of paths
+        seed: Seed or Generator for reproducible paths
+        antithetic: Pair every shock with its mirror image to reduce variance
+    """
+    if days <= 0 or simulations <= 0:
+        return np.empty((max(simulations, 0), max(days, 0)))
+    returns = _draw_returns(_rng(seed), mean_return, std_return, (simulations, days), antithetic)
+    np.add(returns, 1.0, out=returns)
+    np.cumprod(returns, axis=1, out=returns)
+    returns *= start_price
+    return returns
+
+
+def simulate_price_quantiles(
+    start_price: float,
+    mean_return: float,
+    std_return: float,
+    days: int,
+    simulations: int = 1000,
+    quantiles: Iterable[float] = (5, 50, 95),
+    seed: Optional[int | np.random.Generator] = None,
+    antithetic: bool = False,
+    max_cells: int = DEFAULT_MAX_CELLS,
+) -> Dict[float, np.ndarray]:
+    """Per-day percentiles of the simulated paths without holding the full path matrix.
+
+    Days are simulated in blocks sized so that at most ``max_cells`` prices are
+    in memory; each block continues from the last prices of the previous one,
+    so the percentiles are exact.
+
+    Returns:
+        Mapping of percentile (0-100) to an array of length ``days``
+    """
+    levels = [float(q) for q in quantiles]
+    output = {level: np.empty(max(days, 0)) for level in levels}
+    if days <= 0 or simulations <= 0:
+        return output
+
+    rng = _rng(seed)
+    block_days = max(1, min(days, max_cells // simulations))
+    current = np.full(simulations, float(start_price))
+    for offset in range(0, days, block_days):
+        width = min(block_days, days - offset)
+        block = _draw_returns(rng, mean_return, std_return, (simulations, width), antithetic)
+        np.add(block, 1.0, out=block)
+        np.cumprod(block, axis=1, out=block)
+        block *= current[:, None]
+        values = np.percentile(block, levels, axis=0)
+        for row, level in zip(values, levels):
+            output[level][offset : offset + width] = row
+        current = block[:, -1].copy()
+    return output
@@ -1,12 +1,26 @@
 from __future__ import annotations
 
+import multiprocessing
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import timedelta
-from typing import Any, Dict, Optional, Tuple
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 import yfinance as yf
 
+from app.analytics.indicators import indicator_set
+from app.analytics.path_simulation import simulate_price_quantiles
+from app.analytics.walk_forward import WalkForwardBacktester, cached_summary
+from app.core.config import settings
+from app.utils.logger import get_logger
+
 try:
     from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
     from sklearn.linear_model import LinearRegression
@@ -21,12 +35,203 @@ try:
 except ImportError:
     HAS_STATSMODELS = False
 
+logger = get_logger(__name__)
+
+RF_FEATURES = ["SMA_20", "SMA_50", "RSI", "MACD", "Volume_SMA", "Momentum", "ROC"]
+GB_FEATURES = ["SMA_20", "SMA_50", "RSI", "MACD", "Volume_SMA", "Momentum"]
+ARIMA_ORDER: Tuple[int, int, int] = (5, 1, 0)
+MONTE_CARLO_QUANTILES = (5, 25, 50, 75, 95)
+
+
+# Fit functions live at module level so they can be shipped to worker processes.
+# Each returns a small picklable dict that the engine turns into a forecast for any horizon.
+
+def _fit_linear_regression(close: np.ndarray) -> Dict[str, Any]:
+    days = np.arange(len(close)).reshape(-1, 1)
+    train_size = int(len(close) * 0.8)
+    model = LinearRegression()
+    model.fit(days[:train_size], close[:train_size])
+    test_pred = model.predict(days[train_size:])
+    y_test = close[train_size:]
+    return {
+        "model": model,
+        "last_day": len(close) - 1,
+        "metrics": {
+            "RMSE": np.sqrt(mean_squared_error(y_test, test_pred)),
+            "MAE": mean_absolute_error(y_test, test_pred),
+            "R²": r2_score(y_test, test_pred),
+        },
+    }
+
+
+def _fit_feature_regressor(kind: str, X: np.ndarray, y: np.ndarray) -> Dict[str, Any]:
+    train_size = int(len(X) * 0.8)
+    if kind == "random_forest":
+        # Parallelism comes from fitting models side by side, so keep each fit single-threaded.
+        model = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=1)
+    else:
+        model = GradientBoostingRegressor(n_estimators=100, learning_rate=0.1, max_depth=5, random_state=42)
+    model.fit(X[:train_size], y[:train_size])
+    test_pred = model.predict(X[train_size:])
+    y_test = y[train_size:]
+    return {
+        "model": model,
+        "last_features": X[-1].reshape(1, -1),
+        "metrics": {
+            "RMSE": np.sqrt(mean_squared_error(y_test, test_pred)),
+            "MAE": mean_absolute_error(y_test, test_pred),
+            "R²": r2_score(y_test, test_pred),
+        },
+    }
+
+
+def _fit_arima(prices: np.ndarray, order: Tuple[int, int, int]) -> Dict[str, Any]:
+    train_size = int(len(prices) * 0.8)
+    train, test = prices[:train_size], prices[train_size:]
+    test_pred = ARIMA(train, order=order).fit().forecast(steps=len(test))
+    fitted_full = ARIMA(prices, order=order).fit()
+    return {
+        "model": fitted_full,
+        "order": order,
+        "metrics": {
+            "RMSE": np.sqrt(mean_squared_error(test, test_pred)),
+            "MAE": mean_absolute_error(test, test_pred),
+            "AIC": fitted_full.aic,
+        },
+    }
+
+
+def _fit_monte_carlo(close: np.ndarray) -> Dict[str, Any]:
+    returns = pd.Series(close).pct_change().dropna()
+    return {
+        "mean_return": returns.mean(),
+        "std_return": returns.std(),
+        "last_price": float(close[-1]),
+    }
+
+
+class FittedModelCache:
+    """Fitted models per symbol, keyed by the last bar they were trained on.
+
+    A bounded in-process LRU sits in front of one pickle per symbol on disk, so
+    other workers and restarts reuse fits until a new bar arrives.
+    """
+
+    def __init__(self, directory: str | Path | None = None, max_entries: int = 64) -> None:
+        if directory is None:
+            root = Path(__file__).resolve().parents[2]
+            directory = root / settings.PUBLIC_SNAPSHOT_DIR / "models"
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+
+    def _path(self, symbol: str, period: str) -> Path:
+        safe = "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in f"{symbol}-{period}")
+        return self.directory / f"{safe}.pkl"
+
+    def key_lock(self, key: Tuple[str, str, str]) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def get(self, key: Tuple[str, str, str]) -> Dict[str, Any]:
+        with self._lock:
+            fits = self._entries.get(key)
+            if fits is not None:
+                self._entries.move_to_end(key)
+                return dict(fits)
+        symbol, period, last_bar = key
+        try:
+            with self._path(symbol, period).open("rb") as handle:
+                stored = pickle.load(handle)
+        except Exception:
+            return {}
+        if not isinstance(stored, dict) or stored.get("last_bar") != last_bar:
+            return {}
+        fits = dict(stored.get("fits") or {})
+        self._remember(key, fits)
+        return dict(fits)
+
+    def put(self, key: Tuple[str, str, str], fits: Dict[str, Any]) -> None:
+        self._remember(key, fits)
+        symbol, period, last_bar = key
+        path = self._path(symbol, period)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with temp_path.open("wb") as handle:
+                pickle.dump({"last_bar": last_bar, "fits": fits}, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            temp_path.replace(path)
+        except Exception as exc:
+            logger.warning("Could not persist fitted forecast models", symbol=symbol, error=str(exc))
+
+    def _remember(self, key: Tuple[str, str, str], fits: Dict[str, Any]) -> None:
+        with self._lock:
+            # A newer bar makes older fits for the same symbol unreachable.
+            for stale in [item for item in self._entries if item[:2] == key[:2] and item != key]:
+                self._entries.pop(stale, None)
+                self._key_locks.pop(stale, None)
+            self._entries[key] = dict(fits)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._key_locks.pop(evicted, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._key_locks.clear()
+
+
+_model_cache: FittedModelCache | None = None
+_fit_executor: Executor | None = None
+_shared_lock = threading.Lock()
+
+
+def get_model_cache() -> FittedModelCache:
+    global _model_cache
+    with _shared_lock:
+        if _model_cache is None:
+            _model_cache = FittedModelCache()
+        return _model_cache
+
+
+def _get_fit_executor() -> Executor | None:
+    global _fit_executor
+    workers = settings.PUBLIC_FORECAST_FIT_WORKERS
+    if workers <= 1:
+        return None
+    with _shared_lock:
+        if _fit_executor is None:
+            try:
+                # spawn keeps workers independent of the server's threads and open sockets.
+                _fit_executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            except Exception as exc:
+                logger.warning("Forecast fit pool unavailable; fitting in-process", error=str(exc))
+                return None
+        return _fit_executor
+
+
+def _reset_fit_executor() -> None:
+    global _fit_executor
+    with _shared_lock:
+        executor, _fit_executor = _fit_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
 
 class PublicPricePredictionEngine:
-    def __init__(self, symbol: str, period: str = "2y"):
+    def __init__(self, symbol: str, period: str = "2y", model_cache: FittedModelCache | None = None):
         self.symbol = symbol.upper()
         self.period = period
         self.data: pd.DataFrame | None = None
+        self.model_cache = model_cache
+        self._fits: Dict[str, Dict[str, Any]] = {}
+        self._fits_key: Tuple[str, str, str] | None = None
 
     def fetch_data(self) -> bool:
         try:
@@ -41,152 +246,214 @@ class PublicPricePredictionEngine:
 
     def _add_technical_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         enriched = df.copy()
-        enriched["SMA_20"] = enriched["Close"].rolling(window=20).mean()
-        enriched["SMA_50"] = enriched["Close"].rolling(window=50).mean()
-        enriched["EMA_12"] = enriched["Close"].ewm(span=12, adjust=False).mean()
-        enriched["EMA_26"] = enriched["Close"].ewm(span=26, adjust=False).mean()
-        enriched["MACD"] = enriched["EMA_12"] - enriched["EMA_26"]
-        delta = enriched["Close"].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        enriched["RSI"] = 100 - (100 / (1 + rs))
+        kernels = indicator_set(enriched["Close"], cache_key=self.symbol)
+        enriched["SMA_20"] = kernels.sma(20)
+        enriched["SMA_50"] = kernels.sma(50)
+        enriched["EMA_12"] = kernels.ema(12)
+        enriched["EMA_26"] = kernels.ema(26)
+        enriched["MACD"] = kernels.macd()[0]
+        enriched["RSI"] = kernels.rsi(14)
         enriched["Volume_SMA"] = enriched["Volume"].rolling(window=20).mean()
         enriched["Momentum"] = enriched["Close"] - enriched["Close"].shift(10)
         enriched["ROC"] = ((enriched["Close"] - enriched["Close"].shift(10)) / enriched["Close"].shift(10)) * 100
         return enriched.dropna()
 
+    def _cache_key(self) -> Tuple[str, str, str] | None:
+        if self.data is None or self.data.empty:
+            return None
+        return (self.symbol, self.period, pd.Timestamp(self.data.index[-1]).isoformat())
+
+    def _fit_specs(self) -> Dict[str, Tuple[Callable[..., Dict[str, Any]], tuple, bool]]:
+        """Model name -> (fit function, args, heavy). Heavy fits go to the process pool."""
+        if self.data is None or self.data.empty:
+            return {}
+        close = self.data["Close"].to_numpy(dtype=float)
+        specs: Dict[str, Tuple[Callable[..., Dict[str, Any]], tuple, bool]] = {}
+        if HAS_SKLEARN:
+            specs["Linear Regression"] = (_fit_linear_regression, (close,), False)
+            for name, kind, columns in (
+                ("Random Forest", "random_forest", RF_FEATURES),
+                ("Gradient Boosting", "gradient_boosting", GB_FEATURES),
+            ):
+                features = [column for column in columns if column in self.data.columns]
+                if features:
+                    X = self.data[features].to_numpy(dtype=float)
+                    specs[name] = (_fit_feature_regressor, (kind, X, close), True)
+        if HAS_STATSMODELS:
+            specs["ARIMA"] = (_fit_arima, (close, ARIMA_ORDER), True)
+        specs["Monte Carlo"] = (_fit_monte_carlo, (close,), False)
+        return specs
+
+    def _run_fits(self, specs: Dict[str, Tuple[Callable[..., Dict[str, Any]], tuple, bool]]) -> Dict[str, Dict[str, Any]]:
+        fits: Dict[str, Dict[str, Any]] = {}
+        futures = {}
+        executor = _get_fit_executor() if sum(1 for *_, heavy in specs.values() if heavy) > 1 else None
+        if executor is not None:
+            try:
+                futures = {name: executor.submit(fn, *args) for name, (fn, args, heavy) in specs.items() if heavy}
+            except Exception as exc:
+                logger.warning("Forecast fit pool rejected work; fitting in-process", error=str(exc))
+                _reset_fit_executor()
+                futures = {}
+        for name, (fn, args, _heavy) in specs.items():
+            if name in futures:
+                continue
+            try:
+                fits[name] = fn(*args)
+            except Exception:
+                continue
+        for name, future in futures.items():
+            try:
+                fits[name] = future.result()
+            except BrokenProcessPool:
+                _reset_fit_executor()
+                fn, args, _heavy = specs[name]
+                try:
+                    fits[name] = fn(*args)
+                except Exception:
+                    continue
+            except Exception:
+                continue
+        return fits
+
+    def fit_models(self, names: Optional[list[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Fit (or load) the models for the current bars; refits only when a new bar arrives."""
+        key = self._cache_key()
+        if key is None:
+            return {}
+        if self._fits_key != key:
+            self._fits, self._fits_key = {}, key
+        specs = self._fit_specs()
+        wanted = [name for name in (names or list(specs)) if name in specs]
+        cache = self.model_cache or (get_model_cache() if settings.PUBLIC_FORECAST_MODEL_CACHE else None)
+        if cache is None:
+            missing = [name for name in wanted if name not in self._fits]
+            self._fits.update(self._run_fits({name: specs[name] for name in missing}))
+            return {name: self._fits[name] for name in wanted if name in self._fits}
+
+        with cache.key_lock(key):
+            fits = cache.get(key)
+            missing = [name for name in wanted if name not in fits]
+            if missing:
+                fits.update(self._run_fits({name: specs[name] for name in missing}))
+                cache.put(key, fits)
+            self._fits.update(fits)
+        return {name: self._fits[name] for name in wanted if name in self._fits}
+
+    def _fitted(self, name: str) -> Optional[Dict[str, Any]]:
+        if self.data is None:
+            return None
+        return self.fit_models([name]).get(name)
+
+    def _future_dates(self, days: int) -> pd.DatetimeIndex:
+        return pd.date_range(start=self.data.index[-1] + timedelta(days=1), periods=days)
+
     def linear_regression_prediction(self, days: int = 30) -> Optional[Dict[str, Any]]:
-        if not HAS_SKLEARN or self.data is None:
+        fit = self._fitted("Linear Regression")
+        if fit is None:
             return None
-        df = self.data.copy()
-        df["Days"] = np.arange(len(df))
-        train_size = int(len(df) * 0.8)
-        train = df[:train_size]
-        test = df[train_size:]
-        model = LinearRegression()
-        model.fit(train[["Days"]].values, train["Close"].values)
-        test_pred = model.predict(test[["Days"]].values)
-        mse = mean_squared_error(test["Close"].values, test_pred)
-        mae = mean_absolute_error(test["Close"].values, test_pred)
-        r2 = r2_score(test["Close"].values, test_pred)
-        last_day = int(df["Days"].iloc[-1])
+        last_day = fit["last_day"]
         future_days = np.arange(last_day + 1, last_day + days + 1).reshape(-1, 1)
-        future_pred = model.predict(future_days)
-        future_dates = pd.date_range(start=df.index[-1] + timedelta(days=1), periods=days)
         return {
             "model_name": "Linear Regression",
-            "predictions": future_pred,
-            "dates": future_dates,
-            "metrics": {"RMSE": np.sqrt(mse), "MAE": mae, "R²": r2},
+            "predictions": fit["model"].predict(future_days),
+            "dates": self._future_dates(days),
+            "metrics": dict(fit["metrics"]),
         }
 
-    def random_forest_prediction(self, days: int = 30) -> Optional[Dict[str, Any]]:
-        if not HAS_SKLEARN or self.data is None:
-            return None
-        df = self.data.copy()
-        features = [column for column in ["SMA_20", "SMA_50", "RSI", "MACD", "Volume_SMA", "Momentum", "ROC"] if column in df.columns]
-        if not features:
+    def _feature_regressor_prediction(self, name: str, days: int) -> Optional[Dict[str, Any]]:
+        fit = self._fitted(name)
+        if fit is None:
             return None
-        X = df[features].values
-        y = df["Close"].values
-        train_size = int(len(df) * 0.8)
-        X_train, X_test = X[:train_size], X[train_size:]
-        y_train, y_test = y[:train_size], y[train_size:]
-        model = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=-1)
-        model.fit(X_train, y_train)
-        test_pred = model.predict(X_test)
-        mse = mean_squared_error(y_test, test_pred)
-        mae = mean_absolute_error(y_test, test_pred)
-        r2 = r2_score(y_test, test_pred)
-        last_features = X[-1].reshape(1, -1)
-        future_pred = []
-        for _ in range(days):
-            prediction = float(model.predict(last_features)[0])
-            future_pred.append(prediction)
-        future_dates = pd.date_range(start=df.index[-1] + timedelta(days=1), periods=days)
+        # Features are not rolled forward, so every step repeats the next-bar estimate.
+        prediction = float(fit["model"].predict(fit["last_features"])[0])
         return {
-            "model_name": "Random Forest",
-            "predictions": np.array(future_pred),
-            "dates": future_dates,
-            "metrics": {"RMSE": np.sqrt(mse), "MAE": mae, "R²": r2},
+            "model_name": name,
+            "predictions": np.full(days, prediction),
+            "dates": self._future_dates(days),
+            "metrics": dict(fit["metrics"]),
         }
 
+    def random_forest_prediction(self, days: int = 30) -> Optional[Dict[str, Any]]:
+        return self._feature_regressor_prediction("Random Forest", days)
+
     def gradient_boosting_prediction(self, days: int = 30) -> Optional[Dict[str, Any]]:
-        if not HAS_SKLEARN or self.data is None:
-            return None
-        df = self.data.copy()
-        features = [column for column in ["SMA_20", "SMA_50", "RSI", "MACD", "Volume_SMA", "Momentum"] if column in df.columns]
-        if not features:
-            return None
-        X = df[features].values
-        y = df["Close"].values
-        train_size = int(len(df) * 0.8)
-        X_train, X_test = X[:train_size], X[train_size:]
-        y_train, y_test = y[:train_size], y[train_size:]
-        model = GradientBoostingRegressor(n_estimators=100, learning_rate=0.1, max_depth=5, random_state=42)
-        model.fit(X_train, y_train)
-        test_pred = model.predict(X_test)
-        mse = mean_squared_error(y_test, test_pred)
-        mae = mean_absolute_error(y_test, test_pred)
-        r2 = r2_score(y_test, test_pred)
-        last_features = X[-1].reshape(1, -1)
-        future_pred = []
-        for _ in range(days):
-            prediction = float(model.predict(last_features)[0])
-            future_pred.append(prediction)
-        future_dates = pd.date_range(start=df.index[-1] + timedelta(days=1), periods=days)
-        return {
-            "model_name": "Gradient Boosting",
-            "predictions": np.array(future_pred),
-            "dates": future_dates,
-            "metrics": {"RMSE": np.sqrt(mse), "MAE": mae, "R²": r2},
-        }
+        return self._feature_regressor_prediction("Gradient Boosting", days)
 
-    def arima_prediction(self, days: int = 30, order: Tuple[int, int, int] = (5, 1, 0)) -> Optional[Dict[str, Any]]:
+    def arima_prediction(self, days: int = 30, order: Tuple[int, int, int] = ARIMA_ORDER) -> Optional[Dict[str, Any]]:
         if not HAS_STATSMODELS or self.data is None:
             return None
-        prices = self.data["Close"].values
-        train_size = int(len(prices) * 0.8)
-        train, test = prices[:train_size], prices[train_size:]
-        fitted_model = ARIMA(train, order=order).fit()
-        test_pred = fitted_model.forecast(steps=len(test))
-        mse = mean_squared_error(test, test_pred)
-        mae = mean_absolute_error(test, test_pred)
-        fitted_full = ARIMA(prices, order=order).fit()
-        future_pred = fitted_full.forecast(steps=days)
-        future_dates = pd.date_range(start=self.data.index[-1] + timedelta(days=1), periods=days)
+        if order == ARIMA_ORDER:
+            fit = self._fitted("ARIMA")
+        else:
+            fit = _fit_arima(self.data["Close"].to_numpy(dtype=float), order)
+        if fit is None:
+            return None
         return {
             "model_name": f"ARIMA{order}",
-            "predictions": future_pred,
-            "dates": future_dates,
-            "metrics": {"RMSE": np.sqrt(mse), "MAE": mae, "AIC": fitted_full.aic},
+            "predictions": fit["model"].forecast(steps=days),
+            "dates": self._future_dates(days),
+            "metrics": dict(fit["metrics"]),
         }
 
-    def monte_carlo_simulation(self, days: int = 30, simulations: int = 1000) -> Optional[Dict[str, Any]]:
-        if self.data is None:
+    def monte_carlo_simulation(
+        self,
+        days: int = 30,
+        simulations: int = 1000,
+        seed: Optional[int] = None,
+        antithetic: bool = True,
+    ) -> Optional[Dict[str, Any]]:
+        fit = self._fitted("Monte Carlo")
+        if fit is None:
             return None
-        returns = self.data["Close"].pct_change().dropna()
-        mean_return = returns.mean()
-        std_return = returns.std()
-        last_price = float(self.data["Close"].iloc[-1])
-        simulation_results = np.zeros((simulations, days))
-        for i in range(simulations):
-            price = last_price
-            for j in range(days):
-                price = price * (1 + np.random.normal(mean_return, std_return))
-                simulation_results[i, j] = price
-        future_dates = pd.date_range(start=self.data.index[-1] + timedelta(days=1), periods=days)
+        mean_return = fit["mean_return"]
+        std_return = fit["std_return"]
+        fan = simulate_price_quantiles(
+            fit["last_price"],
+            mean_return,
+            std_return,
+            days,
+            simulations=simulations,
+            quantiles=MONTE_CARLO_QUANTILES,
+            seed=seed,
+            antithetic=antithetic,
+        )
         return {
             "model_name": f"Monte Carlo ({simulations} sims)",
-            "predictions": np.percentile(simulation_results, 50, axis=0),
-            "dates": future_dates,
+            "predictions": fan[50.0],
+            "dates": self._future_dates(days),
             "metrics": {"Mean Return": mean_return, "Std Return": std_return},
+            "quantiles": fan,
         }
 
-    def get_all_predictions(self, days: int = 30) -> Dict[str, Dict[str, Any]]:
+    def walk_forward_backtest(self, folds: int = 5, horizon: int = 10) -> Dict[str, Any]:
+        """Out-of-sample metrics per model from an expanding-window walk-forward backtest."""
+        if self.data is None or self.data.empty:
+            return {"folds": 0, "horizon": horizon, "models": {}}
+        backtester = WalkForwardBacktester(
+            self.symbol,
+            self.data,
+            period=self.period,
+            folds=folds,
+            horizon=horizon,
+            feature_sets={"Random Forest": RF_FEATURES, "Gradient Boosting": GB_FEATURES},
+            arima_order=ARIMA_ORDER,
+            executor=_get_fit_executor(),
+        )
+        return backtester.run()
+
+    def get_all_predictions(self, days: int = 30, refresh_backtest: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Forecasts per model, with out-of-sample scores attached from the cached walk-forward summary.
+
+        Only ``refresh_backtest=True`` (the prewarm cycle) runs the backtest; otherwise a
+        missing summary just leaves the ``backtest`` field off.
+        """
         if not self.fetch_data():
             return {}
+        try:
+            self.fit_models()
+        except Exception as exc:
+            logger.warning("Forecast model fitting failed", symbol=self.symbol, error=str(exc))
         results: Dict[str, Dict[str, Any]] = {}
         models = [
             ("Linear Regression", lambda: self.linear_regression_prediction(days)),
@@ -202,4 +469,18 @@ class PublicPricePredictionEngine:
                     results[name] = result
             except Exception:
                 continue
+        backtest: Optional[Dict[str, Any]] = None
+        if refresh_backtest:
+            try:
+                backtest = self.walk_forward_backtest()
+            except Exception as exc:
+                logger.warning("Walk-forward backtest failed", symbol=self.symbol, error=str(exc))
+        else:
+            backtest = cached_summary(self.symbol, self.period)
+        if not backtest:
+            return results
+        for name, result in results.items():
+            scores = backtest["models"].get(name)
+            if scores:
+                result["backtest"] = {**scores, "horizon": backtest["horizon"]}
         return results
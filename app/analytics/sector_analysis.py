@@ -10,6 +10,9 @@ import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import warnings
+
+from app.utils.fetch_context import shared_fetch
+
 warnings.filterwarnings('ignore')
 
 
@@ -38,9 +41,19 @@ class SectorAnalyzer:
         """
         self.symbol = symbol.upper()
         self.stock = yf.Ticker(self.symbol)
-        self.info = self.stock.info
+        self.info = self._info(self.symbol)
         self.sector = self.info.get('sector', 'Unknown')
 
+    @staticmethod
+    def _info(symbol: str) -> Dict[str, Any]:
+        """Ticker info, shared across analyzers within one request"""
+        return shared_fetch(('yf-info', symbol), lambda: yf.Ticker(symbol).info)
+
+    @staticmethod
+    def _history(symbol: str, period: str) -> pd.DataFrame:
+        """Price history, shared within one request; callers get their own copy"""
+        return shared_fetch(('yf-history', symbol, period), lambda: yf.Ticker(symbol).history(period=period)).copy()
+
     def get_comprehensive_sector_analysis(self) -> Dict[str, Any]:
         """Kapsamlı sektör analizi"""
         try:
@@ -78,9 +91,8 @@ class SectorAnalyzer:
                 return {"error": "Sector ETF not found"}
 
             # ETF ve hisse verilerini çek
-            etf = yf.Ticker(sector_etf)
-            etf_hist = etf.history(period=period)
-            stock_hist = self.stock.history(period=period)
+            etf_hist = self._history(sector_etf, period)
+            stock_hist = self._history(self.symbol, period)
 
             if etf_hist.empty or stock_hist.empty:
                 return {"error": "Insufficient data"}
@@ -92,8 +104,7 @@ class SectorAnalyzer:
                            stock_hist['Close'].iloc[0] * 100)
 
             # S&P 500 ile karşılaştır
-            spy = yf.Ticker('SPY')
-            spy_hist = spy.history(period=period)
+            spy_hist = self._history('SPY', period)
             spy_return = ((spy_hist['Close'].iloc[-1] - spy_hist['Close'].iloc[0]) /
                          spy_hist['Close'].iloc[0] * 100) if not spy_hist.empty else 0
 
@@ -200,9 +211,8 @@ class SectorAnalyzer:
     def _get_comparison_data(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Karşılaştırma verilerini çek"""
         try:
-            stock = yf.Ticker(symbol)
-            info = stock.info
-            hist = stock.history(period="1y")
+            info = self._info(symbol)
+            hist = self._history(symbol, "1y")
 
             if hist.empty:
                 return None
@@ -344,14 +354,13 @@ class SectorAnalyzer:
     def calculate_relative_strength(self, period: str = "3mo") -> Dict[str, Any]:
         """Relative Strength Index (RSI) - Sektöre göre"""
         try:
-            stock_hist = self.stock.history(period=period)
+            stock_hist = self._history(self.symbol, period)
 
             sector_etf = self.SECTOR_ETFS.get(self.sector)
             if not sector_etf:
                 return {"error": "Sector ETF not found"}
 
-            etf = yf.Ticker(sector_etf)
-            etf_hist = etf.history(period=period)
+            etf_hist = self._history(sector_etf, period)
 
             if stock_hist.empty or etf_hist.empty:
                 return {"error": "Insufficient data"}
@@ -404,8 +413,7 @@ class SectorAnalyzer:
             if not sector_etf:
                 return {"error": "Sector ETF not found"}
 
-            etf = yf.Ticker(sector_etf)
-            etf_hist = etf.history(period="1y")
+            etf_hist = self._history(sector_etf, "1y")
 
             if etf_hist.empty:
                 return {"error": "No data"}
@@ -10,6 +10,9 @@ import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import warnings
+
+from app.analytics import indicators
+
 warnings.filterwarnings('ignore')
 
 
@@ -91,17 +94,9 @@ class StockScreener:
         }
 
     def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> float:
-        """RSI hesapla"""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-        if loss.iloc[-1] == 0:
-            return 100.0
-
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return float(rsi.iloc[-1]) if not pd.isna(rsi.iloc[-1]) else 50.0
+        """RSI hesapla (Wilder)"""
+        rsi = indicators.rsi(prices, period)
+        return float(rsi.iloc[-1]) if len(rsi) and not pd.isna(rsi.iloc[-1]) else 50.0
 
     def _meets_criteria(self, stock_data: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
         """Hisse kriterlere uygun mu kontrol et"""
@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
+from app.analytics.indicators import IndicatorSet, indicator_set
 from app.utils.logger import get_logger
 
 
@@ -62,26 +63,28 @@ class StocksETFsAnalyzer:
 
     def calculate_technical_indicators(
         self,
-        ohlcv_data: pd.DataFrame
+        ohlcv_data: pd.DataFrame,
+        symbol: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Teknik göstergeleri hesapla."""
+        """Teknik göstergeleri hesapla; ``symbol`` verilirse göstergeler sembol önbelleğinden paylaşılır."""
         try:
             if ohlcv_data.empty or len(ohlcv_data) < 20:
                 return {}
 
             indicators = {}
+            kernels = indicator_set(ohlcv_data["close"], cache_key=symbol)
 
             # Moving Averages
-            indicators["SMA_20"] = ohlcv_data["close"].rolling(window=20).mean().iloc[-1]
-            indicators["SMA_50"] = ohlcv_data["close"].rolling(window=50).mean().iloc[-1] if len(ohlcv_data) >= 50 else None
-            indicators["EMA_12"] = ohlcv_data["close"].ewm(span=12).mean().iloc[-1]
-            indicators["EMA_26"] = ohlcv_data["close"].ewm(span=26).mean().iloc[-1]
+            indicators["SMA_20"] = kernels.sma(20).iloc[-1]
+            indicators["SMA_50"] = kernels.sma(50).iloc[-1] if len(ohlcv_data) >= 50 else None
+            indicators["EMA_12"] = kernels.ema(12).iloc[-1]
+            indicators["EMA_26"] = kernels.ema(26).iloc[-1]
 
             # RSI
-            indicators["RSI"] = self._calculate_rsi(ohlcv_data["close"])
+            indicators["RSI"] = self._calculate_rsi(ohlcv_data["close"], kernels=kernels)
 
             # MACD
-            macd_line, signal_line, histogram = self._calculate_macd(ohlcv_data["close"])
+            macd_line, signal_line, histogram = self._calculate_macd(ohlcv_data["close"], kernels=kernels)
             indicators["MACD"] = {
                 "macd_line": macd_line,
                 "signal_line": signal_line,
@@ -89,7 +92,7 @@ class StocksETFsAnalyzer:
             }
 
             # Bollinger Bands
-            bb_upper, bb_middle, bb_lower = self._calculate_bollinger_bands(ohlcv_data["close"])
+            bb_upper, bb_middle, bb_lower = self._calculate_bollinger_bands(ohlcv_data["close"], kernels=kernels)
             indicators["Bollinger"] = {
                 "upper": bb_upper,
                 "middle": bb_middle,
@@ -113,18 +116,13 @@ class StocksETFsAnalyzer:
             self.logger.error("Failed to calculate technical indicators", error=str(e))
             return {}
 
-    def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> float:
-        """RSI hesapla."""
+    def _calculate_rsi(self, prices: pd.Series, period: int = 14, kernels: Optional[IndicatorSet] = None) -> float:
+        """RSI hesapla (Wilder)."""
         try:
             if len(prices) < period + 1:
                 return 50.0
 
-            delta = prices.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
+            rsi = (kernels or IndicatorSet(prices)).rsi(period)
 
             return round(rsi.iloc[-1], 2)
 
@@ -136,19 +134,15 @@ class StocksETFsAnalyzer:
         prices: pd.Series,
         fast_period: int = 12,
         slow_period: int = 26,
-        signal_period: int = 9
+        signal_period: int = 9,
+        kernels: Optional[IndicatorSet] = None,
     ) -> Tuple[float, float, float]:
         """MACD hesapla."""
         try:
             if len(prices) < slow_period + signal_period:
                 return 0.0, 0.0, 0.0
 
-            ema_fast = prices.ewm(span=fast_period).mean()
-            ema_slow = prices.ewm(span=slow_period).mean()
-
-            macd_line = ema_fast - ema_slow
-            signal_line = macd_line.ewm(span=signal_period).mean()
-            histogram = macd_line - signal_line
+            macd_line, signal_line, histogram = (kernels or IndicatorSet(prices)).macd(fast_period, slow_period, signal_period)
 
             return (
                 round(macd_line.iloc[-1], 4),
@@ -163,7 +157,8 @@ class StocksETFsAnalyzer:
         self,
         prices: pd.Series,
         period: int = 20,
-        std_dev: int = 2
+        std_dev: int = 2,
+        kernels: Optional[IndicatorSet] = None,
     ) -> Tuple[float, float, float]:
         """Bollinger Bands hesapla."""
         try:
@@ -171,11 +166,7 @@ class StocksETFsAnalyzer:
                 current_price = prices.iloc[-1]
                 return current_price * 1.02, current_price, current_price * 0.98
 
-            sma = prices.rolling(window=period).mean()
-            std = prices.rolling(window=period).std()
-
-            upper_band = sma + (std * std_dev)
-            lower_band = sma - (std * std_dev)
+            upper_band, sma, lower_band = (kernels or IndicatorSet(prices)).bollinger(period, std_dev)
 
             return (
                 round(upper_band.iloc[-1], 2),
@@ -286,7 +277,7 @@ class StocksETFsAnalyzer:
             returns = self.calculate_returns(prices)
 
             # Teknik göstergeler
-            technical_indicators = self.calculate_technical_indicators(ohlcv_data)
+            technical_indicators = self.calculate_technical_indicators(ohlcv_data, symbol)
 
             # Risk metrikleri
             risk_metrics = self._calculate_risk_metrics(prices)
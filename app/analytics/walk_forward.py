@@ -0,0 +1,243 @@
+"""
+Walk-Forward Forecast Backtesting
+=================================
+Out-of-sample validation for the public forecast models.
+
+The feature matrix is extracted from the indicator frame once per symbol and
+every fold trains on an expanding prefix of it, forecasting the next
+``horizon`` bars exactly the way the live forecast would.
+
+Fold cut-offs fall on the first bar of each ``horizon``-business-day block
+counted from a fixed epoch, so a fold keeps its date while new bars arrive and
+the history window slides forward. Per-fold forecasts are cached under their
+training-end date and only a newly completed fold is ever fitted. The scored
+summary is cached as well: the prewarm cycle runs the backtest and request
+paths read ``cached_summary()``.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.analytics.path_simulation import simulate_price_quantiles
+from app.services.cache import cache_get, cache_set
+from app.utils.logger import get_logger
+
+try:
+    from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+    from sklearn.linear_model import LinearRegression
+    HAS_SKLEARN = True
+except ImportError:
+    HAS_SKLEARN = False
+
+try:
+    from statsmodels.tsa.arima.model import ARIMA
+    HAS_STATSMODELS = True
+except ImportError:
+    HAS_STATSMODELS = False
+
+logger = get_logger(__name__)
+
+FOLD_CACHE_TTL_SECONDS = 172_800
+FOLD_EPOCH = np.datetime64("2000-01-03", "D")
+
+
+def _summary_key(symbol: str, period: str, folds: int, horizon: int) -> str:
+    return f"forecast-walk-forward-summary:{symbol.upper()}:{period}:{max(1, folds)}:{max(1, horizon)}"
+
+
+def cached_summary(symbol: str, period: str = "2y", folds: int = 5, horizon: int = 10) -> Optional[Dict[str, Any]]:
+    """The last summary ``WalkForwardBacktester.run()`` stored for these settings, if any."""
+    summary = cache_get(_summary_key(symbol, period, folds, horizon))
+    return summary if isinstance(summary, dict) else None
+
+
+def _fold_forecast(
+    model: str,
+    close: np.ndarray,
+    features: Optional[np.ndarray],
+    train_end: int,
+    horizon: int,
+    arima_order: Tuple[int, int, int],
+    seed: int,
+) -> np.ndarray:
+    """Train ``model`` on bars ``[:train_end]`` and forecast the next ``horizon`` bars."""
+    train_close = close[:train_end]
+    if model == "Linear Regression":
+        days = np.arange(train_end).reshape(-1, 1)
+        fitted = LinearRegression().fit(days, train_close)
+        return fitted.predict(np.arange(train_end, train_end + horizon).reshape(-1, 1))
+    if model in {"Random Forest", "Gradient Boosting"}:
+        if model == "Random Forest":
+            regressor = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=1)
+        else:
+            regressor = GradientBoostingRegressor(n_estimators=100, learning_rate=0.1, max_depth=5, random_state=42)
+        regressor.fit(features[:train_end], train_close)
+        return np.full(horizon, float(regressor.predict(features[train_end - 1 : train_end])[0]))
+    if model == "ARIMA":
+        return np.asarray(ARIMA(train_close, order=arima_order).fit().forecast(steps=horizon))
+    if model == "Monte Carlo":
+        returns = pd.Series(train_close).pct_change().dropna()
+        fan = simulate_price_quantiles(
+            float(train_close[-1]),
+            returns.mean(),
+            returns.std(),
+            horizon,
+            simulations=1000,
+            quantiles=(50,),
+            seed=seed,
+            antithetic=True,
+        )
+        return fan[50.0]
+    raise ValueError(f"Unknown forecast model: {model}")
+
+
+class WalkForwardBacktester:
+    """Expanding-window walk-forward backtest over a technical indicator frame."""
+
+    def __init__(
+        self,
+        symbol: str,
+        frame: pd.DataFrame,
+        period: str = "2y",
+        folds: int = 5,
+        horizon: int = 10,
+        feature_sets: Optional[Dict[str, Sequence[str]]] = None,
+        arima_order: Tuple[int, int, int] = (5, 1, 0),
+        executor: Executor | None = None,
+    ) -> None:
+        self.symbol = symbol.upper()
+        self.period = period
+        self.folds = max(1, folds)
+        self.horizon = max(1, horizon)
+        self.arima_order = arima_order
+        self.executor = executor
+        self.close = frame["Close"].to_numpy(dtype=float)
+        self.features: Dict[str, np.ndarray] = {}
+        for model, columns in (feature_sets or {}).items():
+            present = [column for column in columns if column in frame.columns]
+            if present:
+                self.features[model] = frame[present].to_numpy(dtype=float)
+        index = pd.DatetimeIndex(frame.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        self.bar_days = index.values.astype("datetime64[D]")
+
+    def available_models(self) -> List[str]:
+        models: List[str] = []
+        if HAS_SKLEARN:
+            models.append("Linear Regression")
+            models.extend(model for model in ("Random Forest", "Gradient Boosting") if model in self.features)
+        if HAS_STATSMODELS:
+            models.append("ARIMA")
+        models.append("Monte Carlo")
+        return models
+
+    def fold_ends(self) -> List[int]:
+        """Training cut-offs, oldest first; each fold tests the ``horizon`` bars after its cut-off.
+
+        A cut-off is the first bar of a ``horizon``-business-day block counted from
+        ``FOLD_EPOCH``, and only folds whose test window has fully printed count.
+        """
+        size = len(self.close)
+        if not size:
+            return []
+        min_train = max(60, size // 2)
+        blocks = np.busday_count(FOLD_EPOCH, self.bar_days) // self.horizon
+        starts = np.flatnonzero(np.diff(blocks, prepend=blocks[0] - 1))
+        ends = [int(end) for end in starts if end >= min_train and end + self.horizon <= size]
+        return ends[-self.folds :]
+
+    def fold_date(self, train_end: int) -> str:
+        """Date of the last training bar of the fold cut at ``train_end``."""
+        return str(self.bar_days[train_end - 1])
+
+    def _cache_key(self, model: str) -> str:
+        return f"forecast-walk-forward:{self.symbol}:{self.period}:{self.horizon}:{model}"
+
+    def _fold_args(self, model: str, train_end: int) -> tuple:
+        seed = int(self.bar_days[train_end - 1].astype(np.int64))
+        return (model, self.close, self.features.get(model), train_end, self.horizon, self.arima_order, seed)
+
+    def fold_predictions(self, models: Optional[Sequence[str]] = None) -> Dict[str, Dict[int, np.ndarray]]:
+        """Forecasts per model and fold cut-off, fitting only folds missing from the cache."""
+        models = list(models or self.available_models())
+        ends = self.fold_ends()
+        dates = {train_end: self.fold_date(train_end) for train_end in ends}
+        predictions: Dict[str, Dict[int, np.ndarray]] = {}
+        missing: List[Tuple[str, int]] = []
+        for model in models:
+            cached = cache_get(self._cache_key(model))
+            cached = cached if isinstance(cached, dict) else {}
+            predictions[model] = {
+                train_end: np.asarray(cached[date], dtype=float) for train_end, date in dates.items() if date in cached
+            }
+            missing.extend((model, train_end) for train_end in ends if train_end not in predictions[model])
+
+        futures = {}
+        if self.executor is not None and len(missing) > 1:
+            try:
+                futures = {job: self.executor.submit(_fold_forecast, *self._fold_args(*job)) for job in missing}
+            except Exception as exc:
+                logger.warning("Walk-forward pool rejected work; fitting in-process", error=str(exc))
+                futures = {}
+        for job in missing:
+            future = futures.get(job)
+            try:
+                result = future.result() if future is not None else _fold_forecast(*self._fold_args(*job))
+            except Exception:
+                if future is None:
+                    continue
+                # A dead worker pool should not cost the fold; retry it here.
+                try:
+                    result = _fold_forecast(*self._fold_args(*job))
+                except Exception:
+                    continue
+            model, train_end = job
+            predictions[model][train_end] = np.asarray(result, dtype=float)
+
+        for model in {model for model, _ in missing}:
+            cache_set(
+                self._cache_key(model),
+                {dates[end]: values.tolist() for end, values in predictions[model].items()},
+                ttl=FOLD_CACHE_TTL_SECONDS,
+            )
+        return predictions
+
+    def run(self, models: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """Out-of-sample RMSE, MAE and directional hit rate per model; the summary is cached for ``cached_summary()``."""
+        ends = self.fold_ends()
+        summary: Dict[str, Any] = {
+            "folds": len(ends),
+            "horizon": self.horizon,
+            "through": self.fold_date(ends[-1]) if ends else None,
+            "models": {},
+        }
+        if not ends:
+            return summary
+        for model, by_fold in self.fold_predictions(models).items():
+            errors: List[np.ndarray] = []
+            hits: List[np.ndarray] = []
+            for train_end, forecast in by_fold.items():
+                actual = self.close[train_end : train_end + self.horizon]
+                forecast = forecast[: len(actual)]
+                if not len(actual) or not np.all(np.isfinite(forecast)):
+                    continue
+                anchor = self.close[train_end - 1]
+                errors.append(forecast - actual)
+                hits.append(np.sign(forecast - anchor) == np.sign(actual - anchor))
+            if not errors:
+                continue
+            stacked = np.concatenate(errors)
+            summary["models"][model] = {
+                "RMSE": float(np.sqrt(np.mean(stacked**2))),
+                "MAE": float(np.mean(np.abs(stacked))),
+                "Hit Rate": float(np.mean(np.concatenate(hits))),
+                "folds": len(errors),
+            }
+        cache_set(_summary_key(self.symbol, self.period, self.folds, self.horizon), summary, ttl=FOLD_CACHE_TTL_SECONDS)
+        return summary
@@ -0,0 +1,160 @@
+"""
+Public API Artifacts
+====================
+Pre-encoded JSON responses for the hot public endpoints.
+
+Each artifact has a registered builder that returns the endpoint's response
+payload. The prewarm cycle calls ``publish_all()`` once it has refreshed the
+caches the builders read from. Every payload is encoded to JSON once,
+precompressed and stamped with a strong ETag (a ``CachedPage``), then swapped
+in for the previous version. Handlers serve ``respond()``, which is a dict
+lookup plus a byte write; If-None-Match is answered with 304.
+
+When a directory is configured, artifacts are also written there. A process
+that did not publish them (a prewarm follower) picks up the leader's files as
+they change. An artifact older than ``max_age_seconds``, or one that was never
+published, is skipped and the handler builds its payload live.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from app.utils.logger import get_logger
+from app.web.page_cache import CachedPage
+
+logger = get_logger(__name__)
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def _version(timestamp: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(timestamp))
+
+
+def encode_json(payload: Any) -> bytes:
+    """The bytes ``JSONResponse`` would send for ``payload``."""
+    return json.dumps(payload, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+@dataclass(frozen=True)
+class Artifact:
+    """One published response body; ``page.version`` is the publish time."""
+
+    page: CachedPage
+    published_at: float
+    mtime_ns: int = 0
+
+
+class ArtifactStore:
+    """Named, versioned, pre-encoded JSON artifacts held in memory and optionally mirrored to disk."""
+
+    def __init__(self, directory: str | Path | None = None, max_age_seconds: int = 3600) -> None:
+        self.directory = Path(directory) if directory else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_age_seconds = max_age_seconds
+        self._builders: Dict[str, Callable[[], Any]] = {}
+        self._artifacts: Dict[str, Artifact] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, builder: Callable[[], Any]) -> None:
+        self._builders[name] = builder
+
+    def _path_for(self, name: str) -> Path:
+        return self.directory / f"{name}.json"
+
+    def publish(self, name: str, payload: Any) -> CachedPage:
+        """Encode ``payload`` and make it the current ``name`` artifact; an unchanged body keeps its ETag."""
+        body = encode_json(payload)
+        now = time.time()
+        with self._lock:
+            current = self._artifacts.get(name)
+            if current is not None and current.page.body == body:
+                page = current.page
+            else:
+                page = CachedPage.build(_version(now), body, media_type=JSON_MEDIA_TYPE)
+            mtime_ns = self._write(name, body) if self.directory is not None else 0
+            self._artifacts[name] = Artifact(page=page, published_at=now, mtime_ns=mtime_ns)
+        return page
+
+    def _write(self, name: str, body: bytes) -> int:
+        path = self._path_for(name)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(body)
+        tmp_path.replace(path)
+        return path.stat().st_mtime_ns
+
+    def _load(self, name: str, current: Optional[Artifact]) -> Optional[Artifact]:
+        try:
+            stat = self._path_for(name).stat()
+        except OSError:
+            return current
+        if current is not None and current.mtime_ns == stat.st_mtime_ns:
+            return current
+        with self._lock:
+            current = self._artifacts.get(name)
+            if current is not None and current.mtime_ns == stat.st_mtime_ns:
+                return current
+            try:
+                body = self._path_for(name).read_bytes()
+            except OSError:
+                return current
+            published_at = stat.st_mtime_ns / 1e9
+            if current is not None and current.page.body == body:
+                page = current.page
+            else:
+                page = CachedPage.build(_version(published_at), body, media_type=JSON_MEDIA_TYPE)
+            artifact = self._artifacts[name] = Artifact(page=page, published_at=published_at, mtime_ns=stat.st_mtime_ns)
+            return artifact
+
+    def get(self, name: str) -> Optional[CachedPage]:
+        """The current artifact for ``name``, or None when it was never published or has gone stale."""
+        artifact = self._artifacts.get(name)
+        if self.directory is not None:
+            artifact = self._load(name, artifact)
+        if artifact is None or time.time() - artifact.published_at > self.max_age_seconds:
+            return None
+        return artifact.page
+
+    def publish_all(self) -> Dict[str, str]:
+        """Run every registered builder and publish its payload; returns the ETag per published artifact."""
+        published: Dict[str, str] = {}
+        for name, builder in list(self._builders.items()):
+            try:
+                published[name] = self.publish(name, builder()).etag
+            except Exception as exc:
+                logger.warning("Failed to publish API artifact; keeping the previous version", artifact=name, error=str(exc))
+        return published
+
+    def respond(self, request: Request, name: str) -> Response:
+        """Serve the published artifact, or build the payload live when there is none."""
+        page = self.get(name)
+        if page is not None:
+            return page.response(request)
+        return JSONResponse(self._builders[name]())
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {"version": artifact.page.version, "etag": artifact.page.etag, "bytes": len(artifact.page.body)}
+            for name, artifact in self._artifacts.items()
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._artifacts.clear()
+        if self.directory is not None:
+            for name in self._builders:
+                try:
+                    os.remove(self._path_for(name))
+                except OSError:
+                    pass
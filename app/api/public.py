@@ -3,8 +3,10 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Any, Dict
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
 
+from app.api.artifacts import ArtifactStore
 from app.core.config import settings
 from app.services.public_dashboard import PublicDashboardService
 from app.services.institutional_pulse import InstitutionalPulseService
@@ -17,6 +19,10 @@ dashboard_service = PublicDashboardService()
 institutional_pulse_service = InstitutionalPulseService()
 public_research_service = PublicResearchService()
 tr_funds_service = TRFundsService()
+artifacts = ArtifactStore(
+    directory=settings.PUBLIC_API_ARTIFACT_DIR or None,
+    max_age_seconds=settings.PUBLIC_API_ARTIFACT_MAX_AGE_SECONDS,
+)
 
 
 def _to_json_safe(value: Any) -> Any:
@@ -45,8 +51,7 @@ def _to_json_safe(value: Any) -> Any:
     return str(value)
 
 
-@router.get("/public/dashboard")
-async def get_public_dashboard() -> Dict[str, Any]:
+def _dashboard_payload() -> Dict[str, Any]:
     return {
         "status": "success",
         "app_name": settings.APP_DISPLAY_NAME,
@@ -54,22 +59,19 @@ async def get_public_dashboard() -> Dict[str, Any]:
     }
 
 
-@router.get("/public/tr-funds")
-async def get_public_tr_funds() -> Dict[str, Any]:
+def _tr_funds_payload() -> Dict[str, Any]:
     months = settings.PUBLIC_TR_FUNDS_MONTHS
-    peer_board = tr_funds_service.get_cached_peer_signal_board(months=months)
-    peer_board_records = peer_board.to_dict("records") if not peer_board.empty else []
+    board = tr_funds_service.get_cached_peer_board(months=months)
     return {
         "status": "success",
-        "top_pick": _to_json_safe(tr_funds_service.get_cached_top_pick(months=months)),
-        "peer_board": _to_json_safe(peer_board_records),
-        "leadership": _to_json_safe(tr_funds_service.get_leadership_snapshot(months=months)),
+        "top_pick": board.top_pick if board is not None else None,
+        "peer_board": list(board.records) if board is not None else [],
+        "leadership": board.leadership if board is not None else {"family_rows": [], "factor_rows": []},
         "health": _to_json_safe(tr_funds_service.get_status(months=months)),
     }
 
 
-@router.get("/public/source-health")
-async def get_public_source_health() -> Dict[str, Any]:
+def _source_health_payload() -> Dict[str, Any]:
     snapshot = dashboard_service.build_live_source_health()
     return {
         "status": "success",
@@ -78,6 +80,34 @@ async def get_public_source_health() -> Dict[str, Any]:
     }
 
 
+def _influence_map_payload() -> Dict[str, Any]:
+    return {
+        "status": "success",
+        "workspace": _to_json_safe(dashboard_service.build_influence_workspace()),
+    }
+
+
+artifacts.register("dashboard", _dashboard_payload)
+artifacts.register("tr-funds", _tr_funds_payload)
+artifacts.register("source-health", _source_health_payload)
+artifacts.register("influence-map", _influence_map_payload)
+
+
+@router.get("/public/dashboard")
+async def get_public_dashboard(request: Request) -> Response:
+    return artifacts.respond(request, "dashboard")
+
+
+@router.get("/public/tr-funds")
+async def get_public_tr_funds(request: Request) -> Response:
+    return artifacts.respond(request, "tr-funds")
+
+
+@router.get("/public/source-health")
+async def get_public_source_health(request: Request) -> Response:
+    return artifacts.respond(request, "source-health")
+
+
 @router.get("/public/reliability")
 async def get_public_reliability() -> Dict[str, Any]:
     return {
@@ -107,11 +137,8 @@ async def get_public_conviction_board(
 
 
 @router.get("/public/influence-map")
-async def get_public_influence_map() -> Dict[str, Any]:
-    return {
-        "status": "success",
-        "workspace": _to_json_safe(dashboard_service.build_influence_workspace()),
-    }
+async def get_public_influence_map(request: Request) -> Response:
+    return artifacts.respond(request, "influence-map")
 
 
 @router.get("/public/compare")
@@ -76,13 +76,19 @@ class Settings(BaseSettings):
     ENABLE_API_DOCS: bool = os.environ.get("ENABLE_API_DOCS", "").lower() in {"1", "true", "yes"} if os.environ.get("ENABLE_API_DOCS") else ENVIRONMENT != "production"
     ENABLE_PREWARM_WORKER: bool = os.environ.get("ENABLE_PREWARM_WORKER", "").lower() in {"1", "true", "yes"} if os.environ.get("ENABLE_PREWARM_WORKER") else ENVIRONMENT == "production"
     PREWARM_INTERVAL_SECONDS: int = int(os.environ.get("PREWARM_INTERVAL_SECONDS", "900"))
+    PREWARM_LEADER_ELECTION: bool = os.environ.get("PREWARM_LEADER_ELECTION", "true").lower() in {"1", "true", "yes"}
+    PREWARM_LEADER_POLL_SECONDS: int = int(os.environ.get("PREWARM_LEADER_POLL_SECONDS", "30"))
     PUBLIC_SNAPSHOT_DIR: str = os.environ.get("PUBLIC_SNAPSHOT_DIR", "data/public_snapshots")
+    PUBLIC_API_ARTIFACT_DIR: str = os.environ.get("PUBLIC_API_ARTIFACT_DIR", "")
+    PUBLIC_API_ARTIFACT_MAX_AGE_SECONDS: int = int(os.environ.get("PUBLIC_API_ARTIFACT_MAX_AGE_SECONDS", str(PREWARM_INTERVAL_SECONDS * 2)))
     PUBLIC_TR_FUNDS_MONTHS: int = int(os.environ.get("PUBLIC_TR_FUNDS_MONTHS", "3"))
     PUBLIC_RESEARCH_TTL_SECONDS: int = int(os.environ.get("PUBLIC_RESEARCH_TTL_SECONDS", "1800"))
     PUBLIC_DEFAULT_STOCK_SYMBOL: str = os.environ.get("PUBLIC_DEFAULT_STOCK_SYMBOL", "AAPL")
     PUBLIC_DEFAULT_FUND_SYMBOL: str = os.environ.get("PUBLIC_DEFAULT_FUND_SYMBOL", "SPY")
     PUBLIC_DEFAULT_FORECAST_SYMBOL: str = os.environ.get("PUBLIC_DEFAULT_FORECAST_SYMBOL", "NVDA")
     PUBLIC_DEFAULT_FORECAST_DAYS: int = int(os.environ.get("PUBLIC_DEFAULT_FORECAST_DAYS", "30"))
+    PUBLIC_FORECAST_FIT_WORKERS: int = int(os.environ.get("PUBLIC_FORECAST_FIT_WORKERS", str(min(4, os.cpu_count() or 1))))
+    PUBLIC_FORECAST_MODEL_CACHE: bool = os.environ.get("PUBLIC_FORECAST_MODEL_CACHE", "true").lower() in {"1", "true", "yes"}
     PUBLIC_DEFAULT_TR_FUND_CODE: str = os.environ.get("PUBLIC_DEFAULT_TR_FUND_CODE", "TCD")
     PUBLIC_DEFAULT_OWNERSHIP_SYMBOL: str = os.environ.get("PUBLIC_DEFAULT_OWNERSHIP_SYMBOL", "AAPL")
     PUBLIC_DEFAULT_OWNERSHIP_FOCUS: str = os.environ.get("PUBLIC_DEFAULT_OWNERSHIP_FOCUS", "core")
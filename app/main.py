@@ -13,6 +13,7 @@ from app.core.config import settings
 from app.utils.logger import get_logger
 from app.api.endpoints import router as api_router
 from app.api.public import router as public_router
+from app.api.public import artifacts as public_artifacts
 from app.api.public import tr_funds_service
 from app.web.routes import router as web_router
 from app.services.prewarm_worker import PublicDataPrewarmWorker
@@ -158,6 +159,7 @@ def create_app() -> FastAPI:
             "environment": settings.ENVIRONMENT,
             "timestamp": time.time(),
             "prewarm_worker": worker.snapshot() if worker else {"enabled": False, "alive": False},
+            "api_artifacts": public_artifacts.snapshot(),
             "tr_funds": tr_status,
         }
 
@@ -181,7 +183,7 @@ def create_app() -> FastAPI:
         if not settings.ENABLE_PREWARM_WORKER:
             logger.info("Public data prewarm worker disabled")
             return
-        worker = PublicDataPrewarmWorker()
+        worker = PublicDataPrewarmWorker(publish_artifacts=public_artifacts.publish_all)
         app.state.prewarm_worker = worker
         worker.start()
 
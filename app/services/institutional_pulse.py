@@ -1,17 +1,23 @@
 from __future__ import annotations
 
-import re
-import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 import pandas as pd
 import requests
+from lxml import etree
 
+from app.analytics.holdings_diff import diff_holdings, issuer_keys, normalize_issuer_key
 from app.core.config import settings
 from app.services.cache import cache_get, cache_set
 from app.services.snapshot_store import SnapshotStore
 
+INFO_TABLE_FIELDS = ("nameOfIssuer", "titleOfClass", "cusip", "value", "sshPrnamt", "putCall")
+INFO_TABLE_TAGS = tuple(f"{{*}}{name}" for name in ("infoTable", *INFO_TABLE_FIELDS))
+XML_CHUNK_BYTES = 1 << 16
+FILING_HISTORY_LIMIT = 8
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
@@ -52,6 +58,7 @@ def _fmt_compact_money(value: Any) -> str:
 
 
 class InstitutionalPulseService:
+    MAX_WORKERS = 4
     MANAGERS: Dict[str, Dict[str, str]] = {
         "berkshire": {
             "label": "Berkshire Hathaway",
@@ -136,29 +143,7 @@ class InstitutionalPulseService:
         return list(self.MANAGERS.keys())
 
     def _normalize_issuer_key(self, issuer: str) -> str:
-        normalized = re.sub(r"[^A-Z0-9]+", " ", str(issuer or "").upper()).strip()
-        suffixes = {
-            "INC",
-            "INCORPORATED",
-            "CORP",
-            "CORPORATION",
-            "CO",
-            "COMPANY",
-            "PLC",
-            "LTD",
-            "LIMITED",
-            "HOLDINGS",
-            "HLDGS",
-            "GROUP",
-            "NV",
-            "SA",
-        }
-        parts = normalized.split()
-        while parts and parts[-1] in suffixes:
-            parts.pop()
-        while len(parts) >= 2 and parts[-2] in {"CLASS", "CL"} and parts[-1] in {"A", "B", "C"}:
-            parts = parts[:-2]
-        return " ".join(parts)
+        return normalize_issuer_key(issuer)
 
     def _frame_from_rows(self, rows: List[Dict[str, Any]]) -> pd.DataFrame:
         return pd.DataFrame(rows or [])
@@ -168,19 +153,19 @@ class InstitutionalPulseService:
         response.raise_for_status()
         return response.json()
 
-    def _fetch_text(self, url: str) -> str:
-        response = self.session.get(url, timeout=20)
-        response.raise_for_status()
-        return response.text
-
     def _submissions_url(self, cik: str) -> str:
         return f"https://data.sec.gov/submissions/CIK{int(cik):010d}.json"
 
     def _filing_base_url(self, cik: str, accession_no_dash: str) -> str:
         return f"https://www.sec.gov/Archives/edgar/data/{int(cik)}/{accession_no_dash}"
 
-    def _recent_13f_filings(self, cik: str, limit: int = 2) -> List[Dict[str, str]]:
-        payload = self._fetch_json(self._submissions_url(cik))
+    def _filings_snapshot_key(self, cik: str) -> str:
+        return f"institutional-pulse-filings-{int(cik)}"
+
+    def _holdings_snapshot_key(self, cik: str, accession_no_dash: str) -> str:
+        return f"institutional-pulse-13f-{int(cik)}-{accession_no_dash}"
+
+    def _13f_filings_from_submissions(self, payload: Dict[str, Any]) -> List[Dict[str, str]]:
         recent = payload.get("filings", {}).get("recent", {})
         forms = list(recent.get("form", []))
         accessions = list(recent.get("accessionNumber", []))
@@ -200,10 +185,38 @@ class InstitutionalPulseService:
                     "primary_document": str(primary_doc),
                 }
             )
-            if len(rows) >= limit:
+            if len(rows) >= FILING_HISTORY_LIMIT:
                 break
         return rows
 
+    def _recent_13f_filings(self, cik: str, limit: int = 2) -> List[Dict[str, str]]:
+        """Latest 13F filings, polled with a conditional request against the last synced submissions index."""
+        state_key = self._filings_snapshot_key(cik)
+        state = self.snapshot_store.read_json(state_key) or {}
+        stored_filings = list(state.get("filings") or [])
+        headers = {}
+        # A 304 carries no body, so only ask for one when there are stored filings to fall back on.
+        if stored_filings and state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if stored_filings and state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+
+        response = self.session.get(self._submissions_url(cik), timeout=20, headers=headers)
+        if response.status_code == 304:
+            return stored_filings[:limit]
+        response.raise_for_status()
+        filings = self._13f_filings_from_submissions(response.json())
+        self.snapshot_store.write_json(
+            state_key,
+            {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "synced_at": _now_iso(),
+                "filings": filings,
+            },
+        )
+        return filings[:limit]
+
     def _iter_directory_candidates(self, cik: str, accession_no_dash: str) -> Iterable[str]:
         root_url = self._filing_base_url(cik, accession_no_dash)
         pending = [f"{root_url}/index.json"]
@@ -259,46 +272,65 @@ class InstitutionalPulseService:
 
         raise RuntimeError("13F information table XML could not be located.")
 
-    def _node_text(self, parent: ET.Element, name: str) -> str:
-        for element in parent.iter():
-            if element.tag.split("}")[-1] == name:
-                return (element.text or "").strip()
-        return ""
-
-    def _parse_information_table_xml(self, xml_text: str) -> pd.DataFrame:
-        root = ET.fromstring(xml_text)
-        rows: List[Dict[str, Any]] = []
-        for node in root.iter():
-            if node.tag.split("}")[-1] != "infoTable":
-                continue
-            issuer = self._node_text(node, "nameOfIssuer")
-            if not issuer:
+    def _iter_information_rows(self, source: str | bytes | Iterable[bytes]) -> Iterator[Dict[str, str]]:
+        """Field texts of each ``infoTable`` entry, parsed incrementally and freed as soon as it is read."""
+        parser = etree.XMLPullParser(events=("end",), tag=INFO_TABLE_TAGS, remove_blank_text=True, resolve_entities=False, no_network=True)
+        payload = source.encode("utf-8") if isinstance(source, str) else source
+        if isinstance(payload, bytes):
+            chunks: Iterable[bytes] = (payload[start : start + XML_CHUNK_BYTES] for start in range(0, len(payload), XML_CHUNK_BYTES))
+        else:
+            chunks = payload
+        local_names: Dict[str, str] = {}
+        fields: Dict[str, str] = {}
+        for chunk in chunks:
+            parser.feed(chunk)
+            for _, element in parser.read_events():
+                tag = element.tag
+                name = local_names.get(tag)
+                if name is None:
+                    name = local_names[tag] = tag.rsplit("}", 1)[-1]
+                if name != "infoTable":
+                    if name not in fields:
+                        fields[name] = (element.text or "").strip()
+                    continue
+                yield fields
+                fields = {}
+                # Free finished entries so memory stays flat on large books. Only predecessors are
+                # detached: later siblings may already be parsed but not yet read from the queue.
+                element.clear(keep_tail=False)
+                parent = element.getparent()
+                while parent is not None and element.getprevious() is not None:
+                    del parent[0]
+        parser.close()
+
+    def _parse_information_table_xml(self, source: str | bytes | Iterable[bytes]) -> pd.DataFrame:
+        columns: Dict[str, List[str]] = {name: [] for name in INFO_TABLE_FIELDS}
+        for fields in self._iter_information_rows(source):
+            if not fields.get("nameOfIssuer"):
                 continue
-            class_title = self._node_text(node, "titleOfClass") or "N/A"
-            cusip = self._node_text(node, "cusip") or "N/A"
-            value_thousands = _safe_float(self._node_text(node, "value"))
-            rows.append(
-                {
-                    "issuer": issuer,
-                    "issuer_key": self._normalize_issuer_key(issuer),
-                    "class_title": class_title,
-                    "cusip": cusip,
-                    "value_raw": value_thousands,
-                    "shares": _safe_float(self._node_text(node, "sshPrnamt")),
-                    "put_call": self._node_text(node, "putCall") or "Equity",
-                }
-            )
-
-        frame = pd.DataFrame(rows)
-        if frame.empty:
-            return frame
-
-        frame["holding_key"] = frame.apply(
-            lambda row: f"{row['cusip']}|{row['issuer_key']}" if row.get("cusip") not in {"", "N/A"} else str(row["issuer_key"]),
-            axis=1,
+            for name, values in columns.items():
+                values.append(fields.get(name, ""))
+        if not columns["nameOfIssuer"]:
+            return pd.DataFrame()
+
+        issuer = pd.Series(columns["nameOfIssuer"], dtype=object)
+        issuer_key = issuer_keys(issuer)
+        cusip = pd.Series(columns["cusip"], dtype=object).replace("", "N/A")
+        frame = pd.DataFrame(
+            {
+                "issuer": issuer,
+                "issuer_key": issuer_key,
+                "class_title": pd.Series(columns["titleOfClass"], dtype=object).replace("", "N/A"),
+                "cusip": cusip,
+                "value_raw": pd.to_numeric(pd.Series(columns["value"], dtype=object).str.replace(",", ""), errors="coerce").fillna(0.0).astype(float),
+                "shares": pd.to_numeric(pd.Series(columns["sshPrnamt"], dtype=object).str.replace(",", ""), errors="coerce").fillna(0.0).astype(float),
+                "put_call": pd.Series(columns["putCall"], dtype=object).replace("", "Equity"),
+            }
         )
-        priced_rows = frame[(frame["shares"] > 0) & (frame["value_raw"] > 0)].copy()
-        implied_price = (priced_rows["value_raw"] / priced_rows["shares"]).median() if not priced_rows.empty else 0.0
+        frame["holding_key"] = issuer_key.where(cusip == "N/A", cusip + "|" + issuer_key)
+
+        priced = (frame["shares"] > 0) & (frame["value_raw"] > 0)
+        implied_price = (frame["value_raw"][priced] / frame["shares"][priced]).median() if priced.any() else 0.0
         scale_factor = 1000.0 if implied_price < 1.0 else 1.0
         frame["value_usd"] = frame["value_raw"] * scale_factor
         frame = (
@@ -310,55 +342,34 @@ class InstitutionalPulseService:
         return frame.sort_values("value_usd", ascending=False).reset_index(drop=True)
 
     def _fetch_holdings_frame(self, cik: str, filing: Dict[str, str]) -> pd.DataFrame:
-        info_url = self._find_information_table_url(cik, filing["accession_no_dash"], filing["primary_document"])
-        return self._parse_information_table_xml(self._fetch_text(info_url))
+        """Parsed holdings of one accession; filed 13Fs never change, so each is downloaded at most once."""
+        record_key = self._holdings_snapshot_key(cik, filing["accession_no_dash"])
+        record = self.snapshot_store.read_json(record_key) or {}
+        if isinstance(record.get("holdings"), dict):
+            return pd.DataFrame(**record["holdings"])
+
+        info_url = record.get("info_table_url")
+        if not info_url:
+            info_url = self._find_information_table_url(cik, filing["accession_no_dash"], filing["primary_document"])
+            record = {"accession": filing["accession"], "filing_date": filing["filing_date"], "info_table_url": info_url}
+            self.snapshot_store.write_json(record_key, record)
+
+        with self.session.get(info_url, timeout=20, stream=True) as response:
+            response.raise_for_status()
+            frame = self._parse_information_table_xml(response.iter_content(chunk_size=XML_CHUNK_BYTES))
+        self.snapshot_store.write_json(record_key, {**record, "synced_at": _now_iso(), "holdings": frame.to_dict(orient="split")})
+        return frame
 
     def _compare_holdings_frames(self, current_df: pd.DataFrame, previous_df: pd.DataFrame) -> pd.DataFrame:
-        current = current_df.copy() if current_df is not None and not current_df.empty else pd.DataFrame(columns=["holding_key"])
-        previous = previous_df.copy() if previous_df is not None and not previous_df.empty else pd.DataFrame(columns=["holding_key"])
-        columns = ["holding_key", "issuer", "class_title", "cusip", "value_usd", "shares", "portfolio_weight", "put_call"]
-
-        merged = current[columns].merge(
-            previous[columns],
-            on="holding_key",
-            how="outer",
-            suffixes=("_curr", "_prev"),
-        ).fillna(0)
-
-        for column in [
-            "issuer_curr",
-            "class_title_curr",
-            "cusip_curr",
-            "put_call_curr",
-            "issuer_prev",
-            "class_title_prev",
-            "cusip_prev",
-            "put_call_prev",
-        ]:
-            if column in merged.columns:
-                merged[column] = merged[column].replace(0, "")
-
-        merged["issuer"] = merged["issuer_curr"].where(merged["issuer_curr"] != "", merged["issuer_prev"])
-        merged["issuer_key"] = merged["issuer"].apply(self._normalize_issuer_key)
-        merged["class_title"] = merged["class_title_curr"].where(merged["class_title_curr"] != "", merged["class_title_prev"])
-        merged["cusip"] = merged["cusip_curr"].where(merged["cusip_curr"] != "", merged["cusip_prev"])
-        merged["put_call"] = merged["put_call_curr"].where(merged["put_call_curr"] != "", merged["put_call_prev"])
-        merged["value_change"] = merged["value_usd_curr"] - merged["value_usd_prev"]
-        merged["weight_change"] = merged["portfolio_weight_curr"] - merged["portfolio_weight_prev"]
-
-        def _action(row: pd.Series) -> str:
-            if row["value_usd_prev"] == 0 and row["value_usd_curr"] > 0:
-                return "NEW"
-            if row["value_usd_curr"] == 0 and row["value_usd_prev"] > 0:
-                return "SOLD"
-            if row["value_change"] > 0:
-                return "INCREASED"
-            if row["value_change"] < 0:
-                return "DECREASED"
-            return "UNCHANGED"
-
-        merged["action"] = merged.apply(_action, axis=1)
-        return merged.reset_index(drop=True)
+        merged = diff_holdings(
+            current_df,
+            previous_df,
+            key="holding_key",
+            numeric=("value_usd", "shares", "portfolio_weight"),
+            labels=("issuer", "class_title", "cusip", "put_call"),
+        )
+        merged["issuer_key"] = issuer_keys(merged["issuer"])
+        return merged
 
     def _holdings_rows(self, frame: pd.DataFrame, limit: int = 10) -> List[Dict[str, Any]]:
         if frame is None or frame.empty:
@@ -484,6 +495,14 @@ class InstitutionalPulseService:
         self.snapshot_store.write_json(self._dataset_snapshot_key(selected_manager), dataset)
         return dataset
 
+    def get_manager_datasets(self, manager_keys: Iterable[str] | None = None) -> Dict[str, Dict[str, Any]]:
+        """Datasets for several managers; filings that need a refresh are fetched and parsed concurrently."""
+        keys = list(dict.fromkeys(self._selected_manager(key) for key in (self.manager_keys() if manager_keys is None else manager_keys)))
+        if len(keys) < 2:
+            return {manager_key: self.get_manager_dataset(manager_key) for manager_key in keys}
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(keys))) as pool:
+            return dict(zip(keys, pool.map(self.get_manager_dataset, keys)))
+
     def _movement_rows(self, frame: pd.DataFrame, action: str, limit: int = 8) -> List[Dict[str, Any]]:
         if frame is None or frame.empty:
             return []
@@ -599,7 +618,7 @@ class InstitutionalPulseService:
         )
 
     def get_health_snapshot(self) -> Dict[str, Any]:
-        datasets = {manager_key: self.get_manager_dataset(manager_key) for manager_key in self.manager_keys()}
+        datasets = self.get_manager_datasets()
         coverage_rows = self._coverage_rows(datasets)
         live_count = sum(1 for row in coverage_rows if row["source_state"] == "live")
         snapshot_count = sum(1 for row in coverage_rows if row["source_state"] == "snapshot")
@@ -739,10 +758,9 @@ class InstitutionalPulseService:
             return workspace
 
         datasets_by_manager = {selected_manager: dataset}
-        for manager_name in self.manager_keys():
-            if manager_name == selected_manager:
-                continue
-            datasets_by_manager[manager_name] = self.get_manager_dataset(manager_name)
+        datasets_by_manager.update(
+            self.get_manager_datasets(key for key in self.manager_keys() if key != selected_manager)
+        )
 
         workspace = self._workspace_from_dataset(dataset, datasets_by_manager)
 
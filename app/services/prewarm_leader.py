@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.utils.logger import get_logger
+
+try:
+    import fcntl
+except Exception:  # pragma: no cover - non-POSIX hosts
+    fcntl = None
+
+logger = get_logger(__name__)
+
+
+class PrewarmLeaderLease:
+    """Cross-process leadership for the prewarm cycle.
+
+    Leadership is an exclusive ``flock`` on a lock file inside the snapshot
+    directory. The kernel drops the lock when the holding process exits, so a
+    crashed leader is replaced by whichever follower polls next.
+    """
+
+    LOCK_FILENAME = ".prewarm-leader.lock"
+
+    def __init__(self, lock_path: str | Path | None = None) -> None:
+        if lock_path is None:
+            root = Path(__file__).resolve().parents[2]
+            lock_path = root / settings.PUBLIC_SNAPSHOT_DIR / self.LOCK_FILENAME
+        self.lock_path = Path(lock_path)
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd: Optional[int] = None
+        self.acquired_at: Optional[float] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._fd is not None
+
+    def try_acquire(self) -> bool:
+        if self._fd is not None:
+            return True
+        if fcntl is None:
+            # Without flock there is no safe way to coordinate; behave like a single process.
+            self._fd = -1
+            self.acquired_at = time.time()
+            return True
+        fd = os.open(str(self.lock_path), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{os.getpid()}\n".encode("ascii"))
+        self._fd = fd
+        self.acquired_at = time.time()
+        logger.info("Acquired prewarm leadership", pid=os.getpid(), lock_path=str(self.lock_path))
+        return True
+
+    def release(self) -> None:
+        fd, self._fd = self._fd, None
+        self.acquired_at = None
+        if fd is None or fd < 0:
+            return
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+        logger.info("Released prewarm leadership", pid=os.getpid())
+
+    def holder_pid(self) -> Optional[int]:
+        try:
+            raw = self.lock_path.read_text(encoding="ascii").strip()
+        except Exception:
+            return None
+        return int(raw) if raw.isdigit() else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "role": "leader" if self.is_leader else "follower",
+            "pid": os.getpid(),
+            "leader_pid": os.getpid() if self.is_leader else self.holder_pid(),
+            "acquired_at": self.acquired_at,
+        }
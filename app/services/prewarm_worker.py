@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import threading
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from app.core.config import settings
+from app.services.prewarm_leader import PrewarmLeaderLease
 from app.services.public_dashboard import PublicDashboardService
 from app.services.institutional_pulse import InstitutionalPulseService
 from app.services.public_research import PublicResearchService
@@ -14,8 +15,18 @@ logger = get_logger(__name__)
 
 
 class PublicDataPrewarmWorker:
-    def __init__(self, interval_seconds: int | None = None) -> None:
+    def __init__(
+        self,
+        interval_seconds: int | None = None,
+        leader_lease: PrewarmLeaderLease | None = None,
+        publish_artifacts: Callable[[], Dict[str, str]] | None = None,
+    ) -> None:
         self.interval_seconds = interval_seconds or settings.PREWARM_INTERVAL_SECONDS
+        self.leader_poll_seconds = min(self.interval_seconds, settings.PREWARM_LEADER_POLL_SECONDS)
+        if leader_lease is None and settings.PREWARM_LEADER_ELECTION:
+            leader_lease = PrewarmLeaderLease()
+        self.leader_lease = leader_lease
+        self.publish_artifacts = publish_artifacts
         self.public_tr_funds_months = settings.PUBLIC_TR_FUNDS_MONTHS
         self.stop_event = threading.Event()
         self.thread: threading.Thread | None = None
@@ -35,12 +46,21 @@ class PublicDataPrewarmWorker:
         self.stop_event.set()
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=3)
+        if self.leader_lease is not None:
+            self.leader_lease.release()
+
+    def is_leader(self) -> bool:
+        if self.leader_lease is None:
+            return True
+        return self.leader_lease.try_acquire()
 
     def snapshot(self) -> Dict[str, Any]:
         return {
             "enabled": True,
             "interval_seconds": self.interval_seconds,
             "alive": bool(self.thread and self.thread.is_alive()),
+            "leader_election": self.leader_lease is not None,
+            **(self.leader_lease.snapshot() if self.leader_lease is not None else {"role": "leader"}),
         }
 
     def run_once(self) -> Dict[str, Any]:
@@ -130,7 +150,7 @@ class PublicDataPrewarmWorker:
             warmed_stock_symbols.append(normalized_symbol)
             if workspace.get("error"):
                 stock_error_count += 1
-            forecast_workspace = self.public_research_service.get_forecast_workspace(normalized_symbol, 21)
+            forecast_workspace = self.public_research_service.get_forecast_workspace(normalized_symbol, 21, refresh_backtest=True)
             warmed_forecast_symbols.append(normalized_symbol)
             if forecast_workspace.get("error"):
                 forecast_error_count += 1
@@ -147,7 +167,7 @@ class PublicDataPrewarmWorker:
             warmed_fund_symbols.append(normalized_symbol)
             if workspace.get("error"):
                 fund_error_count += 1
-            fund_forecast = self.public_research_service.get_forecast_workspace(normalized_symbol, 21)
+            fund_forecast = self.public_research_service.get_forecast_workspace(normalized_symbol, 21, refresh_backtest=True)
             warmed_fund_forecasts.append(normalized_symbol)
             if fund_forecast.get("error"):
                 fund_forecast_error_count += 1
@@ -165,10 +185,10 @@ class PublicDataPrewarmWorker:
         overlap_matrix_workspace = self.public_research_service.get_overlap_matrix_workspace(
             settings.PUBLIC_DEFAULT_OWNERSHIP_FOCUS,
         )
-        institutional_states = {}
-        for manager_key in self.institutional_pulse_service.manager_keys():
-            dataset = self.institutional_pulse_service.get_manager_dataset(manager_key)
-            institutional_states[manager_key] = dataset.get("source_state")
+        institutional_states = {
+            manager_key: dataset.get("source_state")
+            for manager_key, dataset in self.institutional_pulse_service.get_manager_datasets().items()
+        }
         institutional_workspace = self.institutional_pulse_service.get_workspace(settings.PUBLIC_DEFAULT_INSTITUTIONAL_MANAGER)
         result = {
             "tr_funds_status": tr_result.get("status"),
@@ -200,14 +220,32 @@ class PublicDataPrewarmWorker:
             "institutional_state": institutional_workspace.get("source_state"),
             "institutional_ready": sum(1 for state in institutional_states.values() if state == "live"),
         }
+        if self.publish_artifacts is not None:
+            # Last, so the published responses are encoded from the caches this cycle just refreshed.
+            result["api_artifacts_published"] = len(self.publish_artifacts())
         logger.info("Completed public data prewarm cycle", **result)
         return result
 
+    def run_cycle(self) -> Dict[str, Any] | None:
+        """Run one warm cycle if this process holds leadership.
+
+        Followers skip the cycle and serve whatever the leader persisted to the
+        snapshot store; they keep polling the lease so leadership fails over
+        when the leader process exits.
+        """
+        if not self.is_leader():
+            logger.debug("Skipping prewarm cycle; another process holds leadership")
+            return None
+        return self.run_once()
+
     def _run_forever(self) -> None:
         while not self.stop_event.is_set():
+            wait_seconds = self.leader_poll_seconds
             try:
-                self.run_once()
+                if self.run_cycle() is not None:
+                    wait_seconds = self.interval_seconds
             except Exception as exc:
+                wait_seconds = self.interval_seconds
                 logger.error("Public data prewarm cycle failed", error=str(exc))
-            if self.stop_event.wait(self.interval_seconds):
+            if self.stop_event.wait(wait_seconds):
                 break
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import date, datetime, timedelta
 from typing import Any, Dict, List
 
@@ -19,11 +22,23 @@ from app.services.institutional_pulse import InstitutionalPulseService
 from app.services.public_research import PublicResearchService
 from app.services.snapshot_store import SnapshotStore
 from app.services.stock_enrichment import StockEnrichmentService
-from app.services.tr_funds import TRFundsService
+from app.services.tr_funds import PeerBoard, TRFundsService
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Refresh interval per independently rebuilt dashboard section.
+DASHBOARD_SECTION_TTLS: Dict[str, int] = {
+    "market": 300,
+    "crypto": 300,
+    "sentiment": 600,
+    "bist-catalyst": 900,
+    "macro": 1800,
+    "entropy": 1800,
+}
+# How long a forced snapshot waits for due sections before assembling from the last good states.
+DASHBOARD_SECTION_WAIT_SECONDS = 20
+
 
 def _tone_for_change(change_pct: float) -> str:
     if change_pct > 0.1:
@@ -135,6 +150,8 @@ def _safe_entropy_score(value: Any, multiplier: float = 100.0) -> float | None:
 
 
 class PublicDashboardService:
+    SECTION_WORKERS = len(DASHBOARD_SECTION_TTLS)
+
     def __init__(self, ttl_seconds: int = 300) -> None:
         self.ttl_seconds = ttl_seconds
         self.public_tr_funds_months = settings.PUBLIC_TR_FUNDS_MONTHS
@@ -150,10 +167,18 @@ class PublicDashboardService:
         self.institutional = InstitutionalPulseService(snapshot_store=self.snapshot_store)
         self.stock_enrichment = StockEnrichmentService(snapshot_store=self.snapshot_store)
         self.entropy = EntropyCalculator()
+        self._sections: Dict[str, Dict[str, Any]] = {}
+        self._section_attempts: Dict[str, float] = {}
+        self._section_futures: Dict[str, Future] = {}
+        self._section_lock = threading.Lock()
+        self._section_pool: ThreadPoolExecutor | None = None
 
     def _snapshot_key(self) -> str:
         return "public-dashboard-snapshot"
 
+    def _section_snapshot_key(self, section: str) -> str:
+        return f"public-dashboard-section-{section}"
+
     def _influence_snapshot_key(self) -> str:
         return "public-influence-map-snapshot"
 
@@ -317,6 +342,108 @@ class PublicDashboardService:
             normalized["entropy_signal"] = self._entropy_placeholder(effective_generated_at)
         return normalized
 
+    def _build_section(self, section: str, generated_at: str) -> Dict[str, Any]:
+        """Snapshot fields owned by ``section``, built from its upstream sources."""
+        if section == "market":
+            cards, status = self._build_market_cards(generated_at)
+            return {"market_cards": cards, "market_status": status}
+        if section == "macro":
+            cards, status = self._build_macro_cards(generated_at)
+            return {"macro_cards": cards, "macro_status": status}
+        if section == "crypto":
+            cards, status = self._build_crypto_cards(generated_at)
+            return {"crypto_cards": cards, "crypto_status": status}
+        if section == "entropy":
+            entropy_signal = self._build_entropy_signal(generated_at)
+            return {
+                "entropy_signal": entropy_signal,
+                "market_physics": self._build_market_physics(entropy_signal, generated_at),
+            }
+        if section == "sentiment":
+            return {"sentiment": self._build_sentiment()}
+        if section == "bist-catalyst":
+            rows, summary = self._build_bist_catalyst_lane()
+            return {"bist_catalyst_rows": rows, "bist_catalyst_summary": summary}
+        raise ValueError(f"Unknown dashboard section: {section}")
+
+    def _section_is_good(self, section: str, values: Dict[str, Any]) -> bool:
+        if section in ("market", "macro", "crypto"):
+            return bool(values.get(f"{section}_cards"))
+        if section == "entropy":
+            return (values.get("entropy_signal") or {}).get("state") != "warming"
+        if section == "bist-catalyst":
+            return bool(values.get("bist_catalyst_rows"))
+        return True
+
+    def _refresh_section(self, section: str, generated_at: str) -> None:
+        started = time.monotonic()
+        try:
+            values = _to_json_safe(self._build_section(section, generated_at))
+        except Exception as exc:
+            logger.warning("Dashboard section refresh failed; keeping last good state", section=section, error=str(exc))
+            return
+        if not self._section_is_good(section, values) and self._section_state(section) is not None:
+            logger.info("Dashboard section came back empty; keeping last good state", section=section)
+            return
+        state = {"refreshed_at": generated_at, "values": values}
+        with self._section_lock:
+            self._sections[section] = state
+        self.snapshot_store.write_json(self._section_snapshot_key(section), state)
+        logger.debug("Refreshed dashboard section", section=section, seconds=round(time.monotonic() - started, 3))
+
+    def _section_state(self, section: str) -> Dict[str, Any] | None:
+        state = self._sections.get(section)
+        if state is None:
+            persisted = self.snapshot_store.read_json(self._section_snapshot_key(section))
+            if isinstance(persisted, dict) and isinstance(persisted.get("values"), dict):
+                with self._section_lock:
+                    state = self._sections.setdefault(section, persisted)
+        return state
+
+    def refresh_sections(self, generated_at: str, timeout: float = DASHBOARD_SECTION_WAIT_SECONDS) -> Dict[str, Any]:
+        """
+        Refresh the dashboard sections whose TTL has lapsed and return the merged section fields.
+
+        Due sections run concurrently on a shared pool. A section still running after
+        ``timeout`` seconds keeps going in the background and the snapshot uses its last good
+        state, so one slow source never holds back the others. Persisted states only seed
+        the fallback; every section is rebuilt once per process.
+        """
+        now = time.monotonic()
+        with self._section_lock:
+            if self._section_pool is None:
+                self._section_pool = ThreadPoolExecutor(
+                    max_workers=self.SECTION_WORKERS,
+                    thread_name_prefix="dashboard-section",
+                )
+            futures = []
+            for section, ttl_seconds in DASHBOARD_SECTION_TTLS.items():
+                running = self._section_futures.get(section)
+                if running is None or running.done():
+                    attempted = self._section_attempts.get(section)
+                    if attempted is not None and now - attempted < ttl_seconds:
+                        continue
+                    self._section_attempts[section] = now
+                    running = self._section_futures[section] = self._section_pool.submit(
+                        self._refresh_section,
+                        section,
+                        generated_at,
+                    )
+                futures.append(running)
+        _, pending = wait(futures, timeout=timeout)
+        if pending:
+            logger.warning(
+                "Dashboard sections still refreshing; serving last good state",
+                sections=[section for section, future in self._section_futures.items() if future in pending],
+            )
+
+        values: Dict[str, Any] = {}
+        for section in DASHBOARD_SECTION_TTLS:
+            state = self._section_state(section)
+            if state is not None:
+                values.update(state["values"])
+        return values
+
     def build_snapshot(self, force_refresh: bool = False) -> Dict[str, Any]:
         cache_key = "public-dashboard:snapshot"
         cached = cache_get(cache_key)
@@ -333,35 +460,37 @@ class PublicDashboardService:
             return self._build_placeholder_snapshot()
 
         generated_at = datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
-        market_cards, market_status = self._build_market_cards(generated_at)
-        entropy_signal = self._build_entropy_signal(generated_at)
-        market_physics = self._build_market_physics(entropy_signal, generated_at)
-        macro_cards, macro_status = self._build_macro_cards(generated_at)
-        crypto_cards, crypto_status = self._build_crypto_cards(generated_at)
+        sections = self.refresh_sections(generated_at)
+        placeholder = self._build_placeholder_snapshot()
         tr_top_pick = self._build_cached_tr_top_pick()
         tr_peer_board = self._build_cached_tr_peer_board()
         tr_status = self._build_tr_status(generated_at, tr_peer_board)
         influence_workspace = self.build_influence_workspace(force_refresh=True)
         kap_status = self.stock_enrichment.get_health_snapshot()
         institutional_status = self.institutional.get_health_snapshot()
-        bist_catalyst_rows, bist_catalyst_summary = self._build_bist_catalyst_lane()
+        section_statuses = [sections.get(f"{feed}_status") for feed in ("market", "macro", "crypto")]
 
         snapshot = {
             "app_name": settings.APP_DISPLAY_NAME,
             "generated_at": generated_at,
-            "market_cards": market_cards,
-            "entropy_signal": entropy_signal,
-            "market_physics": market_physics,
-            "macro_cards": macro_cards,
-            "crypto_cards": crypto_cards,
-            "sentiment": self._build_sentiment(),
+            "market_cards": sections.get("market_cards", []),
+            "entropy_signal": sections.get("entropy_signal"),
+            "market_physics": sections.get("market_physics"),
+            "macro_cards": sections.get("macro_cards", []),
+            "crypto_cards": sections.get("crypto_cards", []),
+            "sentiment": sections.get("sentiment", placeholder["sentiment"]),
             "tr_top_pick": tr_top_pick,
             "tr_peer_board": tr_peer_board,
-            "bist_catalyst_rows": bist_catalyst_rows,
-            "bist_catalyst_summary": bist_catalyst_summary,
+            "bist_catalyst_rows": sections.get("bist_catalyst_rows", []),
+            "bist_catalyst_summary": sections.get("bist_catalyst_summary", placeholder["bist_catalyst_summary"]),
             "influence_rows": influence_workspace.get("pair_rows", [])[:5],
             "influence_summary": influence_workspace.get("headline", {}),
-            "source_health": [market_status, macro_status, crypto_status, kap_status, tr_status, institutional_status],
+            "source_health": [
+                *(status for status in section_statuses if status),
+                kap_status,
+                tr_status,
+                institutional_status,
+            ],
             "coverage_cards": self._build_coverage_cards(),
             "sponsor_slots": self._build_sponsor_slots(),
             "editorial_cards": self._build_editorial_cards(),
@@ -1312,19 +1441,16 @@ class PublicDashboardService:
             "vix_label": f"{vix_value:.2f}",
         }
 
+    def _cached_tr_board(self) -> PeerBoard | None:
+        return self.tr_funds.get_cached_peer_board(months=self.public_tr_funds_months)
+
     def _build_cached_tr_peer_board(self) -> List[Dict[str, Any]]:
-        peer_df = cache_get(f"tr-funds:peer-board:{self.public_tr_funds_months}")
-        if not isinstance(peer_df, pd.DataFrame):
-            return []
-        if peer_df.empty:
-            return []
-        return peer_df.head(6).to_dict("records")
+        board = self._cached_tr_board()
+        return list(board.records[:6]) if board is not None else []
 
     def _build_cached_tr_top_pick(self) -> Dict[str, Any] | None:
-        peer_df = cache_get(f"tr-funds:peer-board:{self.public_tr_funds_months}")
-        if not isinstance(peer_df, pd.DataFrame) or peer_df.empty:
-            return None
-        return dict(peer_df.iloc[0])
+        board = self._cached_tr_board()
+        return board.top_pick if board is not None else None
 
     def _build_tr_status(self, generated_at: str, tr_peer_board: List[Dict[str, Any]]) -> Dict[str, str]:
         status = self.tr_funds.get_status(months=self.public_tr_funds_months)
@@ -4,10 +4,11 @@ import csv
 import json
 import re
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from io import StringIO
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
 from urllib.parse import quote_plus
 
 import numpy as np
@@ -55,6 +56,7 @@ from app.services.tr_funds import (
     _signal_band,
     _signal_score,
 )
+from app.utils.fetch_context import fetch_context, request_memoized, request_scoped, submit
 from modules.etf_weight_tracker import ETFWeightTracker
 from modules.portfolio_health import PortfolioHealthScore
 from modules.scenario_sandbox import ScenarioSandbox
@@ -1523,6 +1525,7 @@ class PublicResearchService:
             )
         return normalized
 
+    @request_memoized("stock-snapshot")
     def _read_stock_snapshot(self, symbol: str) -> Dict[str, Any] | None:
         candidates = [symbol.upper()]
         if symbol.upper().endswith(".IS"):
@@ -1927,6 +1930,7 @@ class PublicResearchService:
     def _asset_label(self, key: str) -> str:
         return ASSET_LABELS.get(key, key.replace("_", " ").title())
 
+    @request_memoized("sector-tailwind")
     def _sector_tailwind_map(self) -> Dict[str, float]:
         sector_workspace = self.get_sector_rotation_workspace()
         if sector_workspace.get("error"):
@@ -2825,7 +2829,7 @@ class PublicResearchService:
                 "volume": "Volume",
             }
         )
-        technicals = self.stocks_analyzer.calculate_technical_indicators(ohlcv_df)
+        technicals = self.stocks_analyzer.calculate_technical_indicators(ohlcv_df, resolved_symbol)
         returns = self.stocks_analyzer.calculate_returns(ohlcv_df["close"]) if not ohlcv_df.empty else {}
         trend = self.trend_analyzer.comprehensive_trend_analysis(trend_df) if not trend_df.empty else {}
         fundamental_lens = self._get_fundamental_lens(resolved_symbol, payload)
@@ -3192,6 +3196,7 @@ class PublicResearchService:
         available_models: int,
         validated_series: list[Dict[str, Any]],
         current_price: float,
+        backtested: Dict[str, Dict[str, Any]] | None = None,
     ) -> Dict[str, Any]:
         validated_count = len(validated_series)
         rejected_count = max(available_models - validated_count, 0)
@@ -3208,6 +3213,26 @@ class PublicResearchService:
             if state == "Partial"
             else "Only the fallback path survived validation; treat the output as a scenario sketch."
         )
+        checks = [
+            "Finite future prices only",
+            "Positive closing levels only",
+            "At least three future observations",
+            "Dates must remain ordered and parseable",
+        ]
+        backtested = backtested or {}
+        out_of_sample = None
+        if backtested:
+            folds = max(int(item.get("folds") or 0) for item in backtested.values())
+            horizon = max(int(item.get("horizon") or 0) for item in backtested.values())
+            hit_rates = [float(item["Hit Rate"]) for item in backtested.values() if item.get("Hit Rate") is not None]
+            out_of_sample = {
+                "models": len(backtested),
+                "folds": folds,
+                "horizon": horizon,
+                "avg_hit_rate": _fmt_number(np.mean(hit_rates) * 100, 0) + "%" if hit_rates else "N/A",
+            }
+            detail = f"{detail} Errors are scored out of sample across {folds} walk-forward folds of {horizon} bars."
+            checks.append("Walk-forward out-of-sample error and hit rate")
         return {
             "state": state,
             "validated_models": validated_count,
@@ -3215,12 +3240,8 @@ class PublicResearchService:
             "rejected_models": rejected_count,
             "dispersion_pct": _fmt_pct(dispersion_pct),
             "detail": detail,
-            "checks": [
-                "Finite future prices only",
-                "Positive closing levels only",
-                "At least three future observations",
-                "Dates must remain ordered and parseable",
-            ],
+            "checks": checks,
+            "out_of_sample": out_of_sample,
         }
 
     def _build_forecast_chart_svg(
@@ -3493,16 +3514,16 @@ class PublicResearchService:
             "detail": "Compact fund forecast lens is derived from the validated multi-model forecast workspace.",
         }
 
-    def get_forecast_workspace(self, symbol: str, days: int) -> Dict[str, Any]:
+    def get_forecast_workspace(self, symbol: str, days: int, refresh_backtest: bool = False) -> Dict[str, Any]:
         symbol = (symbol or settings.PUBLIC_DEFAULT_FORECAST_SYMBOL).upper()
         days = max(7, min(days or settings.PUBLIC_DEFAULT_FORECAST_DAYS, 90))
         cache_key = self._cache_key("public-research-forecast", symbol, days)
-        cached = cache_get(cache_key)
+        cached = None if refresh_backtest else cache_get(cache_key)
         if isinstance(cached, dict):
             return cached
 
         engine = PublicPricePredictionEngine(symbol, period="2y")
-        predictions = engine.get_all_predictions(days=days)
+        predictions = engine.get_all_predictions(days=days, refresh_backtest=refresh_backtest)
 
         if not predictions:
             fallback = self._build_fallback_forecast(symbol, days)
@@ -3519,6 +3540,7 @@ class PublicResearchService:
         model_rows = []
         bullish = 0
         final_targets = []
+        backtested: Dict[str, Dict[str, Any]] = {}
         available_models = len(predictions)
 
         for model_name, result in predictions.items():
@@ -3544,6 +3566,9 @@ class PublicResearchService:
             validated_series.append(sanitized)
 
             metrics = result.get("metrics", {})
+            backtest = result.get("backtest") or {}
+            if backtest:
+                backtested[sanitized["model"]] = backtest
             model_rows.append(
                 {
                     "model": sanitized["model"],
@@ -3554,6 +3579,9 @@ class PublicResearchService:
                     "mae": _fmt_number(metrics.get("MAE"), 2),
                     "r2": _fmt_number(metrics.get("R²"), 2),
                     "aic": _fmt_number(metrics.get("AIC"), 1),
+                    "oos_rmse": _fmt_number(backtest.get("RMSE"), 2),
+                    "oos_mae": _fmt_number(backtest.get("MAE"), 2),
+                    "hit_rate": _fmt_number(backtest["Hit Rate"] * 100, 0) + "%" if "Hit Rate" in backtest else "N/A",
                     "validation": sanitized["validation"],
                 }
             )
@@ -3563,9 +3591,11 @@ class PublicResearchService:
             cache_set(cache_key, fallback, ttl=900)
             return fallback
 
+        # Rank on walk-forward error when every row has it; in-sample error is only a fallback.
+        rank_field = "oos_rmse" if all(row["model"] in backtested for row in model_rows) else "rmse"
         model_rows = sorted(
             model_rows,
-            key=lambda item: self._compare_float(item.get("rmse")) if self._compare_float(item.get("rmse")) is not None else 10**9,
+            key=lambda item: self._compare_float(item.get(rank_field)) if self._compare_float(item.get(rank_field)) is not None else 10**9,
         )
         best_model = model_rows[0]
         consensus_price = sum(final_targets) / len(final_targets)
@@ -3636,7 +3666,12 @@ class PublicResearchService:
 
         chart_svg = self._build_forecast_chart_svg(symbol, history_prices, chart_lines)
         entropy_signal = self._build_forecast_entropy_signal(engine.data["Close"] if engine.data is not None and "Close" in engine.data else pd.Series(dtype=float))
-        validation_summary = self._build_forecast_validation_summary(available_models, validated_series, current_price)
+        validation_summary = self._build_forecast_validation_summary(
+            available_models,
+            validated_series,
+            current_price,
+            backtested=backtested,
+        )
 
         result = _to_json_safe(
             {
@@ -4021,6 +4056,7 @@ class PublicResearchService:
             }
         )
 
+    @request_scoped
     def get_screener_workspace(self, universe: str | None, screen_key: str | None, limit: int = 18) -> Dict[str, Any]:
         selected_universe = self._selected_universe(universe)
         selected_screen = self._selected_screen(screen_key)
@@ -4280,7 +4316,7 @@ class PublicResearchService:
             holdings = self.etf_tracker.fetch_etf_holdings(etf, force_refresh=False)
             fetch_counts.append({"etf": etf, "rows": int(len(holdings))})
 
-        exposure_df = self.etf_tracker.get_funds_for_stock(symbol, min_weight=0.05)
+        exposure_df = self.etf_tracker.get_fund_exposures([symbol], min_weight=0.05)
         weight_changes = self.etf_tracker.get_weight_changes(symbol, period_days=90)
         action_signal = self.etf_tracker.detect_fund_manager_actions(symbol, threshold=0.5)
         tracker_stats = self.etf_tracker.get_summary_stats()
@@ -4348,6 +4384,7 @@ class PublicResearchService:
         cache_set(cache_key, result, ttl=self.ttl_seconds)
         return result
 
+    @request_memoized("sector-rotation")
     def get_sector_rotation_workspace(self) -> Dict[str, Any]:
         cache_key = self._cache_key("public-research-sector-rotation", "v1")
         cached = cache_get(cache_key)
@@ -4512,6 +4549,18 @@ class PublicResearchService:
             "rows": rows,
         }
 
+    def _resolve_compare_pair(
+        self,
+        build: Callable[[str], Dict[str, Any]],
+        left_symbol: str,
+        right_symbol: str,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Both compare workspaces, built side by side and sharing benchmark, sector and peer fetches."""
+        with fetch_context(), ThreadPoolExecutor(max_workers=1) as pool:
+            right_future = submit(pool, build, right_symbol)
+            left_ws = build(left_symbol)
+            return left_ws, right_future.result()
+
     def get_compare_workspace(
         self,
         kind: str | None,
@@ -4532,8 +4581,7 @@ class PublicResearchService:
                 if not fallback_candidates:
                     fallback_candidates = [item for item in self._featured_stock_symbols() if item != left_symbol]
                 right_symbol = fallback_candidates[0] if fallback_candidates else "NVDA"
-            left_ws = self.get_stock_workspace(left_symbol)
-            right_ws = self.get_stock_workspace(right_symbol)
+            left_ws, right_ws = self._resolve_compare_pair(self.get_stock_workspace, left_symbol, right_symbol)
             compare_rows = [
                 {
                     "metric": "3M change",
@@ -4596,8 +4644,7 @@ class PublicResearchService:
                 if not fallback_candidates:
                     fallback_candidates = [item for item in self._featured_fund_symbols() if item != left_symbol]
                 right_symbol = fallback_candidates[0] if fallback_candidates else ("SPY" if left_symbol != "SPY" else "QQQ")
-            left_ws = self.get_fund_workspace(left_symbol)
-            right_ws = self.get_fund_workspace(right_symbol)
+            left_ws, right_ws = self._resolve_compare_pair(self.get_fund_workspace, left_symbol, right_symbol)
             left_risk = left_ws.get("risk_snapshot") or {}
             right_risk = right_ws.get("risk_snapshot") or {}
             left_monthly = (left_ws.get("monthly_rows") or [])[-1] if left_ws.get("monthly_rows") else {}
@@ -4647,8 +4694,9 @@ class PublicResearchService:
             right_symbol = (right or (featured[1] if len(featured) > 1 else "GAH")).upper()
             if right_symbol == left_symbol:
                 right_symbol = featured[1] if len(featured) > 1 and featured[1] != left_symbol else "GAH"
-            left_ws = self.get_tr_fund_workspace(left_symbol, months)
-            right_ws = self.get_tr_fund_workspace(right_symbol, months)
+            left_ws, right_ws = self._resolve_compare_pair(
+                lambda code: self.get_tr_fund_workspace(code, months), left_symbol, right_symbol
+            )
             left_signal = left_ws.get("signal_card") or {}
             right_signal = right_ws.get("signal_card") or {}
             left_overview = left_ws.get("overview") or {}
@@ -4910,39 +4958,28 @@ class PublicResearchService:
 
         focus_config = self.ownership_focuses[selected_focus]
         etfs = focus_config["etfs"][:8]
-        holdings_map: Dict[str, pd.DataFrame] = {}
         for etf in etfs:
-            holdings_map[etf] = self.etf_tracker.fetch_etf_holdings(etf, force_refresh=False)
+            self.etf_tracker.fetch_etf_holdings(etf, force_refresh=False)
+        exposure = self.etf_tracker.get_exposure_matrix(fund_codes=etfs)
+        weights = exposure.to_numpy()
+        held = weights > 0
+        symbols = exposure.index.astype(str).str.upper().to_numpy()
 
         pair_rows: List[Dict[str, Any]] = []
         for index, left_etf in enumerate(etfs):
-            left_df = holdings_map.get(left_etf)
-            if left_df is None or left_df.empty:
-                continue
-            left_map = {
-                str(row["stock_symbol"]).upper(): float(row["weight_pct"] or 0.0)
-                for _, row in left_df.iterrows()
-            }
-            for right_etf in etfs[index + 1 :]:
-                right_df = holdings_map.get(right_etf)
-                if right_df is None or right_df.empty:
-                    continue
-                right_map = {
-                    str(row["stock_symbol"]).upper(): float(row["weight_pct"] or 0.0)
-                    for _, row in right_df.iterrows()
-                }
-                shared = sorted(set(left_map) & set(right_map))
-                if not shared:
+            for offset, right_etf in enumerate(etfs[index + 1 :], start=index + 1):
+                shared_mask = held[:, index] & held[:, offset]
+                if not shared_mask.any():
                     continue
-                overlap_score = sum(min(left_map[symbol], right_map[symbol]) for symbol in shared)
-                shared_names = ", ".join(shared[:3])
+                overlap_score = float(np.minimum(weights[shared_mask, index], weights[shared_mask, offset]).sum())
+                shared = sorted(symbols[shared_mask])
                 pair_rows.append(
                     {
                         "left": left_etf,
                         "right": right_etf,
                         "overlap_score": _fmt_pct(overlap_score),
                         "shared_count": len(shared),
-                        "shared_names": shared_names,
+                        "shared_names": ", ".join(shared[:3]),
                     }
                 )
 
@@ -4968,6 +5005,7 @@ class PublicResearchService:
         cache_set(cache_key, result, ttl=self.ttl_seconds)
         return result
 
+    @request_scoped
     def get_idea_radar_workspace(self, universe: str | None, limit: int = 8) -> Dict[str, Any]:
         selected_universe = self._selected_universe(universe)
         limit = max(4, min(limit or 8, 12))
@@ -4983,14 +5021,17 @@ class PublicResearchService:
 
         for etf in self.ownership_focuses["core"]["etfs"]:
             self.etf_tracker.fetch_etf_holdings(etf, force_refresh=False)
+        candidate_symbols = [str(item.get("symbol", "")) for item in raw_rows]
+        exposure = self.etf_tracker.get_exposure_matrix(candidate_symbols, min_weight=0.05)
+        ownership_counts = dict(zip(candidate_symbols, (exposure.to_numpy() > 0).sum(axis=1).tolist()))
+        ownership_weights = dict(zip(candidate_symbols, exposure.to_numpy().sum(axis=1).tolist()))
 
         ranked_rows = []
         for item in raw_rows:
             symbol = str(item.get("symbol", ""))
             sector_tailwind = self._sector_tailwind(str(item.get("sector", "")), sector_map)
-            exposure_df = self.etf_tracker.get_funds_for_stock(symbol, min_weight=0.05)
-            ownership_count = int(len(exposure_df)) if exposure_df is not None else 0
-            ownership_weight = float(exposure_df["weight_pct"].sum()) if exposure_df is not None and not exposure_df.empty else 0.0
+            ownership_count = int(ownership_counts.get(symbol, 0))
+            ownership_weight = float(ownership_weights.get(symbol, 0.0))
             curated = self.institutional_pulse_service.get_symbol_signal(item.get("symbol"), item.get("name"))
             curated_summary = curated.get("summary", {})
             curated_holders = int(curated_summary.get("holder_count", 0) or 0)
@@ -5096,6 +5137,7 @@ class PublicResearchService:
         cache_set(cache_key, result, ttl=self.ttl_seconds)
         return result
 
+    @request_scoped
     def get_conviction_board_workspace(
         self,
         universe: str | None,
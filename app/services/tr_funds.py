@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date, datetime
 import re
 from typing import Any, Dict, Optional, Type
 import unicodedata
@@ -10,6 +11,7 @@ import pandas as pd
 from app.data_collectors.tefas_portfolio_tracker import TEFASPortfolioTracker
 from app.services.cache import cache_get, cache_set
 from app.services.snapshot_store import SnapshotStore
+from app.utils.fetch_context import request_memoized
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -335,6 +337,126 @@ def _enrich_peer_board_frame(frame: pd.DataFrame) -> pd.DataFrame:
     return enriched
 
 
+def _leadership_snapshot(peer_df: pd.DataFrame) -> Dict[str, list[Dict[str, Any]]]:
+    if peer_df.empty:
+        return {"family_rows": [], "factor_rows": []}
+
+    sorted_peer_df = peer_df.sort_values(
+        ["board_score", "signal_score", "investor_growth_pct"],
+        ascending=[False, False, False],
+    ).reset_index(drop=True)
+
+    family_df = (
+        sorted_peer_df.groupby("fund_family", dropna=False)
+        .agg(
+            funds_count=("fund_code", "count"),
+            avg_board_score=("board_score", "mean"),
+            avg_signal_score=("signal_score", "mean"),
+            avg_market_share=("market_share", "mean"),
+            avg_category_percentile=("category_percentile", "mean"),
+            top_fund=("fund_code", "first"),
+        )
+        .reset_index()
+    )
+    family_df["avg_board_score"] = family_df["avg_board_score"].round(1)
+    family_df["avg_signal_score"] = family_df["avg_signal_score"].round(1)
+    family_df["avg_market_share"] = family_df["avg_market_share"].round(2)
+    family_df["avg_category_percentile"] = family_df["avg_category_percentile"].round(1)
+    family_df["house_view"] = family_df.apply(
+        lambda row: _house_view(float(row["avg_board_score"]), float(row["avg_signal_score"])),
+        axis=1,
+    )
+    family_df = family_df.sort_values(
+        ["avg_board_score", "avg_signal_score", "funds_count"],
+        ascending=[False, False, False],
+    ).reset_index(drop=True)
+
+    factor_df = (
+        sorted_peer_df.groupby("local_factor", dropna=False)
+        .agg(
+            funds_count=("fund_code", "count"),
+            avg_board_score=("board_score", "mean"),
+            avg_signal_score=("signal_score", "mean"),
+            avg_investor_growth_pct=("investor_growth_pct", "mean"),
+            avg_value_growth_pct=("value_growth_pct", "mean"),
+            lead_fund=("fund_code", "first"),
+        )
+        .reset_index()
+    )
+    factor_df["avg_board_score"] = factor_df["avg_board_score"].round(1)
+    factor_df["avg_signal_score"] = factor_df["avg_signal_score"].round(1)
+    factor_df["avg_investor_growth_pct"] = factor_df["avg_investor_growth_pct"].round(1)
+    factor_df["avg_value_growth_pct"] = factor_df["avg_value_growth_pct"].round(1)
+    factor_df["breadth"] = factor_df.apply(
+        lambda row: _factor_breadth(
+            float(row["avg_investor_growth_pct"]),
+            float(row["avg_value_growth_pct"]),
+            float(row["avg_board_score"]),
+        ),
+        axis=1,
+    )
+    factor_df = factor_df.sort_values(
+        ["avg_board_score", "avg_signal_score", "funds_count"],
+        ascending=[False, False, False],
+    ).reset_index(drop=True)
+
+    return {
+        "family_rows": family_df.head(6).to_dict("records"),
+        "factor_rows": factor_df.head(6).to_dict("records"),
+    }
+
+
+def _to_json_safe(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        if isinstance(value, float) and value != value:
+            return None
+        return value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {str(key): _to_json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json_safe(item) for item in value]
+    if hasattr(value, "item"):
+        try:
+            return _to_json_safe(value.item())
+        except Exception:
+            pass
+    return str(value)
+
+
+@dataclass(frozen=True)
+class PeerBoard:
+    """
+    A published peer board: canonicalized and enriched once, then shared by every reader.
+
+    ``frame`` is handed out without copying and must be treated as read-only;
+    ``records``, ``top_pick`` and ``leadership`` are already JSON-safe.
+    ``version`` is the time the rows were built (the snapshot's ``saved_at``).
+    """
+
+    version: str
+    frame: pd.DataFrame
+    records: tuple[Dict[str, Any], ...]
+    top_pick: Optional[Dict[str, Any]]
+    leadership: Dict[str, list[Dict[str, Any]]]
+
+    @classmethod
+    def build(cls, version: str, frame: pd.DataFrame) -> "PeerBoard":
+        enriched = _enrich_peer_board_frame(frame)
+        records = tuple(_to_json_safe(enriched.to_dict("records")))
+        return cls(
+            version=version,
+            frame=enriched,
+            records=records,
+            top_pick=records[0] if records else None,
+            leadership=_to_json_safe(_leadership_snapshot(enriched)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+
 class TRFundsService:
     def __init__(
         self,
@@ -355,6 +477,9 @@ class TRFundsService:
     def _status_key(self, months: int) -> str:
         return f"tr-funds:status:{months}"
 
+    def _peer_board_key(self, months: int) -> str:
+        return f"tr-funds:peer-board:{months}"
+
     def _snapshot_key(self, months: int) -> str:
         return f"tr-funds-peer-board-{months}"
 
@@ -472,10 +597,11 @@ class TRFundsService:
     def _save_status(self, months: int, payload: Dict[str, Any]) -> None:
         cache_set(self._status_key(months), payload, ttl=max(self.ttl_seconds * 6, 3600))
 
+    @request_memoized("tr-status")
     def get_status(self, months: int = 12) -> Dict[str, Any]:
         status = self._load_status(months)
-        peer_board = cache_get(f"tr-funds:peer-board:{months}")
-        if isinstance(peer_board, pd.DataFrame) and not peer_board.empty and status.get("status") == "warming":
+        peer_board = cache_get(self._peer_board_key(months))
+        if isinstance(peer_board, (PeerBoard, pd.DataFrame)) and len(peer_board) and status.get("status") == "warming":
             status["status"] = "healthy"
             status["detail"] = f"Cached peer board available with {len(peer_board)} rows."
             status["funds_loaded"] = len(peer_board)
@@ -511,36 +637,50 @@ class TRFundsService:
                 pass
         return status
 
-    def get_cached_peer_signal_board(self, months: int = 12) -> pd.DataFrame:
-        cached = cache_get(f"tr-funds:peer-board:{months}")
-        if isinstance(cached, pd.DataFrame):
-            if not cached.empty:
-                canonical_cached = self._canonicalize_peer_board_frame(cached)
-                enriched_cached = _enrich_peer_board_frame(canonical_cached)
-                cache_set(f"tr-funds:peer-board:{months}", enriched_cached, ttl=self.ttl_seconds)
-                return enriched_cached.copy()
+    def _publish_peer_board(self, months: int, frame: pd.DataFrame, version: str) -> PeerBoard:
+        board = PeerBoard.build(version, frame)
+        cache_set(self._peer_board_key(months), board, ttl=self.ttl_seconds)
+        return board
+
+    def _cached_peer_board(self, months: int) -> Optional[PeerBoard]:
+        cached = cache_get(self._peer_board_key(months))
+        if isinstance(cached, PeerBoard):
+            return cached
+        if isinstance(cached, pd.DataFrame) and not cached.empty:
+            # Frame cached by an older build: publish it once in the current form.
+            return self._publish_peer_board(months, self._canonicalize_peer_board_frame(cached), self._now_iso())
+        return None
+
+    @request_memoized("tr-peer-board")
+    def get_cached_peer_board(self, months: int = 12) -> Optional[PeerBoard]:
+        """The published peer board from cache, else from the last persisted snapshot; never refreshes TEFAS."""
+        board = self._cached_peer_board(months)
+        if board is not None:
+            return board
         snapshot_payload = self.snapshot_store.read_json(self._snapshot_key(months))
         if snapshot_payload and isinstance(snapshot_payload.get("rows"), list) and snapshot_payload["rows"]:
             frame = self._canonicalize_peer_board_frame(pd.DataFrame(snapshot_payload["rows"]))
+            version = str(snapshot_payload.get("saved_at") or self._now_iso())
             if frame.to_dict("records") != snapshot_payload.get("rows"):
+                version = self._now_iso()
                 self.snapshot_store.write_json(
                     self._snapshot_key(months),
                     {
-                        "saved_at": self._now_iso(),
+                        "saved_at": version,
                         "months": months,
                         "rows": frame.to_dict("records"),
                     },
                 )
-            frame = _enrich_peer_board_frame(frame)
-            cache_set(f"tr-funds:peer-board:{months}", frame, ttl=self.ttl_seconds)
-            return frame.copy()
-        return pd.DataFrame()
+            return self._publish_peer_board(months, frame, version)
+        return None
+
+    def get_cached_peer_signal_board(self, months: int = 12) -> pd.DataFrame:
+        board = self.get_cached_peer_board(months)
+        return board.frame if board is not None else pd.DataFrame()
 
     def get_cached_top_pick(self, months: int = 12) -> Optional[Dict[str, Any]]:
-        peer_df = self.get_cached_peer_signal_board(months)
-        if peer_df.empty:
-            return None
-        return dict(peer_df.iloc[0])
+        board = self.get_cached_peer_board(months)
+        return board.top_pick if board is not None else None
 
     def get_persisted_fund_summary(self, fund_code: str, months: int = 12) -> Optional[Dict[str, Any]]:
         snapshot = self.snapshot_store.read_json(self._summary_snapshot_key(fund_code.upper(), months))
@@ -549,73 +689,10 @@ class TRFundsService:
         return None
 
     def get_leadership_snapshot(self, months: int = 12) -> Dict[str, list[Dict[str, Any]]]:
-        peer_df = self.get_cached_peer_signal_board(months)
-        if peer_df.empty:
+        board = self.get_cached_peer_board(months)
+        if board is None:
             return {"family_rows": [], "factor_rows": []}
-
-        sorted_peer_df = peer_df.sort_values(
-            ["board_score", "signal_score", "investor_growth_pct"],
-            ascending=[False, False, False],
-        ).reset_index(drop=True)
-
-        family_df = (
-            sorted_peer_df.groupby("fund_family", dropna=False)
-            .agg(
-                funds_count=("fund_code", "count"),
-                avg_board_score=("board_score", "mean"),
-                avg_signal_score=("signal_score", "mean"),
-                avg_market_share=("market_share", "mean"),
-                avg_category_percentile=("category_percentile", "mean"),
-                top_fund=("fund_code", "first"),
-            )
-            .reset_index()
-        )
-        family_df["avg_board_score"] = family_df["avg_board_score"].round(1)
-        family_df["avg_signal_score"] = family_df["avg_signal_score"].round(1)
-        family_df["avg_market_share"] = family_df["avg_market_share"].round(2)
-        family_df["avg_category_percentile"] = family_df["avg_category_percentile"].round(1)
-        family_df["house_view"] = family_df.apply(
-            lambda row: _house_view(float(row["avg_board_score"]), float(row["avg_signal_score"])),
-            axis=1,
-        )
-        family_df = family_df.sort_values(
-            ["avg_board_score", "avg_signal_score", "funds_count"],
-            ascending=[False, False, False],
-        ).reset_index(drop=True)
-
-        factor_df = (
-            sorted_peer_df.groupby("local_factor", dropna=False)
-            .agg(
-                funds_count=("fund_code", "count"),
-                avg_board_score=("board_score", "mean"),
-                avg_signal_score=("signal_score", "mean"),
-                avg_investor_growth_pct=("investor_growth_pct", "mean"),
-                avg_value_growth_pct=("value_growth_pct", "mean"),
-                lead_fund=("fund_code", "first"),
-            )
-            .reset_index()
-        )
-        factor_df["avg_board_score"] = factor_df["avg_board_score"].round(1)
-        factor_df["avg_signal_score"] = factor_df["avg_signal_score"].round(1)
-        factor_df["avg_investor_growth_pct"] = factor_df["avg_investor_growth_pct"].round(1)
-        factor_df["avg_value_growth_pct"] = factor_df["avg_value_growth_pct"].round(1)
-        factor_df["breadth"] = factor_df.apply(
-            lambda row: _factor_breadth(
-                float(row["avg_investor_growth_pct"]),
-                float(row["avg_value_growth_pct"]),
-                float(row["avg_board_score"]),
-            ),
-            axis=1,
-        )
-        factor_df = factor_df.sort_values(
-            ["avg_board_score", "avg_signal_score", "funds_count"],
-            ascending=[False, False, False],
-        ).reset_index(drop=True)
-
-        return {
-            "family_rows": family_df.head(6).to_dict("records"),
-            "factor_rows": factor_df.head(6).to_dict("records"),
-        }
+        return board.leadership
 
     def get_fund_summary(self, fund_code: str, months: int = 12, force_refresh: bool = False) -> Dict[str, Any]:
         fund_code = fund_code.upper()
@@ -664,13 +741,14 @@ class TRFundsService:
         return summary
 
     def get_peer_signal_board(self, months: int = 12, force_refresh: bool = False) -> pd.DataFrame:
-        cache_key = f"tr-funds:peer-board:{months}"
-        cached = cache_get(cache_key)
-        if isinstance(cached, pd.DataFrame) and not force_refresh:
-            canonical_cached = self._canonicalize_peer_board_frame(cached)
-            enriched_cached = _enrich_peer_board_frame(canonical_cached)
-            cache_set(cache_key, enriched_cached, ttl=self.ttl_seconds)
-            return enriched_cached.copy()
+        board = self.get_peer_board(months, force_refresh=force_refresh)
+        return board.frame if board is not None else pd.DataFrame()
+
+    def get_peer_board(self, months: int = 12, force_refresh: bool = False) -> Optional[PeerBoard]:
+        if not force_refresh:
+            cached = self._cached_peer_board(months)
+            if cached is not None:
+                return cached
 
         started_at = self._now_iso()
         existing_status = self._load_status(months)
@@ -770,19 +848,20 @@ class TRFundsService:
                     "cache_ttl_seconds": self.ttl_seconds,
                 },
             )
-            return peer_df
+            return None
 
         peer_df = peer_df.sort_values(
             ["board_score", "signal_score", "investor_growth_pct", "value_growth_pct"],
             ascending=[False, False, False, False],
         ).reset_index(drop=True)
-        cache_set(cache_key, peer_df, ttl=self.ttl_seconds)
+        saved_at = self._now_iso()
+        board = self._publish_peer_board(months, peer_df, saved_at)
         self.snapshot_store.write_json(
             self._snapshot_key(months),
             {
-                "saved_at": self._now_iso(),
+                "saved_at": saved_at,
                 "months": months,
-                "rows": peer_df.to_dict("records"),
+                "rows": list(board.records),
             },
         )
         self._save_status(
@@ -794,24 +873,22 @@ class TRFundsService:
                 "last_attempt_at": started_at,
                 "last_success_at": self._now_iso(),
                 "funds_requested": len(POPULAR_FUNDS),
-                "funds_loaded": len(peer_df),
+                "funds_loaded": len(board),
                 "error_count": error_count,
                 "cache_ttl_seconds": self.ttl_seconds,
             },
         )
-        return peer_df.copy()
+        return board
 
     def get_top_pick(self, months: int = 12, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
-        peer_df = self.get_peer_signal_board(months, force_refresh=force_refresh)
-        if peer_df.empty:
-            return None
-        return dict(peer_df.iloc[0])
+        board = self.get_peer_board(months, force_refresh=force_refresh)
+        return board.top_pick if board is not None else None
 
     def prewarm(self, months: int = 12, force_refresh: bool = True) -> Dict[str, Any]:
-        peer_df = self.get_peer_signal_board(months=months, force_refresh=force_refresh)
+        board = self.get_peer_board(months=months, force_refresh=force_refresh)
         status = self.get_status(months=months)
         return {
             "status": status,
-            "rows": len(peer_df),
-            "top_pick": dict(peer_df.iloc[0]) if not peer_df.empty else None,
+            "rows": len(board) if board is not None else 0,
+            "top_pick": board.top_pick if board is not None else None,
         }
@@ -10,7 +10,7 @@ from plotly.subplots import make_subplots
 
 from utils.market_data_fetcher import get_market_fetcher
 from utils.data_quality import format_quality_badge, DataQuality
-from app.analytics.custom_indicator_suite import PROFILES, compute_indicator_bundle
+from app.analytics.custom_indicator_suite import PROFILES, compute_imse_universe, compute_indicator_bundle
 
 
 # INTENTIONAL CACHE DIVERGENCE: This UI-bound memoization intentionally bypasses 
@@ -25,10 +25,67 @@ def _load_indicator_bundle(symbol: str, profile_key: str, source_pref: str):
         interval=profile.interval,
         source_preference=source_pref,
     )
-    analysis = compute_indicator_bundle(hist, profile) if hist is not None else {"error": "No data"}
+    analysis = compute_indicator_bundle(hist, profile, cache_key=(symbol, source_pref)) if hist is not None else {"error": "No data"}
     return hist, info, quality, analysis
 
 
+@st.cache_data(ttl=300)
+def _scan_universe(symbols: tuple, profile_key: str, source_pref: str) -> pd.DataFrame:
+    profile = PROFILES[profile_key]
+    fetcher = get_market_fetcher()
+    histories = {}
+    for symbol in symbols:
+        hist, _info, _quality = fetcher.get_stock_data_with_meta(
+            symbol,
+            period=profile.period,
+            interval=profile.interval,
+            source_preference=source_pref,
+        )
+        histories[symbol] = hist
+    # Same cache key as the single-symbol panel, so both reuse one k-NN state per symbol
+    return compute_imse_universe(histories, profile.imse, cache_tag=source_pref)
+
+
+def _render_universe_scan(source_pref: str):
+    st.markdown("### 🌐 Evren Taraması")
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        raw_symbols = st.text_area(
+            "Semboller (virgülle ayırın)",
+            value="AAPL, MSFT, NVDA, AMZN, GOOGL, META, TSLA",
+            key="indicator_lab_universe",
+        )
+    with col2:
+        profile_key = st.selectbox("Profil", list(PROFILES.keys()), key="indicator_lab_universe_profile")
+        run_scan = st.button("Taramayı Başlat", key="indicator_lab_universe_run")
+
+    symbols = tuple(dict.fromkeys(s.strip().upper() for s in raw_symbols.split(",") if s.strip()))
+    if not run_scan or not symbols:
+        return
+
+    with st.spinner(f"{len(symbols)} sembol için IMSE hesaplanıyor..."):
+        scan = _scan_universe(symbols, profile_key, source_pref)
+
+    if scan.empty:
+        st.warning("Taranan sembollerin hiçbiri için veri alınamadı.")
+        return
+
+    missing = [symbol for symbol in symbols if symbol not in scan.index]
+    if missing:
+        st.caption(f"Veri alınamadı: {', '.join(missing)}")
+
+    table = pd.DataFrame({
+        "Sembol": scan.index,
+        "IMSE Skor": scan["final_score"].astype(float).round(3).to_numpy(),
+        "Güven": scan["confidence"].astype(float).round(2).to_numpy(),
+        "Sinyal": ["BULL" if bull else "BEAR" if bear else "NEUTRAL" for bull, bear in zip(scan["bull"], scan["bear"])],
+        "Rejim": scan["regime"].to_numpy(),
+        "ADX": scan["adx"].astype(float).round(1).to_numpy(),
+        "ATR%": scan["atrp"].astype(float).round(2).to_numpy(),
+    }).sort_values("IMSE Skor", ascending=False)
+    st.dataframe(table, use_container_width=True, hide_index=True)
+
+
 def _render_profile_panel(symbol: str, profile_key: str, source_pref: str):
     profile = PROFILES[profile_key]
     hist, info, quality, analysis = _load_indicator_bundle(symbol, profile_key, source_pref)
@@ -164,6 +221,9 @@ def render_indicator_lab():
         with profile_tabs[idx]:
             _render_profile_panel(symbol, profile_key, source_pref)
 
+    st.markdown("---")
+    _render_universe_scan(source_pref)
+
     st.markdown("---")
     st.info(
         "IMSE serileri (Score / Threshold / Confidence / Slope) Python tarafında hesaplanır. "
@@ -0,0 +1,127 @@
+"""
+Request-scoped shared fetches.
+
+A composite request (compare two stocks, two funds, ...) builds several
+workspaces that often need the same upstream data: the SPY benchmark, a
+sector ETF history, overlapping peer quotes. Inside ``fetch_context()`` every
+``shared_fetch(key, loader)`` call with the same key runs ``loader`` once and
+hands the result to every caller, including callers on other threads that
+are still loading it. Outside a context ``shared_fetch`` simply calls the
+loader, so library code can use it unconditionally.
+
+The same table memoizes pure per-request helpers: methods decorated with
+``request_memoized`` run once per distinct argument tuple while a context is
+active, and ``request_scoped`` opens a context around a composite entry
+point. Each context counts the duplicate calls it absorbed, per kind, and
+logs them when it closes.
+
+The context lives in a ``ContextVar``; work submitted with ``submit()`` runs
+in a copy of the caller's context and therefore shares its fetches.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import threading
+from collections import Counter
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, TypeVar
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class FetchContext:
+    """Single-flight results keyed by fetch key for the lifetime of one request."""
+
+    def __init__(self) -> None:
+        self._futures: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.shared = 0
+        self.absorbed: Counter = Counter()
+
+    def fetch(self, key: Hashable, loader: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._futures.get(key)
+            owner = future is None
+            if owner:
+                future = self._futures[key] = Future()
+                self.loads += 1
+            else:
+                self.shared += 1
+                self.absorbed[key[0] if isinstance(key, tuple) and key else key] += 1
+        if owner:
+            try:
+                future.set_result(loader())
+            except BaseException as exc:
+                future.set_exception(exc)
+        return future.result()
+
+
+_current: contextvars.ContextVar[Optional[FetchContext]] = contextvars.ContextVar("fetch_context", default=None)
+
+
+def current_fetch_context() -> Optional[FetchContext]:
+    return _current.get()
+
+
+@contextmanager
+def fetch_context() -> Iterator[FetchContext]:
+    """Share fetches for the enclosed block; reuses an already active context."""
+    active = _current.get()
+    if active is not None:
+        yield active
+        return
+    context = FetchContext()
+    token = _current.set(context)
+    try:
+        yield context
+    finally:
+        _current.reset(token)
+        if context.shared:
+            logger.debug("Fetch context absorbed duplicate calls", loads=context.loads, absorbed=dict(context.absorbed))
+
+
+def shared_fetch(key: Hashable, loader: Callable[[], T]) -> T:
+    context = _current.get()
+    if context is None:
+        return loader()
+    return context.fetch(key, loader)
+
+
+def submit(executor: Executor, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+    """``executor.submit`` that runs ``fn`` in a copy of the caller's context."""
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def request_memoized(kind: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Memoize a method per instance and arguments while a fetch context is active."""
+
+    def decorate(method: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(method)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> T:
+            if _current.get() is None:
+                return method(self, *args, **kwargs)
+            key = (kind, id(self), args, tuple(sorted(kwargs.items())))
+            return shared_fetch(key, lambda: method(self, *args, **kwargs))
+
+        return wrapper
+
+    return decorate
+
+
+def request_scoped(method: Callable[..., T]) -> Callable[..., T]:
+    """Run a composite entry point inside a fetch context (the caller's, if one is active)."""
+
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        with fetch_context():
+            return method(*args, **kwargs)
+
+    return wrapper
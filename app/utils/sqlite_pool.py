@@ -0,0 +1,157 @@
+"""
+Shared SQLite storage helpers.
+
+Connections are opened in WAL mode with tuned pragmas and handed out from a
+small per-database pool, so readers never block the writer and modules that
+touch the same file reuse connections instead of reconnecting per call.
+"""
+
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+DEFAULT_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+# A checkout that waits this long means connections are leaking, not that the pool is busy.
+ACQUIRE_TIMEOUT_SECONDS = 30.0
+
+
+class PooledConnection(sqlite3.Connection):
+    """Connection whose ``close()`` hands it back to its pool.
+
+    Existing ``conn = ...; ...; conn.close()`` call sites keep working
+    unchanged, and pandas still sees a real ``sqlite3.Connection``.
+    """
+
+    _pool: Optional["SQLitePool"] = None
+    _checked_out = False
+
+    def close(self) -> None:
+        if self._pool is None:
+            super().close()
+        elif self._checked_out:
+            self._pool._release(self)
+
+    def _close_for_real(self) -> None:
+        super().close()
+
+
+def connect(
+    db_path: str,
+    row_factory: Optional[Callable[..., Any]] = None,
+    factory: type = sqlite3.Connection,
+) -> sqlite3.Connection:
+    """Open a tuned connection that may be handed between threads."""
+    if db_path != ":memory:":
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, check_same_thread=False, timeout=5.0, factory=factory)
+    for pragma in DEFAULT_PRAGMAS:
+        conn.execute(pragma)
+    if row_factory is not None:
+        conn.row_factory = row_factory
+    return conn
+
+
+class SQLitePool:
+    """Thread-safe pool of tuned connections to one SQLite database."""
+
+    def __init__(
+        self,
+        db_path: str,
+        max_connections: int = 8,
+        row_factory: Optional[Callable[..., Any]] = None,
+        acquire_timeout: float = ACQUIRE_TIMEOUT_SECONDS,
+    ) -> None:
+        self.db_path = db_path
+        # Every ":memory:" connection is its own database, so never hand out more than one.
+        self.max_connections = 1 if db_path == ":memory:" else max(1, max_connections)
+        self.row_factory = row_factory
+        self.acquire_timeout = acquire_timeout
+        self._idle: "queue.LifoQueue[PooledConnection]" = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _open(self) -> PooledConnection:
+        conn = connect(self.db_path, self.row_factory, factory=PooledConnection)
+        conn._pool = self
+        return conn
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledConnection:
+        """Check out a connection; ``close()`` returns it to the pool.
+
+        Raises ``sqlite3.OperationalError`` when every connection stays checked
+        out for ``timeout`` seconds (the pool's ``acquire_timeout`` by default).
+        """
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = None
+        if conn is None:
+            with self._lock:
+                if self._created < self.max_connections:
+                    self._created += 1
+                    conn = self._open()
+        if conn is None:
+            wait_seconds = self.acquire_timeout if timeout is None else timeout
+            try:
+                conn = self._idle.get(timeout=wait_seconds)
+            except queue.Empty:
+                raise sqlite3.OperationalError(
+                    f"No pooled connection to {self.db_path} was released within {wait_seconds:g}s "
+                    f"({self.max_connections} checked out)"
+                ) from None
+        conn._checked_out = True
+        return conn
+
+    def _release(self, conn: PooledConnection) -> None:
+        conn._checked_out = False
+        # Match sqlite3 close() semantics: uncommitted work is discarded.
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[PooledConnection]:
+        """Borrow a connection; commits on success and rolls back on error."""
+        conn = self.acquire()
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def close_all(self) -> None:
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn._close_for_real()
+            with self._lock:
+                self._created -= 1
+
+
+_pools: Dict[tuple, SQLitePool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str, row_factory: Optional[Callable[..., Any]] = None) -> SQLitePool:
+    """Return the process-wide pool for ``db_path``, creating it on first use."""
+    resolved = db_path if db_path == ":memory:" else str(Path(db_path).resolve())
+    key = (resolved, row_factory)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = SQLitePool(db_path, row_factory=row_factory)
+        return pool
@@ -0,0 +1,189 @@
+"""
+Rendered Page Cache
+===================
+Keeps the rendered HTML of the public pages so a page is rendered once per
+workspace version instead of once per hit.
+
+Entries are keyed by template and the route's resolved query parameters; each
+entry remembers the fingerprint of the context it was rendered from. When a
+workspace is rebuilt its fingerprint changes and the next request re-renders
+and replaces the entry, so stale pages are never served. Every entry stores
+identity, gzip and (when ``brotli`` is installed) brotli bodies plus a strong
+ETag, and conditional requests are answered with 304.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.utils.logger import get_logger
+
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+logger = get_logger(__name__)
+
+PAGE_CACHE_LIMIT = 256
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 6
+ETAG_SUFFIXES = {"gzip": "-gz", "br": "-br"}
+HTML_MEDIA_TYPE = "text/html; charset=utf-8"
+
+
+def context_fingerprint(context: Mapping[str, Any]) -> Optional[str]:
+    """Digest of everything a template sees except the request; None when it cannot be pickled."""
+    payload = {key: value for key, value in context.items() if key != "request"}
+    try:
+        return hashlib.blake2b(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL), digest_size=16).hexdigest()
+    except Exception:
+        return None
+
+
+def accepted_encodings(header: str | None) -> Dict[str, float]:
+    """Content codings from an Accept-Encoding header with their q-values."""
+    accepted: Dict[str, float] = {}
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    """Weak comparison (RFC 9110 If-None-Match), ignoring the per-encoding suffix."""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    base = etag.strip('"')
+    for candidate in header.split(","):
+        tag = candidate.strip().removeprefix("W/").strip('"')
+        for suffix in ETAG_SUFFIXES.values():
+            tag = tag.removesuffix(suffix)
+        if tag == base:
+            return True
+    return False
+
+
+@dataclass
+class CachedPage:
+    """One rendered page (or other pre-encoded body) with its precompressed variants."""
+
+    version: str
+    body: bytes
+    etag: str
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+    status_code: int = 200
+    media_type: str = HTML_MEDIA_TYPE
+
+    @classmethod
+    def build(
+        cls,
+        version: str,
+        content: str | bytes,
+        status_code: int = 200,
+        media_type: str = HTML_MEDIA_TYPE,
+    ) -> "CachedPage":
+        body = content.encode("utf-8") if isinstance(content, str) else content
+        encoded = {"gzip": gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)}
+        if HAS_BROTLI:
+            encoded["br"] = brotli.compress(body, quality=BROTLI_QUALITY)
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        return cls(
+            version=version,
+            body=body,
+            etag=etag,
+            encoded=encoded,
+            status_code=status_code,
+            media_type=media_type,
+        )
+
+    def choose_encoding(self, accept_encoding: str | None) -> Optional[str]:
+        accepted = accepted_encodings(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+        best, best_quality = None, 0.0
+        for coding in ("br", "gzip"):
+            quality = accepted.get(coding, wildcard)
+            if coding in self.encoded and quality > best_quality:
+                best, best_quality = coding, quality
+        return best
+
+    def response(self, request: Request) -> Response:
+        coding = self.choose_encoding(request.headers.get("accept-encoding"))
+        etag = self.etag if coding is None else self.etag[:-1] + ETAG_SUFFIXES[coding] + '"'
+        headers = {"ETag": etag, "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=headers)
+        if coding is not None:
+            headers["Content-Encoding"] = coding
+        body = self.encoded[coding] if coding else self.body
+        return Response(content=body, status_code=self.status_code, headers=headers, media_type=self.media_type)
+
+
+class PageCache:
+    """Bounded LRU of rendered pages; an entry is replaced as soon as its context changes."""
+
+    def __init__(self, limit: int = PAGE_CACHE_LIMIT) -> None:
+        self.limit = limit
+        self._pages: "OrderedDict[Tuple[Hashable, ...], CachedPage]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.renders = 0
+
+    def get(self, key: Tuple[Hashable, ...], version: str) -> Optional[CachedPage]:
+        with self._lock:
+            page = self._pages.get(key)
+            if page is None or page.version != version:
+                return None
+            self._pages.move_to_end(key)
+            self.hits += 1
+            return page
+
+    def put(self, key: Tuple[Hashable, ...], page: CachedPage) -> CachedPage:
+        with self._lock:
+            self._pages[key] = page
+            self._pages.move_to_end(key)
+            self.renders += 1
+            while len(self._pages) > self.limit:
+                self._pages.popitem(last=False)
+            return page
+
+    def page(self, key: Tuple[Hashable, ...], context: Mapping[str, Any], render: Callable[[], str]) -> CachedPage:
+        """Cached page for ``key`` if ``context`` is unchanged, otherwise render and store it."""
+        version = context_fingerprint(context)
+        if version is None:
+            logger.warning("Page context is not fingerprintable; rendering uncached", page=str(key[0]))
+            return CachedPage.build("", render())
+        cached = self.get(key, version)
+        if cached is not None:
+            return cached
+        return self.put(key, CachedPage.build(version, render()))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pages.clear()
+
+    def __len__(self) -> int:
+        return len(self._pages)
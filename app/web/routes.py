@@ -4,10 +4,11 @@ from datetime import datetime
 from pathlib import Path
 
 from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from fastapi.templating import Jinja2Templates
 
 from app.core.config import settings
+from app.web.page_cache import PageCache
 from app.services.public_dashboard import PublicDashboardService
 from app.services.institutional_pulse import InstitutionalPulseService
 from app.services.public_research import PublicResearchService
@@ -20,6 +21,7 @@ dashboard_service = PublicDashboardService()
 public_research_service = PublicResearchService()
 institutional_pulse_service = InstitutionalPulseService()
 tr_funds_service = TRFundsService()
+page_cache = PageCache()
 
 LEGACY_VIEW_REDIRECTS = {
     "dashboard": "/dashboard",
@@ -57,6 +59,13 @@ def _base_context(request: Request) -> dict:
     }
 
 
+def _render_page(request: Request, template_name: str, context: dict, **params) -> Response:
+    """Serve ``template_name`` from the page cache, rendering only when its context changed."""
+    key = (template_name, *sorted(params.items()))
+    page = page_cache.page(key, context, lambda: templates.get_template(template_name).render(context))
+    return page.response(request)
+
+
 @router.api_route("/", methods=["GET", "HEAD"], response_class=HTMLResponse)
 async def homepage(request: Request, view: str | None = None) -> HTMLResponse:
     if view and view in LEGACY_VIEW_REDIRECTS:
@@ -78,7 +87,7 @@ async def dashboard_page(request: Request) -> HTMLResponse:
             "snapshot": dashboard_service.build_snapshot(),
         }
     )
-    return templates.TemplateResponse(request, "dashboard.html", context)
+    return _render_page(request, "dashboard.html", context)
 
 
 @router.api_route("/conviction-board", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -100,7 +109,7 @@ async def conviction_board_page(
             "workspace": public_research_service.get_conviction_board_workspace(universe, months, limit),
         }
     )
-    return templates.TemplateResponse(request, "conviction_board.html", context)
+    return _render_page(request, "conviction_board.html", context, universe=universe, months=months, limit=limit)
 
 
 @router.api_route("/influence-map", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -116,7 +125,7 @@ async def influence_map_page(request: Request) -> HTMLResponse:
             "workspace": dashboard_service.build_influence_workspace(),
         }
     )
-    return templates.TemplateResponse(request, "influence_map.html", context)
+    return _render_page(request, "influence_map.html", context)
 
 
 @router.api_route("/compare", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -138,7 +147,7 @@ async def compare_page(
             "workspace": public_research_service.get_compare_workspace(kind, left, right, months),
         }
     )
-    return templates.TemplateResponse(request, "compare.html", context)
+    return _render_page(request, "compare.html", context, kind=kind, left=left, right=right, months=months)
 
 
 @router.api_route("/turkish-funds", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -148,7 +157,7 @@ async def turkish_funds_page(
     months: int = settings.PUBLIC_TR_FUNDS_MONTHS,
 ) -> HTMLResponse:
     months = max(3, min(months or settings.PUBLIC_TR_FUNDS_MONTHS, 18))
-    peer_board = tr_funds_service.get_cached_peer_signal_board(months=months)
+    board = tr_funds_service.get_cached_peer_board(months=months)
     context = _base_context(request)
     context.update(
         {
@@ -158,13 +167,13 @@ async def turkish_funds_page(
                 "Public TEFAS signal board with Turkish fund momentum, allocation drift, "
                 "and investor growth context."
             ),
-            "top_pick": tr_funds_service.get_cached_top_pick(months=months),
-            "peer_board": peer_board.to_dict("records") if not peer_board.empty else [],
-            "leadership": tr_funds_service.get_leadership_snapshot(months=months),
+            "top_pick": board.top_pick if board is not None else None,
+            "peer_board": list(board.records) if board is not None else [],
+            "leadership": board.leadership if board is not None else {"family_rows": [], "factor_rows": []},
             "fund_workspace": public_research_service.get_tr_fund_workspace(fund, months),
         }
     )
-    return templates.TemplateResponse(request, "turkish_funds.html", context)
+    return _render_page(request, "turkish_funds.html", context, fund=fund, months=months)
 
 
 @router.api_route("/stocks", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -181,7 +190,7 @@ async def stocks_page(request: Request, symbol: str = settings.PUBLIC_DEFAULT_ST
             "workspace": public_research_service.get_stock_workspace(symbol),
         }
     )
-    return templates.TemplateResponse(request, "stocks.html", context)
+    return _render_page(request, "stocks.html", context, symbol=symbol)
 
 
 @router.api_route("/funds-etfs", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -198,7 +207,7 @@ async def funds_page(request: Request, symbol: str = settings.PUBLIC_DEFAULT_FUN
             "workspace": public_research_service.get_fund_workspace(symbol),
         }
     )
-    return templates.TemplateResponse(request, "funds_etfs.html", context)
+    return _render_page(request, "funds_etfs.html", context, symbol=symbol)
 
 
 @router.api_route("/sovereign-funds", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -219,7 +228,7 @@ async def sovereign_funds_page(
             "workspace": public_research_service.get_sovereign_workspace(fund, country),
         }
     )
-    return templates.TemplateResponse(request, "sovereign_funds.html", context)
+    return _render_page(request, "sovereign_funds.html", context, fund=fund, country=country)
 
 
 @router.api_route("/forecasts", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -240,7 +249,7 @@ async def forecasts_page(
             "workspace": public_research_service.get_forecast_workspace(symbol, days),
         }
     )
-    return templates.TemplateResponse(request, "forecasts.html", context)
+    return _render_page(request, "forecasts.html", context, symbol=symbol, days=days)
 
 
 @router.api_route("/screener", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -261,7 +270,7 @@ async def screener_page(
             "workspace": public_research_service.get_screener_workspace(universe, screen, limit),
         }
     )
-    return templates.TemplateResponse(request, "screener.html", context)
+    return _render_page(request, "screener.html", context, universe=universe, screen=screen, limit=limit)
 
 
 @router.api_route("/bist-quality-board", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -277,7 +286,7 @@ async def bist_quality_board_page(request: Request, limit: int = 12) -> HTMLResp
             "workspace": public_research_service.get_bist_quality_board_workspace(limit),
         }
     )
-    return templates.TemplateResponse(request, "bist_quality_board.html", context)
+    return _render_page(request, "bist_quality_board.html", context, limit=limit)
 
 
 @router.api_route("/ownership-lens", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -297,7 +306,7 @@ async def ownership_lens_page(
             "workspace": public_research_service.get_ownership_workspace(symbol, focus),
         }
     )
-    return templates.TemplateResponse(request, "ownership_lens.html", context)
+    return _render_page(request, "ownership_lens.html", context, symbol=symbol, focus=focus)
 
 
 @router.api_route("/overlap-matrix", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -316,7 +325,7 @@ async def overlap_matrix_page(
             "workspace": public_research_service.get_overlap_matrix_workspace(focus),
         }
     )
-    return templates.TemplateResponse(request, "overlap_matrix.html", context)
+    return _render_page(request, "overlap_matrix.html", context, focus=focus)
 
 
 @router.api_route("/sector-rotation", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -332,7 +341,7 @@ async def sector_rotation_page(request: Request) -> HTMLResponse:
             "workspace": public_research_service.get_sector_rotation_workspace(),
         }
     )
-    return templates.TemplateResponse(request, "sector_rotation.html", context)
+    return _render_page(request, "sector_rotation.html", context)
 
 
 @router.api_route("/scenario-lab", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -352,7 +361,7 @@ async def scenario_lab_page(
             "workspace": public_research_service.get_portfolio_lab_workspace(positions, preset),
         }
     )
-    return templates.TemplateResponse(request, "scenario_lab.html", context)
+    return _render_page(request, "scenario_lab.html", context, positions=positions, preset=preset)
 
 
 @router.api_route("/idea-radar", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -372,7 +381,7 @@ async def idea_radar_page(
             "workspace": public_research_service.get_idea_radar_workspace(universe, limit),
         }
     )
-    return templates.TemplateResponse(request, "idea_radar.html", context)
+    return _render_page(request, "idea_radar.html", context, universe=universe, limit=limit)
 
 
 @router.api_route("/catalyst-calendar", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -388,7 +397,7 @@ async def catalyst_calendar_page(request: Request) -> HTMLResponse:
             "workspace": public_research_service.get_catalyst_calendar_workspace(),
         }
     )
-    return templates.TemplateResponse(request, "catalyst_calendar.html", context)
+    return _render_page(request, "catalyst_calendar.html", context)
 
 
 @router.api_route("/institutional-pulse", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -408,7 +417,7 @@ async def institutional_pulse_page(
             "workspace": institutional_pulse_service.get_workspace(manager),
         }
     )
-    return templates.TemplateResponse(request, "institutional_pulse.html", context)
+    return _render_page(request, "institutional_pulse.html", context, manager=manager)
 
 
 @router.api_route("/reliability", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -425,7 +434,7 @@ async def reliability_page(request: Request) -> HTMLResponse:
             "workspace": dashboard_service.build_reliability_workspace(),
         }
     )
-    return templates.TemplateResponse(request, "reliability.html", context)
+    return _render_page(request, "reliability.html", context)
 
 
 @router.api_route("/portfolio", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -440,7 +449,7 @@ async def portfolio_page(request: Request) -> HTMLResponse:
             ),
         }
     )
-    return templates.TemplateResponse(request, "portfolio.html", context)
+    return _render_page(request, "portfolio.html", context)
 
 
 @router.api_route("/privacy", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -456,7 +465,7 @@ async def privacy_page(request: Request) -> HTMLResponse:
             ),
         }
     )
-    return templates.TemplateResponse(request, "privacy.html", context)
+    return _render_page(request, "privacy.html", context)
 
 
 @router.api_route("/methodology", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -472,7 +481,7 @@ async def methodology_page(request: Request) -> HTMLResponse:
             ),
         }
     )
-    return templates.TemplateResponse(request, "methodology.html", context)
+    return _render_page(request, "methodology.html", context)
 
 
 @router.api_route("/favicon.ico", methods=["GET", "HEAD"], include_in_schema=False)
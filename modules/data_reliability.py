@@ -5,10 +5,12 @@ Verify ETF holdings data integrity and detect anomalies
 
 import pandas as pd
 import numpy as np
-import sqlite3
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import warnings
+
+from app.utils.sqlite_pool import get_pool
+
 warnings.filterwarnings('ignore')
 
 
@@ -25,6 +27,7 @@ class DataReliabilityAuditor:
 
     def __init__(self, db_path: str = "data/etf_holdings.db"):
         self.db_path = db_path
+        self.pool = get_pool(db_path)
         self.audit_log = []
 
     def run_full_audit(self) -> Dict:
@@ -45,8 +48,8 @@ class DataReliabilityAuditor:
 
         # Check 1: Database connectivity
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.close()
+            with self.pool.connection() as conn:
+                conn.execute("SELECT 1")
             audit_results['checks_passed'] += 1
         except Exception as e:
             audit_results['checks_failed'] += 1
@@ -106,14 +109,12 @@ class DataReliabilityAuditor:
 
     def _check_data_freshness(self) -> Dict:
         """Check if data is recent (< 7 days old)"""
-        conn = sqlite3.connect(self.db_path)
-
         try:
             query = "SELECT MAX(report_date) as latest_date FROM holdings"
-            result = pd.read_sql_query(query, conn)
+            with self.pool.connection() as conn:
+                result = pd.read_sql_query(query, conn)
 
             if result.empty or pd.isna(result['latest_date'].iloc[0]):
-                conn.close()
                 return {
                     'status': 'fail',
                     'message': 'No data found in database',
@@ -123,8 +124,6 @@ class DataReliabilityAuditor:
             latest_date = pd.to_datetime(result['latest_date'].iloc[0])
             days_old = (datetime.now() - latest_date).days
 
-            conn.close()
-
             if days_old <= 7:
                 return {
                     'status': 'pass',
@@ -145,7 +144,6 @@ class DataReliabilityAuditor:
                 }
 
         except Exception as e:
-            conn.close()
             return {
                 'status': 'fail',
                 'message': f'Freshness check failed: {e}',
@@ -154,7 +152,6 @@ class DataReliabilityAuditor:
 
     def _check_weight_consistency(self) -> Dict:
         """Check if weights are valid (0-100, sum to ~100%)"""
-        conn = sqlite3.connect(self.db_path)
         result = {'passed': 0, 'failed': 0, 'warnings': []}
 
         try:
@@ -166,8 +163,8 @@ class DataReliabilityAuditor:
                 GROUP BY fund_code
             """
 
-            df = pd.read_sql_query(query, conn)
-            conn.close()
+            with self.pool.connection() as conn:
+                df = pd.read_sql_query(query, conn)
 
             if df.empty:
                 result['failed'] += 1
@@ -191,7 +188,6 @@ class DataReliabilityAuditor:
             return result
 
         except Exception as e:
-            conn.close()
             result['failed'] += 1
             result['warnings'].append(f"Weight consistency check failed: {e}")
             return result
@@ -203,7 +199,6 @@ class DataReliabilityAuditor:
         Args:
             threshold: Minimum weight change to flag (default 20%)
         """
-        conn = sqlite3.connect(self.db_path)
         anomalies = []
 
         try:
@@ -235,8 +230,8 @@ class DataReliabilityAuditor:
                 LIMIT 50
             """
 
-            df = pd.read_sql_query(query, conn, params=(threshold,))
-            conn.close()
+            with self.pool.connection() as conn:
+                df = pd.read_sql_query(query, conn, params=(threshold,))
 
             for idx, row in df.iterrows():
                 anomalies.append({
@@ -255,7 +250,6 @@ class DataReliabilityAuditor:
             }
 
         except Exception as e:
-            conn.close()
             return {
                 'anomalies': [],
                 'count': 0,
@@ -269,8 +263,6 @@ class DataReliabilityAuditor:
         tracker = ETFWeightTracker(db_path=self.db_path)
         tracked_etfs = list(tracker.TRACKED_ETFS.keys())
 
-        conn = sqlite3.connect(self.db_path)
-
         try:
             # Get ETFs with recent data (< 30 days)
             cutoff_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
@@ -281,8 +273,8 @@ class DataReliabilityAuditor:
                 WHERE report_date >= ?
             """
 
-            df = pd.read_sql_query(query, conn, params=(cutoff_date,))
-            conn.close()
+            with self.pool.connection() as conn:
+                df = pd.read_sql_query(query, conn, params=(cutoff_date,))
 
             etfs_with_data = set(df['fund_code'].tolist())
             coverage_pct = (len(etfs_with_data) / len(tracked_etfs)) * 100
@@ -295,7 +287,6 @@ class DataReliabilityAuditor:
             }
 
         except Exception as e:
-            conn.close()
             return {
                 'tracked_etfs': len(tracked_etfs),
                 'etfs_with_data': 0,
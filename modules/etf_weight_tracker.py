@@ -8,8 +8,11 @@ import numpy as np
 import yfinance as yf
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
-import sqlite3
+import threading
 import warnings
+
+from app.utils.sqlite_pool import get_pool
+
 warnings.filterwarnings('ignore')
 
 
@@ -26,6 +29,9 @@ class ETFWeightTracker:
 
     def __init__(self, db_path: str = "data/etf_holdings.db"):
         self.db_path = db_path
+        self.pool = get_pool(db_path)
+        self._exposure_lock = threading.Lock()
+        self._exposure_snapshot: Optional[Tuple[int, pd.DataFrame, pd.DataFrame]] = None
         self._init_database()
 
         # Popular ETFs to track
@@ -64,38 +70,80 @@ class ETFWeightTracker:
 
     def _init_database(self):
         """Initialize SQLite database for holdings storage"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Create holdings table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS holdings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                fund_code TEXT NOT NULL,
-                fund_name TEXT,
-                stock_symbol TEXT NOT NULL,
-                weight_pct REAL,
-                shares REAL,
-                market_value REAL,
-                report_date TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(fund_code, stock_symbol, report_date)
-            )
-        """)
-
-        # Create index for faster queries
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_stock_symbol
-            ON holdings(stock_symbol)
-        """)
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+
+            # Create holdings table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS holdings (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    fund_code TEXT NOT NULL,
+                    fund_name TEXT,
+                    stock_symbol TEXT NOT NULL,
+                    weight_pct REAL,
+                    shares REAL,
+                    market_value REAL,
+                    report_date TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE(fund_code, stock_symbol, report_date)
+                )
+            """)
+
+            # Covering indexes: per-stock history lookups and per-fund report scans
+            # never touch the table rows. They supersede the old single-column indexes.
+            cursor.execute("DROP INDEX IF EXISTS idx_stock_symbol")
+            cursor.execute("DROP INDEX IF EXISTS idx_fund_code")
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_holdings_symbol_fund_date
+                ON holdings(stock_symbol, fund_code, report_date, weight_pct)
+            """)
+
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_holdings_fund_date
+                ON holdings(fund_code, report_date, stock_symbol, weight_pct)
+            """)
+
+            # Materialized latest-vs-previous report comparison, one row per fund/stock
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS holding_weight_changes (
+                    fund_code TEXT NOT NULL,
+                    stock_symbol TEXT NOT NULL,
+                    report_date TEXT NOT NULL,
+                    current_weight REAL,
+                    previous_date TEXT,
+                    previous_weight REAL,
+                    weight_change REAL,
+                    weight_change_pct REAL,
+                    PRIMARY KEY (fund_code, stock_symbol)
+                )
+            """)
+
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_weight_changes_symbol
+                ON holding_weight_changes(stock_symbol, report_date)
+            """)
+
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_weight_changes_date
+                ON holding_weight_changes(report_date)
+            """)
+
+            # Bumped with every holdings write so in-memory exposure caches know when to reload
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS holdings_meta (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    version INTEGER NOT NULL
+                )
+            """)
+            cursor.execute("INSERT OR IGNORE INTO holdings_meta (id, version) VALUES (1, 0)")
 
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_fund_code
-            ON holdings(fund_code)
-        """)
+            conn.commit()
 
-        conn.commit()
-        conn.close()
+            # Backfill the materialized table for databases created before it existed
+            materialized = cursor.execute("SELECT 1 FROM holding_weight_changes LIMIT 1").fetchone()
+            has_holdings = cursor.execute("SELECT 1 FROM holdings LIMIT 1").fetchone()
+        if has_holdings and not materialized:
+            self.rebuild_weight_changes()
 
     def _normalize_holdings_frame(self, holdings_source, etf_ticker: str) -> pd.DataFrame:
         """Normalize holdings from different yfinance fund APIs into one schema."""
@@ -182,34 +230,120 @@ class ETFWeightTracker:
 
     def _get_cached_holdings(self, fund_code: str, days: int = 7) -> Optional[pd.DataFrame]:
         """Get cached holdings from database"""
-        conn = sqlite3.connect(self.db_path)
-
-        cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        with self.pool.connection() as conn:
+            cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
 
-        query = """
-            SELECT * FROM holdings
-            WHERE fund_code = ? AND report_date >= ?
-            ORDER BY report_date DESC
-        """
+            query = """
+                SELECT * FROM holdings
+                WHERE fund_code = ? AND report_date >= ?
+                ORDER BY report_date DESC
+            """
 
-        df = pd.read_sql_query(query, conn, params=(fund_code, cutoff_date))
-        conn.close()
+            df = pd.read_sql_query(query, conn, params=(fund_code, cutoff_date))
 
         return df if len(df) > 0 else None
 
     def _save_holdings_to_db(self, holdings_df: pd.DataFrame):
         """Save holdings to database"""
-        conn = sqlite3.connect(self.db_path)
-
         # Select only relevant columns
         cols_to_save = ['fund_code', 'fund_name', 'stock_symbol', 'weight_pct', 'report_date']
-        df_to_save = holdings_df[[col for col in cols_to_save if col in holdings_df.columns]]
+        df_to_save = holdings_df.reindex(columns=cols_to_save)
+        df_to_save = df_to_save.astype(object).where(df_to_save.notna(), None)
+
+        # Upsert so re-fetching a fund on the same report date replaces that snapshot
+        with self.pool.connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO holdings (fund_code, fund_name, stock_symbol, weight_pct, report_date)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(fund_code, stock_symbol, report_date) DO UPDATE SET
+                    fund_name = excluded.fund_name,
+                    weight_pct = excluded.weight_pct
+                """,
+                df_to_save.itertuples(index=False, name=None),
+            )
+            for fund_code in holdings_df['fund_code'].dropna().unique():
+                self._refresh_weight_changes(conn, str(fund_code))
+            conn.execute("UPDATE holdings_meta SET version = version + 1 WHERE id = 1")
+
+    # Compares a fund's latest report with its immediately previous report.
+    # Positions dropped since the previous report appear with a current weight of 0;
+    # new positions get a previous weight of 0 (NULL when the fund has no earlier report).
+    _WEIGHT_CHANGES_SQL = """
+        INSERT INTO holding_weight_changes (
+            fund_code, stock_symbol, report_date, current_weight,
+            previous_date, previous_weight, weight_change, weight_change_pct
+        )
+        WITH fund_reports AS (
+            SELECT
+                report_date,
+                ROW_NUMBER() OVER (ORDER BY report_date DESC) AS report_rank
+            FROM (SELECT DISTINCT report_date FROM holdings WHERE fund_code = :fund_code)
+        ),
+        report_pair AS (
+            SELECT
+                MAX(CASE WHEN report_rank = 1 THEN report_date END) AS latest_date,
+                MAX(CASE WHEN report_rank = 2 THEN report_date END) AS previous_date
+            FROM fund_reports
+        ),
+        compared AS (
+            SELECT
+                l.stock_symbol,
+                l.report_date,
+                l.weight_pct AS current_weight,
+                r.previous_date,
+                CASE WHEN r.previous_date IS NULL THEN NULL ELSE COALESCE(p.weight_pct, 0) END AS previous_weight
+            FROM report_pair r
+            JOIN holdings l
+                ON l.fund_code = :fund_code AND l.report_date = r.latest_date
+            LEFT JOIN holdings p
+                ON p.fund_code = :fund_code
+                AND p.stock_symbol = l.stock_symbol
+                AND p.report_date = r.previous_date
+            UNION ALL
+            SELECT
+                p.stock_symbol,
+                r.latest_date,
+                0.0,
+                r.previous_date,
+                p.weight_pct
+            FROM report_pair r
+            JOIN holdings p
+                ON p.fund_code = :fund_code AND p.report_date = r.previous_date
+            WHERE NOT EXISTS (
+                SELECT 1 FROM holdings l
+                WHERE l.fund_code = :fund_code
+                AND l.stock_symbol = p.stock_symbol
+                AND l.report_date = r.latest_date
+            )
+        )
+        SELECT
+            :fund_code,
+            stock_symbol,
+            report_date,
+            current_weight,
+            previous_date,
+            previous_weight,
+            current_weight - COALESCE(previous_weight, 0),
+            CASE
+                WHEN previous_weight > 0
+                THEN (current_weight - previous_weight) / previous_weight * 100
+                ELSE NULL
+            END
+        FROM compared
+    """
 
-        # Use replace to handle duplicates
-        df_to_save.to_sql('holdings', conn, if_exists='append', index=False)
+    def _refresh_weight_changes(self, conn, fund_code: str):
+        """Recompute the materialized weight changes of one fund"""
+        conn.execute("DELETE FROM holding_weight_changes WHERE fund_code = ?", (fund_code,))
+        conn.execute(self._WEIGHT_CHANGES_SQL, {'fund_code': fund_code})
 
-        conn.commit()
-        conn.close()
+    def rebuild_weight_changes(self):
+        """Recompute the materialized weight changes for every fund"""
+        with self.pool.connection() as conn:
+            fund_codes = [row[0] for row in conn.execute("SELECT DISTINCT fund_code FROM holdings")]
+            for fund_code in fund_codes:
+                self._refresh_weight_changes(conn, fund_code)
 
     def get_funds_for_stock(self, stock_symbol: str, min_weight: float = 0.1) -> pd.DataFrame:
         """
@@ -225,27 +359,116 @@ class ETFWeightTracker:
         # Clean symbol (remove exchange suffix if present)
         clean_symbol = stock_symbol.split('.')[0].upper()
 
-        conn = sqlite3.connect(self.db_path)
+        with self.pool.connection() as conn:
+            query = """
+                SELECT
+                    fund_code,
+                    fund_name,
+                    stock_symbol,
+                    weight_pct,
+                    report_date,
+                    MAX(report_date) as latest_date
+                FROM holdings
+                WHERE stock_symbol = ?
+                AND weight_pct >= ?
+                GROUP BY fund_code, stock_symbol
+                ORDER BY weight_pct DESC
+            """
 
-        query = """
-            SELECT
-                fund_code,
-                fund_name,
-                stock_symbol,
-                weight_pct,
-                report_date,
-                MAX(report_date) as latest_date
-            FROM holdings
-            WHERE stock_symbol = ?
-            AND weight_pct >= ?
-            GROUP BY fund_code, stock_symbol
-            ORDER BY weight_pct DESC
+            df = pd.read_sql_query(query, conn, params=(clean_symbol, min_weight))
+
+        return df
+
+    def holdings_version(self) -> int:
+        """Counter that changes whenever holdings are written"""
+        with self.pool.connection() as conn:
+            row = conn.execute("SELECT version FROM holdings_meta WHERE id = 1").fetchone()
+        return int(row[0]) if row else 0
+
+    def _latest_exposures(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Each fund's latest report as long rows and as a stock x fund weight matrix, cached per holdings version"""
+        version = self.holdings_version()
+        snapshot = self._exposure_snapshot
+        if snapshot is not None and snapshot[0] == version:
+            return snapshot[1], snapshot[2]
+
+        with self._exposure_lock:
+            snapshot = self._exposure_snapshot
+            if snapshot is not None and snapshot[0] == version:
+                return snapshot[1], snapshot[2]
+
+            query = """
+                SELECT
+                    h.fund_code,
+                    h.fund_name,
+                    h.stock_symbol,
+                    h.weight_pct,
+                    h.report_date
+                FROM holdings h
+                JOIN (
+                    SELECT fund_code, MAX(report_date) AS report_date
+                    FROM holdings
+                    GROUP BY fund_code
+                ) latest
+                    ON latest.fund_code = h.fund_code
+                    AND latest.report_date = h.report_date
+                ORDER BY h.weight_pct DESC
+            """
+            with self.pool.connection() as conn:
+                rows = pd.read_sql_query(query, conn)
+
+            rows['weight_pct'] = pd.to_numeric(rows['weight_pct'], errors='coerce').fillna(0.0)
+            matrix = rows.pivot_table(
+                index='stock_symbol', columns='fund_code', values='weight_pct', aggfunc='sum', fill_value=0.0
+            )
+            matrix.columns.name = None
+            matrix.index.name = None
+            self._exposure_snapshot = (version, rows, matrix)
+            return rows, matrix
+
+    def get_exposure_matrix(
+        self,
+        stock_symbols: Optional[List[str]] = None,
+        fund_codes: Optional[List[str]] = None,
+        min_weight: float = 0.0
+    ) -> pd.DataFrame:
         """
+        Weight of each stock in each fund's latest report, in one lookup
 
-        df = pd.read_sql_query(query, conn, params=(clean_symbol, min_weight))
-        conn.close()
+        Args:
+            stock_symbols: Stock tickers for the rows (default: every held stock)
+            fund_codes: ETF tickers for the columns (default: every fund)
+            min_weight: Weights below this are reported as 0
 
-        return df
+        Returns:
+            DataFrame indexed by the requested symbols with one column per fund (0 where not held)
+        """
+        _, matrix = self._latest_exposures()
+        if stock_symbols is not None:
+            symbols = list(stock_symbols)
+            matrix = matrix.reindex([symbol.split('.')[0].upper() for symbol in symbols], fill_value=0.0)
+            matrix.index = symbols
+        if fund_codes is not None:
+            matrix = matrix.reindex(columns=list(fund_codes), fill_value=0.0)
+        if min_weight > 0:
+            matrix = matrix.where(matrix >= min_weight, 0.0)
+        return matrix.copy()
+
+    def get_fund_exposures(self, stock_symbols: List[str], min_weight: float = 0.1) -> pd.DataFrame:
+        """
+        Funds holding any of the given stocks, from each fund's latest report
+
+        Args:
+            stock_symbols: Stock tickers
+            min_weight: Minimum weight percentage to include
+
+        Returns:
+            DataFrame with fund holdings sorted by weight
+        """
+        rows, _ = self._latest_exposures()
+        symbols = {symbol.split('.')[0].upper() for symbol in stock_symbols}
+        selected = rows[rows['stock_symbol'].isin(symbols) & (rows['weight_pct'] >= min_weight)]
+        return selected.reset_index(drop=True)
 
     def get_weight_history(self, stock_symbol: str, fund_code: str) -> pd.DataFrame:
         """
@@ -260,21 +483,19 @@ class ETFWeightTracker:
         """
         clean_symbol = stock_symbol.split('.')[0].upper()
 
-        conn = sqlite3.connect(self.db_path)
-
-        query = """
-            SELECT
-                report_date,
-                weight_pct,
-                fund_code,
-                fund_name
-            FROM holdings
-            WHERE stock_symbol = ? AND fund_code = ?
-            ORDER BY report_date ASC
-        """
+        with self.pool.connection() as conn:
+            query = """
+                SELECT
+                    report_date,
+                    weight_pct,
+                    fund_code,
+                    fund_name
+                FROM holdings
+                WHERE stock_symbol = ? AND fund_code = ?
+                ORDER BY report_date ASC
+            """
 
-        df = pd.read_sql_query(query, conn, params=(clean_symbol, fund_code))
-        conn.close()
+            df = pd.read_sql_query(query, conn, params=(clean_symbol, fund_code))
 
         if len(df) > 0:
             df['report_date'] = pd.to_datetime(df['report_date'])
@@ -289,6 +510,9 @@ class ETFWeightTracker:
         """
         Calculate recent weight changes across all funds
 
+        Each fund's latest report inside the period is compared with that
+        fund's immediately previous report.
+
         Args:
             stock_symbol: Stock ticker
             period_days: Period to analyze (default 30 days)
@@ -298,57 +522,26 @@ class ETFWeightTracker:
         """
         clean_symbol = stock_symbol.split('.')[0].upper()
 
-        conn = sqlite3.connect(self.db_path)
-
-        cutoff_date = (datetime.now() - timedelta(days=period_days)).strftime('%Y-%m-%d')
+        with self.pool.connection() as conn:
+            cutoff_date = (datetime.now() - timedelta(days=period_days)).strftime('%Y-%m-%d')
 
-        query = """
-            WITH latest_holdings AS (
+            query = """
                 SELECT
                     fund_code,
                     stock_symbol,
-                    weight_pct as current_weight,
-                    report_date as current_date
-                FROM holdings
+                    current_weight,
+                    report_date AS "current_date",
+                    previous_weight,
+                    previous_date,
+                    weight_change,
+                    weight_change_pct
+                FROM holding_weight_changes
                 WHERE stock_symbol = ?
                 AND report_date >= ?
-            ),
-            previous_holdings AS (
-                SELECT
-                    fund_code,
-                    stock_symbol,
-                    weight_pct as previous_weight,
-                    report_date as previous_date
-                FROM holdings
-                WHERE stock_symbol = ?
-                AND report_date < ?
-            )
-            SELECT
-                l.fund_code,
-                l.stock_symbol,
-                l.current_weight,
-                l.current_date,
-                p.previous_weight,
-                p.previous_date,
-                (l.current_weight - COALESCE(p.previous_weight, 0)) as weight_change,
-                CASE
-                    WHEN p.previous_weight > 0
-                    THEN ((l.current_weight - p.previous_weight) / p.previous_weight * 100)
-                    ELSE NULL
-                END as weight_change_pct
-            FROM latest_holdings l
-            LEFT JOIN previous_holdings p
-                ON l.fund_code = p.fund_code AND l.stock_symbol = p.stock_symbol
-            ORDER BY weight_change DESC
-        """
+                ORDER BY weight_change DESC
+            """
 
-        df = pd.read_sql_query(
-            query,
-            conn,
-            params=(clean_symbol, cutoff_date, clean_symbol, cutoff_date)
-        )
-
-        conn.close()
+            df = pd.read_sql_query(query, conn, params=(clean_symbol, cutoff_date))
 
         return df
 
@@ -363,41 +556,26 @@ class ETFWeightTracker:
         Returns:
             DataFrame with top weight changes
         """
-        conn = sqlite3.connect(self.db_path)
-
-        cutoff_date = (datetime.now() - timedelta(days=period_days)).strftime('%Y-%m-%d')
+        with self.pool.connection() as conn:
+            cutoff_date = (datetime.now() - timedelta(days=period_days)).strftime('%Y-%m-%d')
 
-        query = f"""
-            WITH recent_changes AS (
+            query = """
                 SELECT
-                    h1.stock_symbol,
-                    h1.fund_code,
-                    h1.weight_pct as current_weight,
-                    h2.weight_pct as previous_weight,
-                    (h1.weight_pct - h2.weight_pct) as weight_change,
-                    h1.report_date
-                FROM holdings h1
-                INNER JOIN holdings h2
-                    ON h1.fund_code = h2.fund_code
-                    AND h1.stock_symbol = h2.stock_symbol
-                WHERE h1.report_date >= ?
-                AND h2.report_date < ?
-                AND ABS(h1.weight_pct - h2.weight_pct) > 0.5
-            )
-            SELECT
-                stock_symbol,
-                COUNT(*) as num_funds_changed,
-                AVG(weight_change) as avg_weight_change,
-                SUM(CASE WHEN weight_change > 0 THEN 1 ELSE 0 END) as funds_increased,
-                SUM(CASE WHEN weight_change < 0 THEN 1 ELSE 0 END) as funds_decreased
-            FROM recent_changes
-            GROUP BY stock_symbol
-            ORDER BY ABS(avg_weight_change) DESC
-            LIMIT ?
-        """
-
-        df = pd.read_sql_query(query, conn, params=(cutoff_date, cutoff_date, limit))
-        conn.close()
+                    stock_symbol,
+                    COUNT(*) as num_funds_changed,
+                    AVG(weight_change) as avg_weight_change,
+                    SUM(CASE WHEN weight_change > 0 THEN 1 ELSE 0 END) as funds_increased,
+                    SUM(CASE WHEN weight_change < 0 THEN 1 ELSE 0 END) as funds_decreased
+                FROM holding_weight_changes
+                WHERE report_date >= ?
+                AND previous_date IS NOT NULL
+                AND ABS(weight_change) > 0.5
+                GROUP BY stock_symbol
+                ORDER BY ABS(avg_weight_change) DESC
+                LIMIT ?
+            """
+
+            df = pd.read_sql_query(query, conn, params=(cutoff_date, limit))
 
         return df
 
@@ -407,23 +585,22 @@ class ETFWeightTracker:
 
         Returns one row per month using the latest available snapshot in that month.
         """
-        conn = sqlite3.connect(self.db_path)
-        cutoff_date = (datetime.now() - timedelta(days=max(months, 1) * 35)).strftime('%Y-%m-%d')
+        with self.pool.connection() as conn:
+            cutoff_date = (datetime.now() - timedelta(days=max(months, 1) * 35)).strftime('%Y-%m-%d')
 
-        query = """
-            SELECT
-                fund_code,
-                fund_name,
-                stock_symbol,
-                weight_pct,
-                report_date
-            FROM holdings
-            WHERE fund_code = ?
-            AND report_date >= ?
-            ORDER BY report_date ASC, weight_pct DESC
-        """
-        df = pd.read_sql_query(query, conn, params=(fund_code.upper(), cutoff_date))
-        conn.close()
+            query = """
+                SELECT
+                    fund_code,
+                    fund_name,
+                    stock_symbol,
+                    weight_pct,
+                    report_date
+                FROM holdings
+                WHERE fund_code = ?
+                AND report_date >= ?
+                ORDER BY report_date ASC, weight_pct DESC
+            """
+            df = pd.read_sql_query(query, conn, params=(fund_code.upper(), cutoff_date))
 
         if df.empty:
             return df
@@ -572,31 +749,28 @@ class ETFWeightTracker:
 
     def get_summary_stats(self) -> Dict:
         """Get summary statistics of the database"""
-        conn = sqlite3.connect(self.db_path)
-
-        stats = {}
-
-        # Total holdings records
-        stats['total_records'] = pd.read_sql_query(
-            "SELECT COUNT(*) as count FROM holdings", conn
-        ).iloc[0]['count']
-
-        # Unique stocks
-        stats['unique_stocks'] = pd.read_sql_query(
-            "SELECT COUNT(DISTINCT stock_symbol) as count FROM holdings", conn
-        ).iloc[0]['count']
-
-        # Unique funds
-        stats['unique_funds'] = pd.read_sql_query(
-            "SELECT COUNT(DISTINCT fund_code) as count FROM holdings", conn
-        ).iloc[0]['count']
-
-        # Latest update date
-        latest_date = pd.read_sql_query(
-            "SELECT MAX(report_date) as date FROM holdings", conn
-        ).iloc[0]['date']
-        stats['latest_update'] = latest_date
-
-        conn.close()
+        with self.pool.connection() as conn:
+            stats = {}
+
+            # Total holdings records
+            stats['total_records'] = pd.read_sql_query(
+                "SELECT COUNT(*) as count FROM holdings", conn
+            ).iloc[0]['count']
+
+            # Unique stocks
+            stats['unique_stocks'] = pd.read_sql_query(
+                "SELECT COUNT(DISTINCT stock_symbol) as count FROM holdings", conn
+            ).iloc[0]['count']
+
+            # Unique funds
+            stats['unique_funds'] = pd.read_sql_query(
+                "SELECT COUNT(DISTINCT fund_code) as count FROM holdings", conn
+            ).iloc[0]['count']
+
+            # Latest update date
+            latest_date = pd.read_sql_query(
+                "SELECT MAX(report_date) as date FROM holdings", conn
+            ).iloc[0]['date']
+            stats['latest_update'] = latest_date
 
         return stats
@@ -5,7 +5,8 @@ Analyzes institutional investor behavior through fund flow patterns
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, Tuple, Optional
 from datetime import datetime, timedelta
 import requests
 from bs4 import BeautifulSoup
@@ -43,6 +44,12 @@ class FundFlowRadar:
         'KAY', 'TGY', 'ZPX', 'ZRH'
     ]
 
+    # Concurrent fund fetches
+    MAX_WORKERS = 16
+
+    # Lookback per aggregation period (ytd is handled separately)
+    PERIOD_DAYS = {'7d': 7, '30d': 30, '90d': 90}
+
     def __init__(self):
         """Initialize Fund Flow Radar"""
         self.flow_data = None
@@ -73,12 +80,13 @@ class FundFlowRadar:
             dates = pd.date_range(start=start_date, end=end_date, freq='D')
 
             # Synthetic fund data (replace with actual API call)
-            np.random.seed(hash(fund_code) % 2**32)
+            # Per-call generator so concurrent fetches do not share global RNG state
+            rng = np.random.RandomState(hash(fund_code) % 2**32)
 
             data = {
                 'date': dates,
-                'price': 100 + np.cumsum(np.random.randn(len(dates)) * 0.5),
-                'total_value': 1_000_000_000 + np.cumsum(np.random.randn(len(dates)) * 10_000_000),
+                'price': 100 + np.cumsum(rng.randn(len(dates)) * 0.5),
+                'total_value': 1_000_000_000 + np.cumsum(rng.randn(len(dates)) * 10_000_000),
                 'num_shares': None  # Will calculate
             }
 
@@ -95,7 +103,8 @@ class FundFlowRadar:
         self,
         fund_data: pd.DataFrame,
         price_col: str = 'price',
-        aum_col: str = 'total_value'
+        aum_col: str = 'total_value',
+        group_col: Optional[str] = None
     ) -> pd.DataFrame:
         """
         Calculate net flows (money in/out excluding market performance)
@@ -111,17 +120,26 @@ class FundFlowRadar:
             fund_data: DataFrame with price and AUM data
             price_col: Name of price column
             aum_col: Name of AUM column
+            group_col: Fund key column when fund_data holds several funds (long frame)
 
         Returns:
             DataFrame with net_flow column added
         """
         df = fund_data.copy()
 
+        if group_col is None:
+            prices = df[price_col]
+            previous_aum = df[aum_col].shift(1)
+        else:
+            grouped = df.groupby(group_col, sort=False)
+            prices = grouped[price_col]
+            previous_aum = grouped[aum_col].shift(1)
+
         # Calculate returns
-        df['return_pct'] = df[price_col].pct_change() * 100
+        df['return_pct'] = prices.pct_change() * 100
 
         # Calculate expected AUM based on performance
-        df['expected_aum'] = df[aum_col].shift(1) * (1 + df['return_pct'] / 100)
+        df['expected_aum'] = previous_aum * (1 + df['return_pct'] / 100)
 
         # Net flow = Actual AUM - Expected AUM
         df['net_flow'] = df[aum_col] - df['expected_aum']
@@ -146,67 +164,167 @@ class FundFlowRadar:
         Returns:
             DataFrame with aggregated flows
         """
-        df = flow_data.copy()
-        df['date'] = pd.to_datetime(df['date'])
-
-        # Calculate period start date
-        end_date = df['date'].max()
-
-        if period == '7d':
-            start_date = end_date - timedelta(days=7)
-        elif period == '30d':
-            start_date = end_date - timedelta(days=30)
-        elif period == '90d':
-            start_date = end_date - timedelta(days=90)
-        elif period == 'ytd':
-            start_date = datetime(end_date.year, 1, 1)
+        df = flow_data[['date', 'net_flow']].assign(fund_code='')
+        return self.aggregate_flows_by_fund(df, period).drop(columns='fund_code')
+
+    def aggregate_flows_by_fund(
+        self,
+        flow_frame: pd.DataFrame,
+        period: str = '7d'
+    ) -> pd.DataFrame:
+        """
+        Aggregate flows per fund over each fund's trailing period in one groupby
+
+        Args:
+            flow_frame: Long frame with fund_code, date and net_flow columns
+            period: '7d', '30d', '90d', 'ytd'
+
+        Returns:
+            DataFrame with one row of aggregated flows per fund
+        """
+        dates = pd.to_datetime(flow_frame['date'])
+        fund_keys = flow_frame['fund_code']
+
+        # Period start relative to each fund's latest date
+        end_dates = dates.groupby(fund_keys, sort=False).transform('max')
+        if period == 'ytd':
+            start_dates = end_dates.dt.normalize() - pd.to_timedelta(end_dates.dt.dayofyear - 1, unit='D')
         else:
-            start_date = end_date - timedelta(days=30)
+            start_dates = end_dates - timedelta(days=self.PERIOD_DAYS.get(period, 30))
+
+        in_period = (dates >= start_dates).to_numpy()
+        flows = flow_frame['net_flow'][in_period]
+        agg = pd.DataFrame({
+            'fund_code': fund_keys[in_period],
+            'total_flow': flows,
+            'avg_daily_flow': flows,
+            'flow_volatility': flows,
+            'days_inflow': flows > 0,
+            'days_outflow': flows < 0,
+            'largest_inflow': flows,
+            'largest_outflow': flows
+        }).groupby('fund_code', sort=False).agg({
+            'total_flow': 'sum',
+            'avg_daily_flow': 'mean',
+            'flow_volatility': 'std',
+            'days_inflow': 'sum',
+            'days_outflow': 'sum',
+            'largest_inflow': 'max',
+            'largest_outflow': 'min'
+        })
 
-        # Filter to period
-        period_data = df[df['date'] >= start_date].copy()
+        return agg.reset_index()
 
-        # Aggregate
-        agg_data = {
-            'total_flow': period_data['net_flow'].sum(),
-            'avg_daily_flow': period_data['net_flow'].mean(),
-            'flow_volatility': period_data['net_flow'].std(),
-            'days_inflow': (period_data['net_flow'] > 0).sum(),
-            'days_outflow': (period_data['net_flow'] < 0).sum(),
-            'largest_inflow': period_data['net_flow'].max(),
-            'largest_outflow': period_data['net_flow'].min()
-        }
+    def _fetch_fund_flows(
+        self,
+        fund_code: str,
+        start_date: str,
+        end_date: str
+    ) -> Optional[pd.DataFrame]:
+        """Fetch one fund and calculate its net flows"""
+        data = self.fetch_tefas_fund_data(fund_code, start_date, end_date)
+        if data is None:
+            return None
+        return self.calculate_net_flows(data)
+
+    def iter_fund_flows(
+        self,
+        fund_codes: List[str],
+        start_date: str,
+        end_date: str,
+        max_workers: Optional[int] = None
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Fetch funds concurrently and yield (fund_code, flow DataFrame) as each arrives
 
-        return pd.DataFrame([agg_data])
+        Results come back in completion order, so callers can render progress
+        while the rest of the universe is still loading.
+
+        Args:
+            fund_codes: List of TEFAS fund codes
+            start_date: Start date
+            end_date: End date
+            max_workers: Concurrent fetches (default: MAX_WORKERS)
+
+        Yields:
+            Tuples of fund_code and flow DataFrame; failed funds are skipped
+        """
+        codes = list(dict.fromkeys(fund_codes))
+        if not codes:
+            return
+        workers = max(1, min(max_workers or self.MAX_WORKERS, len(codes)))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._fetch_fund_flows, code, start_date, end_date): code
+                for code in codes
+            }
+            for future in as_completed(futures):
+                fund_code = futures[future]
+                try:
+                    data = future.result()
+                except Exception as e:
+                    print(f"Error fetching TEFAS data for {fund_code}: {str(e)}")
+                    continue
+                if data is not None:
+                    yield fund_code, data
 
     def fetch_multiple_funds(
         self,
         fund_codes: List[str],
         start_date: str,
-        end_date: str
+        end_date: str,
+        max_workers: Optional[int] = None,
+        on_result: Optional[Callable[[str, pd.DataFrame], None]] = None
     ) -> Dict[str, pd.DataFrame]:
         """
-        Fetch data for multiple funds
+        Fetch data for multiple funds concurrently
 
         Args:
             fund_codes: List of TEFAS fund codes
             start_date: Start date
             end_date: End date
+            max_workers: Concurrent fetches (default: MAX_WORKERS)
+            on_result: Called with (fund_code, flow DataFrame) as each fund arrives
 
         Returns:
-            Dict mapping fund_code to DataFrame
+            Dict mapping fund_code to DataFrame, in fund_codes order
         """
-        results = {}
+        fetched = {}
 
-        for fund_code in fund_codes:
-            data = self.fetch_tefas_fund_data(fund_code, start_date, end_date)
+        for fund_code, data in self.iter_fund_flows(fund_codes, start_date, end_date, max_workers):
+            fetched[fund_code] = data
+            if on_result is not None:
+                on_result(fund_code, data)
 
-            if data is not None:
-                # Calculate net flows
-                data = self.calculate_net_flows(data)
-                results[fund_code] = data
+        return {code: fetched[code] for code in dict.fromkeys(fund_codes) if code in fetched}
 
-        return results
+    def build_flow_frame(
+        self,
+        fund_flows: Dict[str, pd.DataFrame],
+        fund_sectors: Optional[Dict[str, str]] = None
+    ) -> pd.DataFrame:
+        """
+        Concatenate per-fund flow DataFrames into one long frame keyed by fund_code
+
+        Args:
+            fund_flows: Dict of fund_code -> flow DataFrame
+            fund_sectors: Optional dict of fund_code -> sector (adds a sector column)
+
+        Returns:
+            Long DataFrame with fund_code (and sector) columns
+        """
+        frames = {code: df for code, df in fund_flows.items() if df is not None and len(df) > 0}
+        if not frames:
+            columns = ['fund_code', 'date', 'net_flow'] + (['sector'] if fund_sectors is not None else [])
+            return pd.DataFrame(columns=columns)
+
+        flow_frame = pd.concat(frames, names=['fund_code', None]).reset_index(level='fund_code')
+        flow_frame = flow_frame.reset_index(drop=True)
+        flow_frame['date'] = pd.to_datetime(flow_frame['date'])
+        if fund_sectors is not None:
+            flow_frame['sector'] = flow_frame['fund_code'].map(fund_sectors).fillna('Unknown')
+        return flow_frame
 
     def aggregate_sector_flows(
         self,
@@ -218,27 +336,21 @@ class FundFlowRadar:
         Aggregate flows by sector
 
         Args:
-            fund_flows: Dict of fund_code -> flow DataFrame
+            fund_flows: Dict of fund_code -> flow DataFrame, or a long frame from build_flow_frame
             fund_sectors: Dict of fund_code -> sector
             period: Aggregation period
 
         Returns:
             DataFrame with sector-level flows
         """
-        sector_data = []
-
-        for fund_code, flow_df in fund_flows.items():
-            sector = fund_sectors.get(fund_code, 'Unknown')
-
-            # Aggregate this fund's flows
-            agg = self.aggregate_flows_by_period(flow_df, period)
-            agg['fund_code'] = fund_code
-            agg['sector'] = sector
-
-            sector_data.append(agg)
+        if isinstance(fund_flows, pd.DataFrame):
+            flow_frame = fund_flows
+        else:
+            flow_frame = self.build_flow_frame(fund_flows)
 
-        # Combine all funds
-        all_funds_df = pd.concat(sector_data, ignore_index=True)
+        # Aggregate every fund's flows in one pass
+        all_funds_df = self.aggregate_flows_by_fund(flow_frame, period)
+        all_funds_df['sector'] = all_funds_df['fund_code'].map(fund_sectors).fillna('Unknown')
 
         # Aggregate by sector
         sector_agg = all_funds_df.groupby('sector').agg({
@@ -282,17 +394,10 @@ class FundFlowRadar:
         # Detect anomalies
         anomalies = df[abs(df['z_score']) > threshold_std].copy()
 
-        results = []
-        for _, row in anomalies.iterrows():
-            results.append({
-                'date': row['date'],
-                'net_flow': row['net_flow'],
-                'z_score': row['z_score'],
-                'type': 'massive_inflow' if row['z_score'] > 0 else 'massive_outflow',
-                'magnitude': abs(row['z_score'])
-            })
+        anomalies['type'] = np.where(anomalies['z_score'] > 0, 'massive_inflow', 'massive_outflow')
+        anomalies['magnitude'] = anomalies['z_score'].abs()
 
-        return results
+        return anomalies[['date', 'net_flow', 'z_score', 'type', 'magnitude']].to_dict('records')
 
     def create_flow_sankey(
         self,
@@ -324,32 +429,19 @@ class FundFlowRadar:
         nodes = ['Yatırımcılar (Giriş)', 'Yatırımcılar (Çıkış)']
         node_colors = ['green', 'red']
 
-        # Add sector nodes
-        for sector in significant_flows['sector'].unique():
-            nodes.append(sector)
-            # Color based on net flow
-            net = significant_flows[significant_flows['sector'] == sector]['net_flow'].sum()
-            node_colors.append('lightgreen' if net > 0 else 'lightcoral')
-
-        # Build links
-        sources = []
-        targets = []
-        values = []
-        link_colors = []
-
-        # Inflows: Investors → Sectors
-        for _, row in inflows.iterrows():
-            sources.append(0)  # Investors (Inflow)
-            targets.append(nodes.index(row['sector']))
-            values.append(row['net_flow'])
-            link_colors.append('rgba(0, 200, 0, 0.3)')
-
-        # Outflows: Sectors → Investors
-        for _, row in outflows.iterrows():
-            sources.append(nodes.index(row['sector']))
-            targets.append(1)  # Investors (Outflow)
-            values.append(abs(row['net_flow']))
-            link_colors.append('rgba(200, 0, 0, 0.3)')
+        # Add sector nodes, colored by net flow
+        sector_net = significant_flows.groupby('sector', sort=False)['net_flow'].sum()
+        nodes.extend(sector_net.index)
+        node_colors.extend(np.where(sector_net > 0, 'lightgreen', 'lightcoral').tolist())
+        node_index = {sector: i for i, sector in enumerate(nodes)}
+
+        # Inflows: Investors → Sectors, Outflows: Sectors → Investors
+        inflow_targets = inflows['sector'].map(node_index).tolist()
+        outflow_sources = outflows['sector'].map(node_index).tolist()
+        sources = [0] * len(inflows) + outflow_sources
+        targets = inflow_targets + [1] * len(outflows)
+        values = inflows['net_flow'].tolist() + outflows['net_flow'].abs().tolist()
+        link_colors = ['rgba(0, 200, 0, 0.3)'] * len(inflows) + ['rgba(200, 0, 0, 0.3)'] * len(outflows)
 
         # Create Sankey
         fig = go.Figure(go.Sankey(
@@ -391,17 +483,8 @@ class FundFlowRadar:
         Returns:
             Plotly heatmap figure
         """
-        # Aggregate daily flows by sector
-        daily_sector_flows = []
-
-        for fund_code, flow_df in fund_flows.items():
-            sector = fund_sectors.get(fund_code, 'Unknown')
-            temp = flow_df[['date', 'net_flow']].copy()
-            temp['sector'] = sector
-            daily_sector_flows.append(temp)
-
-        # Combine
-        all_flows = pd.concat(daily_sector_flows, ignore_index=True)
+        # Daily flows for every fund, tagged with sector
+        all_flows = self.build_flow_frame(fund_flows, fund_sectors)
 
         # Pivot
         pivot = all_flows.pivot_table(
@@ -467,28 +550,23 @@ class FundFlowRadar:
         Returns:
             List of signal dicts
         """
-        signals = []
-
         # Calculate total flow
         total_flow = sector_flows['net_flow'].sum()
 
-        for _, row in sector_flows.iterrows():
-            flow_pct = (row['net_flow'] / total_flow * 100) if total_flow != 0 else 0
-
-            if abs(flow_pct) >= threshold_pct:
-                signal_type = 'BULLISH' if row['net_flow'] > 0 else 'BEARISH'
-                strength = 'STRONG' if abs(flow_pct) >= 20 else 'MODERATE'
+        flows = sector_flows['net_flow']
+        flow_pct = flows / total_flow * 100 if total_flow != 0 else pd.Series(0.0, index=sector_flows.index)
+        selected = flow_pct.abs() >= threshold_pct
 
-                signals.append({
-                    'sector': row['sector'],
-                    'signal': signal_type,
-                    'strength': strength,
-                    'flow_amount': row['net_flow'],
-                    'flow_pct': flow_pct,
-                    'num_funds': row.get('num_funds', 0)
-                })
+        signals = pd.DataFrame({
+            'sector': sector_flows['sector'],
+            'signal': np.where(flows > 0, 'BULLISH', 'BEARISH'),
+            'strength': np.where(flow_pct.abs() >= 20, 'STRONG', 'MODERATE'),
+            'flow_amount': flows,
+            'flow_pct': flow_pct,
+            'num_funds': sector_flows['num_funds'] if 'num_funds' in sector_flows else 0
+        })[selected]
 
-        return signals
+        return signals.to_dict('records')
 
 
 def quick_flow_analysis(
@@ -101,12 +101,24 @@ class FundFlowRadarUI:
         # Sample fund codes (in production, filter by category)
         fund_codes = self.radar.MAJOR_TEFAS_FUNDS[:10]
 
-        # Fetch fund data
+        # Fetch fund data concurrently, reporting each fund as it arrives
+        progress = st.progress(0.0, text="Fon verileri yükleniyor...")
+        loaded = []
+
+        def _on_fund_loaded(fund_code: str, flow_df: pd.DataFrame):
+            loaded.append(fund_code)
+            progress.progress(
+                len(loaded) / len(fund_codes),
+                text=f"{fund_code} yüklendi ({len(loaded)}/{len(fund_codes)})"
+            )
+
         fund_flows = self.radar.fetch_multiple_funds(
             fund_codes,
             start_date.strftime('%Y-%m-%d'),
-            end_date.strftime('%Y-%m-%d')
+            end_date.strftime('%Y-%m-%d'),
+            on_result=_on_fund_loaded
         )
+        progress.empty()
 
         if not fund_flows:
             st.error("Veri alınamadı. Lütfen tekrar deneyin.")
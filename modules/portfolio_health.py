@@ -6,11 +6,16 @@ Calculates 0-100 health score based on 8 key metrics
 import pandas as pd
 import numpy as np
 import yfinance as yf
-from typing import Dict, List, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
+from app.analytics import indicators
+from app.services.snapshot_store import SnapshotStore
+
 
 class PortfolioHealthScore:
     """
@@ -47,12 +52,22 @@ class PortfolioHealthScore:
         'Tüketim': ['BIMAS', 'MGROS', 'SOKM', 'CCOLA']
     }
 
-    def __init__(self):
+    # Symbol -> Yahoo listing resolutions, shared by every calculator in the process
+    LISTING_SNAPSHOT_KEY = 'portfolio-health-listings'
+    LISTING_INFO_TTL = timedelta(hours=24)
+    INFO_FIELDS = ('sector', 'beta', 'marketCap', 'averageVolume')
+    MAX_WORKERS = 8
+    _listings: Optional[Dict[str, Dict]] = None
+    _listings_lock = threading.Lock()
+
+    def __init__(self, listing_store: Optional[SnapshotStore] = None):
         self.portfolio_data = None
         self.enriched_data = None
         self.scores = {}
         self.total_score = 0
         self.recommendations = []
+        self.listing_store = listing_store
+        self._stats = None
 
     def _resolve_market_data(self, symbol: str):
         """Resolve the most likely Yahoo ticker for both US and Turkish symbols."""
@@ -94,6 +109,141 @@ class PortfolioHealthScore:
 
         return self.portfolio_data
 
+    def _listing_cache(self) -> Dict[str, Dict]:
+        """Load the persisted symbol -> listing map once per process."""
+        cls = PortfolioHealthScore
+        with cls._listings_lock:
+            if cls._listings is None:
+                try:
+                    store = self.listing_store or SnapshotStore()
+                    cls._listings = dict((store.read_json(self.LISTING_SNAPSHOT_KEY) or {}).get('listings', {}))
+                except Exception:
+                    cls._listings = {}
+            return cls._listings
+
+    def _save_listing_cache(self, updates: Dict[str, Dict]) -> None:
+        cls = PortfolioHealthScore
+        with cls._listings_lock:
+            cls._listings.update(updates)
+            snapshot = {'listings': dict(cls._listings)}
+        try:
+            (self.listing_store or SnapshotStore()).write_json(self.LISTING_SNAPSHOT_KEY, snapshot)
+        except Exception as e:
+            print(f"Warning: Could not persist listing cache: {e}")
+
+    def _resolve_entry(self, symbol: str, cached: Optional[Dict]) -> Tuple[Optional[Dict], pd.DataFrame]:
+        """Resolve one symbol, reusing a cached listing and refreshing only its stale info."""
+        if cached and cached.get('listing'):
+            try:
+                info = yf.Ticker(cached['listing']).info or {}
+                return self._listing_entry(cached['listing'], info), pd.DataFrame()
+            except Exception:
+                pass
+
+        listing, ticker, info, hist = self._resolve_market_data(symbol)
+        if ticker is None:
+            return None, pd.DataFrame()
+        return self._listing_entry(listing, info), hist
+
+    def _listing_entry(self, listing: str, info: Dict) -> Dict:
+        return {
+            'listing': listing,
+            'info': {field: info[field] for field in self.INFO_FIELDS if field in info},
+            'resolved_at': datetime.now().isoformat(timespec='seconds'),
+        }
+
+    def _resolve_listings(self, symbols: List[str]) -> Tuple[Dict[str, Dict], Dict[str, pd.DataFrame]]:
+        """Resolve every symbol concurrently; fresh cache entries need no network at all."""
+        cache = self._listing_cache()
+        now = datetime.now()
+        resolved: Dict[str, Dict] = {}
+        pending: List[str] = []
+        for symbol in symbols:
+            entry = cache.get(symbol)
+            try:
+                fresh = entry is not None and now - datetime.fromisoformat(entry['resolved_at']) < self.LISTING_INFO_TTL
+            except Exception:
+                fresh = False
+            if fresh:
+                resolved[symbol] = entry
+            else:
+                pending.append(symbol)
+
+        histories: Dict[str, pd.DataFrame] = {}
+        if pending:
+            workers = max(1, min(self.MAX_WORKERS, len(pending)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(lambda symbol: self._resolve_entry(symbol, cache.get(symbol)), pending))
+            updates = {}
+            for symbol, (entry, hist) in zip(pending, results):
+                if entry is None:
+                    continue
+                resolved[symbol] = updates[symbol] = entry
+                if not hist.empty:
+                    histories[entry['listing']] = hist
+            if updates:
+                self._save_listing_cache(updates)
+        return resolved, histories
+
+    def _download_closes(self, listings: List[str], histories: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """Six months of closes (dates x listings) in one request for everything not already fetched."""
+        columns: Dict[str, pd.Series] = {
+            listing: histories[listing]['Close'] for listing in listings if listing in histories
+        }
+        missing = [listing for listing in listings if listing not in columns]
+        if missing:
+            try:
+                raw = yf.download(missing, period="6mo", progress=False, threads=True, auto_adjust=False)
+                closes = raw['Close'] if raw is not None and not raw.empty else pd.DataFrame()
+                if isinstance(closes, pd.Series):
+                    closes = closes.to_frame(missing[0])
+                for listing in missing:
+                    if listing in closes.columns:
+                        columns[listing] = closes[listing]
+            except Exception as e:
+                print(f"Warning: Bulk history download failed: {e}")
+
+        if not columns:
+            return pd.DataFrame()
+        for listing, series in columns.items():
+            # Exchanges report in their own time zones; compare on calendar dates.
+            index = pd.DatetimeIndex(series.index)
+            if index.tz is not None:
+                index = index.tz_localize(None)
+            columns[listing] = pd.Series(series.to_numpy(dtype=float), index=index.normalize())
+        return pd.DataFrame(columns)
+
+    @staticmethod
+    def _price_metrics(closes: pd.DataFrame, rsi_period: int = 14) -> pd.DataFrame:
+        """Volatility, 3-month return and RSI for every column of a wide close frame.
+
+        Each column is bottom-aligned on its own trading days first, so listings on
+        different exchange calendars are measured exactly as they would be alone.
+        """
+        columns = list(closes.columns)
+        metrics = pd.DataFrame(np.nan, index=columns, columns=['Volatility', 'Return_3M', 'RSI'])
+        if closes.empty:
+            return metrics
+
+        values = closes.to_numpy(dtype=float)
+        present = ~np.isnan(values)
+        order = np.argsort(present, axis=0, kind='stable')
+        aligned = np.take_along_axis(values, order, axis=0)
+        counts = present.sum(axis=0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = aligned[1:] / aligned[:-1] - 1
+            volatility = np.nanstd(returns, axis=0, ddof=1) * np.sqrt(252)
+            metrics['Volatility'] = np.where(counts > 30, volatility, np.nan)
+
+            if len(aligned) >= 60:
+                base = aligned[-60]
+                metrics['Return_3M'] = np.where(counts >= 60, (aligned[-1] - base) / base * 100, np.nan)
+
+            if len(aligned) > rsi_period:
+                metrics['RSI'] = indicators.rsi(pd.DataFrame(aligned), rsi_period).to_numpy()[-1]
+        return metrics
+
     def enrich_portfolio_data(self) -> pd.DataFrame:
         """
         Enrich portfolio with market data from yfinance
@@ -103,53 +253,33 @@ class PortfolioHealthScore:
             raise ValueError("Portfolio not loaded. Call load_portfolio() first.")
 
         enriched = self.portfolio_data.copy()
-
-        # Initialize columns
-        enriched['Sector'] = ''
-        enriched['Beta'] = np.nan
-        enriched['Volatility'] = np.nan
-        enriched['Avg_Volume'] = np.nan
-        enriched['Market_Cap'] = np.nan
-        enriched['Return_3M'] = np.nan
-        enriched['RSI'] = np.nan
-
-        for idx, row in enriched.iterrows():
-            symbol = row['Symbol']
-
-            try:
-                ticker_symbol, ticker, info, hist = self._resolve_market_data(symbol)
-                if ticker is None:
-                    raise ValueError(f"No market data resolved for {symbol}")
-
-                # Basic info
-                enriched.at[idx, 'Sector'] = info.get('sector', self._guess_turkish_sector(symbol))
-                enriched.at[idx, 'Beta'] = info.get('beta', 1.0)
-                enriched.at[idx, 'Market_Cap'] = info.get('marketCap', 0)
-                enriched.at[idx, 'Avg_Volume'] = info.get('averageVolume', 0)
-
-                # Calculate volatility
-                if len(hist) > 30:
-                    returns = hist['Close'].pct_change().dropna()
-                    enriched.at[idx, 'Volatility'] = returns.std() * np.sqrt(252)  # Annualized
-
-                # Calculate 3-month return
-                if len(hist) >= 60:
-                    price_3m_ago = hist['Close'].iloc[-60]
-                    current_price = hist['Close'].iloc[-1]
-                    enriched.at[idx, 'Return_3M'] = ((current_price - price_3m_ago) / price_3m_ago) * 100
-
-                # Calculate RSI (14-day)
-                if len(hist) >= 14:
-                    enriched.at[idx, 'RSI'] = self._calculate_rsi(hist['Close'], period=14)
-
-            except Exception as e:
-                print(f"Warning: Could not fetch data for {symbol}: {e}")
-                # Use defaults
-                enriched.at[idx, 'Sector'] = self._guess_turkish_sector(symbol)
-                enriched.at[idx, 'Beta'] = 1.0
-                enriched.at[idx, 'Volatility'] = 0.25
+        symbols = enriched['Symbol'].astype(str).str.strip().str.upper()
+        resolved, histories = self._resolve_listings(list(dict.fromkeys(symbols)))
+        listings = sorted({entry['listing'] for entry in resolved.values()})
+        metrics = self._price_metrics(self._download_closes(listings, histories))
+
+        listing = symbols.map(lambda symbol: resolved.get(symbol, {}).get('listing'))
+        info = symbols.map(lambda symbol: resolved.get(symbol, {}).get('info', {}))
+        found = listing.notna()
+        guessed_sector = enriched['Symbol'].map(self._guess_turkish_sector)
+
+        # Unresolved symbols keep the historical defaults: guessed sector, beta 1.0, 25% volatility
+        enriched['Sector'] = np.where(found, [item.get('sector', guess) for item, guess in zip(info, guessed_sector)], guessed_sector)
+        enriched['Beta'] = np.where(found, [item.get('beta', 1.0) for item in info], 1.0)
+        enriched['Volatility'] = np.where(found, listing.map(metrics['Volatility']), 0.25)
+        enriched['Avg_Volume'] = np.where(found, [item.get('averageVolume', 0) for item in info], np.nan)
+        enriched['Market_Cap'] = np.where(found, [item.get('marketCap', 0) for item in info], np.nan)
+        enriched['Return_3M'] = listing.map(metrics['Return_3M'])
+        enriched['RSI'] = listing.map(metrics['RSI'])
+        for column in ['Beta', 'Volatility', 'Avg_Volume', 'Market_Cap', 'Return_3M', 'RSI']:
+            enriched[column] = pd.to_numeric(enriched[column], errors='coerce')
+        enriched['Volume_USD'] = enriched['Avg_Volume'] * enriched['Price']
+
+        for symbol in symbols[~found]:
+            print(f"Warning: Could not fetch data for {symbol}: No market data resolved for {symbol}")
 
         self.enriched_data = enriched
+        self._stats = None
         return enriched
 
     def _guess_turkish_sector(self, symbol: str) -> str:
@@ -161,18 +291,14 @@ class PortfolioHealthScore:
 
     def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> float:
         """Calculate Relative Strength Index"""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi.iloc[-1]
+        return indicators.rsi(prices, period).iloc[-1]
 
     def calculate_all_metrics(self) -> Dict[str, float]:
         """Calculate all 8 health metrics"""
         if self.enriched_data is None:
             raise ValueError("Portfolio data not enriched. Call enrich_portfolio_data() first.")
 
+        self._stats = None
         self.scores = {
             'diversification': self._calculate_diversification_score(),
             'risk': self._calculate_risk_score(),
@@ -195,13 +321,45 @@ class PortfolioHealthScore:
 
         return self.scores
 
+    def _portfolio_stats(self) -> Dict[str, float]:
+        """Weighted aggregates shared by the score methods, computed in one pass over the frame"""
+        if self._stats is not None:
+            return self._stats
+
+        df = self.enriched_data
+        weights = df['Weight'].to_numpy(dtype=float)
+        # NaN cells drop out of the weighted sums, matching pandas' skipna sums
+        avg_beta, avg_vol, avg_return = np.nansum(
+            df[['Beta', 'Volatility', 'Return_3M']].to_numpy(dtype=float) * weights[:, None], axis=0
+        )
+        returns = df['Return_3M'].to_numpy(dtype=float)
+        valid_returns = returns[~np.isnan(returns)]
+        volume_usd = (df['Avg_Volume'] * df['Price']).to_numpy(dtype=float)
+        ranked_weights = df['Weight'].sort_values(ascending=False)
+
+        self._stats = {
+            'num_stocks': len(df),
+            'avg_beta': avg_beta,
+            'avg_vol': avg_vol,
+            'avg_return': avg_return,
+            'valid_returns': len(valid_returns),
+            'positive_returns': int((valid_returns > 0).sum()),
+            'max_sector_weight': df.groupby('Sector')['Weight'].sum().max(),
+            'max_position': ranked_weights.max(),
+            'top3_weight': ranked_weights.head(3).sum(),
+            'high_liquidity': int((volume_usd >= 1_000_000).sum()),
+            'medium_liquidity': int(((volume_usd >= 100_000) & (volume_usd < 1_000_000)).sum()),
+            'low_liquidity': int((volume_usd < 100_000).sum()),
+        }
+        return self._stats
+
     def _calculate_diversification_score(self) -> float:
         """
         Score: 0-100
         Perfect: 10+ stocks, well-distributed sectors
         """
-        df = self.enriched_data
-        num_stocks = len(df)
+        stats = self._portfolio_stats()
+        num_stocks = stats['num_stocks']
 
         # Stock count component (50%)
         if num_stocks >= 15:
@@ -218,8 +376,7 @@ class PortfolioHealthScore:
             stock_score = 20
 
         # Sector distribution component (50%)
-        sector_weights = df.groupby('Sector')['Weight'].sum()
-        max_sector_weight = sector_weights.max()
+        max_sector_weight = stats['max_sector_weight']
 
         if max_sector_weight <= 0.25:  # No sector > 25%
             sector_score = 100
@@ -239,13 +396,13 @@ class PortfolioHealthScore:
         Score: 0-100
         Perfect: Portfolio beta 0.8-1.2, moderate volatility
         """
-        df = self.enriched_data
+        stats = self._portfolio_stats()
 
         # Weighted average beta
-        avg_beta = (df['Beta'] * df['Weight']).sum()
+        avg_beta = stats['avg_beta']
 
         # Weighted average volatility
-        avg_vol = (df['Volatility'] * df['Weight']).sum()
+        avg_vol = stats['avg_vol']
 
         # Beta score (50%)
         if 0.8 <= avg_beta <= 1.2:
@@ -275,19 +432,16 @@ class PortfolioHealthScore:
         Score: 0-100
         Perfect: 70%+ stocks with positive 3M momentum
         """
-        df = self.enriched_data
+        stats = self._portfolio_stats()
 
         # Filter valid return data
-        valid_returns = df['Return_3M'].dropna()
-
-        if len(valid_returns) == 0:
+        if stats['valid_returns'] == 0:
             return 50  # Neutral if no data
 
-        positive_returns = (valid_returns > 0).sum()
-        positive_pct = positive_returns / len(valid_returns)
+        positive_pct = stats['positive_returns'] / stats['valid_returns']
 
         # Weighted average return
-        avg_return = (df['Return_3M'] * df['Weight']).sum()
+        avg_return = stats['avg_return']
 
         # Positive ratio score (60%)
         if positive_pct >= 0.75:
@@ -320,17 +474,14 @@ class PortfolioHealthScore:
         Score: 0-100
         Perfect: All stocks with daily volume > $1M equivalent
         """
-        df = self.enriched_data
+        stats = self._portfolio_stats()
 
-        # Calculate average volume in dollars (approximate)
-        df['Volume_USD'] = df['Avg_Volume'] * df['Price']
-
-        # Threshold: 1M for large cap, 100K for mid/small
-        high_liquidity = (df['Volume_USD'] >= 1_000_000).sum()
-        medium_liquidity = ((df['Volume_USD'] >= 100_000) & (df['Volume_USD'] < 1_000_000)).sum()
-        low_liquidity = (df['Volume_USD'] < 100_000).sum()
+        # Threshold on approximate dollar volume: 1M for large cap, 100K for mid/small
+        high_liquidity = stats['high_liquidity']
+        medium_liquidity = stats['medium_liquidity']
+        low_liquidity = stats['low_liquidity']
 
-        total_stocks = len(df)
+        total_stocks = stats['num_stocks']
 
         score = (
             (high_liquidity / total_stocks) * 100 +
@@ -363,10 +514,10 @@ class PortfolioHealthScore:
         Score: 0-100
         Perfect: No single position > 15%, top 3 positions < 40%
         """
-        df = self.enriched_data.sort_values('Weight', ascending=False)
+        stats = self._portfolio_stats()
 
-        max_position = df['Weight'].max()
-        top3_weight = df['Weight'].head(3).sum()
+        max_position = stats['max_position']
+        top3_weight = stats['top3_weight']
 
         # Max position score (60%)
         if max_position <= 0.10:
@@ -405,10 +556,8 @@ class PortfolioHealthScore:
         Score: 0-100
         Portfolio performance vs benchmark (e.g., BIST100 or S&P500)
         """
-        df = self.enriched_data
-
         # Weighted 3M return
-        portfolio_return = (df['Return_3M'] * df['Weight']).sum()
+        portfolio_return = self._portfolio_stats()['avg_return']
 
         # Compare to benchmark (assume 5% as neutral)
         benchmark_return = 5.0
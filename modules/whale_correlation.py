@@ -8,10 +8,28 @@ import numpy as np
 import networkx as nx
 import plotly.graph_objects as go
 import plotly.express as px
+from dataclasses import dataclass
+from scipy import sparse
 from typing import Dict, List, Tuple, Optional
 import functools
 
 
+@dataclass
+class HoldingsMatrix:
+    """
+    Holdings pivoted once into sparse ticker x investor matrices
+
+    presence: 1 where the investor holds the ticker at all
+    weights: holding weight where it is finite (0 elsewhere)
+    weight_mask: 1 where the weight is finite, i.e. usable for correlation
+    """
+    tickers: pd.Index
+    investors: List[str]
+    presence: sparse.csc_matrix
+    weights: sparse.csc_matrix
+    weight_mask: sparse.csc_matrix
+
+
 class WhaleCorrelationEngine:
     """
     Analyzes portfolio correlations between whale investors
@@ -88,6 +106,101 @@ class WhaleCorrelationEngine:
             'common_holdings': len(common)
         }
 
+    def build_holdings_matrix(
+        self,
+        portfolios: List[pd.DataFrame],
+        investor_names: List[str],
+        weight_col: Optional[str] = 'portfolio_weight'
+    ) -> HoldingsMatrix:
+        """
+        Pivot portfolios into sparse ticker x investor matrices in one pass
+
+        Duplicate ticker rows within a portfolio are summed. With weight_col=None
+        only presence is tracked (every weight is 1).
+        """
+        ticker_parts, weight_parts, column_parts = [], [], []
+        for column, df in enumerate(portfolios):
+            if df is None or len(df) == 0:
+                continue
+            ticker_parts.append(df['ticker'].to_numpy(dtype=object))
+            if weight_col is None:
+                weight_parts.append(np.ones(len(df)))
+            else:
+                weight_parts.append(pd.to_numeric(df[weight_col], errors='coerce').to_numpy(dtype=float))
+            column_parts.append(np.full(len(df), column, dtype=np.int64))
+
+        tickers_long = np.concatenate(ticker_parts) if ticker_parts else np.array([], dtype=object)
+        weights = np.concatenate(weight_parts) if weight_parts else np.array([], dtype=float)
+        columns = np.concatenate(column_parts) if column_parts else np.array([], dtype=np.int64)
+
+        ticker_codes, tickers = pd.factorize(tickers_long)
+        known = ticker_codes >= 0  # factorize marks missing tickers with -1
+        ticker_codes, weights, columns = ticker_codes[known], weights[known], columns[known]
+        finite = np.isfinite(weights)
+        shape = (len(tickers), len(portfolios))
+
+        def _matrix(rows, cols, data):
+            matrix = sparse.coo_matrix((data, (rows, cols)), shape=shape).tocsc()
+            matrix.sum_duplicates()
+            return matrix
+
+        presence = _matrix(ticker_codes, columns, np.ones(len(columns)))
+        presence.data[:] = 1.0
+        weight_mask = _matrix(ticker_codes[finite], columns[finite], np.ones(int(finite.sum())))
+        weight_mask.data[:] = 1.0
+        return HoldingsMatrix(
+            tickers=pd.Index(tickers),
+            investors=list(investor_names),
+            presence=presence,
+            weights=_matrix(ticker_codes[finite], columns[finite], weights[finite]),
+            weight_mask=weight_mask,
+        )
+
+    @staticmethod
+    def _cross_correlation(matrix: HoldingsMatrix, left: List[int], right: List[int]) -> np.ndarray:
+        """
+        Pearson correlation of weights on commonly held tickers for every left x right pair
+
+        Equivalent to inner-merging each pair on ticker and correlating the two
+        weight columns, but built from sparse products instead of merges.
+        """
+        w_left, w_right = matrix.weights[:, left], matrix.weights[:, right]
+        m_left, m_right = matrix.weight_mask[:, left], matrix.weight_mask[:, right]
+
+        def _dense(product):
+            return np.asarray(product.todense(), dtype=float)
+
+        count = _dense(m_left.T @ m_right)
+        sum_left = _dense(w_left.T @ m_right)
+        sum_right = _dense(m_left.T @ w_right)
+        sum_cross = _dense(w_left.T @ w_right)
+        sq_left = _dense(w_left.multiply(w_left).T @ m_right)
+        sq_right = _dense(m_left.T @ w_right.multiply(w_right))
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = sum_cross - sum_left * sum_right / count
+            var_left = sq_left - sum_left ** 2 / count
+            var_right = sq_right - sum_right ** 2 / count
+            # Constant weights leave only rounding noise in the variance; treat that as zero
+            var_left[var_left <= 1e-12 * sq_left] = np.nan
+            var_right[var_right <= 1e-12 * sq_right] = np.nan
+            corr = cov / np.sqrt(var_left * var_right)
+
+        corr[(count < 2) | ~np.isfinite(corr)] = 0.0
+        return np.clip(corr, -1.0, 1.0)
+
+    @staticmethod
+    def _cross_overlap(matrix: HoldingsMatrix, left: List[int], right: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Jaccard overlap (%) and common holding counts for every left x right pair"""
+        p_left, p_right = matrix.presence[:, left], matrix.presence[:, right]
+        common = np.asarray((p_left.T @ p_right).todense(), dtype=float)
+        sizes_left = np.asarray(p_left.sum(axis=0), dtype=float).ravel()
+        sizes_right = np.asarray(p_right.sum(axis=0), dtype=float).ravel()
+        union = sizes_left[:, None] + sizes_right[None, :] - common
+        with np.errstate(divide='ignore', invalid='ignore'):
+            overlap = np.where(union > 0, common / union * 100, 0.0)
+        return overlap, common.astype(int)
+
     def build_correlation_matrix(
         self,
         whale_data_dict: Dict[str, pd.DataFrame],
@@ -105,27 +218,12 @@ class WhaleCorrelationEngine:
         """
         investor_names = list(whale_data_dict.keys())
         n = len(investor_names)
+        matrix = self.build_holdings_matrix(list(whale_data_dict.values()), investor_names, weight_col)
 
-        # Initialize correlation matrix
-        corr_matrix = pd.DataFrame(
-            np.eye(n),  # Diagonal = 1.0 (self-correlation)
-            index=investor_names,
-            columns=investor_names
-        )
-
-        # Calculate pairwise correlations
-        for i, name_a in enumerate(investor_names):
-            for j, name_b in enumerate(investor_names):
-                if i < j:  # Only calculate upper triangle (symmetric)
-                    corr = self.calculate_portfolio_correlation(
-                        whale_data_dict[name_a],
-                        whale_data_dict[name_b],
-                        weight_col
-                    )
-                    corr_matrix.loc[name_a, name_b] = corr
-                    corr_matrix.loc[name_b, name_a] = corr  # Symmetry
+        values = self._cross_correlation(matrix, list(range(n)), list(range(n)))
+        np.fill_diagonal(values, 1.0)  # Diagonal = 1.0 (self-correlation)
 
-        return corr_matrix
+        return pd.DataFrame(values, index=investor_names, columns=investor_names)
 
     def build_overlap_matrix(
         self,
@@ -139,25 +237,12 @@ class WhaleCorrelationEngine:
         """
         investor_names = list(whale_data_dict.keys())
         n = len(investor_names)
+        matrix = self.build_holdings_matrix(list(whale_data_dict.values()), investor_names, weight_col=None)
 
-        overlap_matrix = pd.DataFrame(
-            100.0 * np.eye(n),  # Diagonal = 100% (self-overlap)
-            index=investor_names,
-            columns=investor_names
-        )
-
-        for i, name_a in enumerate(investor_names):
-            for j, name_b in enumerate(investor_names):
-                if i < j:
-                    metrics = self.calculate_overlap_percentage(
-                        whale_data_dict[name_a],
-                        whale_data_dict[name_b]
-                    )
-                    overlap_pct = metrics['overlap_percentage']
-                    overlap_matrix.loc[name_a, name_b] = overlap_pct
-                    overlap_matrix.loc[name_b, name_a] = overlap_pct
+        values, _ = self._cross_overlap(matrix, list(range(n)), list(range(n)))
+        np.fill_diagonal(values, 100.0)  # Diagonal = 100% (self-overlap)
 
-        return overlap_matrix
+        return pd.DataFrame(values, index=investor_names, columns=investor_names)
 
     def compare_user_to_whales(
         self,
@@ -173,19 +258,21 @@ class WhaleCorrelationEngine:
             Sorted by correlation (descending)
         """
         results = []
+        names = list(whale_data_dict.keys())
+        # The user portfolio is the last column of the shared matrix
+        matrix = self.build_holdings_matrix(
+            list(whale_data_dict.values()) + [user_df], names + ['__user__'], weight_col
+        )
+        whales = list(range(len(names)))
+        correlations = self._cross_correlation(matrix, [len(names)], whales)[0]
+        overlaps, commons = self._cross_overlap(matrix, [len(names)], whales)
 
-        for name, whale_df in whale_data_dict.items():
-            # Calculate correlation
-            corr = self.calculate_portfolio_correlation(user_df, whale_df, weight_col)
-
-            # Calculate overlap
-            overlap_metrics = self.calculate_overlap_percentage(user_df, whale_df)
-
+        for position, name in enumerate(names):
             results.append({
                 'Investor': name,
-                'Similarity_Score': round(corr * 100, 1),
-                'Overlap_Percentage': round(overlap_metrics['overlap_percentage'], 1),
-                'Common_Holdings': overlap_metrics['common_holdings']
+                'Similarity_Score': round(float(correlations[position]) * 100, 1),
+                'Overlap_Percentage': round(float(overlaps[0, position]), 1),
+                'Common_Holdings': int(commons[0, position])
             })
 
         df_results = pd.DataFrame(results)
@@ -210,11 +297,7 @@ class WhaleCorrelationEngine:
         """
         # Build graph
         G = nx.Graph()
-
-        for i in corr_matrix.index:
-            for j in corr_matrix.columns:
-                if i != j and corr_matrix.loc[i, j] >= threshold:
-                    G.add_edge(i, j, weight=corr_matrix.loc[i, j])
+        G.add_weighted_edges_from(self._edges_above(corr_matrix, threshold))
 
         # Find connected components (clusters)
         clusters = list(nx.connected_components(G))
@@ -225,6 +308,19 @@ class WhaleCorrelationEngine:
 
         return clusters
 
+    @staticmethod
+    def _edges_above(corr_matrix: pd.DataFrame, threshold: float) -> List[Tuple[str, str, float]]:
+        """Off-diagonal (row, column, correlation) entries at or above threshold, row-major"""
+        values = corr_matrix.to_numpy(dtype=float)
+        rows = corr_matrix.index.to_numpy()
+        columns = corr_matrix.columns.to_numpy()
+        hits = np.argwhere(values >= threshold)
+        return [
+            (rows[i], columns[j], values[i, j])
+            for i, j in hits
+            if rows[i] != columns[j]
+        ]
+
     def plot_correlation_heatmap(
         self,
         corr_matrix: pd.DataFrame,
@@ -310,13 +406,8 @@ class WhaleCorrelationEngine:
         # Build graph
         G = nx.Graph()
 
-        for name in corr_matrix.index:
-            G.add_node(name)
-
-        for i in corr_matrix.index:
-            for j in corr_matrix.columns:
-                if i != j and corr_matrix.loc[i, j] >= threshold:
-                    G.add_edge(i, j, weight=corr_matrix.loc[i, j])
+        G.add_nodes_from(corr_matrix.index)
+        G.add_weighted_edges_from(self._edges_above(corr_matrix, threshold))
 
         if len(G.edges()) == 0:
             # No connections above threshold
@@ -401,16 +492,16 @@ class WhaleCorrelationEngine:
         Returns:
             List of dicts with keys: investor_a, investor_b, correlation
         """
-        pairs = []
-
-        for i, name_a in enumerate(corr_matrix.index):
-            for j, name_b in enumerate(corr_matrix.columns):
-                if i < j:  # Only upper triangle
-                    pairs.append({
-                        'investor_a': name_a,
-                        'investor_b': name_b,
-                        'correlation': corr_matrix.loc[name_a, name_b]
-                    })
+        values = corr_matrix.to_numpy()
+        upper_i, upper_j = np.triu_indices(values.shape[0], k=1, m=values.shape[1])  # Only upper triangle
+        pairs = [
+            {
+                'investor_a': corr_matrix.index[i],
+                'investor_b': corr_matrix.columns[j],
+                'correlation': values[i, j]
+            }
+            for i, j in zip(upper_i, upper_j)
+        ]
 
         # Sort by correlation (descending)
         pairs = sorted(pairs, key=lambda x: x['correlation'], reverse=True)
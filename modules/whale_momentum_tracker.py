@@ -8,6 +8,13 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
 
+from app.analytics.holdings_diff import diff_holdings
+
+
+BUY_ACTIONS = ['NEW', 'INCREASED']
+SELL_ACTIONS = ['SOLD', 'DECREASED']
+MOVE_COLUMNS = ['ticker', 'whale', 'action', 'shares_change', 'value_change', 'weight_change', 'shares_change_pct']
+
 
 class WhaleMomentumTracker:
     """
@@ -36,34 +43,13 @@ class WhaleMomentumTracker:
         Returns:
             DataFrame with position changes and direction
         """
-        # Merge current and previous
-        merged = pd.merge(
-            current_holdings[['ticker', 'shares', 'value_usd', 'portfolio_weight']],
-            previous_holdings[['ticker', 'shares', 'value_usd', 'portfolio_weight']],
-            on='ticker',
-            how='outer',
-            suffixes=('_curr', '_prev')
-        ).fillna(0)
-
-        # Calculate changes
-        merged['shares_change'] = merged['shares_curr'] - merged['shares_prev']
-        merged['value_change'] = merged['value_usd_curr'] - merged['value_usd_prev']
-        merged['weight_change'] = merged['portfolio_weight_curr'] - merged['portfolio_weight_prev']
-
-        # Determine action
-        def determine_action(row):
-            if row['shares_prev'] == 0:
-                return 'NEW'
-            elif row['shares_curr'] == 0:
-                return 'SOLD'
-            elif row['shares_change'] > 0:
-                return 'INCREASED'
-            elif row['shares_change'] < 0:
-                return 'DECREASED'
-            else:
-                return 'UNCHANGED'
-
-        merged['action'] = merged.apply(determine_action, axis=1)
+        merged = diff_holdings(
+            current_holdings,
+            previous_holdings,
+            key='ticker',
+            numeric=('shares', 'value_usd', 'portfolio_weight'),
+            basis='shares'
+        )
 
         # Calculate percentage changes
         merged['shares_change_pct'] = np.where(
@@ -87,22 +73,87 @@ class WhaleMomentumTracker:
         Returns:
             DataFrame with aggregated moves per ticker
         """
-        all_moves = []
-
-        for whale_name, changes_df in whale_changes_dict.items():
-            for _, row in changes_df.iterrows():
-                if row['action'] in ['NEW', 'INCREASED', 'SOLD', 'DECREASED']:
-                    all_moves.append({
-                        'ticker': row['ticker'],
-                        'whale': whale_name,
-                        'action': row['action'],
-                        'shares_change': row['shares_change'],
-                        'value_change': row['value_change'],
-                        'weight_change': row['weight_change'],
-                        'shares_change_pct': row['shares_change_pct']
-                    })
-
-        return pd.DataFrame(all_moves)
+        frames = {
+            whale_name: changes_df[MOVE_COLUMNS[:1] + MOVE_COLUMNS[2:]]
+            for whale_name, changes_df in whale_changes_dict.items()
+            if changes_df is not None and len(changes_df) > 0
+        }
+        if not frames:
+            return pd.DataFrame(columns=MOVE_COLUMNS)
+
+        all_moves = pd.concat(frames, names=['whale', None]).reset_index(level='whale')
+        all_moves = all_moves[all_moves['action'].isin(BUY_ACTIONS + SELL_ACTIONS)]
+
+        return all_moves[MOVE_COLUMNS].reset_index(drop=True)
+
+    def summarize_tickers(
+        self,
+        aggregated_moves: pd.DataFrame,
+        num_whales: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Per-ticker buy/sell summary and momentum metrics from a single groupby
+
+        Rows keep the order in which tickers first appear in aggregated_moves.
+
+        Args:
+            aggregated_moves: Aggregated whale moves
+            num_whales: Whales in the universe used for overlap (default: whales in the moves)
+
+        Returns:
+            DataFrame indexed by ticker
+        """
+        if num_whales is None:
+            num_whales = aggregated_moves['whale'].nunique()
+
+        is_buy = aggregated_moves['action'].isin(BUY_ACTIONS)
+        is_sell = aggregated_moves['action'].isin(SELL_ACTIONS)
+        frame = pd.DataFrame({
+            'ticker': aggregated_moves['ticker'],
+            'is_buy': is_buy,
+            'is_sell': is_sell,
+            'abs_weight_change': aggregated_moves['weight_change'].abs(),
+            'buy_value_change': aggregated_moves['value_change'].where(is_buy, 0.0),
+            'sell_value_change': aggregated_moves['value_change'].where(is_sell, 0.0),
+            'buy_weight_change': aggregated_moves['weight_change'].where(is_buy, 0.0),
+            'sell_weight_change': aggregated_moves['weight_change'].where(is_sell, 0.0),
+        })
+        summary = frame.groupby('ticker', sort=False).agg(
+            buyers=('is_buy', 'sum'),
+            sellers=('is_sell', 'sum'),
+            avg_weight_change=('abs_weight_change', 'mean'),
+            buy_value_change=('buy_value_change', 'sum'),
+            sell_value_change=('sell_value_change', 'sum'),
+            buy_weight_change=('buy_weight_change', 'sum'),
+            sell_weight_change=('sell_weight_change', 'sum'),
+        )
+        summary[['buyers', 'sellers']] = summary[['buyers', 'sellers']].astype(int)
+
+        # Whale lists per ticker: stable sort by ticker code keeps move order within each group
+        codes = summary.index.get_indexer(aggregated_moves['ticker'])
+        whales = aggregated_moves['whale'].to_numpy(dtype=object)
+        for side, mask in (('buyer_whales', is_buy.to_numpy()), ('seller_whales', is_sell.to_numpy())):
+            side_codes = codes[mask]
+            order = np.argsort(side_codes, kind='stable')
+            bounds = np.searchsorted(side_codes[order], np.arange(len(summary) + 1))
+            side_whales = whales[mask][order].tolist()
+            summary[side] = [side_whales[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+        total = summary['buyers'] + summary['sellers']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            summary['net_buy_pct'] = np.where(total > 0, (summary['buyers'] - summary['sellers']) / total, 0)
+            summary['overlap'] = total / num_whales
+        summary['num_whales'] = total
+        summary['confidence'] = np.minimum(summary['avg_weight_change'] / 2.0, 1.0)  # Normalize to 0-1
+        summary['momentum_score'] = (
+            (summary['net_buy_pct'] + 1) / 2 * 0.5 + summary['overlap'] * 0.3 + summary['confidence'] * 0.2
+        )
+        summary['net_direction'] = np.select(
+            [summary['net_buy_pct'] > 0.3, summary['net_buy_pct'] < -0.3],
+            ['BULLISH', 'BEARISH'],
+            default='NEUTRAL'
+        )
+        return summary
 
     def calculate_momentum_score(
         self,
@@ -133,49 +184,17 @@ class WhaleMomentumTracker:
                 'net_direction': 'NEUTRAL'
             }
 
-        # Count buyers and sellers
-        buyers = ticker_moves[ticker_moves['action'].isin(['NEW', 'INCREASED'])]
-        sellers = ticker_moves[ticker_moves['action'].isin(['SOLD', 'DECREASED'])]
-
-        num_buyers = len(buyers)
-        num_sellers = len(sellers)
-        total_whales = num_buyers + num_sellers
-
-        # Net buy percentage
-        net_buy_pct = (num_buyers - num_sellers) / total_whales if total_whales > 0 else 0
-
-        # Overlap (how many whales are involved)
-        overlap = total_whales / len(aggregated_moves['whale'].unique())
+        summary = self.summarize_tickers(ticker_moves, num_whales=aggregated_moves['whale'].nunique())
+        return self._momentum_records(summary)[0]
 
-        # Confidence (based on magnitude of changes)
-        avg_weight_change = ticker_moves['weight_change'].abs().mean()
-        confidence = min(avg_weight_change / 2.0, 1.0)  # Normalize to 0-1
-
-        # Momentum score
-        momentum_score = ((net_buy_pct + 1) / 2 * 0.5 + overlap * 0.3 + confidence * 0.2)
-
-        # Net direction
-        if net_buy_pct > 0.3:
-            net_direction = 'BULLISH'
-        elif net_buy_pct < -0.3:
-            net_direction = 'BEARISH'
-        else:
-            net_direction = 'NEUTRAL'
-
-        return {
-            'ticker': ticker,
-            'momentum_score': momentum_score,
-            'num_whales': total_whales,
-            'buyers': num_buyers,
-            'sellers': num_sellers,
-            'net_buy_pct': net_buy_pct,
-            'overlap': overlap,
-            'confidence': confidence,
-            'net_direction': net_direction,
-            'avg_weight_change': avg_weight_change,
-            'buyer_whales': buyers['whale'].tolist(),
-            'seller_whales': sellers['whale'].tolist()
-        }
+    @staticmethod
+    def _momentum_records(summary: pd.DataFrame) -> List[Dict]:
+        """Momentum score dicts (calculate_momentum_score layout) for every summarized ticker"""
+        columns = [
+            'momentum_score', 'num_whales', 'buyers', 'sellers', 'net_buy_pct', 'overlap',
+            'confidence', 'net_direction', 'avg_weight_change', 'buyer_whales', 'seller_whales'
+        ]
+        return summary[columns].rename_axis('ticker').reset_index().to_dict('records')
 
     def detect_consensus_buys(
         self,
@@ -192,29 +211,20 @@ class WhaleMomentumTracker:
         Returns:
             List of consensus buy signals
         """
-        # Get unique tickers
-        tickers = aggregated_moves['ticker'].unique()
+        summary = self.summarize_tickers(aggregated_moves)
+        summary = summary[summary['buyers'] >= min_whales]
 
-        consensus_buys = []
-
-        for ticker in tickers:
-            ticker_moves = aggregated_moves[aggregated_moves['ticker'] == ticker]
-
-            # Count buyers
-            buyers = ticker_moves[ticker_moves['action'].isin(['NEW', 'INCREASED'])]
-
-            if len(buyers) >= min_whales:
-                # Calculate total value change
-                total_value_change = buyers['value_change'].sum()
-
-                consensus_buys.append({
-                    'ticker': ticker,
-                    'num_buyers': len(buyers),
-                    'buyer_whales': buyers['whale'].tolist(),
-                    'total_value_change': total_value_change,
-                    'avg_weight_change': buyers['weight_change'].mean(),
-                    'signal_strength': 'STRONG' if len(buyers) >= 5 else 'MODERATE'
-                })
+        consensus_buys = [
+            {
+                'ticker': ticker,
+                'num_buyers': int(row.buyers),
+                'buyer_whales': row.buyer_whales,
+                'total_value_change': row.buy_value_change,
+                'avg_weight_change': row.buy_weight_change / row.buyers,
+                'signal_strength': 'STRONG' if row.buyers >= 5 else 'MODERATE'
+            }
+            for ticker, row in zip(summary.index, summary.itertuples(index=False))
+        ]
 
         # Sort by number of buyers
         consensus_buys = sorted(consensus_buys, key=lambda x: x['num_buyers'], reverse=True)
@@ -236,27 +246,20 @@ class WhaleMomentumTracker:
         Returns:
             List of consensus sell signals
         """
-        tickers = aggregated_moves['ticker'].unique()
+        summary = self.summarize_tickers(aggregated_moves)
+        summary = summary[summary['sellers'] >= min_whales]
 
-        consensus_sells = []
-
-        for ticker in tickers:
-            ticker_moves = aggregated_moves[aggregated_moves['ticker'] == ticker]
-
-            # Count sellers
-            sellers = ticker_moves[ticker_moves['action'].isin(['SOLD', 'DECREASED'])]
-
-            if len(sellers) >= min_whales:
-                total_value_change = sellers['value_change'].sum()
-
-                consensus_sells.append({
-                    'ticker': ticker,
-                    'num_sellers': len(sellers),
-                    'seller_whales': sellers['whale'].tolist(),
-                    'total_value_change': total_value_change,
-                    'avg_weight_change': sellers['weight_change'].mean(),
-                    'signal_strength': 'STRONG' if len(sellers) >= 5 else 'MODERATE'
-                })
+        consensus_sells = [
+            {
+                'ticker': ticker,
+                'num_sellers': int(row.sellers),
+                'seller_whales': row.seller_whales,
+                'total_value_change': row.sell_value_change,
+                'avg_weight_change': row.sell_weight_change / row.sellers,
+                'signal_strength': 'STRONG' if row.sellers >= 5 else 'MODERATE'
+            }
+            for ticker, row in zip(summary.index, summary.itertuples(index=False))
+        ]
 
         consensus_sells = sorted(consensus_sells, key=lambda x: x['num_sellers'], reverse=True)
 
@@ -280,8 +283,8 @@ class WhaleMomentumTracker:
             }
 
         # Count all actions
-        buys = aggregated_moves[aggregated_moves['action'].isin(['NEW', 'INCREASED'])]
-        sells = aggregated_moves[aggregated_moves['action'].isin(['SOLD', 'DECREASED'])]
+        buys = aggregated_moves[aggregated_moves['action'].isin(BUY_ACTIONS)]
+        sells = aggregated_moves[aggregated_moves['action'].isin(SELL_ACTIONS)]
 
         num_buys = len(buys)
         num_sells = len(sells)
@@ -338,15 +341,7 @@ class WhaleMomentumTracker:
         Returns:
             DataFrame with top momentum stocks
         """
-        tickers = aggregated_moves['ticker'].unique()
-
-        momentum_scores = []
-
-        for ticker in tickers:
-            score_dict = self.calculate_momentum_score(ticker, aggregated_moves)
-            momentum_scores.append(score_dict)
-
-        df = pd.DataFrame(momentum_scores)
+        df = pd.DataFrame(self._momentum_records(self.summarize_tickers(aggregated_moves)))
 
         # Sort by momentum score
         df = df.sort_values('momentum_score', ascending=False)
@@ -363,27 +358,22 @@ class WhaleMomentumTracker:
         Returns:
             List of divergence signals
         """
-        tickers = aggregated_moves['ticker'].unique()
-
-        divergences = []
-
-        for ticker in tickers:
-            ticker_moves = aggregated_moves[aggregated_moves['ticker'] == ticker]
-
-            buyers = ticker_moves[ticker_moves['action'].isin(['NEW', 'INCREASED'])]
-            sellers = ticker_moves[ticker_moves['action'].isin(['SOLD', 'DECREASED'])]
-
-            # Divergence = both buyers and sellers present
-            if len(buyers) >= 2 and len(sellers) >= 2:
-                divergences.append({
-                    'ticker': ticker,
-                    'num_buyers': len(buyers),
-                    'num_sellers': len(sellers),
-                    'buyer_whales': buyers['whale'].tolist(),
-                    'seller_whales': sellers['whale'].tolist(),
-                    'total_whales': len(buyers) + len(sellers),
-                    'divergence_score': min(len(buyers), len(sellers)) / max(len(buyers), len(sellers))
-                })
+        summary = self.summarize_tickers(aggregated_moves)
+        # Divergence = both buyers and sellers present
+        summary = summary[(summary['buyers'] >= 2) & (summary['sellers'] >= 2)]
+
+        divergences = [
+            {
+                'ticker': ticker,
+                'num_buyers': int(row.buyers),
+                'num_sellers': int(row.sellers),
+                'buyer_whales': row.buyer_whales,
+                'seller_whales': row.seller_whales,
+                'total_whales': int(row.buyers + row.sellers),
+                'divergence_score': min(row.buyers, row.sellers) / max(row.buyers, row.sellers)
+            }
+            for ticker, row in zip(summary.index, summary.itertuples(index=False))
+        ]
 
         # Sort by divergence score (higher = more balanced divergence)
         divergences = sorted(divergences, key=lambda x: x['divergence_score'], reverse=True)
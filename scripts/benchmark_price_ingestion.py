@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Price history ingestion benchmark
+Writes synthetic daily bars for many symbols through DatabaseManager.cache_price_frames
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+import argparse
+
+from utils.database import DatabaseManager
+
+
+def build_frames(symbols: int, years: int) -> dict:
+    """Generate random-walk OHLCV frames sharing one business-day index"""
+    index = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=years * 252)
+    rng = np.random.default_rng(7)
+    frames = {}
+    for i in range(symbols):
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(index))))
+        frames[f"SYM{i:04d}"] = pd.DataFrame(
+            {
+                'Open': close * 0.999,
+                'High': close * 1.01,
+                'Low': close * 0.99,
+                'Close': close,
+                'Volume': rng.integers(1_000, 1_000_000, len(index)),
+            },
+            index=index,
+        )
+    return frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark bulk price ingestion')
+    parser.add_argument('--symbols', type=int, default=1000)
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--batch', type=int, default=100, help='Symbols per transaction')
+    args = parser.parse_args()
+
+    frames = build_frames(args.symbols, args.years)
+    symbols = list(frames)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(str(Path(tmp) / 'bench.db'))
+        started = time.perf_counter()
+        written = 0
+        for offset in range(0, len(symbols), args.batch):
+            chunk = {symbol: frames[symbol] for symbol in symbols[offset:offset + args.batch]}
+            written += db.cache_price_frames(chunk)
+        elapsed = time.perf_counter() - started
+        db.pool.close_all()
+        db.close()
+
+    print(f"📈 Ingested {written:,} rows ({args.symbols} symbols × {args.years} years) in {elapsed:.2f}s")
+    print(f"⚡ {written / elapsed:,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -25,16 +25,16 @@ def init_database(db_path: str = "data/dashboard.db", demo_data: bool = False):
     print("✅ Database schema created successfully!")
 
     # Show created tables
-    conn = db.get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-    tables = cursor.fetchall()
+    with db.pool.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        tables = cursor.fetchall()
 
-    print(f"\n📊 Created {len(tables)} tables:")
-    for table in tables:
-        cursor.execute(f"SELECT COUNT(*) FROM {table[0]}")
-        count = cursor.fetchone()[0]
-        print(f"  - {table[0]}: {count} rows")
+        print(f"\n📊 Created {len(tables)} tables:")
+        for table in tables:
+            cursor.execute(f"SELECT COUNT(*) FROM {table[0]}")
+            count = cursor.fetchone()[0]
+            print(f"  - {table[0]}: {count} rows")
 
     if demo_data:
         print("\n🎭 Creating demo data...")
@@ -55,10 +55,8 @@ def create_demo_data(db: DatabaseManager):
         print("     ⚠️  Demo user already exists")
 
     # Get user ID
-    conn = db.get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT id FROM users WHERE username = 'demo'")
-    user_row = cursor.fetchone()
+    with db.pool.connection() as conn:
+        user_row = conn.execute("SELECT id FROM users WHERE username = 'demo'").fetchone()
 
     if user_row:
         user_id = user_row[0]
@@ -113,28 +111,28 @@ def check_database(db_path: str = "data/dashboard.db"):
     print(f"✅ Database exists: {db_path}")
 
     db = DatabaseManager(db_path)
-    conn = db.get_connection()
-    cursor = conn.cursor()
-
-    # Count tables
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-    tables = cursor.fetchall()
-    print(f"📊 Tables: {len(tables)}")
-
-    # Count users
-    cursor.execute("SELECT COUNT(*) FROM users")
-    user_count = cursor.fetchone()[0]
-    print(f"👤 Users: {user_count}")
-
-    # Count portfolios
-    cursor.execute("SELECT COUNT(*) FROM portfolios")
-    portfolio_count = cursor.fetchone()[0]
-    print(f"💼 Portfolios: {portfolio_count}")
-
-    # Count holdings
-    cursor.execute("SELECT COUNT(*) FROM holdings")
-    holding_count = cursor.fetchone()[0]
-    print(f"📈 Holdings: {holding_count}")
+    with db.pool.connection() as conn:
+        cursor = conn.cursor()
+
+        # Count tables
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        tables = cursor.fetchall()
+        print(f"📊 Tables: {len(tables)}")
+
+        # Count users
+        cursor.execute("SELECT COUNT(*) FROM users")
+        user_count = cursor.fetchone()[0]
+        print(f"👤 Users: {user_count}")
+
+        # Count portfolios
+        cursor.execute("SELECT COUNT(*) FROM portfolios")
+        portfolio_count = cursor.fetchone()[0]
+        print(f"💼 Portfolios: {portfolio_count}")
+
+        # Count holdings
+        cursor.execute("SELECT COUNT(*) FROM holdings")
+        holding_count = cursor.fetchone()[0]
+        print(f"📈 Holdings: {holding_count}")
 
     db.close()
     return True
@@ -8,6 +8,7 @@ import sys
 sys.path.insert(0, '.')
 
 from utils.market_data_engine import market
+from utils.unified_api_manager import PRIORITY_BULK, api_priority
 from datetime import datetime, timedelta
 import time
 
@@ -162,14 +163,16 @@ print("\n\n" + "🚀 " + "="*76)
 print("🚀 BATCH OPERATIONS TESTS")
 print("🚀 " + "="*76)
 
-test_api("Batch - Multiple Stocks", market.get_multiple_stocks, ['AAPL', 'GOOGL', 'MSFT'])
-time.sleep(2)
+# The sweep is bulk traffic; keep it behind interactive callers sharing the limiter.
+with api_priority(PRIORITY_BULK):
+    test_api("Batch - Multiple Stocks", market.get_multiple_stocks, ['AAPL', 'GOOGL', 'MSFT'])
+    time.sleep(2)
 
-test_api("Batch - Multiple Cryptos", market.get_multiple_cryptos, ['BTC', 'ETH'])
-time.sleep(1)
+    test_api("Batch - Multiple Cryptos", market.get_multiple_cryptos, ['BTC', 'ETH'])
+    time.sleep(1)
 
-test_api("Batch - Multiple Funds", market.get_multiple_funds, ['TCD', 'AKG'])
-time.sleep(1)
+    test_api("Batch - Multiple Funds", market.get_multiple_funds, ['TCD', 'AKG'])
+    time.sleep(1)
 
 # ========== FINAL RESULTS ==========
 print("\n\n" + "=" * 80)
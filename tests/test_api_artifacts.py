@@ -0,0 +1,22 @@
+import os
+import time
+
+from app.api.artifacts import ArtifactStore
+
+
+def test_follower_store_picks_up_published_artifacts_and_skips_stale_ones(tmp_path):
+    leader = ArtifactStore(directory=tmp_path, max_age_seconds=60)
+    follower = ArtifactStore(directory=tmp_path, max_age_seconds=60)
+    leader.register("tr-funds", lambda: {"status": "success", "rows": 2})
+
+    assert follower.get("tr-funds") is None
+    published = leader.publish_all()
+    page = follower.get("tr-funds")
+
+    assert page.etag == published["tr-funds"]
+    assert page.body == b'{"status":"success","rows":2}'
+    assert follower.get("tr-funds") is page
+
+    stale = time.time() - 120
+    os.utime(tmp_path / "tr-funds.json", (stale, stale))
+    assert follower.get("tr-funds") is None
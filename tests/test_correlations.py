@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+from app.analytics.correlations import CorrelationAnalyzer, regime_history, rolling_correlation_matrix
+
+
+def _returns(periods: int = 240, assets: int = 6) -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    market = rng.normal(0, 0.01, (periods, 1))
+    loadings = np.linspace(0.0, 1.5, assets)
+    return pd.DataFrame(
+        market * loadings + rng.normal(0, 0.01, (periods, assets)),
+        index=pd.bdate_range("2024-01-01", periods=periods),
+        columns=[f"A{i}" for i in range(assets)],
+    )
+
+
+def test_rolling_matrix_matches_pandas_including_pairwise_gaps():
+    returns = _returns()
+    expected = returns.rolling(20).corr()
+    result = CorrelationAnalyzer().rolling_correlation_matrix(returns, window=20)
+
+    assert result.shape == expected.shape
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-10, equal_nan=True)
+
+    gapped = returns.copy()
+    gapped.iloc[[5, 50, 51, 130], 1] = np.nan
+    gapped.iloc[[90, 200], 4] = np.nan
+    pair = rolling_correlation_matrix(gapped[["A1", "A4"]].to_numpy(), 20)[:, 0, 1]
+    np.testing.assert_allclose(pair, gapped["A1"].rolling(20).corr(gapped["A4"]).to_numpy(), atol=1e-10, equal_nan=True)
+
+
+def test_regime_history_labels_runs_and_restarts_after_gaps():
+    correlations = np.array([0.5, 0.5, 0.5, 0.9, 0.95, 0.97, 0.1, np.nan, 0.5, 0.5, 0.5, 0.5])
+
+    z_scores, labels, runs = regime_history(correlations, regime_window=3)
+
+    assert labels[:, 0].tolist() == [0, 0, 0, 1, 0, 0, -1, 0, 0, 0, 0, 0]
+    assert runs[:, 0].tolist() == [0, 0, 1, 1, 1, 2, 1, 0, 0, 0, 1, 2]
+    assert z_scores[2, 0] == 0.0  # flat window counts as a normal regime
+
+
+def test_pairwise_regime_summary_covers_every_pair_and_agrees_with_single_series_analysis():
+    returns = _returns(periods=300, assets=5)
+    analyzer = CorrelationAnalyzer()
+
+    summary = analyzer.pairwise_regime_summary(returns, window=20, regime_window=40)
+    single = analyzer.correlation_regime_analysis(returns["A0"].rolling(20).corr(returns["A3"]), regime_window=40)
+
+    assert len(summary) == 10
+    row = summary[(summary["asset_1"] == "A0") & (summary["asset_2"] == "A3")].iloc[0]
+    assert row["regime"] == single["current_regime"]
+    assert row["regime_duration"] == single["regime_duration"]
+    assert abs(row["z_score"] - single["z_score"]) < 1e-8
+
+    cross = analyzer.cross_asset_correlation_analysis(returns, "A4")
+    assert set(cross["rolling_correlation_analysis"]) == {"A0", "A1", "A2", "A3"}
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+from app.analytics import custom_indicator_suite as suite
+from app.analytics.custom_indicator_suite import PROFILES, clear_imse_state, compute_imse, compute_imse_universe
+
+
+def _history(periods: int, seed: int = 4) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, periods)))
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * (1 + rng.random(periods) * 0.02),
+            "Low": close * (1 - rng.random(periods) * 0.02),
+            "Close": close,
+        },
+        index=pd.bdate_range("2022-01-03", periods=periods),
+    )
+
+
+def _reference_knn(features, chg, k_in, win_in, sens):
+    n = len(chg)
+    scores = np.zeros(n)
+    k_eff = max(1, min(k_in, win_in))
+    for t in range(min(n, max(win_in + 50, k_eff + 2)), n):
+        weights = np.array([1.0 / (1.0 + np.log1p(np.abs(features[t] - features[t - i])).sum() * sens) for i in range(1, k_eff + 1)])
+        votes = np.array([1.0 if chg[t - i] > 0 else -1.0 for i in range(1, k_eff + 1)])
+        scores[t] = (weights * votes).sum() / weights.sum()
+    return scores
+
+
+def test_vectorized_knn_matches_reference_loop_for_all_horizons():
+    rng = np.random.default_rng(0)
+    features = rng.random((300, 4))
+    chg = rng.normal(size=300)
+    chg[::17] = 0.0
+    horizons = suite._knn_horizons(PROFILES["Orta Vade"].imse)
+
+    scores = suite._knn_scores(features, chg, horizons)
+
+    for column, (k, win, sens) in enumerate(horizons):
+        np.testing.assert_allclose(scores[:, column], _reference_knn(features, chg, k, win, sens), atol=1e-12)
+
+
+def test_incremental_imse_scores_only_new_bars(monkeypatch):
+    clear_imse_state()
+    params = PROFILES["Günlük"].imse
+    history = _history(260)
+    compute_imse(history.iloc[:250], params, cache_key="AAPL")
+    scored_from = []
+    original = suite._knn_scores
+
+    def _spy(features, chg, horizons, first_row=0):
+        scored_from.append(first_row)
+        return original(features, chg, horizons, first_row)
+
+    monkeypatch.setattr(suite, "_knn_scores", _spy)
+    incremental = compute_imse(history, params, cache_key="AAPL")
+    revised = history.copy()
+    revised.iloc[-1, revised.columns.get_loc("Close")] *= 1.02
+    compute_imse(revised, params, cache_key="AAPL")
+
+    assert scored_from == [250, 259]
+    pd.testing.assert_frame_equal(incremental, compute_imse(history, params))
+
+
+def test_universe_scan_reuses_the_single_symbol_state(monkeypatch):
+    clear_imse_state()
+    params = PROFILES["Günlük"].imse
+    histories = {"AAPL": _history(260, seed=1), "MSFT": _history(260, seed=2), "EMPTY": pd.DataFrame()}
+    compute_imse(histories["AAPL"].iloc[:255], params, cache_key=("AAPL", "auto"))
+    scored_from = []
+    original = suite._knn_scores
+
+    def _spy(features, chg, horizons, first_row=0):
+        scored_from.append(first_row)
+        return original(features, chg, horizons, first_row)
+
+    monkeypatch.setattr(suite, "_knn_scores", _spy)
+    scan = compute_imse_universe(histories, params, cache_tag="auto")
+
+    assert list(scan.index) == ["AAPL", "MSFT"]
+    assert scored_from == [255, 0]
+    for symbol in scan.index:
+        expected = compute_imse(histories[symbol], params).iloc[-1]
+        assert scan.loc[symbol, "final_score"] == expected["final_score"]
+        assert scan.loc[symbol, "regime"] == expected["regime"]
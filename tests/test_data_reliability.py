@@ -0,0 +1,18 @@
+from modules.data_reliability import DataReliabilityAuditor
+from modules.etf_weight_tracker import ETFWeightTracker
+
+
+def test_failing_audit_checks_return_each_connection_once(tmp_path):
+    db_path = str(tmp_path / "holdings.db")
+    ETFWeightTracker(db_path=db_path)
+    auditor = DataReliabilityAuditor(db_path=db_path)
+    with auditor.pool.connection() as conn:
+        conn.execute("DROP TABLE holdings")
+
+    for _ in range(auditor.pool.max_connections + 2):
+        assert auditor._check_data_freshness()["status"] == "fail"
+        assert auditor._check_weight_consistency()["failed"] == 1
+        assert "error" in auditor._detect_weight_anomalies()
+
+    assert auditor.pool._idle.qsize() == auditor.pool._created
+    assert len({id(conn) for conn in list(auditor.pool._idle.queue)}) == auditor.pool._created
@@ -1,4 +1,7 @@
+import sqlite3
+
 import pandas as pd
+import pytest
 
 from modules.etf_weight_tracker import ETFWeightTracker
 
@@ -23,3 +26,95 @@ def test_normalize_holdings_frame_supports_funds_data(tmp_path):
     assert list(df["stock_symbol"]) == ["AAPL", "MSFT"]
     assert list(df["fund_code"].unique()) == ["SPY"]
     assert round(float(df.iloc[0]["weight_pct"]), 1) == 8.2
+
+
+def _snapshot(fund_code, report_date, weights):
+    return pd.DataFrame(
+        {
+            "fund_code": fund_code,
+            "fund_name": fund_code,
+            "stock_symbol": list(weights),
+            "weight_pct": list(weights.values()),
+            "report_date": report_date,
+        }
+    )
+
+
+def test_weight_changes_compare_latest_report_with_previous_only(tmp_path):
+    tracker = ETFWeightTracker(db_path=str(tmp_path / "holdings.db"))
+    today = pd.Timestamp.today().normalize()
+    dates = [(today - pd.Timedelta(days=offset)).strftime("%Y-%m-%d") for offset in (90, 60, 5)]
+
+    tracker._save_holdings_to_db(_snapshot("SPY", dates[0], {"AAPL": 5.0, "XOM": 2.0}))
+    tracker._save_holdings_to_db(_snapshot("SPY", dates[1], {"AAPL": 6.0, "XOM": 2.5}))
+    tracker._save_holdings_to_db(_snapshot("SPY", dates[2], {"AAPL": 7.5, "NVDA": 3.0}))
+    tracker._save_holdings_to_db(_snapshot("QQQ", dates[2], {"AAPL": 9.0}))
+
+    changes = tracker.get_weight_changes("AAPL", period_days=30).set_index("fund_code")
+
+    assert len(changes) == 2
+    assert changes.loc["SPY", "previous_weight"] == 6.0
+    assert changes.loc["SPY", "previous_date"] == dates[1]
+    assert round(changes.loc["SPY", "weight_change"], 2) == 1.5
+    assert round(changes.loc["SPY", "weight_change_pct"], 2) == 25.0
+    assert pd.isna(changes.loc["QQQ", "previous_date"])
+
+    exited = tracker.get_weight_changes("XOM", period_days=30)
+    assert exited.iloc[0]["current_weight"] == 0.0
+    assert exited.iloc[0]["weight_change"] == -2.5
+
+    top = tracker.get_top_weight_changes(period_days=30, limit=10).set_index("stock_symbol")
+    assert set(top.index) == {"AAPL", "NVDA", "XOM"}
+    assert top.loc["AAPL", "num_funds_changed"] == 1
+    assert top.loc["NVDA", "funds_increased"] == 1
+    assert top.loc["XOM", "funds_decreased"] == 1
+
+
+def test_weight_changes_backfilled_for_existing_databases(tmp_path):
+    db_path = str(tmp_path / "holdings.db")
+    tracker = ETFWeightTracker(db_path=db_path)
+    today = pd.Timestamp.today().normalize()
+    tracker._save_holdings_to_db(_snapshot("SPY", (today - pd.Timedelta(days=40)).strftime("%Y-%m-%d"), {"AAPL": 5.0}))
+    tracker._save_holdings_to_db(_snapshot("SPY", today.strftime("%Y-%m-%d"), {"AAPL": 6.0}))
+    with tracker.pool.connection() as conn:
+        conn.execute("DELETE FROM holding_weight_changes")
+
+    reopened = ETFWeightTracker(db_path=db_path)
+
+    changes = reopened.get_weight_changes("AAPL", period_days=30)
+    assert changes.iloc[0]["weight_change"] == 1.0
+
+
+def test_exposure_matrix_uses_latest_reports_and_reloads_after_writes(tmp_path):
+    tracker = ETFWeightTracker(db_path=str(tmp_path / "holdings.db"))
+    tracker._save_holdings_to_db(_snapshot("SPY", "2026-01-02", {"AAPL": 5.0, "XOM": 2.0}))
+    tracker._save_holdings_to_db(_snapshot("SPY", "2026-02-02", {"AAPL": 6.0, "NVDA": 0.04}))
+    tracker._save_holdings_to_db(_snapshot("QQQ", "2026-02-02", {"AAPL": 9.0, "NVDA": 7.0}))
+
+    matrix = tracker.get_exposure_matrix(["AAPL", "NVDA.US", "XOM"], min_weight=0.05)
+
+    assert list(matrix.index) == ["AAPL", "NVDA.US", "XOM"]
+    assert matrix.loc["AAPL"].to_dict() == {"QQQ": 9.0, "SPY": 6.0}
+    assert matrix.loc["NVDA.US"].to_dict() == {"QQQ": 7.0, "SPY": 0.0}
+    assert matrix.loc["XOM"].sum() == 0.0
+    assert tracker.get_exposure_matrix() is not tracker.get_exposure_matrix()
+    cached = tracker._exposure_snapshot
+
+    tracker.get_fund_exposures(["AAPL"])
+    assert tracker._exposure_snapshot is cached
+    tracker._save_holdings_to_db(_snapshot("DIA", "2026-02-03", {"AAPL": 3.0}))
+
+    exposures = tracker.get_fund_exposures(["AAPL"], min_weight=0.05)
+    assert list(exposures["fund_code"]) == ["QQQ", "SPY", "DIA"]
+    assert tracker._exposure_snapshot is not cached
+
+
+def test_failing_exposure_lookups_return_their_connections(tmp_path):
+    tracker = ETFWeightTracker(db_path=str(tmp_path / "holdings.db"))
+    with tracker.pool.connection() as conn:
+        conn.execute("DROP TABLE holdings_meta")
+
+    for _ in range(tracker.pool.max_connections + 2):
+        with pytest.raises(sqlite3.OperationalError, match="holdings_meta"):
+            tracker.get_exposure_matrix(["AAPL"])
+    assert tracker.pool._idle.qsize() == tracker.pool._created
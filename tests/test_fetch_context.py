@@ -0,0 +1,56 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.utils.fetch_context import current_fetch_context, fetch_context, request_memoized, request_scoped, shared_fetch, submit
+
+
+def test_shared_fetch_loads_once_per_context_across_threads():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def _load():
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return {"symbol": "SPY"}
+
+    with fetch_context() as context, ThreadPoolExecutor(max_workers=1) as pool:
+        pending = submit(pool, shared_fetch, ("history", "SPY"), _load)
+        started.wait(timeout=5)
+        threading.Timer(0.05, release.set).start()
+        local = shared_fetch(("history", "SPY"), _load)
+
+        assert pending.result() is local
+        assert (context.loads, context.shared) == (1, 1)
+
+    shared_fetch(("history", "SPY"), _load)
+    assert len(calls) == 2
+
+
+class _Board:
+    def __init__(self):
+        self.reads = 0
+
+    @request_memoized("snapshot")
+    def read(self, symbol, months=12):
+        self.reads += 1
+        return {"symbol": symbol, "months": months}
+
+    @request_scoped
+    def build(self):
+        rows = [self.read(symbol) for symbol in ("AAPL", "MSFT", "AAPL", "AAPL")]
+        return rows, dict(current_fetch_context().absorbed)
+
+
+def test_request_memoized_helpers_run_once_per_scope_and_report_absorbed_calls():
+    board = _Board()
+
+    rows, absorbed = board.build()
+
+    assert board.reads == 2
+    assert rows[0] is rows[2]
+    assert absorbed == {"snapshot": 2}
+    board.read("AAPL")
+    board.build()
+    assert board.reads == 5
@@ -216,5 +216,38 @@ def test_fund_flow_radar():
     print()
 
 
+
+def test_concurrent_fetch_streams_funds_and_long_frame_matches_per_fund_aggregation():
+    """Concurrent fetch keeps fund order; groupby aggregation matches the per-fund path"""
+    radar = FundFlowRadar()
+    fund_codes = ['AAV', 'AEH', 'AFT', 'AHE', 'AHU', 'AAV']
+    streamed = []
+
+    fund_flows = radar.fetch_multiple_funds(
+        fund_codes, '2024-01-01', '2024-03-31', max_workers=4,
+        on_result=lambda code, df: streamed.append(code)
+    )
+
+    assert list(fund_flows) == ['AAV', 'AEH', 'AFT', 'AHE', 'AHU']
+    assert sorted(streamed) == sorted(fund_flows)
+
+    flow_frame = radar.build_flow_frame(fund_flows)
+    by_fund = radar.aggregate_flows_by_fund(flow_frame, period='30d').set_index('fund_code')
+    for code, flow_df in fund_flows.items():
+        expected = radar.aggregate_flows_by_period(flow_df, period='30d').iloc[0]
+        pd.testing.assert_series_equal(by_fund.loc[code], expected, check_names=False)
+
+    raw = pd.concat({code: radar.fetch_tefas_fund_data(code, '2024-01-01', '2024-03-31') for code in fund_flows},
+                    names=['fund_code', None]).reset_index(level='fund_code')
+    long_flows = radar.calculate_net_flows(raw, group_col='fund_code')
+    assert (long_flows['net_flow'].to_numpy() == flow_frame['net_flow'].to_numpy()).all()
+
+    fund_sectors = {'AAV': 'Teknoloji', 'AEH': 'Finans', 'AFT': 'Teknoloji'}
+    sector_flows = radar.aggregate_sector_flows(flow_frame, fund_sectors, period='30d').set_index('sector')
+    assert sector_flows.loc['Unknown', 'num_funds'] == 2
+    assert abs(sector_flows.loc['Teknoloji', 'net_flow']
+               - by_fund.loc[['AAV', 'AFT'], 'total_flow'].sum()) < 1e-6
+
+
 if __name__ == "__main__":
     test_fund_flow_radar()
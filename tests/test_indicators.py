@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.analytics import indicators
+
+
+def _close(periods: int = 300, seed: int = 0) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    return pd.Series(
+        100 * np.exp(np.cumsum(rng.normal(0, 0.02, periods))),
+        index=pd.bdate_range("2024-01-01", periods=periods),
+    )
+
+
+def _reference_wilder(values: np.ndarray, length: int) -> np.ndarray:
+    output = np.full(len(values), np.nan)
+    first = int(np.flatnonzero(~np.isnan(values))[0])
+    seed_row = first + length - 1
+    output[seed_row] = values[first : seed_row + 1].mean()
+    for row in range(seed_row + 1, len(values)):
+        output[row] = output[row - 1] + (values[row] - output[row - 1]) / length
+    return output
+
+
+def test_kernels_match_pandas_and_wilder_reference():
+    close = _close()
+    high, low = close * 1.01, close * 0.985
+
+    pd.testing.assert_series_equal(indicators.ema(close, 12), close.ewm(span=12, adjust=False).mean())
+    pd.testing.assert_series_equal(indicators.sma(close, 20), close.rolling(20).mean())
+    upper, middle, _ = indicators.bollinger(close, 20, 2)
+    pd.testing.assert_series_equal(upper, middle + 2 * close.rolling(20).std(), check_exact=False, atol=1e-9)
+
+    delta = close.diff().to_numpy()
+    gains, losses = np.where(delta > 0, delta, 0.0), np.where(delta < 0, -delta, 0.0)
+    gains[0] = losses[0] = np.nan
+    expected_rsi = 100 - 100 / (1 + _reference_wilder(gains, 14) / _reference_wilder(losses, 14))
+    np.testing.assert_allclose(indicators.rsi(close, 14).to_numpy(), expected_rsi, atol=1e-10, equal_nan=True)
+
+    true_range = pd.concat([high - low, (high - close.shift()).abs(), (low - close.shift()).abs()], axis=1).max(axis=1)
+    np.testing.assert_allclose(indicators.atr(high, low, close, 14).to_numpy(), _reference_wilder(true_range.to_numpy(), 14), atol=1e-10, equal_nan=True)
+
+
+def test_wide_frame_columns_match_single_symbol_calls_despite_different_listing_dates():
+    close = _close()
+    wide = pd.DataFrame({"A": close, "B": close * 0.5, "C": close * 2, "D": np.nan}, index=close.index)
+    wide.iloc[:40, 1] = np.nan
+    wide.iloc[:120, 2] = np.nan
+
+    rsi = indicators.rsi(wide, 14)
+    line, signal, _ = indicators.macd(wide)
+
+    for column in ["A", "B", "C"]:
+        listed = wide[column].dropna()
+        pd.testing.assert_series_equal(rsi[column].dropna(), indicators.rsi(listed, 14).dropna())
+        np.testing.assert_allclose(signal[column].loc[listed.index], indicators.macd(listed)[1], atol=1e-10)
+    assert rsi["D"].isna().all() and line["D"].isna().all()
+    assert indicators.rsi(pd.Series(np.arange(30.0))).iloc[-1] == 100.0
+    assert indicators.rsi(pd.Series(np.full(30, 5.0))).iloc[-1] == 50.0
+
+
+def test_indicator_set_is_shared_per_symbol_until_a_new_bar():
+    indicators.clear_indicator_cache()
+    close = _close(120)
+
+    first = indicators.indicator_set(close, cache_key="AAPL")
+    again = indicators.indicator_set(close.copy(), close * 1.01, close * 0.99, cache_key="AAPL")
+    extended = indicators.indicator_set(_close(121), cache_key="AAPL")
+
+    assert again is first
+    assert first.rsi() is again.rsi()
+    assert first.atr().notna().any()
+    assert extended is not first
+
+
+def test_indicator_set_tells_adjusted_history_from_unadjusted():
+    indicators.clear_indicator_cache()
+    unadjusted = _close(120)
+    adjusted = unadjusted.copy()
+    adjusted.iloc[:60] *= 0.5
+
+    raw = indicators.indicator_set(unadjusted, cache_key="AAPL")
+    split_adjusted = indicators.indicator_set(adjusted, cache_key="AAPL")
+
+    assert split_adjusted is not raw
+    assert split_adjusted.sma(20).iloc[40] == pytest.approx(adjusted.iloc[21:41].mean())
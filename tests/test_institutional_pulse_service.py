@@ -1,5 +1,7 @@
 from tempfile import TemporaryDirectory
 
+import pandas as pd
+
 from app.services.institutional_pulse import InstitutionalPulseService
 from app.services.snapshot_store import SnapshotStore
 
@@ -96,6 +98,17 @@ def test_parse_information_table_xml_aggregates_duplicate_rows_when_values_are_i
     assert frame.iloc[0]["shares"] == 12_500_000
 
 
+def test_parse_information_table_xml_streams_chunks_identically_to_a_full_document():
+    service = InstitutionalPulseService()
+    payload = SAMPLE_XML_DOLLARS.encode("utf-8")
+    chunks = (payload[start : start + 7] for start in range(0, len(payload), 7))
+
+    streamed = service._parse_information_table_xml(chunks)
+
+    assert streamed.equals(service._parse_information_table_xml(SAMPLE_XML_DOLLARS))
+    assert list(service._iter_information_rows(SAMPLE_XML))[1]["cusip"] == "594918104"
+
+
 def test_workspace_uses_snapshot_when_live_refresh_fails(monkeypatch):
     with TemporaryDirectory() as tmpdir:
         snapshot_store = SnapshotStore(base_dir=tmpdir)
@@ -248,3 +261,103 @@ def test_get_health_snapshot_counts_live_snapshot_and_warming(monkeypatch):
     assert health["summary"]["live_count"] == 3
     assert health["summary"]["snapshot_count"] == 1
     assert health["summary"]["warming_count"] == 1
+
+
+def test_compare_holdings_frames_classifies_every_action_and_handles_an_empty_quarter():
+    service = InstitutionalPulseService()
+    current = service._parse_information_table_xml(SAMPLE_XML)
+    previous = current.copy()
+    previous.loc[previous["issuer"] == "APPLE INC", "value_usd"] = 400_000
+    previous = pd.concat(
+        [previous, pd.DataFrame([{"holding_key": "88160R101|TESLA", "issuer": "TESLA INC", "class_title": "COM", "cusip": "88160R101", "value_usd": 10.0, "shares": 1.0, "portfolio_weight": 1.0, "put_call": "Equity"}])],
+        ignore_index=True,
+    )
+
+    changes = service._compare_holdings_frames(current, previous).set_index("issuer")
+    first_quarter = service._compare_holdings_frames(current, pd.DataFrame())
+
+    assert changes["action"].to_dict() == {"APPLE INC": "INCREASED", "MICROSOFT CORP": "UNCHANGED", "TESLA INC": "SOLD"}
+    assert changes.loc["TESLA INC", "issuer_key"] == "TESLA"
+    assert changes.loc["TESLA INC", "cusip_curr"] == ""
+    assert changes.loc["APPLE INC", "value_change"] == 600_000
+    assert set(first_quarter["action"]) == {"NEW"}
+    assert [service._normalize_issuer_key(name) for name in ("Apple Inc.", "ALPHABET CL A")] == ["APPLE", "ALPHABET"]
+
+
+class _FakeResponse:
+    def __init__(self, payload=None, status_code=200, headers=None):
+        self.payload = payload
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+    def json(self):
+        return self.payload
+
+    def iter_content(self, chunk_size=1):
+        yield self.payload.encode("utf-8")
+
+
+class _FakeEdgarSession:
+    def __init__(self):
+        self.headers = {}
+        self.calls = []
+
+    def get(self, url, timeout=20, headers=None, stream=False):
+        self.calls.append(url)
+        if "submissions" in url:
+            if (headers or {}).get("If-None-Match") == '"v1"':
+                return _FakeResponse(status_code=304)
+            return _FakeResponse(
+                {
+                    "filings": {
+                        "recent": {
+                            "form": ["13F-HR", "SC 13G", "13F-HR"],
+                            "accessionNumber": ["0001-26-000002", "0001-26-000009", "0001-26-000001"],
+                            "filingDate": ["2026-05-15", "2026-04-01", "2026-02-14"],
+                            "primaryDocument": ["primary.xml", "doc.xml", "primary.xml"],
+                        }
+                    }
+                },
+                headers={"ETag": '"v1"'},
+            )
+        if url.endswith("index.json"):
+            return _FakeResponse({"directory": {"item": [{"name": "infotable.xml", "type": "file"}]}})
+        return _FakeResponse(SAMPLE_XML)
+
+
+def test_build_dataset_syncs_only_new_accessions_and_reuses_stored_holdings():
+    with TemporaryDirectory() as tmpdir:
+        first = InstitutionalPulseService(snapshot_store=SnapshotStore(base_dir=tmpdir), session=_FakeEdgarSession())
+        dataset = first._build_dataset("berkshire")
+        assert len(first.session.calls) == 5  # submissions + (index + table) per accession
+
+        second = InstitutionalPulseService(snapshot_store=SnapshotStore(base_dir=tmpdir), session=_FakeEdgarSession())
+        again = second._build_dataset("berkshire")
+
+        assert second.session.calls == ["https://data.sec.gov/submissions/CIK0001067983.json"]
+        assert again["latest_filing"]["accession"] == "0001-26-000002"
+        assert again["current_rows"] == dataset["current_rows"]
+        assert again["summary"]["holding_count"] == 2
+
+
+def test_recent_filings_skip_conditional_headers_when_no_filings_are_stored():
+    with TemporaryDirectory() as tmpdir:
+        store = SnapshotStore(base_dir=tmpdir)
+        service = InstitutionalPulseService(snapshot_store=store, session=_FakeEdgarSession())
+        cik = "0001067983"
+        store.write_json(service._filings_snapshot_key(cik), {"etag": '"v1"', "last_modified": None, "filings": []})
+
+        filings = service._recent_13f_filings(cik)
+
+        assert [filing["accession"] for filing in filings] == ["0001-26-000002", "0001-26-000001"]
+        assert store.read_json(service._filings_snapshot_key(cik))["filings"][0]["accession"] == "0001-26-000002"
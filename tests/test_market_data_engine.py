@@ -0,0 +1,111 @@
+import threading
+import time
+
+from utils import unified_api_manager
+from utils.market_data_engine import MarketDataEngine
+from utils.unified_api_manager import PRIORITY_BULK, PRIORITY_INTERACTIVE, UnifiedAPIManager, api_priority, current_priority
+
+
+class _FakeAPI:
+    def __init__(self):
+        self.single_calls = []
+        self.release = threading.Event()
+
+    def get_yahoo_batch_quotes(self, symbols):
+        return {"AAPL": {"price": 190.0, "change": 1.5}} if "AAPL" in symbols else {}
+
+    def get_fmp_batch_quotes(self, symbols):
+        return [{"symbol": "MSFT", "price": 410.0, "changesPercentage": -0.4}] if "MSFT" in symbols else None
+
+    def get_stock_price_with_fallback(self, symbol):
+        self.single_calls.append(symbol)
+        if symbol == "SLOW":
+            self.release.wait(2)
+        if symbol == "BOOM":
+            raise RuntimeError("upstream exploded")
+        return {"symbol": symbol, "price": None, "change": None, "source": None}
+
+    def get_binance_tickers(self, symbols):
+        return [{"symbol": "BTCUSDT", "lastPrice": "65000", "priceChangePercent": "2.0", "volume": "10"}]
+
+
+def test_get_multiple_stocks_uses_batch_sources_and_reports_status():
+    engine = MarketDataEngine()
+    engine.api = _FakeAPI()
+
+    results = engine.get_multiple_stocks(["AAPL", "MSFT", "ZZZZ", "BOOM", "SLOW", "AAPL"], timeout=0.2)
+    engine.api.release.set()
+
+    assert list(results) == ["AAPL", "MSFT", "ZZZZ", "BOOM", "SLOW"]
+    assert results["AAPL"]["source"] == "yahoo" and results["AAPL"]["status"] == "ok"
+    assert results["MSFT"]["source"] == "fmp" and results["MSFT"]["price"] == 410.0
+    assert results["ZZZZ"]["status"] == "missing"
+    assert results["BOOM"]["status"] == "error"
+    assert results["SLOW"]["status"] == "timeout"
+    assert sorted(engine.api.single_calls) == ["BOOM", "SLOW", "ZZZZ"]
+
+
+def test_coalescer_shares_inflight_requests():
+    engine = MarketDataEngine()
+    api = _FakeAPI()
+    engine.api = api
+
+    first = engine.coalescer.submit(("stock", "SLOW"), api.get_stock_price_with_fallback, "SLOW")
+    time.sleep(0.05)
+    second = engine.coalescer.submit(("stock", "SLOW"), api.get_stock_price_with_fallback, "SLOW")
+    api.release.set()
+
+    assert first is second
+    assert first.result(timeout=2)["symbol"] == "SLOW"
+    assert api.single_calls == ["SLOW"]
+
+
+def test_get_multiple_cryptos_uses_binance_multi_ticker(monkeypatch):
+    engine = MarketDataEngine()
+    engine.api = _FakeAPI()
+    monkeypatch.setattr(engine, "get_crypto", lambda symbol: {"symbol": symbol, "price": 3.0, "source": "okx"})
+
+    results = engine.get_multiple_cryptos(["BTC", "ETH"])
+
+    assert results["BTC"]["source"] == "binance" and results["BTC"]["price"] == 65000.0
+    assert results["ETH"]["source"] == "okx" and results["ETH"]["status"] == "ok"
+
+
+class _FakeQuoteResponse:
+    def __init__(self, symbols):
+        self.symbols = symbols
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return [{"symbol": symbol, "price": 10.0, "changesPercentage": 0.5} for symbol in self.symbols]
+
+
+def test_batch_quotes_reach_the_rate_limiter_in_the_callers_lane(monkeypatch):
+    manager = UnifiedAPIManager()
+    manager.api_keys["fmp"] = "demo"
+    monkeypatch.setattr(manager, "get_yahoo_batch_quotes", lambda symbols: {})
+    monkeypatch.setattr(
+        unified_api_manager.requests,
+        "get",
+        lambda url, params=None, headers=None, timeout=10: _FakeQuoteResponse(url.rsplit("/", 1)[-1].split(",")),
+    )
+    lanes = []
+    original_wait = manager.rate_limiter.wait_until_ready
+
+    def _recording_wait(api_name, *args, **kwargs):
+        lanes.append((api_name, current_priority()))
+        return original_wait(api_name, *args, **kwargs)
+
+    monkeypatch.setattr(manager.rate_limiter, "wait_until_ready", _recording_wait)
+    engine = MarketDataEngine()
+    engine.api = manager
+
+    interactive = engine.get_multiple_stocks(["LANEA", "LANEB"])
+    with api_priority(PRIORITY_BULK):
+        bulk = engine.get_multiple_stocks(["LANEC"])
+
+    assert interactive["LANEA"]["source"] == "fmp" and bulk["LANEC"]["source"] == "fmp"
+    assert lanes == [("fmp", PRIORITY_INTERACTIVE), ("fmp", PRIORITY_BULK)]
+    assert manager.rate_limiter.metrics("fmp")["fmp"]["admitted"] == 2
@@ -0,0 +1,42 @@
+import numpy as np
+
+from app.analytics.path_simulation import simulate_price_paths, simulate_price_quantiles
+
+
+def test_price_paths_are_reproducible_and_compound_daily_returns():
+    paths = simulate_price_paths(100.0, 0.001, 0.02, days=20, simulations=500, seed=11)
+    again = simulate_price_paths(100.0, 0.001, 0.02, days=20, simulations=500, seed=11)
+
+    assert paths.shape == (500, 20)
+    np.testing.assert_array_equal(paths, again)
+    implied_returns = np.diff(np.column_stack([np.full(500, 100.0), paths]), axis=1) / np.column_stack(
+        [np.full(500, 100.0), paths[:, :-1]]
+    )
+    assert abs(implied_returns.mean() - 0.001) < 0.002
+    assert abs(implied_returns.std() - 0.02) < 0.002
+
+
+def test_antithetic_paths_mirror_shocks():
+    paths = simulate_price_paths(50.0, 0.0, 0.01, days=1, simulations=6, seed=3, antithetic=True)
+
+    np.testing.assert_allclose(paths[:3, 0] - 50.0, -(paths[3:, 0] - 50.0))
+
+
+def test_quantile_mode_matches_full_matrix_without_materializing_it():
+    full = simulate_price_paths(100.0, 0.0005, 0.015, days=40, simulations=2_000, seed=5)
+    fan = simulate_price_quantiles(
+        100.0,
+        0.0005,
+        0.015,
+        days=40,
+        simulations=2_000,
+        quantiles=(5, 50, 95),
+        seed=5,
+        max_cells=2_000 * 7,
+    )
+
+    for level in (5, 50, 95):
+        assert fan[float(level)].shape == (40,)
+    # Blocked draws consume the generator in a different order, so compare distributions, not values.
+    np.testing.assert_allclose(fan[50.0], np.percentile(full, 50, axis=0), rtol=0.02)
+    assert np.all(fan[5.0] < fan[50.0]) and np.all(fan[50.0] < fan[95.0])
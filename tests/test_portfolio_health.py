@@ -1,5 +1,7 @@
+import numpy as np
 import pandas as pd
 
+from app.services.snapshot_store import SnapshotStore
 from modules.portfolio_health import PortfolioHealthScore
 
 
@@ -23,3 +25,47 @@ def test_resolve_market_data_prefers_native_then_bist_suffix(monkeypatch):
 
     assert resolved_aapl == "AAPL"
     assert resolved_thyao == "THYAO.IS"
+
+
+def test_enrich_portfolio_batches_history_and_reuses_persisted_listings(monkeypatch, tmp_path):
+    index = pd.bdate_range(end="2026-06-30", periods=80)
+    closes = {
+        "AAPL": pd.Series(np.linspace(100.0, 120.0, 80), index=index),
+        "THYAO.IS": pd.Series(np.linspace(50.0, 45.0, 80), index=index),
+    }
+    calls = []
+
+    class _Ticker(_FakeTicker):
+        def __init__(self, symbol: str):
+            super().__init__(symbol)
+            calls.append(("ticker", symbol))
+
+        def history(self, period: str = "6mo"):
+            return pd.DataFrame({"Close": closes[self.symbol]}) if self.symbol in closes else pd.DataFrame()
+
+    def _download(tickers, **kwargs):
+        calls.append(("download", tuple(tickers)))
+        return pd.concat({"Close": pd.DataFrame({ticker: closes[ticker] for ticker in tickers})}, axis=1)
+
+    monkeypatch.setattr("modules.portfolio_health.yf.Ticker", _Ticker)
+    monkeypatch.setattr("modules.portfolio_health.yf.download", _download)
+    monkeypatch.setattr(PortfolioHealthScore, "_listings", None)
+    portfolio = pd.DataFrame({"Symbol": ["AAPL", "THYAO"], "Shares": [1, 2], "Price": [120.0, 45.0], "Value": [120.0, 90.0]})
+
+    first = PortfolioHealthScore(listing_store=SnapshotStore(base_dir=tmp_path))
+    first.load_portfolio(portfolio)
+    enriched = first.enrich_portfolio_data()
+
+    assert enriched["Return_3M"].round(2).tolist() == [round((120.0 / closes["AAPL"].iloc[-60] - 1) * 100, 2), round((45.0 / closes["THYAO.IS"].iloc[-60] - 1) * 100, 2)]
+    assert enriched["RSI"].tolist() == [100.0, 0.0]
+    assert enriched["Volatility"].notna().all()
+
+    monkeypatch.setattr(PortfolioHealthScore, "_listings", None)
+    calls.clear()
+    second = PortfolioHealthScore(listing_store=SnapshotStore(base_dir=tmp_path))
+    second.load_portfolio(portfolio)
+    second.enrich_portfolio_data()
+    second.calculate_all_metrics()
+
+    assert calls == [("download", ("AAPL", "THYAO.IS"))]
+    assert second.get_summary()["portfolio_stats"]["num_sectors"] == 1
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from app.services.prewarm_leader import PrewarmLeaderLease
 from app.services.prewarm_worker import PublicDataPrewarmWorker
 
 
@@ -53,8 +54,8 @@ def test_public_prewarm_worker_warms_default_and_top_tr_funds(monkeypatch):
     monkeypatch.setattr(worker.public_research_service, "get_stock_workspace", _fake_stock_workspace)
     warmed_forecasts = []
 
-    def _fake_forecast_workspace(symbol, days):
-        warmed_forecasts.append((symbol, days))
+    def _fake_forecast_workspace(symbol, days, refresh_backtest=False):
+        warmed_forecasts.append((symbol, days, refresh_backtest))
         return {"symbol": symbol, "error": None}
 
     monkeypatch.setattr(worker.public_research_service, "get_forecast_workspace", _fake_forecast_workspace)
@@ -97,19 +98,19 @@ def test_public_prewarm_worker_warms_default_and_top_tr_funds(monkeypatch):
     assert result["stock_workspaces_warmed"] == 9
     assert result["stock_workspace_errors"] == 0
     assert warmed_forecasts == [
-        ("AAPL", 21),
-        ("NVDA", 21),
-        ("THYAO", 21),
-        ("GARAN", 21),
-        ("ASELS", 21),
-        ("TUPRS", 21),
-        ("BIMAS", 21),
-        ("MSFT", 21),
-        ("AMZN", 21),
-        ("SPY", 21),
-        ("QQQ", 21),
-        ("VTI", 21),
-        ("AGG", 21),
+        ("AAPL", 21, True),
+        ("NVDA", 21, True),
+        ("THYAO", 21, True),
+        ("GARAN", 21, True),
+        ("ASELS", 21, True),
+        ("TUPRS", 21, True),
+        ("BIMAS", 21, True),
+        ("MSFT", 21, True),
+        ("AMZN", 21, True),
+        ("SPY", 21, True),
+        ("QQQ", 21, True),
+        ("VTI", 21, True),
+        ("AGG", 21, True),
     ]
     assert result["forecast_workspaces_warmed"] == 9
     assert result["forecast_workspace_errors"] == 0
@@ -129,3 +130,41 @@ def test_public_prewarm_worker_warms_default_and_top_tr_funds(monkeypatch):
     assert result["catalyst_recent_rows"] == 2
     assert result["bist_quality_rows"] == 4
     assert result["overlap_pairs"] == 1
+
+
+def test_prewarm_leader_lease_is_exclusive_and_fails_over(tmp_path):
+    lock_path = tmp_path / ".prewarm-leader.lock"
+    first = PrewarmLeaderLease(lock_path)
+    second = PrewarmLeaderLease(lock_path)
+
+    assert first.try_acquire() is True
+    assert second.try_acquire() is False
+    assert second.snapshot()["role"] == "follower"
+    assert second.snapshot()["leader_pid"] == first.snapshot()["pid"]
+
+    first.release()
+
+    assert second.try_acquire() is True
+    assert second.snapshot()["role"] == "leader"
+    second.release()
+
+
+def test_prewarm_follower_skips_warm_cycle(tmp_path, monkeypatch):
+    lock_path = tmp_path / ".prewarm-leader.lock"
+    leader = PrewarmLeaderLease(lock_path)
+    assert leader.try_acquire() is True
+    worker = PublicDataPrewarmWorker(interval_seconds=1, leader_lease=PrewarmLeaderLease(lock_path))
+    runs = []
+    monkeypatch.setattr(worker, "run_once", lambda: runs.append(1) or {"ok": True})
+
+    assert worker.run_cycle() is None
+    assert runs == []
+    assert worker.snapshot()["role"] == "follower"
+
+    leader.release()
+
+    assert worker.run_cycle() == {"ok": True}
+    assert runs == [1]
+    assert worker.snapshot()["role"] == "leader"
+    worker.stop()
+    assert worker.snapshot()["role"] == "follower"
@@ -1,11 +1,12 @@
 from pathlib import Path
 from tempfile import TemporaryDirectory
+import threading
 
 import numpy as np
 import pandas as pd
 
 from app.analytics.entropy_metrics import EntropyCalculator
-from app.services.cache import cache_clear
+from app.services.cache import cache_clear, cache_set
 from app.services.public_dashboard import PublicDashboardService
 from app.services.snapshot_store import SnapshotStore
 
@@ -501,3 +502,56 @@ def test_public_dashboard_macro_cards_merge_official_sources(monkeypatch):
     assert "FRED" in status["detail"]
     assert "TCMB EVDS" in status["detail"]
     assert "U.S. Treasury" in status["detail"]
+
+
+def test_public_dashboard_slow_section_does_not_hold_back_the_others(monkeypatch):
+    cache_clear()
+    with TemporaryDirectory() as tmpdir:
+        service = PublicDashboardService(ttl_seconds=1)
+        service.snapshot_store = SnapshotStore(base_dir=Path(tmpdir))
+        service.snapshot_store.write_json(
+            service._section_snapshot_key("market"),
+            {"refreshed_at": "2026-06-01T00:00:00Z", "values": {"market_cards": [{"label": "Persisted"}]}},
+        )
+        release = threading.Event()
+        builds = []
+
+        def _build_section(section, generated_at):
+            builds.append(section)
+            if section == "market":
+                release.wait(5)
+                return {"market_cards": [{"label": "Live"}]}
+            if section == "crypto":
+                return {"crypto_cards": [{"label": "BTC", "change_pct": np.float64(1.5)}]}
+            return {}
+
+        monkeypatch.setattr(service, "_build_section", _build_section)
+
+        first = service.refresh_sections("2026-06-02T00:00:00Z", timeout=0.2)
+        assert first["market_cards"][0]["label"] == "Persisted"
+        assert first["crypto_cards"][0]["change_pct"] == 1.5
+
+        release.set()
+        service._section_futures["market"].result(timeout=5)
+        second = service.refresh_sections("2026-06-02T00:01:00Z", timeout=0.2)
+        assert second["market_cards"][0]["label"] == "Live"
+        assert sorted(builds) == sorted(["market", "crypto", "sentiment", "bist-catalyst", "macro", "entropy"])
+        persisted = service.snapshot_store.read_json(service._section_snapshot_key("market"))
+        assert persisted["values"]["market_cards"][0]["label"] == "Live"
+
+
+def test_public_dashboard_serves_a_legacy_cached_tr_frame():
+    cache_clear()
+    with TemporaryDirectory() as tmpdir:
+        service = PublicDashboardService(ttl_seconds=1)
+        service.tr_funds.snapshot_store = SnapshotStore(base_dir=Path(tmpdir))
+        cache_set(
+            f"tr-funds:peer-board:{service.public_tr_funds_months}",
+            pd.DataFrame([{"fund_code": "TCD", "fund_name": "Legacy", "signal_score": 70.0}]),
+            ttl=60,
+        )
+
+        peer_board = service._build_cached_tr_peer_board()
+
+        assert [row["fund_code"] for row in peer_board] == ["TCD"]
+        assert service._build_cached_tr_top_pick()["fund_code"] == "TCD"
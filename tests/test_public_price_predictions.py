@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+
+from app.analytics import public_price_predictions as predictions_module
+from app.analytics import walk_forward as walk_forward_module
+from app.analytics.public_price_predictions import FittedModelCache, PublicPricePredictionEngine
+from app.analytics.walk_forward import WalkForwardBacktester
+from app.services.cache import cache_clear
+
+
+def _history(periods: int) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.01, periods)))
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(100_000, 1_000_000, periods),
+        },
+        index=pd.bdate_range("2024-01-01", periods=periods),
+    )
+
+
+def _patch_history(monkeypatch, frame_ref):
+    class FakeTicker:
+        def __init__(self, symbol):
+            self.symbol = symbol
+
+        def history(self, period):
+            return frame_ref["frame"]
+
+    monkeypatch.setattr(predictions_module.yf, "Ticker", FakeTicker)
+    monkeypatch.setattr(predictions_module.settings, "PUBLIC_FORECAST_FIT_WORKERS", 0)
+
+
+def test_prediction_engine_reuses_fits_across_horizons_until_new_bar(monkeypatch, tmp_path):
+    frame_ref = {"frame": _history(260)}
+    _patch_history(monkeypatch, frame_ref)
+    fit_calls = []
+    original_fit = predictions_module._fit_feature_regressor
+
+    def _counting_fit(kind, X, y):
+        fit_calls.append(kind)
+        return original_fit(kind, X, y)
+
+    monkeypatch.setattr(predictions_module, "_fit_feature_regressor", _counting_fit)
+    cache = FittedModelCache(tmp_path / "models")
+
+    first = PublicPricePredictionEngine("nvda", model_cache=cache).get_all_predictions(days=30)
+    second = PublicPricePredictionEngine("NVDA", model_cache=cache).get_all_predictions(days=7)
+
+    assert {"Linear Regression", "Random Forest", "Gradient Boosting", "Monte Carlo"} <= set(first)
+    assert sorted(fit_calls) == ["gradient_boosting", "random_forest"]
+    assert len(second["Random Forest"]["predictions"]) == 7
+    assert second["Random Forest"]["predictions"][0] == first["Random Forest"]["predictions"][0]
+    assert second["Linear Regression"]["metrics"] == first["Linear Regression"]["metrics"]
+
+    frame_ref["frame"] = _history(261)
+    PublicPricePredictionEngine("NVDA", model_cache=cache).get_all_predictions(days=30)
+
+    assert len(fit_calls) == 4
+
+
+def test_fitted_model_cache_persists_fits_for_other_processes(monkeypatch, tmp_path):
+    frame_ref = {"frame": _history(200)}
+    _patch_history(monkeypatch, frame_ref)
+    PublicPricePredictionEngine("SPY", model_cache=FittedModelCache(tmp_path)).get_all_predictions(days=14)
+
+    def _unexpected_fit(*args, **kwargs):
+        raise AssertionError("fits should be loaded from disk")
+
+    monkeypatch.setattr(predictions_module, "_fit_linear_regression", _unexpected_fit)
+    monkeypatch.setattr(predictions_module, "_fit_feature_regressor", _unexpected_fit)
+    monkeypatch.setattr(predictions_module, "_fit_arima", _unexpected_fit)
+    reloaded = PublicPricePredictionEngine("SPY", model_cache=FittedModelCache(tmp_path)).get_all_predictions(days=21)
+
+    assert (tmp_path / "SPY-2y.pkl").exists()
+    assert len(reloaded["Linear Regression"]["predictions"]) == 21
+    assert len(reloaded["Gradient Boosting"]["dates"]) == 21
+
+
+def test_walk_forward_backtest_scores_out_of_sample_and_reuses_cached_folds(monkeypatch):
+    cache_clear()
+    frame = PublicPricePredictionEngine("AAPL")._add_technical_indicators(_history(240))
+    fold_calls = []
+    original_fold = walk_forward_module._fold_forecast
+
+    def _counting_fold(model, *args):
+        fold_calls.append(model)
+        return original_fold(model, *args)
+
+    monkeypatch.setattr(walk_forward_module, "_fold_forecast", _counting_fold)
+    backtester = WalkForwardBacktester("AAPL", frame, folds=3, horizon=5, feature_sets={"Random Forest": ["SMA_20", "RSI"]})
+
+    first = backtester.run(["Linear Regression", "Random Forest", "Monte Carlo"])
+    second = WalkForwardBacktester("AAPL", frame, folds=3, horizon=5, feature_sets={"Random Forest": ["SMA_20", "RSI"]}).run(
+        ["Linear Regression", "Random Forest", "Monte Carlo"]
+    )
+
+    # Business-day bars: every cut-off opens a five-day block, and the newest block has fully printed.
+    ends = backtester.fold_ends()
+    assert len(ends) == 3
+    assert [later - earlier for earlier, later in zip(ends, ends[1:])] == [5, 5]
+    assert ends[-1] + 5 <= len(frame) < ends[-1] + 10
+    assert len(fold_calls) == 9
+    assert second == first
+    for scores in first["models"].values():
+        assert scores["folds"] == 3
+        assert scores["RMSE"] >= scores["MAE"] > 0
+        assert 0.0 <= scores["Hit Rate"] <= 1.0
+
+
+def test_walk_forward_folds_keep_their_dates_as_bars_arrive(monkeypatch):
+    cache_clear()
+    frame = PublicPricePredictionEngine("AAPL")._add_technical_indicators(_history(243))
+    fold_calls = []
+    original_fold = walk_forward_module._fold_forecast
+
+    def _counting_fold(model, *args):
+        fold_calls.append(model)
+        return original_fold(model, *args)
+
+    monkeypatch.setattr(walk_forward_module, "_fold_forecast", _counting_fold)
+    first = WalkForwardBacktester("AAPL", frame, folds=3, horizon=5)
+    first.run(["Linear Regression"])
+    # One more bar, with the oldest one dropped and a revised last close.
+    slid = frame.iloc[1:].copy()
+    slid = pd.concat([slid, frame.iloc[[-1]].set_axis([frame.index[-1] + pd.offsets.BDay(1)])])
+    slid.iloc[-2, slid.columns.get_loc("Close")] *= 1.02
+    second = WalkForwardBacktester("AAPL", slid, folds=3, horizon=5)
+    second.run(["Linear Regression"])
+
+    assert [first.fold_date(end) for end in first.fold_ends()] == [second.fold_date(end) for end in second.fold_ends()]
+    assert fold_calls == ["Linear Regression"] * 3
+
+
+def test_predictions_attach_only_the_prewarmed_backtest(monkeypatch, tmp_path):
+    cache_clear()
+    frame_ref = {"frame": _history(240)}
+    _patch_history(monkeypatch, frame_ref)
+
+    def _unexpected_backtest(*args, **kwargs):
+        raise AssertionError("request paths must not run the walk-forward backtest")
+
+    monkeypatch.setattr(walk_forward_module.WalkForwardBacktester, "run", _unexpected_backtest)
+    cold = PublicPricePredictionEngine("MSFT", model_cache=FittedModelCache(tmp_path)).get_all_predictions(days=14)
+    assert cold and all("backtest" not in result for result in cold.values())
+
+    monkeypatch.undo()
+    _patch_history(monkeypatch, frame_ref)
+    PublicPricePredictionEngine("MSFT", model_cache=FittedModelCache(tmp_path)).get_all_predictions(days=14, refresh_backtest=True)
+    monkeypatch.setattr(walk_forward_module.WalkForwardBacktester, "run", _unexpected_backtest)
+    warm = PublicPricePredictionEngine("MSFT", model_cache=FittedModelCache(tmp_path)).get_all_predictions(days=14)
+
+    assert warm["Linear Regression"]["backtest"]["horizon"] == 10
+    assert warm["Linear Regression"]["backtest"]["folds"] == 5
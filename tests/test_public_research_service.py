@@ -284,7 +284,11 @@ def test_get_idea_radar_workspace_includes_trend_overlay(monkeypatch):
     )
     monkeypatch.setattr(service, "_sector_tailwind_map", lambda: {"Technology": 2.4})
     monkeypatch.setattr(service.etf_tracker, "fetch_etf_holdings", lambda etf, force_refresh=False: pd.DataFrame())
-    monkeypatch.setattr(service.etf_tracker, "get_funds_for_stock", lambda symbol, min_weight=0.05: pd.DataFrame())
+    monkeypatch.setattr(
+        service.etf_tracker,
+        "get_exposure_matrix",
+        lambda stock_symbols=None, fund_codes=None, min_weight=0.0: pd.DataFrame(0.0, index=list(stock_symbols), columns=["SPY"]),
+    )
     monkeypatch.setattr(
         service.institutional_pulse_service,
         "get_symbol_signal",
@@ -1003,7 +1007,7 @@ def test_get_stock_workspace_refreshes_legacy_persisted_snapshot(monkeypatch):
         monkeypatch.setattr(
             service.stocks_analyzer,
             "calculate_technical_indicators",
-            lambda df: {"RSI": 55.4, "volatility": 21.1, "Bollinger": {"position": "Mid"}, "MACD": {"histogram": 0.32}, "volume_ratio": 1.04, "support_resistance": {"support": 360.0, "resistance": 395.0}},
+            lambda df, symbol=None: {"RSI": 55.4, "volatility": 21.1, "Bollinger": {"position": "Mid"}, "MACD": {"histogram": 0.32}, "volume_ratio": 1.04, "support_resistance": {"support": 360.0, "resistance": 395.0}},
         )
         monkeypatch.setattr(service.stocks_analyzer, "calculate_returns", lambda series: {"1M": 3.2, "3M": 9.4})
         monkeypatch.setattr(
@@ -1176,7 +1180,7 @@ def test_get_stock_workspace_force_refresh_persists_requested_and_resolved_snaps
         monkeypatch.setattr(
             service.stocks_analyzer,
             "calculate_technical_indicators",
-            lambda df: {"RSI": 58.4, "volatility": 22.1, "Bollinger": {"position": "Mid"}, "MACD": {"histogram": 0.42}, "volume_ratio": 1.14, "support_resistance": {"support": 292.0, "resistance": 312.0}},
+            lambda df, symbol=None: {"RSI": 58.4, "volatility": 22.1, "Bollinger": {"position": "Mid"}, "MACD": {"histogram": 0.42}, "volume_ratio": 1.14, "support_resistance": {"support": 292.0, "resistance": 312.0}},
         )
         monkeypatch.setattr(service.stocks_analyzer, "calculate_returns", lambda series: {"1M": 4.2, "3M": 8.1})
         monkeypatch.setattr(
@@ -1535,7 +1539,7 @@ def test_get_forecast_workspace_builds_chart_entropy_and_validation(monkeypatch)
             self.period = period
             self.data = history
 
-        def get_all_predictions(self, days: int = 30):
+        def get_all_predictions(self, days: int = 30, refresh_backtest: bool = False):
             future_dates = pd.date_range(start=history.index[-1] + pd.Timedelta(days=1), periods=days)
             return {
                 "Random Forest": {
@@ -1572,6 +1576,53 @@ def test_get_forecast_workspace_builds_chart_entropy_and_validation(monkeypatch)
     assert all(row["validation"] == "Validated" for row in workspace["model_rows"])
 
 
+def test_get_forecast_workspace_ranks_models_on_walk_forward_error(monkeypatch):
+    cache_clear()
+    service = PublicResearchService()
+    history = pd.DataFrame(
+        {"Close": np.linspace(100.0, 130.0, 120)},
+        index=pd.date_range("2026-01-02", periods=120, freq="B"),
+    )
+
+    class FakePredictionEngine:
+        def __init__(self, symbol: str, period: str = "2y"):
+            self.data = history
+
+        def get_all_predictions(self, days: int = 30, refresh_backtest: bool = False):
+            future_dates = pd.date_range(start=history.index[-1] + pd.Timedelta(days=1), periods=days)
+            return {
+                "Random Forest": {
+                    "model_name": "Random Forest",
+                    "predictions": np.linspace(131.0, 134.0, days),
+                    "dates": future_dates,
+                    "metrics": {"RMSE": 0.9, "MAE": 0.7},
+                    "backtest": {"RMSE": 6.5, "MAE": 5.2, "Hit Rate": 0.4, "folds": 5, "horizon": 10},
+                },
+                "ARIMA": {
+                    "model_name": "ARIMA(5, 1, 0)",
+                    "predictions": np.linspace(130.5, 133.0, days),
+                    "dates": future_dates,
+                    "metrics": {"RMSE": 2.4, "MAE": 1.9},
+                    "backtest": {"RMSE": 2.1, "MAE": 1.6, "Hit Rate": 0.8, "folds": 5, "horizon": 10},
+                },
+            }
+
+    monkeypatch.setattr(public_research_module, "PublicPricePredictionEngine", FakePredictionEngine)
+
+    workspace = service.get_forecast_workspace("NVDA", 30)
+
+    assert workspace["best_model"]["model"] == "ARIMA"
+    assert workspace["model_rows"][0]["oos_rmse"] == "2.10"
+    assert workspace["model_rows"][0]["hit_rate"] == "80%"
+    assert workspace["validation_summary"]["out_of_sample"] == {
+        "models": 2,
+        "folds": 5,
+        "horizon": 10,
+        "avg_hit_rate": "60%",
+    }
+    assert "walk-forward" in workspace["validation_summary"]["detail"]
+
+
 def test_get_tr_fund_workspace_force_refresh_persists_snapshot(monkeypatch):
     cache_clear()
     with TemporaryDirectory() as tmpdir:
@@ -4,6 +4,7 @@ from fastapi.testclient import TestClient
 
 from app.api import public as public_api
 from app.main import app
+from app.services.tr_funds import PeerBoard
 from app.web import routes as web_routes
 
 
@@ -1293,16 +1294,7 @@ def test_public_tr_funds_api_serializes_numpy_scalars(monkeypatch):
         ]
     )
 
-    monkeypatch.setattr(public_api.tr_funds_service, "get_cached_peer_signal_board", lambda months: board)
-    monkeypatch.setattr(
-        public_api.tr_funds_service,
-        "get_cached_top_pick",
-        lambda months: {
-            "fund_code": "TCD",
-            "signal_score": np.float64(81.2),
-            "category_rank": np.int64(1),
-        },
-    )
+    monkeypatch.setattr(public_api.tr_funds_service, "get_cached_peer_board", lambda months: PeerBoard.build("v1", board))
     monkeypatch.setattr(
         public_api.tr_funds_service,
         "get_status",
@@ -1312,14 +1304,6 @@ def test_public_tr_funds_api_serializes_numpy_scalars(monkeypatch):
             "funds_loaded": np.int64(1),
         },
     )
-    monkeypatch.setattr(
-        public_api.tr_funds_service,
-        "get_leadership_snapshot",
-        lambda months: {
-            "family_rows": [{"fund_family": "Is Portfoy", "house_view": "House Leader", "funds_count": 1}],
-            "factor_rows": [{"local_factor": "Broad BIST Beta", "breadth": "Broadening", "funds_count": 1}],
-        },
-    )
 
     response = client.get("/api/v1/public/tr-funds")
     assert response.status_code == 200
@@ -1327,7 +1311,8 @@ def test_public_tr_funds_api_serializes_numpy_scalars(monkeypatch):
     assert body["status"] == "success"
     assert body["top_pick"]["category_rank"] == 1
     assert body["peer_board"][0]["category_rank"] == 1
-    assert body["leadership"]["family_rows"][0]["house_view"] == "House Leader"
+    assert body["peer_board"][0]["board_band"]
+    assert body["leadership"]["family_rows"][0]["funds_count"] == 1
     assert body["health"]["funds_requested"] == 1
 
 
@@ -1490,24 +1475,18 @@ def test_sector_rotation_page_renders(monkeypatch):
 
 
 def test_turkish_funds_page_renders(monkeypatch):
-    monkeypatch.setattr(
-        web_routes.tr_funds_service,
-        "get_cached_peer_signal_board",
-        lambda months: pd.DataFrame([{"fund_code": "TCD", "fund_name_short": "Test Fund", "signal_score": 82.1, "signal_band": "Leading", "board_score": 86.4, "board_band": "Institutional Leader", "fund_family": "Is Portfoy", "local_factor": "Broad BIST Beta", "quality_tier": "Elite", "category_percentile": 91.7, "regime": "Accumulation", "investor_growth_pct": 8.4, "value_growth_pct": 6.8, "allocation_drift": 4.1, "dominant_asset": "Hisse"}]),
-    )
-    monkeypatch.setattr(
-        web_routes.tr_funds_service,
-        "get_cached_top_pick",
-        lambda months: {"fund_code": "TCD", "signal_band": "Leading", "signal_score": 82.1, "fund_family": "Is Portfoy", "local_factor": "Broad BIST Beta", "quality_tier": "Elite", "board_score": 86.4, "investor_growth_pct": 8.4, "dominant_asset": "Hisse"},
-    )
-    monkeypatch.setattr(
-        web_routes.tr_funds_service,
-        "get_leadership_snapshot",
-        lambda months: {
+    rows = [{"fund_code": "TCD", "fund_name_short": "Test Fund", "signal_score": 82.1, "signal_band": "Leading", "board_score": 86.4, "board_band": "Institutional Leader", "fund_family": "Is Portfoy", "local_factor": "Broad BIST Beta", "quality_tier": "Elite", "category_percentile": 91.7, "regime": "Accumulation", "investor_growth_pct": 8.4, "value_growth_pct": 6.8, "allocation_drift": 4.1, "dominant_asset": "Hisse"}]
+    board = PeerBoard(
+        version="2026-05-28T00:00:00Z",
+        frame=pd.DataFrame(rows),
+        records=tuple(rows),
+        top_pick={"fund_code": "TCD", "signal_band": "Leading", "signal_score": 82.1, "fund_family": "Is Portfoy", "local_factor": "Broad BIST Beta", "quality_tier": "Elite", "board_score": 86.4, "investor_growth_pct": 8.4, "dominant_asset": "Hisse"},
+        leadership={
             "family_rows": [{"fund_family": "Is Portfoy", "house_view": "House Leader", "funds_count": 1, "avg_board_score": 86.4, "avg_signal_score": 82.1, "top_fund": "TCD", "avg_category_percentile": 91.7}],
             "factor_rows": [{"local_factor": "Broad BIST Beta", "breadth": "Broadening", "funds_count": 1, "avg_board_score": 86.4, "avg_investor_growth_pct": 8.4, "lead_fund": "TCD", "avg_value_growth_pct": 6.8}],
         },
     )
+    monkeypatch.setattr(web_routes.tr_funds_service, "get_cached_peer_board", lambda months: board)
     monkeypatch.setattr(web_routes.public_research_service, "get_tr_fund_workspace", _fake_tr_fund_workspace)
     response = client.get("/turkish-funds?fund=TCD&months=6")
     assert response.status_code == 200
@@ -1518,21 +1497,15 @@ def test_turkish_funds_page_renders(monkeypatch):
 
 
 def test_turkish_funds_head_request_with_legacy_peer_board(monkeypatch):
-    monkeypatch.setattr(
-        web_routes.tr_funds_service,
-        "get_cached_peer_signal_board",
-        lambda months: pd.DataFrame([{"fund_code": "TCD", "fund_name_short": "Legacy Fund", "signal_score": 82.1, "signal_band": "Leading", "regime": "Accumulation", "investor_growth_pct": 8.4, "value_growth_pct": 6.8, "allocation_drift": 4.1}]),
-    )
-    monkeypatch.setattr(
-        web_routes.tr_funds_service,
-        "get_cached_top_pick",
-        lambda months: {"fund_code": "TCD", "signal_band": "Leading", "signal_score": 82.1, "fund_family": "Is Portfoy", "local_factor": "Broad BIST Beta", "quality_tier": "Elite", "board_score": 86.4, "investor_growth_pct": 8.4, "dominant_asset": "Hisse"},
-    )
-    monkeypatch.setattr(
-        web_routes.tr_funds_service,
-        "get_leadership_snapshot",
-        lambda months: {"family_rows": [], "factor_rows": []},
+    rows = [{"fund_code": "TCD", "fund_name_short": "Legacy Fund", "signal_score": 82.1, "signal_band": "Leading", "regime": "Accumulation", "investor_growth_pct": 8.4, "value_growth_pct": 6.8, "allocation_drift": 4.1}]
+    board = PeerBoard(
+        version="2026-05-28T00:00:00Z",
+        frame=pd.DataFrame(rows),
+        records=tuple(rows),
+        top_pick={"fund_code": "TCD", "signal_band": "Leading", "signal_score": 82.1, "fund_family": "Is Portfoy", "local_factor": "Broad BIST Beta", "quality_tier": "Elite", "board_score": 86.4, "investor_growth_pct": 8.4, "dominant_asset": "Hisse"},
+        leadership={"family_rows": [], "factor_rows": []},
     )
+    monkeypatch.setattr(web_routes.tr_funds_service, "get_cached_peer_board", lambda months: board)
     monkeypatch.setattr(web_routes.public_research_service, "get_tr_fund_workspace", _fake_tr_fund_workspace)
     response = client.head("/turkish-funds?fund=TCD&months=6")
     assert response.status_code == 200
@@ -1655,3 +1628,62 @@ def test_dashboard_failure_renders_friendly_html(monkeypatch):
     assert response.status_code == 500
     assert "Temporary issue on the public workspace." in response.text
     assert "raw traceback should not leak" not in response.text
+
+
+def test_page_cache_serves_gzip_with_etag_and_rerenders_when_workspace_changes(monkeypatch):
+    web_routes.page_cache.clear()
+    renders = []
+    original_get_template = web_routes.templates.get_template
+
+    def _counting_get_template(name):
+        renders.append(name)
+        return original_get_template(name)
+
+    snapshot = _fake_snapshot()
+    monkeypatch.setattr(web_routes.templates, "get_template", _counting_get_template)
+    monkeypatch.setattr(web_routes.dashboard_service, "build_snapshot", lambda: snapshot)
+
+    first = client.get("/dashboard", headers={"Accept-Encoding": "gzip"})
+    etag = first.headers["etag"]
+    repeat = client.get("/dashboard", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    identity = client.get("/dashboard", headers={"Accept-Encoding": "identity"})
+
+    assert first.headers["content-encoding"] == "gzip"
+    assert etag.endswith('-gz"')
+    assert repeat.status_code == 304 and repeat.content == b""
+    assert identity.text == first.text and "content-encoding" not in identity.headers
+    assert renders == ["dashboard.html"]
+
+    snapshot["sentiment"] = dict(snapshot["sentiment"], mood="Defensive")
+    rebuilt = client.get("/dashboard", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+
+    assert rebuilt.status_code == 200
+    assert "Defensive" in rebuilt.text
+    assert rebuilt.headers["etag"] != etag
+    assert renders == ["dashboard.html", "dashboard.html"]
+
+
+def test_public_api_serves_published_artifact_without_rebuilding(monkeypatch):
+    builds = []
+
+    def _influence_workspace():
+        builds.append(1)
+        return {"pair_rows": [{"pair": "SPY / TLT", "score": np.float64(0.42)}], "headline": {}}
+
+    monkeypatch.setattr(public_api.dashboard_service, "build_influence_workspace", _influence_workspace)
+    public_api.artifacts.clear()
+    try:
+        live = client.get("/api/v1/public/influence-map")
+        page = public_api.artifacts.publish("influence-map", public_api._influence_map_payload())
+        served = client.get("/api/v1/public/influence-map", headers={"Accept-Encoding": "gzip"})
+        repeat = client.get("/api/v1/public/influence-map", headers={"If-None-Match": served.headers["etag"]})
+
+        assert builds == [1, 1]
+        assert served.json() == live.json()
+        assert served.headers["content-type"] == "application/json"
+        assert served.headers["content-encoding"] == "gzip"
+        assert served.headers["etag"] == page.etag[:-1] + '-gz"'
+        assert repeat.status_code == 304 and repeat.content == b""
+        assert public_api.artifacts.publish("influence-map", public_api._influence_map_payload()) is page
+    finally:
+        public_api.artifacts.clear()
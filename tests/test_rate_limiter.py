@@ -0,0 +1,75 @@
+import time
+
+from utils import unified_api_manager
+from utils.unified_api_manager import (
+    PRIORITY_BULK,
+    PRIORITY_INTERACTIVE,
+    RateLimiter,
+    api_priority,
+    current_priority,
+)
+
+
+def test_token_bucket_admits_burst_then_throttles():
+    limiter = RateLimiter(bursts={"demo": 3})
+
+    admitted = [limiter.can_call("demo", 60, 60) for _ in range(4)]
+
+    assert admitted == [True, True, True, False]
+    metrics = limiter.metrics("demo")["demo"]
+    assert metrics["capacity"] == 3
+    assert metrics["admitted"] == 3
+    assert metrics["throttled"] == 1
+    assert metrics["saturation"] > 0.9
+
+
+def test_wait_until_ready_sleeps_precisely_and_fails_fast():
+    limiter = RateLimiter(bursts={"fast": 1, "daily": 1})
+    assert limiter.can_call("fast", 20, 1)
+
+    started = time.monotonic()
+    assert limiter.wait_until_ready("fast", 20, 1, timeout=1)
+    assert 0.03 <= time.monotonic() - started < 0.5
+
+    assert limiter.can_call("daily", 1, 86400)
+    started = time.monotonic()
+    assert limiter.wait_until_ready("daily", 1, 86400, timeout=5) is False
+    assert time.monotonic() - started < 0.1
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def test_daily_quota_is_never_exceeded_in_any_window(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(unified_api_manager, "time", clock)
+    limiter = RateLimiter()
+    admissions = []
+
+    # Poll every ten minutes for two days against a 25-per-day quota.
+    for _ in range(2 * 24 * 6):
+        if limiter.can_call("alpha_vantage", 25, 86400):
+            admissions.append(clock.now)
+        clock.now += 600
+
+    assert len(admissions) > 25
+    for index, started in enumerate(admissions):
+        in_window = [moment for moment in admissions[index:] if moment - started < 86400]
+        assert len(in_window) <= 25
+
+
+def test_bulk_lane_keeps_reserve_for_interactive_calls():
+    limiter = RateLimiter(bursts={"shared": 5})
+
+    with api_priority(PRIORITY_BULK):
+        assert current_priority() == PRIORITY_BULK
+        bulk = [limiter.can_call("shared", 5, 3600) for _ in range(5)]
+    assert current_priority() == PRIORITY_INTERACTIVE
+
+    assert bulk == [True, True, True, True, False]
+    assert limiter.can_call("shared", 5, 3600, priority=PRIORITY_INTERACTIVE)
@@ -0,0 +1,128 @@
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.utils.sqlite_pool import SQLitePool
+from modules.etf_weight_tracker import ETFWeightTracker
+from utils.database import DatabaseManager
+
+
+def test_sqlite_pool_reuses_connections_in_wal_mode(tmp_path):
+    pool = SQLitePool(str(tmp_path / "pool.db"), max_connections=2)
+
+    first = pool.acquire()
+    assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    first.execute("CREATE TABLE t (x INTEGER)")
+    first.execute("INSERT INTO t VALUES (1)")
+    first.close()
+    first.close()  # double close must not return the connection twice
+
+    with pool.connection() as conn:
+        assert conn is first
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0  # uncommitted work was discarded
+        conn.execute("INSERT INTO t VALUES (2)")
+
+    results = []
+
+    def _reader():
+        with pool.connection() as conn:
+            results.append(conn.execute("SELECT SUM(x) FROM t").fetchone()[0])
+
+    threads = [threading.Thread(target=_reader) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [2] * 6
+    assert pool._created <= 2
+    pool.close_all()
+
+
+def test_cache_price_frames_bulk_inserts_and_round_trips(tmp_path):
+    db = DatabaseManager(str(tmp_path / "dashboard.db"))
+    index = pd.date_range("2024-01-01", periods=5, freq="D")
+    frame = pd.DataFrame(
+        {
+            "Open": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "High": [1.5, 2.5, 3.5, 4.5, 5.5],
+            "Low": [0.5, 1.5, 2.5, 3.5, 4.5],
+            "Close": [1.2, 2.2, np.nan, 4.2, 5.2],
+            "Volume": [100, 200, 300, 400, 500],
+        },
+        index=index,
+    )
+
+    written = db.cache_price_frames({"AAA": frame, "BBB": frame.iloc[:2]})
+    db.cache_price_data("AAA", frame)
+
+    assert written == 7
+    cached = db.get_cached_price_data("AAA", "2024-01-01", "2024-01-31")
+    assert len(cached) == 5
+    assert pd.isna(cached["close"].iloc[2])
+    assert cached["volume"].tolist() == [100, 200, 300, 400, 500]
+
+    db.set_cache_many({"a": {"x": 1}, "b": [1, 2]}, ttl_seconds=60)
+    assert db.get_cache("a") == {"x": 1}
+    assert db.get_cache("b") == [1, 2]
+
+
+def test_save_holdings_upserts_same_day_snapshot(tmp_path):
+    tracker = ETFWeightTracker(db_path=str(tmp_path / "holdings.db"))
+    snapshot = pd.DataFrame(
+        {
+            "fund_code": ["SPY", "SPY"],
+            "fund_name": ["SPDR", "SPDR"],
+            "stock_symbol": ["AAPL", "MSFT"],
+            "weight_pct": [7.0, 6.5],
+            "report_date": ["2026-01-02", "2026-01-02"],
+        }
+    )
+
+    tracker._save_holdings_to_db(snapshot)
+    snapshot.loc[0, "weight_pct"] = 7.4
+    tracker._save_holdings_to_db(snapshot)
+
+    assert tracker.get_summary_stats()["total_records"] == 2
+    funds = tracker.get_funds_for_stock("AAPL", min_weight=0.1)
+    assert float(funds.iloc[0]["weight_pct"]) == 7.4
+
+
+def test_failing_queries_return_connections_and_exhaustion_raises(tmp_path):
+    tracker = ETFWeightTracker(db_path=str(tmp_path / "holdings.db"))
+    with tracker.pool.connection() as conn:
+        conn.execute("DROP TABLE holding_weight_changes")
+
+    for _ in range(tracker.pool.max_connections + 2):
+        with pytest.raises(Exception):
+            tracker.get_top_weight_changes()
+    assert tracker.pool._idle.qsize() == tracker.pool._created
+
+    pool = SQLitePool(str(tmp_path / "small.db"), max_connections=1, acquire_timeout=0.05)
+    held = pool.acquire()
+    with pytest.raises(sqlite3.OperationalError, match="released within"):
+        pool.acquire()
+    held.close()
+    pool.acquire().close()
+
+
+def test_database_manager_threads_share_pooled_connections(tmp_path):
+    db = DatabaseManager(str(tmp_path / "dashboard.db"))
+
+    def _worker(index):
+        portfolio_id = db.create_portfolio(1, f"p{index}")
+        db.add_holding(portfolio_id, "AAPL", 1.0, 100.0, "2024-01-01")
+        db.update_holding(db.get_portfolio_holdings(portfolio_id)[0]["id"], quantity=2.0)
+
+    threads = [threading.Thread(target=_worker, args=(index,)) for index in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(db.get_user_portfolios(1)) == 12
+    assert db.pool._created <= db.pool.max_connections
+    assert db.pool._idle.qsize() == db.pool._created
@@ -2,7 +2,9 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import pandas as pd
+import pytest
 
+from app.services import tr_funds
 from app.services.cache import cache_clear, cache_set
 from app.services.snapshot_store import SnapshotStore
 from app.services.tr_funds import TRFundsService
@@ -255,6 +257,35 @@ def test_tr_funds_service_refreshes_legacy_peer_board_identity():
         assert persisted["rows"][0]["fund_name"] == "Tacirler Portfoy Degisken Fon"
 
 
+def test_tr_funds_service_publishes_peer_board_once_and_serves_it_on_cache_hits(monkeypatch):
+    cache_clear()
+    with TemporaryDirectory() as tmpdir:
+        store = SnapshotStore(base_dir=Path(tmpdir))
+        service = TRFundsService(tracker_cls=FakeTracker, ttl_seconds=60, snapshot_store=store)
+        board = service.get_peer_board(months=12)
+        monkeypatch.setattr(tr_funds, "_enrich_peer_board_frame", lambda frame: pytest.fail("enriched on a cache hit"))
+        monkeypatch.setattr(service, "_canonicalize_peer_board_frame", lambda frame: pytest.fail("canonicalized on a cache hit"))
+
+        assert service.get_cached_peer_board(months=12) is board
+        assert service.get_cached_peer_signal_board(months=12) is board.frame
+        assert service.get_peer_signal_board(months=12) is board.frame
+        assert service.get_cached_top_pick(months=12)["fund_code"] == "TCD"
+        assert service.get_leadership_snapshot(months=12) is board.leadership
+        assert isinstance(board.records[0]["category_rank"], int)
+        assert store.read_json("tr-funds-peer-board-12")["saved_at"] == board.version
+
+
+def test_tr_funds_service_publishes_legacy_cached_frame():
+    cache_clear()
+    with TemporaryDirectory() as tmpdir:
+        service = TRFundsService(tracker_cls=FakeTracker, ttl_seconds=60, snapshot_store=SnapshotStore(base_dir=Path(tmpdir)))
+        cache_set("tr-funds:peer-board:12", pd.DataFrame([{"fund_code": "TCD", "fund_name": "Legacy", "signal_score": 70.0}]), ttl=60)
+        board = service.get_cached_peer_board(months=12)
+        assert board.frame.iloc[0]["board_band"]
+        assert service.get_status(months=12)["funds_loaded"] == 1
+        assert service.get_cached_peer_board(months=12) is board
+
+
 def test_tr_funds_service_builds_leadership_snapshot():
     service = TRFundsService(tracker_cls=FakeTracker, ttl_seconds=1)
     leadership = service.get_leadership_snapshot(months=12)
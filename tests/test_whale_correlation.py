@@ -291,6 +291,36 @@ def test_whale_correlation():
     print("=" * 70)
 
 
+def test_sparse_matrices_match_pairwise_merges():
+    engine = WhaleCorrelationEngine()
+    whales = {
+        "A": pd.DataFrame({"ticker": ["AAPL", "MSFT", "KO", "BAC"], "portfolio_weight": [40.0, 30.0, 20.0, 10.0]}),
+        "B": pd.DataFrame({"ticker": ["AAPL", "MSFT", "KO", "XOM"], "portfolio_weight": [35.0, 25.0, 28.0, 12.0]}),
+        "C": pd.DataFrame({"ticker": ["TSLA", "AAPL", "MSFT"], "portfolio_weight": [50.0, 25.0, np.nan]}),
+        "Empty": pd.DataFrame({"ticker": [], "portfolio_weight": []}),
+    }
+    user = pd.DataFrame({"ticker": ["KO", "AAPL", "BAC", "MSFT"], "portfolio_weight": [5.0, 45.0, 20.0, 30.0]})
+
+    corr_matrix = engine.build_correlation_matrix(whales)
+    overlap_matrix = engine.build_overlap_matrix(whales)
+    comparison = engine.compare_user_to_whales(user, whales).set_index("Investor")
+
+    for name_a, df_a in whales.items():
+        for name_b, df_b in whales.items():
+            if name_a == name_b:
+                continue
+            expected_corr = engine.calculate_portfolio_correlation(df_a, df_b)
+            expected_overlap = engine.calculate_overlap_percentage(df_a, df_b)["overlap_percentage"]
+            assert abs(corr_matrix.loc[name_a, name_b] - expected_corr) < 1e-9
+            assert abs(overlap_matrix.loc[name_a, name_b] - expected_overlap) < 1e-9
+        expected_user = engine.calculate_overlap_percentage(user, df_a)
+        assert comparison.loc[name_a, "Common_Holdings"] == expected_user["common_holdings"]
+        assert comparison.loc[name_a, "Similarity_Score"] == round(engine.calculate_portfolio_correlation(user, df_a) * 100, 1)
+
+    assert corr_matrix.loc["C", "A"] == 0.0  # one usable common weight is not enough for a correlation
+    assert engine.identify_whale_clusters(corr_matrix, threshold=0.6) == [["A", "B"]]
+
+
 if __name__ == "__main__":
     import numpy as np
     test_whale_correlation()
@@ -5,6 +5,7 @@ Validates momentum calculation, consensus detection, and institutional indicator
 
 import pandas as pd
 import numpy as np
+import pytest
 import sys
 from pathlib import Path
 
@@ -323,5 +324,61 @@ def test_whale_momentum():
     print("=" * 70)
 
 
+def test_columnar_pipeline_classifies_and_scores_every_ticker():
+    """Columnar moves/summary match the per-ticker definitions"""
+    tracker = WhaleMomentumTracker()
+
+    def holdings(rows):
+        return pd.DataFrame(rows, columns=['ticker', 'shares', 'value_usd', 'portfolio_weight'])
+
+    current = {
+        'A': holdings([('AAPL', 200, 2000, 4.0), ('MSFT', 100, 1000, 2.0), ('NVDA', 50, 500, 1.0)]),
+        'B': holdings([('AAPL', 150, 1500, 3.0), ('KO', 80, 800, 1.5)]),
+        'C': holdings([('MSFT', 40, 400, 0.5), ('NVDA', 100, 1000, 2.5)]),
+    }
+    previous = {
+        'A': holdings([('AAPL', 100, 1000, 2.0), ('MSFT', 100, 1000, 2.0), ('KO', 10, 100, 0.2)]),
+        'B': holdings([('AAPL', 100, 1000, 2.0), ('KO', 100, 1000, 2.0), ('NVDA', 30, 300, 0.6)]),
+        'C': holdings([('MSFT', 80, 800, 1.0), ('NVDA', 100, 1000, 2.5)]),
+    }
+
+    changes = {name: tracker.calculate_position_changes(current[name], previous[name]) for name in current}
+    actions = changes['A'].set_index('ticker')['action'].to_dict()
+    assert actions == {'AAPL': 'INCREASED', 'MSFT': 'UNCHANGED', 'NVDA': 'NEW', 'KO': 'SOLD'}
+
+    moves = tracker.aggregate_whale_moves(changes)
+    assert list(moves.columns) == ['ticker', 'whale', 'action', 'shares_change', 'value_change',
+                                   'weight_change', 'shares_change_pct']
+    assert 'UNCHANGED' not in set(moves['action'])
+    assert len(moves) == 7
+
+    top = tracker.get_top_momentum_stocks(moves, n=10).set_index('ticker')
+    # AAPL: A and B both add weight (+2.0, +1.0), C does not trade it; 3 whales move overall
+    # net 1.0 -> 0.5, overlap 2/3 -> 0.2, confidence 1.5 / 2 = 0.75 -> 0.15
+    assert top.loc['AAPL', 'momentum_score'] == pytest.approx(0.85)
+    assert top.loc['AAPL', 'overlap'] == pytest.approx(2 / 3)
+    assert top.loc['AAPL', 'confidence'] == pytest.approx(0.75)
+    assert (top.loc['AAPL', 'buyers'], top.loc['AAPL', 'sellers']) == (2, 0)
+    assert top.loc['AAPL', 'buyer_whales'] == ['A', 'B']
+    assert top.loc['AAPL', 'net_direction'] == 'BULLISH'
+    # NVDA: A opens (+1.0), B closes (-0.6): net 0 -> 0.25, overlap 2/3 -> 0.2, confidence 0.4 -> 0.08
+    assert top.loc['NVDA', 'momentum_score'] == pytest.approx(0.53)
+    assert top.loc['NVDA', 'confidence'] == pytest.approx(0.4)
+    assert (top.loc['NVDA', 'buyer_whales'], top.loc['NVDA', 'seller_whales']) == (['A'], ['B'])
+    assert top.loc['NVDA', 'net_direction'] == 'NEUTRAL'
+
+    single = tracker.calculate_momentum_score('NVDA', moves)
+    assert single['momentum_score'] == pytest.approx(0.53) and single['overlap'] == pytest.approx(2 / 3)
+
+    buys = tracker.detect_consensus_buys(moves, min_whales=2)
+    assert [(row['ticker'], row['num_buyers'], row['total_value_change']) for row in buys] == [('AAPL', 2, 1500.0)]
+    assert buys[0]['avg_weight_change'] == 1.5
+    sells = tracker.detect_consensus_sells(moves, min_whales=2)
+    assert [(row['ticker'], sorted(row['seller_whales'])) for row in sells] == [('KO', ['A', 'B'])]
+
+    empty = tracker.aggregate_whale_moves({'A': changes['A'].iloc[0:0]})
+    assert empty.empty and list(empty.columns) == list(moves.columns)
+
+
 if __name__ == "__main__":
     test_whale_momentum()
@@ -3,19 +3,63 @@
 Single class to access all market data sources
 """
 
-from typing import Dict, Any, Optional, List
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Dict, Any, Callable, Hashable, Optional, List
+import contextvars
+import threading
 from .unified_api_manager import api_manager
 import pandas as pd
 
 
+class RequestCoalescer:
+    """
+    Share one in-flight call between concurrent callers asking for the same key
+
+    The first caller submits the work to the executor; callers arriving while
+    it is still running receive the same future instead of a duplicate request.
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor):
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, Future] = {}
+
+    def submit(self, key: Hashable, fn: Callable, *args) -> Future:
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            # Carry the caller's context (e.g. rate limiter lane) into the worker thread
+            context = contextvars.copy_context()
+            future = self._executor.submit(context.run, fn, *args)
+            self._inflight[key] = future
+        future.add_done_callback(lambda done, key=key: self._forget(key, done))
+        return future
+
+    def _forget(self, key: Hashable, future: Future):
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def inflight_count(self) -> int:
+        with self._lock:
+            return len(self._inflight)
+
+
 class MarketDataEngine:
     """
     Unified interface for all market data
     Simplifies access to stocks, ETFs, crypto, funds, and macro data
     """
 
+    MAX_WORKERS = 8
+    BATCH_TIMEOUT_SECONDS = 20.0
+
     def __init__(self):
         self.api = api_manager
+        self.executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix='market-data')
+        self.coalescer = RequestCoalescer(self.executor)
 
     # ========== STOCKS & ETFs ==========
 
@@ -24,7 +68,7 @@ class MarketDataEngine:
         Get stock price with automatic fallback
         Priority: Yahoo → FMP → Alpha Vantage → Finnhub → Polygon
         """
-        return self.api.get_stock_price_with_fallback(symbol)
+        return self.coalescer.submit(('stock', symbol), self.api.get_stock_price_with_fallback, symbol).result()
 
     def get_etf(self, symbol: str) -> Dict[str, Any]:
         """Get ETF price (same as stock)"""
@@ -224,28 +268,137 @@ class MarketDataEngine:
         self.api.clear_cache()
 
     # ========== BATCH OPERATIONS ==========
+    # Batch calls run in the caller's rate limiter lane; bulk jobs wrap them in api_priority(PRIORITY_BULK).
 
-    def get_multiple_stocks(self, symbols: List[str]) -> Dict[str, Dict]:
-        """Get multiple stock prices efficiently"""
-        results = {}
-        for symbol in symbols:
-            results[symbol] = self.get_stock(symbol)
-        return results
+    def get_multiple_stocks(self, symbols: List[str], timeout: Optional[float] = None) -> Dict[str, Dict]:
+        """
+        Get multiple stock prices efficiently
 
-    def get_multiple_cryptos(self, symbols: List[str]) -> Dict[str, Dict]:
-        """Get multiple crypto prices"""
-        results = {}
-        for symbol in symbols:
-            results[symbol] = self.get_crypto(symbol)
-        return results
+        Symbols are first answered from one Yahoo bulk download, then from one
+        FMP batch quote; anything still missing runs the single-symbol fallback
+        chain concurrently. Every entry carries a ``status`` of ``ok``,
+        ``missing``, ``error`` or ``timeout`` so slow symbols never hold back
+        the rest of the batch.
+        """
+        ordered = self._unique(symbols)
+        results: Dict[str, Dict] = {}
+
+        for symbol, quote in self.api.get_yahoo_batch_quotes(ordered).items():
+            results[symbol] = self._stock_result(symbol, quote['price'], quote['change'], 'yahoo')
+
+        missing = [symbol for symbol in ordered if symbol not in results]
+        if missing:
+            for item in self.api.get_fmp_batch_quotes(missing) or []:
+                symbol = item.get('symbol')
+                if symbol in missing and item.get('price') is not None:
+                    results[symbol] = self._stock_result(symbol, item['price'], item.get('changesPercentage', 0), 'fmp')
+
+        missing = [symbol for symbol in ordered if symbol not in results]
+        results.update(
+            self._fan_out(
+                'stock',
+                missing,
+                self.api.get_stock_price_with_fallback,
+                timeout,
+                lambda symbol: {'symbol': symbol, 'price': None, 'change': None, 'source': None},
+            )
+        )
+        return {symbol: results[symbol] for symbol in ordered}
+
+    def get_multiple_cryptos(self, symbols: List[str], timeout: Optional[float] = None) -> Dict[str, Dict]:
+        """
+        Get multiple crypto prices
+
+        Uses one Binance multi-ticker call for all USDT pairs and falls back
+        to concurrent single-symbol lookups for the rest.
+        """
+        ordered = self._unique(symbols)
+        results: Dict[str, Dict] = {}
+
+        pairs = {(symbol.upper() if symbol.upper().endswith('USDT') else symbol.upper() + 'USDT'): symbol for symbol in ordered}
+        for ticker in self.api.get_binance_tickers(list(pairs)) or []:
+            symbol = pairs.get(ticker.get('symbol'))
+            if symbol is None:
+                continue
+            results[symbol] = {
+                'symbol': symbol,
+                'price': float(ticker.get('lastPrice', 0)),
+                'change_24h': float(ticker.get('priceChangePercent', 0)),
+                'volume': float(ticker.get('volume', 0)),
+                'source': 'binance',
+                'status': 'ok',
+            }
+
+        missing = [symbol for symbol in ordered if symbol not in results]
+        results.update(
+            self._fan_out(
+                'crypto',
+                missing,
+                self.get_crypto,
+                timeout,
+                lambda symbol: {'symbol': symbol, 'price': None, 'change_24h': None, 'source': None},
+            )
+        )
+        return {symbol: results[symbol] for symbol in ordered}
+
+    def get_multiple_funds(self, fund_codes: List[str], timeout: Optional[float] = None) -> Dict[str, Dict]:
+        """Get multiple TEFAS funds concurrently"""
+        ordered = self._unique(fund_codes)
+        return self._fan_out(
+            'fund',
+            ordered,
+            self.get_fund,
+            timeout,
+            lambda code: {'fund_code': code, 'current_price': None, 'source': None},
+            value_key='current_price',
+        )
+
+    def _fan_out(
+        self,
+        kind: str,
+        keys: List[str],
+        fetch: Callable[[str], Optional[Dict]],
+        timeout: Optional[float],
+        empty: Callable[[str], Dict],
+        value_key: str = 'price',
+    ) -> Dict[str, Dict]:
+        """Run coalesced single-key fetches concurrently and collect what finishes in time"""
+        if not keys:
+            return {}
+        futures = {key: self.coalescer.submit((kind, key), fetch, key) for key in keys}
+        wait(futures.values(), timeout=self.BATCH_TIMEOUT_SECONDS if timeout is None else timeout)
 
-    def get_multiple_funds(self, fund_codes: List[str]) -> Dict[str, Dict]:
-        """Get multiple TEFAS funds"""
         results = {}
-        for code in fund_codes:
-            results[code] = self.get_fund(code)
+        for key, future in futures.items():
+            if not future.done():
+                results[key] = {**empty(key), 'status': 'timeout'}
+                continue
+            try:
+                payload = future.result()
+            except Exception as e:
+                results[key] = {**empty(key), 'status': 'error', 'error': str(e)}
+                continue
+            if payload and payload.get(value_key) is not None:
+                results[key] = {**payload, 'status': 'ok'}
+            else:
+                results[key] = {**empty(key), **(payload or {}), 'status': 'missing'}
         return results
 
+    @staticmethod
+    def _unique(keys: List[str]) -> List[str]:
+        return list(dict.fromkeys(keys))
+
+    @staticmethod
+    def _stock_result(symbol: str, price: float, change: float, source: str) -> Dict[str, Any]:
+        return {
+            'symbol': symbol,
+            'price': float(price),
+            'change': float(change or 0),
+            'source': source,
+            'timestamp': datetime.now().isoformat(),
+            'status': 'ok',
+        }
+
     # ========== HELPER METHODS ==========
 
     def search_stock(self, query: str) -> List[Dict]:
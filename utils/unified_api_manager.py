@@ -6,55 +6,230 @@ Zero-cost operation with free tier APIs
 
 import os
 import time
+import contextvars
 import requests
 import json
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 import hashlib
-from collections import defaultdict
+from collections import defaultdict, deque
+from contextlib import contextmanager
 import threading
 from .secret_utils import get_secret
 from app.services.cache import get_cache
 
 
-class RateLimiter:
-    """Rate limiter for API calls"""
+PRIORITY_INTERACTIVE = 'interactive'
+PRIORITY_BULK = 'bulk'
+PRIORITY_LANES = (PRIORITY_INTERACTIVE, PRIORITY_BULK)
 
-    def __init__(self):
-        self.locks = defaultdict(threading.Lock)
-        self.call_times = defaultdict(list)
+_current_priority = contextvars.ContextVar('api_priority', default=PRIORITY_INTERACTIVE)
+
+
+@contextmanager
+def api_priority(lane: str):
+    """
+    Run the enclosed API calls in the given rate limiter lane
+
+    Bulk jobs (batch refreshes, API sweeps) should wrap their work in
+    ``api_priority(PRIORITY_BULK)`` so interactive requests are admitted first.
+    Calls default to the interactive lane.
+    """
+    if lane not in PRIORITY_LANES:
+        raise ValueError(f"Unknown priority lane: {lane}")
+    token = _current_priority.set(lane)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> str:
+    """Return the rate limiter lane of the current context"""
+    return _current_priority.get()
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at ``rate`` tokens per second
+
+    ``recent`` holds the admission times of the current quota window, so the
+    bucket can never admit more than the provider quota in any window even
+    when a full burst and a full window of refill fall inside it.
+    """
+
+    __slots__ = ('rate', 'capacity', 'tokens', 'updated', 'recent', 'admitted', 'throttled', 'waits', 'wait_seconds')
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.recent = deque()
+        self.admitted = 0
+        self.throttled = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    def refill(self, now: float):
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def delay_for(self, reserve: float = 0.0) -> float:
+        """Seconds until one token is available on top of ``reserve``"""
+        deficit = 1.0 + reserve - self.tokens
+        return 0.0 if deficit <= 0 else deficit / self.rate
+
+    def window_delay(self, now: float, max_calls: int, time_window: int) -> float:
+        """Seconds until the sliding quota window has room for one more call"""
+        while self.recent and now - self.recent[0] >= time_window:
+            self.recent.popleft()
+        if len(self.recent) < max_calls:
+            return 0.0
+        return self.recent[-max_calls] + time_window - now
 
-    def can_call(self, api_name: str, max_calls: int, time_window: int) -> bool:
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter for API calls
+
+    Admission is O(1) per call and waiters sleep exactly until the next token
+    is due instead of polling. Calls run in one of two lanes: ``interactive``
+    calls may drain the whole bucket, while ``bulk`` calls leave a reserve
+    for interactive traffic and yield while interactive callers are waiting.
+    On top of the bucket a sliding window caps admissions at ``max_calls``
+    per ``time_window``, so hard daily and monthly quotas hold.
+    """
+
+    BULK_RESERVE_FRACTION = 0.2
+
+    def __init__(self, bursts: Optional[Dict[str, int]] = None):
+        self.bursts = dict(bursts or {})
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.waiting = defaultdict(lambda: dict.fromkeys(PRIORITY_LANES, 0))
+        self._conditions: Dict[str, threading.Condition] = {}
+        self._guard = threading.Lock()
+
+    def _condition(self, api_name: str) -> threading.Condition:
+        with self._guard:
+            condition = self._conditions.get(api_name)
+            if condition is None:
+                condition = self._conditions[api_name] = threading.Condition()
+            return condition
+
+    def _bucket(self, api_name: str, max_calls: int, time_window: int) -> TokenBucket:
+        rate = max_calls / time_window
+        capacity = float(max(1, self.bursts.get(api_name) or max_calls))
+        bucket = self.buckets.get(api_name)
+        if bucket is None:
+            bucket = self.buckets[api_name] = TokenBucket(rate, capacity)
+        elif bucket.rate != rate or bucket.capacity != capacity:
+            bucket.refill(time.monotonic())
+            bucket.rate = rate
+            bucket.capacity = capacity
+            bucket.tokens = min(bucket.tokens, capacity)
+        return bucket
+
+    def _admit(self, api_name: str, max_calls: int, time_window: int, priority: str) -> float:
+        """Take a token or return the seconds until one could be taken (condition lock held)"""
+        bucket = self._bucket(api_name, max_calls, time_window)
+        now = time.monotonic()
+        bucket.refill(now)
+        window_delay = bucket.window_delay(now, max_calls, time_window)
+        if priority == PRIORITY_BULK:
+            if self.waiting[api_name][PRIORITY_INTERACTIVE]:
+                # Let queued interactive callers take the next token first.
+                return max(bucket.delay_for(), window_delay) + 1.0 / bucket.rate
+            delay = bucket.delay_for(bucket.capacity * self.BULK_RESERVE_FRACTION)
+        else:
+            delay = bucket.delay_for()
+        delay = max(delay, window_delay)
+        if delay <= 0:
+            bucket.tokens -= 1.0
+            bucket.recent.append(now)
+            bucket.admitted += 1
+        return delay
+
+    def configure_burst(self, api_name: str, burst: int):
+        """Set the bucket capacity (maximum burst) for an API"""
+        self.bursts[api_name] = burst
+
+    def can_call(self, api_name: str, max_calls: int, time_window: int,
+                 priority: Optional[str] = None) -> bool:
         """
-        Check if API call is allowed
+        Check if API call is allowed, consuming a token when it is
 
         Args:
             api_name: Name of the API
             max_calls: Maximum calls allowed
             time_window: Time window in seconds
+            priority: Lane to admit the call in (defaults to the context lane)
+        """
+        priority = priority or current_priority()
+        with self._condition(api_name):
+            admitted = self._admit(api_name, max_calls, time_window, priority) <= 0
+            if not admitted:
+                self.buckets[api_name].throttled += 1
+            return admitted
+
+    def wait_until_ready(self, api_name: str, max_calls: int, time_window: int, timeout: float = 60,
+                         priority: Optional[str] = None) -> bool:
         """
-        with self.locks[api_name]:
-            now = time.time()
-            # Remove old calls outside the window
-            self.call_times[api_name] = [
-                t for t in self.call_times[api_name]
-                if now - t < time_window
-            ]
-
-            # Check if we can make another call
-            if len(self.call_times[api_name]) < max_calls:
-                self.call_times[api_name].append(now)
-                return True
-            return False
-
-    def wait_until_ready(self, api_name: str, max_calls: int, time_window: int, timeout: int = 60):
-        """Wait until API call is allowed"""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if self.can_call(api_name, max_calls, time_window):
-                return True
-            time.sleep(0.5)
-        return False
+        Block until API call is allowed
+
+        Returns False immediately when the next token is due after ``timeout``.
+        """
+        priority = priority or current_priority()
+        deadline = time.monotonic() + timeout
+        condition = self._condition(api_name)
+        with condition:
+            start = time.monotonic()
+            self.waiting[api_name][priority] += 1
+            try:
+                while True:
+                    delay = self._admit(api_name, max_calls, time_window, priority)
+                    bucket = self.buckets[api_name]
+                    if delay <= 0:
+                        waited = time.monotonic() - start
+                        if waited > 0.001:
+                            bucket.waits += 1
+                            bucket.wait_seconds += waited
+                        return True
+                    remaining = deadline - time.monotonic()
+                    if delay > remaining:
+                        bucket.throttled += 1
+                        return False
+                    condition.wait(timeout=delay)
+            finally:
+                self.waiting[api_name][priority] -= 1
+                condition.notify_all()
+
+    def metrics(self, api_name: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Saturation and admission counters per API"""
+        names = [api_name] if api_name else list(self.buckets)
+        now = time.monotonic()
+        result = {}
+        for name in names:
+            bucket = self.buckets.get(name)
+            if bucket is None:
+                continue
+            with self._condition(name):
+                bucket.refill(now)
+                result[name] = {
+                    'capacity': bucket.capacity,
+                    'rate_per_second': bucket.rate,
+                    'tokens_available': round(bucket.tokens, 3),
+                    'saturation': round(1.0 - bucket.tokens / bucket.capacity, 4),
+                    'admitted': bucket.admitted,
+                    'throttled': bucket.throttled,
+                    'waits': bucket.waits,
+                    'wait_seconds': round(bucket.wait_seconds, 3),
+                    'waiting': dict(self.waiting[name]),
+                }
+        return result
+
+
 class UnifiedAPIManager:
     """
     Unified API Manager for all data sources
@@ -62,7 +237,14 @@ class UnifiedAPIManager:
     """
 
     def __init__(self):
-        self.rate_limiter = RateLimiter()
+        # Maximum burst per API; APIs not listed may burst up to their window quota, never past it
+        self.rate_limit_bursts = {
+            'finnhub': 30,
+            'binance': 100,
+            'okx': 100,
+            'coingecko': 10,
+        }
+        self.rate_limiter = RateLimiter(bursts=self.rate_limit_bursts)
         self.api_keys = self._load_api_keys()
 
         self.tefas_session = requests.Session()
@@ -328,6 +510,16 @@ class UnifiedAPIManager:
 
         return self._make_request('binance', url, params, data_type='crypto_price')
 
+    def get_binance_tickers(self, symbols: List[str]) -> Optional[List[Dict]]:
+        """Get 24h tickers for many pairs from Binance in one call"""
+        if not symbols:
+            return None
+        url = "https://api.binance.com/api/v3/ticker/24hr"
+        params = {'symbols': json.dumps(list(symbols), separators=(',', ':'))}
+
+        data = self._make_request('binance', url, params, data_type='crypto_price')
+        return data if isinstance(data, list) else None
+
     def get_binance_klines(self, symbol: str = 'BTCUSDT', interval: str = '1h', limit: int = 100) -> Optional[List]:
         """Get historical klines from Binance"""
         url = "https://api.binance.com/api/v3/klines"
@@ -505,6 +697,17 @@ class UnifiedAPIManager:
 
         return self._make_request('fmp', url, params, data_type='stock_price')
 
+    def get_fmp_batch_quotes(self, symbols: List[str]) -> Optional[List]:
+        """Get quotes for many symbols from FMP in a single call"""
+        if not self.api_keys.get('fmp') or not symbols:
+            return None
+
+        url = f"https://financialmodelingprep.com/api/v3/quote/{','.join(symbols)}"
+        params = {'apikey': self.api_keys['fmp']}
+
+        data = self._make_request('fmp', url, params, data_type='stock_price')
+        return data if isinstance(data, list) else None
+
     def get_fmp_profile(self, symbol: str) -> Optional[Dict]:
         """Get company profile from FMP"""
         if not self.api_keys.get('fmp'):
@@ -646,6 +849,69 @@ class UnifiedAPIManager:
 
         return None
 
+    # ========== YAHOO FINANCE (BULK) ==========
+
+    def get_yahoo_batch_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, float]]:
+        """
+        Get last close and daily change for many tickers with one yf.download call
+
+        Returns a mapping of symbol -> {'price', 'change'} for the symbols Yahoo
+        answered; symbols without data are simply absent.
+        """
+        quotes = {}
+        pending = []
+        for symbol in symbols:
+            cached = get_cache().get(self.get_cache_key('yahoo', 'quote', {'symbol': symbol}))
+            if cached is not None:
+                quotes[symbol] = cached
+            else:
+                pending.append(symbol)
+        if not pending:
+            return quotes
+
+        try:
+            import yfinance as yf
+            frame = yf.download(
+                pending,
+                period='5d',
+                interval='1d',
+                auto_adjust=False,
+                group_by='column',
+                progress=False,
+                threads=True,
+            )
+        except Exception as e:
+            print(f"❌ Error calling yahoo bulk download: {e}")
+            return quotes
+
+        if frame is None or frame.empty or 'Close' not in frame:
+            return quotes
+
+        closes = frame['Close']
+        if closes.ndim == 1:
+            closes = closes.to_frame(pending[0])
+
+        for symbol in pending:
+            if symbol not in closes:
+                continue
+            series = closes[symbol].dropna()
+            if series.empty:
+                continue
+            last_close = float(series.iloc[-1])
+            prev_close = float(series.iloc[-2]) if len(series) > 1 else 0.0
+            quote = {
+                'price': last_close,
+                'change': ((last_close / prev_close) - 1) * 100 if prev_close else 0.0,
+            }
+            get_cache().set(
+                self.get_cache_key('yahoo', 'quote', {'symbol': symbol}),
+                quote,
+                ttl=self.cache_durations['stock_price'],
+            )
+            quotes[symbol] = quote
+
+        return quotes
+
     # ========== UTILITY METHODS ==========
 
     def get_stock_price_with_fallback(self, symbol: str) -> Dict[str, Any]:
@@ -826,10 +1092,13 @@ class UnifiedAPIManager:
             else:
                 limit_str = f"{max_calls} calls per {time_window}s"
 
+            limiter_metrics = self.rate_limiter.metrics(api_name).get(api_name, {})
             status[api_name] = {
                 'configured': has_key,
                 'rate_limit': limit_str,
-                'calls_made': len(self.rate_limiter.call_times.get(api_name, []))
+                'calls_made': limiter_metrics.get('admitted', 0),
+                'saturation': limiter_metrics.get('saturation', 0.0),
+                'throttled': limiter_metrics.get('throttled', 0),
             }
 
         return status